@@ -8,8 +8,18 @@ from sqlalchemy.ext.asyncio import create_async_engine
 from app.core.db.database import Base, get_database_url
 from app.features.audit_log.models import AuditLogEntry
 from app.features.auth.models import User
-from app.features.outbox.models import OutboxEvent
-from app.features.rbac.models import Permission, Role, RoleInheritance, RolePermission, UserRole
+from app.features.jobs.models import Job
+from app.features.outbox.models import OutboxDeadLetter, OutboxEvent
+from app.features.rate_limit.models import RateLimitBucket
+from app.features.rbac.models import (
+    Permission,
+    Role,
+    RoleInheritance,
+    RolePermission,
+    UserEffectivePermission,
+    UserRole,
+)
+from app.features.search.models import SearchDocument
 
 config = context.config
 
@@ -17,7 +27,21 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # Keep explicit model references so Alembic sees all tables in metadata.
-_MODEL_REGISTRY = (User, Role, Permission, UserRole, RolePermission, RoleInheritance, OutboxEvent, AuditLogEntry)
+_MODEL_REGISTRY = (
+    User,
+    Role,
+    Permission,
+    UserRole,
+    RolePermission,
+    RoleInheritance,
+    UserEffectivePermission,
+    OutboxEvent,
+    OutboxDeadLetter,
+    AuditLogEntry,
+    Job,
+    SearchDocument,
+    RateLimitBucket,
+)
 
 target_metadata = Base.metadata
 
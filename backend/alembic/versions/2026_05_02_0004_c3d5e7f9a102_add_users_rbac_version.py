@@ -0,0 +1,29 @@
+"""Add persisted users.rbac_version
+
+Revision ID: c3d5e7f9a102
+Revises: b8e2d4f6a901
+Create Date: 2026-05-02 00:04:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d5e7f9a102"
+down_revision: str | None = "b8e2d4f6a901"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("rbac_version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "rbac_version")
@@ -0,0 +1,61 @@
+"""Add user effective-permission closure table
+
+Revision ID: d4e6f8a0b213
+Revises: c3d5e7f9a102
+Create Date: 2026-05-03 00:05:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e6f8a0b213"
+down_revision: str | None = "c3d5e7f9a102"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_BACKFILL_SQL = """
+INSERT INTO user_effective_permissions (user_id, permission_id, scope)
+WITH RECURSIVE user_effective_roles(user_id, role_id) AS (
+    SELECT user_roles.user_id, user_roles.role_id FROM user_roles
+    UNION
+    SELECT user_effective_roles.user_id, role_inheritances.parent_role_id
+    FROM role_inheritances
+    JOIN user_effective_roles ON role_inheritances.role_id = user_effective_roles.role_id
+)
+SELECT
+    effective_grants.user_id,
+    effective_grants.permission_id,
+    CASE effective_grants.scope_rank WHEN 1 THEN 'own' WHEN 2 THEN 'tenant' WHEN 3 THEN 'any' END
+FROM (
+    SELECT
+        user_effective_roles.user_id,
+        role_permissions.permission_id,
+        MAX(CASE role_permissions.scope WHEN 'own' THEN 1 WHEN 'tenant' THEN 2 WHEN 'any' THEN 3 END) AS scope_rank
+    FROM user_effective_roles
+    JOIN role_permissions ON role_permissions.role_id = user_effective_roles.role_id
+    WHERE role_permissions.scope IN ('own', 'tenant', 'any')
+    GROUP BY user_effective_roles.user_id, role_permissions.permission_id
+) AS effective_grants
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_effective_permissions",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("permission_id", sa.String(length=100), nullable=False),
+        sa.Column("scope", sa.String(length=20), nullable=False),
+        sa.CheckConstraint("scope IN ('own', 'tenant', 'any')", name="ck_user_effective_permissions_scope"),
+        sa.ForeignKeyConstraint(["permission_id"], ["permissions.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "permission_id"),
+    )
+    op.execute(_BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_table("user_effective_permissions")
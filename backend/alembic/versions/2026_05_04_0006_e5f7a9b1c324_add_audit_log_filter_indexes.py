@@ -0,0 +1,38 @@
+"""Add audit log filter indexes
+
+Revision ID: e5f7a9b1c324
+Revises: d4e6f8a0b213
+Create Date: 2026-05-04 00:06:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f7a9b1c324"
+down_revision: str | None = "d4e6f8a0b213"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_FILTER_INDEXES: tuple[tuple[str, str], ...] = (
+    ("ix_audit_log_entries_actor_user_id_created_at_id", "actor_user_id"),
+    ("ix_audit_log_entries_action_created_at_id", "action"),
+    ("ix_audit_log_entries_resource_type_created_at_id", "resource_type"),
+)
+
+
+def upgrade() -> None:
+    for index_name, column_name in _FILTER_INDEXES:
+        op.create_index(
+            index_name,
+            "audit_log_entries",
+            [column_name, "created_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    for index_name, _ in reversed(_FILTER_INDEXES):
+        op.drop_index(index_name, table_name="audit_log_entries")
@@ -0,0 +1,115 @@
+"""Partition outbox events by month and index pending rows
+
+Revision ID: f6a8b0c2d435
+Revises: e5f7a9b1c324
+Create Date: 2026-05-05 00:07:00.000000
+
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a8b0c2d435"
+down_revision: str | None = "e5f7a9b1c324"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_UTC_SERVER_DEFAULT = sa.text("CURRENT_TIMESTAMP")
+_PENDING_INDEX = "ix_outbox_events_pending_occurred_at_id"
+_PENDING_PREDICATE = sa.text("published_at IS NULL")
+_PREMADE_MONTHS = 3
+_COLUMNS = "id, aggregate_type, aggregate_id, event_type, payload, occurred_at, published_at, created_at, updated_at"
+
+
+def _outbox_columns(*, id_server_default: sa.TextClause | None = None) -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.Integer(), nullable=False, server_default=id_server_default),
+        sa.Column("aggregate_type", sa.String(length=100), nullable=False),
+        sa.Column("aggregate_id", sa.String(length=100), nullable=False),
+        sa.Column("event_type", sa.String(length=150), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+    ]
+
+
+def _add_months(month_start: date, months: int) -> date:
+    month_index = month_start.month - 1 + months
+    return date(month_start.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def _create_monthly_partitions(first_occurred_at: datetime | None) -> None:
+    current_month = datetime.now(UTC).date().replace(day=1)
+    month_start = min((first_occurred_at.date() if first_occurred_at else current_month).replace(day=1), current_month)
+    last_month = _add_months(current_month, _PREMADE_MONTHS)
+    while month_start <= last_month:
+        next_month = _add_months(month_start, 1)
+        op.execute(
+            f"CREATE TABLE outbox_events_p{month_start:%Y%m} PARTITION OF outbox_events "
+            f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{next_month.isoformat()}')"
+        )
+        month_start = next_month
+
+
+def _partition_postgresql_table() -> None:
+    first_occurred_at = op.get_bind().execute(sa.text("SELECT min(occurred_at) FROM outbox_events")).scalar()
+    op.rename_table("outbox_events", "outbox_events_unpartitioned")
+    op.execute("ALTER TABLE outbox_events_unpartitioned RENAME CONSTRAINT outbox_events_pkey TO outbox_events_old_pkey")
+    # The partition key must be part of the primary key; ids keep coming from the existing sequence.
+    op.create_table(
+        "outbox_events",
+        *_outbox_columns(id_server_default=sa.text("nextval('outbox_events_id_seq'::regclass)")),
+        sa.PrimaryKeyConstraint("id", "occurred_at", name="outbox_events_pkey"),
+        postgresql_partition_by="RANGE (occurred_at)",
+    )
+    op.execute("ALTER SEQUENCE outbox_events_id_seq OWNED BY outbox_events.id")
+    _create_monthly_partitions(first_occurred_at)
+    # Catches rows outside the premade months until the retention job creates their partition.
+    op.execute("CREATE TABLE outbox_events_default PARTITION OF outbox_events DEFAULT")
+    op.execute(f"INSERT INTO outbox_events ({_COLUMNS}) SELECT {_COLUMNS} FROM outbox_events_unpartitioned")
+    op.drop_table("outbox_events_unpartitioned")
+
+
+def _unpartition_postgresql_table() -> None:
+    op.rename_table("outbox_events", "outbox_events_partitioned")
+    op.execute("ALTER TABLE outbox_events_partitioned RENAME CONSTRAINT outbox_events_pkey TO outbox_events_old_pkey")
+    op.create_table(
+        "outbox_events",
+        *_outbox_columns(id_server_default=sa.text("nextval('outbox_events_id_seq'::regclass)")),
+        sa.PrimaryKeyConstraint("id", name="outbox_events_pkey"),
+    )
+    op.execute("ALTER SEQUENCE outbox_events_id_seq OWNED BY outbox_events.id")
+    op.execute(f"INSERT INTO outbox_events ({_COLUMNS}) SELECT {_COLUMNS} FROM outbox_events_partitioned")
+    op.drop_table("outbox_events_partitioned")
+
+
+def upgrade() -> None:
+    op.drop_index("ix_outbox_events_published_at_id", table_name="outbox_events")
+    if op.get_bind().dialect.name == "postgresql":
+        _partition_postgresql_table()
+    op.create_index(
+        _PENDING_INDEX,
+        "outbox_events",
+        ["occurred_at", "id"],
+        unique=False,
+        postgresql_where=_PENDING_PREDICATE,
+        sqlite_where=_PENDING_PREDICATE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(_PENDING_INDEX, table_name="outbox_events")
+    if op.get_bind().dialect.name == "postgresql":
+        _unpartition_postgresql_table()
+    op.create_index(
+        "ix_outbox_events_published_at_id",
+        "outbox_events",
+        ["published_at", "id"],
+        unique=False,
+    )
@@ -0,0 +1,59 @@
+"""Add outbox events shard key
+
+Revision ID: a7b9c1d3e546
+Revises: f6a8b0c2d435
+Create Date: 2026-05-06 00:08:00.000000
+
+"""
+
+import zlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b9c1d3e546"
+down_revision: str | None = "f6a8b0c2d435"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_OUTBOX_EVENTS = sa.table(
+    "outbox_events",
+    sa.column("aggregate_type", sa.String()),
+    sa.column("aggregate_id", sa.String()),
+    sa.column("published_at", sa.DateTime(timezone=True)),
+    sa.column("shard_key", sa.Integer()),
+)
+
+
+def _shard_key(aggregate_type: str, aggregate_id: str) -> int:
+    return zlib.crc32(f"{aggregate_type}:{aggregate_id}".encode()) & 0x7FFFFFFF
+
+
+def upgrade() -> None:
+    op.add_column(
+        "outbox_events",
+        sa.Column("shard_key", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    # Only pending events are ever routed to a shard, so published history keeps the default key.
+    connection = op.get_bind()
+    pending_aggregates = connection.execute(
+        sa.select(_OUTBOX_EVENTS.c.aggregate_type, _OUTBOX_EVENTS.c.aggregate_id)
+        .where(_OUTBOX_EVENTS.c.published_at.is_(None))
+        .distinct()
+    ).all()
+    for aggregate_type, aggregate_id in pending_aggregates:
+        connection.execute(
+            sa.update(_OUTBOX_EVENTS)
+            .where(
+                _OUTBOX_EVENTS.c.aggregate_type == aggregate_type,
+                _OUTBOX_EVENTS.c.aggregate_id == aggregate_id,
+                _OUTBOX_EVENTS.c.published_at.is_(None),
+            )
+            .values(shard_key=_shard_key(aggregate_type, aggregate_id))
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("outbox_events", "shard_key")
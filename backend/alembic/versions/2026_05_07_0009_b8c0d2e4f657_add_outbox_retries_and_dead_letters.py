@@ -0,0 +1,65 @@
+"""Add outbox retry tracking and dead letters
+
+Revision ID: b8c0d2e4f657
+Revises: a7b9c1d3e546
+Create Date: 2026-05-07 00:09:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c0d2e4f657"
+down_revision: str | None = "a7b9c1d3e546"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_UTC_SERVER_DEFAULT = sa.text("CURRENT_TIMESTAMP")
+_PENDING_PREDICATE = sa.text("published_at IS NULL")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "outbox_events",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column("outbox_events", sa.Column("last_error", sa.Text(), nullable=True))
+    op.add_column(
+        "outbox_events",
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+    )
+    op.create_index(
+        "ix_outbox_events_pending_aggregate",
+        "outbox_events",
+        ["aggregate_type", "aggregate_id", "occurred_at", "id"],
+        unique=False,
+        postgresql_where=_PENDING_PREDICATE,
+        sqlite_where=_PENDING_PREDICATE,
+    )
+    op.create_table(
+        "outbox_dead_letters",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("outbox_event_id", sa.Integer(), nullable=False),
+        sa.Column("aggregate_type", sa.String(length=100), nullable=False),
+        sa.Column("aggregate_id", sa.String(length=100), nullable=False),
+        sa.Column("event_type", sa.String(length=150), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("dead_lettered_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("outbox_dead_letters")
+    op.drop_index("ix_outbox_events_pending_aggregate", table_name="outbox_events")
+    op.drop_column("outbox_events", "available_at")
+    op.drop_column("outbox_events", "last_error")
+    op.drop_column("outbox_events", "attempts")
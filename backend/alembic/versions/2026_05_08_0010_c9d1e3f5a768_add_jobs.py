@@ -0,0 +1,54 @@
+"""Add jobs
+
+Revision ID: c9d1e3f5a768
+Revises: b8c0d2e4f657
+Create Date: 2026-05-08 00:10:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d1e3f5a768"
+down_revision: str | None = "b8c0d2e4f657"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_UTC_SERVER_DEFAULT = sa.text("CURRENT_TIMESTAMP")
+_CLAIMABLE_PREDICATE = sa.text("status IN ('queued', 'running')")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_name", sa.String(length=150), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default=sa.text("'queued'")),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("run_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default=sa.text("3")),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_jobs_claimable_priority_run_at_id",
+        "jobs",
+        ["priority", "run_at", "id"],
+        unique=False,
+        postgresql_where=_CLAIMABLE_PREDICATE,
+        sqlite_where=_CLAIMABLE_PREDICATE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_claimable_priority_run_at_id", table_name="jobs")
+    op.drop_table("jobs")
@@ -0,0 +1,50 @@
+"""Add search documents
+
+Revision ID: d0e2f4a6b879
+Revises: c9d1e3f5a768
+Create Date: 2026-05-09 00:11:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e2f4a6b879"
+down_revision: str | None = "c9d1e3f5a768"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_UTC_SERVER_DEFAULT = sa.text("CURRENT_TIMESTAMP")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_documents",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("index_name", sa.String(length=100), nullable=False),
+        sa.Column("document_id", sa.String(length=100), nullable=False),
+        sa.Column("body", sa.JSON(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("index_name", "document_id", name="uq_search_documents_index_document"),
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "CREATE INDEX ix_search_documents_content_tsvector ON search_documents "
+            "USING gin (to_tsvector('simple', content))"
+        )
+    else:
+        op.execute("CREATE VIRTUAL TABLE search_documents_fts USING fts5(content, tokenize='unicode61')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_search_documents_content_tsvector", table_name="search_documents")
+    else:
+        op.execute("DROP TABLE search_documents_fts")
+    op.drop_table("search_documents")
@@ -0,0 +1,50 @@
+"""Add RBAC list filter indexes
+
+Revision ID: e1f3a5b7c980
+Revises: d0e2f4a6b879
+Create Date: 2026-05-10 00:12:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f3a5b7c980"
+down_revision: str | None = "d0e2f4a6b879"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_FILTER_INDEXES: tuple[tuple[str, str, list[str]], ...] = (
+    ("ix_users_disabled_username_id", "users", ["disabled", "username", "id"]),
+    ("ix_users_tenant_id_username_id", "users", ["tenant_id", "username", "id"]),
+    ("ix_user_roles_role_id_user_id", "user_roles", ["role_id", "user_id"]),
+)
+
+# PostgreSQL only: trigram indexes serve substring search, text_pattern_ops indexes serve short prefix search.
+_NAME_SEARCH_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("ix_users_username_lower_trgm", "users", "USING gin (lower(username) gin_trgm_ops)"),
+    ("ix_users_username_lower_pattern", "users", "(lower(username) text_pattern_ops)"),
+    ("ix_roles_name_lower_trgm", "roles", "USING gin (lower(name) gin_trgm_ops)"),
+    ("ix_roles_name_lower_pattern", "roles", "(lower(name) text_pattern_ops)"),
+)
+
+
+def upgrade() -> None:
+    for index_name, table_name, column_names in _FILTER_INDEXES:
+        op.create_index(index_name, table_name, column_names, unique=False)
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for index_name, table_name, index_definition in _NAME_SEARCH_INDEXES:
+            op.execute(f"CREATE INDEX {index_name} ON {table_name} {index_definition}")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for index_name, table_name, _ in reversed(_NAME_SEARCH_INDEXES):
+            op.drop_index(index_name, table_name=table_name)
+
+    for index_name, table_name, _ in reversed(_FILTER_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
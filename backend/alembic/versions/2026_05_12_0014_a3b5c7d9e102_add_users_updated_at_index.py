@@ -0,0 +1,26 @@
+"""Add users updated_at index
+
+Revision ID: a3b5c7d9e102
+Revises: f2a4b6c8d091
+Create Date: 2026-05-12 00:14:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b5c7d9e102"
+down_revision: str | None = "f2a4b6c8d091"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Token watermark refreshes read the users changed since the previous refresh.
+    op.create_index("ix_users_updated_at", "users", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_updated_at", table_name="users")
@@ -0,0 +1,34 @@
+"""Add rate limit bucket full_at
+
+Revision ID: b5d7f9a1c324
+Revises: a3b5c7d9e102
+Create Date: 2026-05-13 00:15:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d7f9a1c324"
+down_revision: str | None = "a3b5c7d9e102"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_UTC_SERVER_DEFAULT = sa.text("CURRENT_TIMESTAMP")
+
+
+def upgrade() -> None:
+    # Existing rows become prunable straight away, which only resets their buckets to full.
+    op.add_column(
+        "rate_limit_buckets",
+        sa.Column("full_at", sa.DateTime(timezone=True), nullable=False, server_default=_UTC_SERVER_DEFAULT),
+    )
+    op.create_index("ix_rate_limit_buckets_full_at", "rate_limit_buckets", ["full_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rate_limit_buckets_full_at", table_name="rate_limit_buckets")
+    op.drop_column("rate_limit_buckets", "full_at")
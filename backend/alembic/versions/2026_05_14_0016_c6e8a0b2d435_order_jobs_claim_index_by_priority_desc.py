@@ -0,0 +1,45 @@
+"""Order jobs claim index by priority descending
+
+Revision ID: c6e8a0b2d435
+Revises: b5d7f9a1c324
+Create Date: 2026-05-14 00:16:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6e8a0b2d435"
+down_revision: str | None = "b5d7f9a1c324"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_CLAIMABLE_PREDICATE = sa.text("status IN ('queued', 'running')")
+
+
+def upgrade() -> None:
+    # Claims order by priority DESC, run_at ASC, id ASC; an all-ascending index cannot serve that mixed order.
+    op.create_index(
+        "ix_jobs_claimable_priority_desc_run_at_id",
+        "jobs",
+        [sa.text("priority DESC"), "run_at", "id"],
+        unique=False,
+        postgresql_where=_CLAIMABLE_PREDICATE,
+        sqlite_where=_CLAIMABLE_PREDICATE,
+    )
+    op.drop_index("ix_jobs_claimable_priority_run_at_id", table_name="jobs")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_jobs_claimable_priority_run_at_id",
+        "jobs",
+        ["priority", "run_at", "id"],
+        unique=False,
+        postgresql_where=_CLAIMABLE_PREDICATE,
+        sqlite_where=_CLAIMABLE_PREDICATE,
+    )
+    op.drop_index("ix_jobs_claimable_priority_desc_run_at_id", table_name="jobs")
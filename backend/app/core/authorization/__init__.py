@@ -1,3 +1,10 @@
+from app.core.authorization.bitset import (
+    PERMISSION_BITSET_VERSION,
+    decode_permission_scopes,
+    encode_permission_scopes,
+    merge_permission_bitsets,
+    split_permission_scopes,
+)
 from app.core.authorization.catalog import (
     PERMISSION_CATALOG,
     PERMISSION_CATALOG_BY_ID,
@@ -0,0 +1,56 @@
+from collections.abc import Mapping
+from hashlib import sha256
+from typing import Final
+
+from app.core.authorization.catalog import PERMISSION_IDS
+from app.core.authorization.types import PERMISSION_SCOPE_RANK
+
+# Two bits per permission, in catalog order: 0 = not granted, then the scope rank (own=1, tenant=2, any=3).
+PERMISSION_BITSET_BITS_PER_PERMISSION: Final[int] = 2
+_SCOPE_MASK: Final[int] = (1 << PERMISSION_BITSET_BITS_PER_PERMISSION) - 1
+_SCOPES_BY_RANK: Final[dict[int, str]] = {rank: scope for scope, rank in PERMISSION_SCOPE_RANK.items()}
+_PERMISSION_OFFSETS: Final[dict[str, int]] = {
+    permission_id: index * PERMISSION_BITSET_BITS_PER_PERMISSION for index, permission_id in enumerate(PERMISSION_IDS)
+}
+_LOW_BITS: Final[int] = sum(1 << offset for offset in _PERMISSION_OFFSETS.values())
+_HIGH_BITS: Final[int] = _LOW_BITS << 1
+
+# Changes whenever catalog ids are added, removed or reordered, so bitsets encoded by another catalog are detectable.
+PERMISSION_BITSET_VERSION: Final[str] = sha256("\n".join(PERMISSION_IDS).encode()).hexdigest()[:8]
+
+
+def split_permission_scopes(scopes: Mapping[str, str | None]) -> tuple[int, dict[str, str]]:
+    bitset = 0
+    uncataloged_scopes: dict[str, str] = {}
+    for permission_id, scope in scopes.items():
+        if scope is None:
+            continue
+        offset = _PERMISSION_OFFSETS.get(permission_id)
+        if offset is None:
+            uncataloged_scopes[permission_id] = scope
+            continue
+        bitset |= PERMISSION_SCOPE_RANK[scope] << offset
+    return bitset, uncataloged_scopes
+
+
+def encode_permission_scopes(scopes: Mapping[str, str | None]) -> int:
+    # Permissions outside the catalog have no slot; callers that need them keep them next to the bitset.
+    return split_permission_scopes(scopes)[0]
+
+
+def decode_permission_scopes(bitset: int) -> dict[str, str | None]:
+    return {
+        permission_id: _SCOPES_BY_RANK.get((bitset >> offset) & _SCOPE_MASK)
+        for permission_id, offset in _PERMISSION_OFFSETS.items()
+    }
+
+
+def merge_permission_bitsets(left: int, right: int) -> int:
+    # Per permission, keep the broader scope: a lane-wise max of the 2-bit ranks for every permission at once.
+    left_high = (left & _HIGH_BITS) >> 1
+    right_high = (right & _HIGH_BITS) >> 1
+    left_low = left & _LOW_BITS
+    right_low = right & _LOW_BITS
+    left_wins = ((left_high & ~right_high) | (~(left_high ^ right_high) & left_low & ~right_low)) & _LOW_BITS
+    left_lanes = left_wins | (left_wins << 1)
+    return (left & left_lanes) | (right & ~left_lanes)
@@ -162,6 +162,70 @@ def require_permission(
     return dependency
 
 
+def require_permissions(
+    *permission_ids: str,
+    required_scope: str = PermissionScope.ANY,
+    resource_context_dependency: PermissionContextProvider = build_default_permission_context,
+    conditional_policy_dependency: ConditionalPermissionPolicyDependency = allow_conditional_permission_policy,
+) -> PermissionPolicyDependency:
+    if not permission_ids:
+        raise ValueError("require_permissions expects at least one permission id.")
+
+    required_permission_ids = tuple(dict.fromkeys(permission_ids))
+    normalized_required_scope = normalize_permission_scope(required_scope)
+
+    def log_decisions(*, request: Request, user_id: int, decision: str) -> None:
+        for permission_id in required_permission_ids:
+            _log_authorization_decision(
+                request=request,
+                user_id=user_id,
+                permission_id=permission_id,
+                required_scope=normalized_required_scope,
+                decision=decision,
+            )
+
+    async def dependency(
+        current_user: CurrentActiveUserDependency,
+        auth_service: AuthServiceDependency,
+        request: Request,
+        resource_context: Annotated[PermissionResourceContext, Depends(resource_context_dependency)],
+        conditional_policy_allowed: Annotated[bool, Depends(conditional_policy_dependency)],
+    ) -> None:
+        decisions = await auth_service.user_has_permissions(
+            user_id=current_user.id,
+            permission_ids=required_permission_ids,
+            required_scope=normalized_required_scope,
+            resource_owner_id=resource_context.owner_user_id,
+            resource_tenant_id=resource_context.tenant_id,
+            user_tenant_id=current_user.tenant_id,
+        )
+        missing_permission_ids = [
+            permission_id for permission_id in required_permission_ids if not decisions[permission_id]
+        ]
+        if missing_permission_ids:
+            log_decisions(request=request, user_id=current_user.id, decision="deny")
+            raise ForbiddenError(
+                message=f"Missing required permission: {missing_permission_ids[0]}",
+                details={
+                    "permission_id": missing_permission_ids[0],
+                    "permission_ids": missing_permission_ids,
+                },
+            )
+        if not conditional_policy_allowed:
+            log_decisions(request=request, user_id=current_user.id, decision="deny")
+            raise ForbiddenError(
+                message=f"Conditional policy denied access: {', '.join(required_permission_ids)}",
+                details={
+                    "permission_ids": list(required_permission_ids),
+                    "authorization_stage": "conditional_policy",
+                },
+            )
+
+        log_decisions(request=request, user_id=current_user.id, decision="allow")
+
+    return dependency
+
+
 def require_authorized_user(
     permission_id: str,
     *,
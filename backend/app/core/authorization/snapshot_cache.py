@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock, RLock
+from time import monotonic
+from typing import Protocol
+
+from app.core.common.records import UserRecord
+from app.core.common.schema import ApplicationSchema
+from app.core.config.settings import AuthSettings
+
+
+class AuthorizationSnapshot(ApplicationSchema):
+    user: UserRecord
+    rbac_version: str
+    permission_bitset: int | None = None
+
+
+class AuthorizationSnapshotCachePort(Protocol):
+    def get_by_username(self, username: str) -> AuthorizationSnapshot | None: ...
+
+    def store(self, snapshot: AuthorizationSnapshot) -> None: ...
+
+    def invalidate_user(self, user_id: int) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class AuthorizationSnapshotCache:
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[int, tuple[float, AuthorizationSnapshot]] = OrderedDict()
+        self._user_ids_by_username: dict[str, int] = {}
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, user_id: int) -> None:
+        entry = self._entries.pop(user_id, None)
+        if entry is None:
+            return
+
+        username = entry[1].user.username
+        if self._user_ids_by_username.get(username) == user_id:
+            del self._user_ids_by_username[username]
+
+    def get_by_username(self, username: str) -> AuthorizationSnapshot | None:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            user_id = self._user_ids_by_username.get(username)
+            if user_id is None:
+                return None
+
+            expires_at, snapshot = self._entries[user_id]
+            if expires_at <= self._clock():
+                self._evict(user_id)
+                return None
+
+            self._entries.move_to_end(user_id)
+            return snapshot
+
+    def store(self, snapshot: AuthorizationSnapshot) -> None:
+        if not self.enabled:
+            return
+
+        user_id = snapshot.user.id
+        with self._lock:
+            self._evict(user_id)
+            self._entries[user_id] = (self._clock() + self._ttl_seconds, snapshot)
+            self._user_ids_by_username[snapshot.user.username] = user_id
+            while len(self._entries) > self._max_entries:
+                self._evict(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            self._evict(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._user_ids_by_username.clear()
+
+
+class AuthorizationSnapshotCacheRuntime:
+    def __init__(self, settings_loader: Callable[[], AuthSettings] | None = None) -> None:
+        self._settings_loader = settings_loader or AuthSettings
+        self._cache: AuthorizationSnapshotCache | None = None
+        self._lock = RLock()
+
+    def get_cache(self) -> AuthorizationSnapshotCache:
+        if self._cache is not None:
+            return self._cache
+
+        with self._lock:
+            if self._cache is None:
+                settings = self._settings_loader()
+                self._cache = AuthorizationSnapshotCache(
+                    ttl_seconds=settings.AUTH_SNAPSHOT_CACHE_TTL_SECONDS,
+                    max_entries=settings.AUTH_SNAPSHOT_CACHE_MAX_ENTRIES,
+                )
+            return self._cache
+
+    def reset(self) -> None:
+        with self._lock:
+            self._cache = None
+
+
+authorization_snapshot_cache_runtime = AuthorizationSnapshotCacheRuntime()
+
+
+def get_authorization_snapshot_cache() -> AuthorizationSnapshotCache:
+    return authorization_snapshot_cache_runtime.get_cache()
+
+
+def reset_authorization_snapshot_cache() -> None:
+    authorization_snapshot_cache_runtime.reset()
@@ -1,5 +1,8 @@
+from datetime import UTC, datetime
 from typing import Any
 
+from pydantic import Field
+
 from app.core.common.schema import ApplicationSchema
 
 
@@ -10,8 +13,11 @@ class PublishMessageCommand(ApplicationSchema):
 
 
 class EnqueueJobCommand(ApplicationSchema):
-    job_name: str
+    job_name: str = Field(min_length=1, max_length=150)
     payload: dict[str, Any]
+    priority: int = 0
+    run_at: datetime | None = None
+    max_attempts: int = Field(default=3, ge=1)
 
 
 class SearchDocumentUpsertCommand(ApplicationSchema):
@@ -25,6 +31,19 @@ class DeleteSearchDocumentCommand(ApplicationSchema):
     document_id: str
 
 
+class SearchDocumentsQuery(ApplicationSchema):
+    index: str
+    text: str = Field(min_length=1, max_length=200)
+    limit: int = Field(default=20, ge=1, le=100)
+
+
+class SearchHit(ApplicationSchema):
+    index: str
+    document_id: str
+    score: float
+    body: dict[str, Any]
+
+
 class StoreFileCommand(ApplicationSchema):
     bucket: str
     path: str
@@ -32,7 +51,34 @@ class StoreFileCommand(ApplicationSchema):
     body: bytes
 
 
+class StoreFileStreamCommand(ApplicationSchema):
+    bucket: str
+    path: str
+    content_type: str
+
+
 class StoredFileResult(ApplicationSchema):
     bucket: str
     path: str
     etag: str | None = None
+    size: int | None = None
+
+
+class RecordAuditEntryCommand(ApplicationSchema):
+    actor_user_id: int | None = None
+    action: str = Field(min_length=1, max_length=100)
+    resource_type: str = Field(min_length=1, max_length=100)
+    resource_id: str | None = Field(default=None, max_length=100)
+    summary: str = Field(min_length=1, max_length=255)
+    occurred_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
+class TakeRateLimitTokenCommand(ApplicationSchema):
+    key: str = Field(min_length=1, max_length=255)
+    capacity: int = Field(gt=0)
+    refill_per_second: float = Field(gt=0)
+
+
+class RateLimitDecision(ApplicationSchema):
+    allowed: bool
+    retry_after_seconds: float = 0.0
@@ -1,6 +1,7 @@
 from typing import Any
 
 REQUEST_ID_HEADER = "X-Request-ID"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 REQUEST_ID_EXAMPLE = "req-example-1234"
 VALIDATION_ERROR_RESPONSE_KEY = "422"
 
@@ -27,6 +28,13 @@ REQUEST_ID_RESPONSE_HEADER: dict[str, Any] = {
     }
 }
 
+NEXT_CURSOR_RESPONSE_HEADER: dict[str, Any] = {
+    NEXT_CURSOR_HEADER: {
+        "description": "Opaque cursor for the next page. Omitted on the last page or when `limit` is not sent.",
+        "schema": {"type": "string", "example": "WyJyZWFkZXJfdXNlciIsM10"},
+    }
+}
+
 WWW_AUTHENTICATE_HEADER: dict[str, Any] = {
     "WWW-Authenticate": {
         "description": "Bearer authentication challenge.",
@@ -34,6 +42,19 @@ WWW_AUTHENTICATE_HEADER: dict[str, Any] = {
     }
 }
 
+RETRY_AFTER_HEADER: dict[str, Any] = {
+    "Retry-After": {
+        "description": "Seconds to wait before retrying the request.",
+        "schema": {"type": "string", "example": "1"},
+    }
+}
+
+PASSWORD_HASHING_UNAVAILABLE_EXAMPLE: dict[str, Any] = {
+    "detail": "Password hashing capacity exceeded. Retry shortly.",
+    "status": 503,
+    "code": "service_unavailable",
+}
+
 INTERNAL_ERROR_EXAMPLE: dict[str, Any] = {
     "detail": "Internal server error",
     "status": 500,
@@ -84,6 +105,7 @@ def build_error_response(
     description: str,
     example: dict[str, Any],
     include_www_authenticate: bool = False,
+    include_retry_after: bool = False,
 ) -> dict[str, Any]:
     response: dict[str, Any] = {
         "description": description,
@@ -97,6 +119,8 @@ def build_error_response(
     }
     if include_www_authenticate:
         response["headers"].update(WWW_AUTHENTICATE_HEADER)
+    if include_retry_after:
+        response["headers"].update(RETRY_AFTER_HEADER)
     return response
 
 
@@ -1,3 +1,46 @@
+import base64
+import json
+from dataclasses import dataclass
+
 DEFAULT_LIST_LIMIT = 50
 MAX_LIST_LIMIT = 100
 DEFAULT_SORT = "id"
+
+type CursorValue = str | int
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    limit: int = DEFAULT_LIST_LIMIT
+    cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class CursorPage[ItemType]:
+    items: list[ItemType]
+    next_cursor: str | None = None
+
+
+def encode_cursor(values: tuple[CursorValue, ...]) -> str:
+    payload = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def _is_cursor_value(value: object) -> bool:
+    return isinstance(value, str | int) and not isinstance(value, bool)
+
+
+def decode_cursor(cursor: str) -> tuple[CursorValue, ...]:
+    padded_cursor = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded_cursor.encode("ascii")))
+    except ValueError as exc:
+        raise InvalidCursorError("Malformed pagination cursor") from exc
+
+    if not isinstance(values, list) or not values or not all(_is_cursor_value(value) for value in values):
+        raise InvalidCursorError("Malformed pagination cursor")
+    return tuple(values)
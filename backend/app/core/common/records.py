@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import ConfigDict
 
 from app.core.common.schema import ApplicationSchema
@@ -13,6 +15,17 @@ class UserRecord(ApplicationSchema):
     model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
+class UserTokenWatermarkRecord(ApplicationSchema):
+    id: int
+    username: str
+    disabled: bool
+    tenant_id: int | None = None
+    rbac_version: str
+    updated_at: datetime
+
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+
 class RoleRecord(ApplicationSchema):
     id: int
     name: str
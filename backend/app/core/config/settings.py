@@ -1,5 +1,5 @@
 import os
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
@@ -35,6 +35,16 @@ class AuthSettings(BaseSettings):
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(30, gt=0)
     JWT_ISSUER: str = "fastapi-template"
     JWT_AUDIENCE: str = "fastapi-template-api"
+    AUTH_SNAPSHOT_CACHE_TTL_SECONDS: float = Field(10.0, ge=0)
+    AUTH_SNAPSHOT_CACHE_MAX_ENTRIES: int = Field(10_000, gt=0)
+    AUTH_STATELESS_TOKENS_ENABLED: bool = False
+    AUTH_TOKEN_WATERMARK_REFRESH_SECONDS: float = Field(5.0, gt=0)
+    PASSWORD_HASH_MAX_CONCURRENCY: int = Field(4, gt=0)
+    PASSWORD_HASH_MAX_QUEUE_DEPTH: int = Field(64, ge=0)
+    PASSWORD_HASH_PROFILE: Literal["low", "default", "high"] = "default"
+    PASSWORD_HASH_TIME_COST: int | None = Field(None, gt=0)
+    PASSWORD_HASH_MEMORY_COST_KIB: int | None = Field(None, ge=8)
+    PASSWORD_HASH_PARALLELISM: int | None = Field(None, gt=0)
 
     @field_validator("APP_ENV")
     @classmethod
@@ -89,6 +99,26 @@ class AuthSettings(BaseSettings):
         return self
 
 
+class RateLimitSettings(BaseSettings):
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_STORE: Literal["memory", "database"] = "memory"
+    LOGIN_RATE_LIMIT_USER_BURST: int = Field(5, gt=0)
+    LOGIN_RATE_LIMIT_USER_PER_MINUTE: float = Field(5.0, gt=0)
+    LOGIN_RATE_LIMIT_IP_BURST: int = Field(20, gt=0)
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = Field(60.0, gt=0)
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = Field(100_000, gt=0)
+    LOGIN_RATE_LIMIT_PRUNE_INTERVAL_SECONDS: float = Field(60.0, gt=0)
+
+
+class AuditLogSettings(BaseSettings):
+    AUDIT_LOG_QUEUE_MAX_SIZE: int = Field(1_000, gt=0)
+    AUDIT_LOG_BATCH_SIZE: int = Field(100, gt=0)
+    AUDIT_LOG_FLUSH_INTERVAL_SECONDS: float = Field(1.0, gt=0)
+    AUDIT_LOG_ENQUEUE_TIMEOUT_SECONDS: float = Field(0.05, ge=0)
+    AUDIT_LOG_WRITE_MAX_ATTEMPTS: int = Field(5, gt=0)
+    AUDIT_LOG_WRITE_RETRY_BACKOFF_SECONDS: float = Field(0.1, ge=0)
+
+
 class DatabaseSettings(BaseSettings):
     DB_TYPE: str = "sqlite+aiosqlite"
     DB_USER: str | None = None
@@ -1,12 +1,23 @@
 from collections.abc import Iterable, Mapping
 from typing import Any, Protocol, cast
 
-from sqlalchemy import Select, select
+from sqlalchemy import ColumnElement, Select, and_, false, inspect, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
-from app.core.common.pagination import DEFAULT_LIST_LIMIT, DEFAULT_SORT, MAX_LIST_LIMIT
+from app.core.common.pagination import (
+    DEFAULT_LIST_LIMIT,
+    DEFAULT_SORT,
+    MAX_LIST_LIMIT,
+    CursorPage,
+    CursorValue,
+    InvalidCursorError,
+    PageRequest,
+    decode_cursor,
+    encode_cursor,
+)
 from app.core.db.database import Base
+from app.core.errors.domain import DomainErrorType
 from app.core.errors.repositories import RepositoryError
 
 IdType = int
@@ -29,25 +40,102 @@ class BaseRepository[ModelType: Base]:
         self.model = model
         self._default_record_type = default_record_type
 
-    def _get_column(self, column_name: str) -> InstrumentedAttribute[Any]:
-        column = getattr(self.model, column_name, None)
+    def _get_column(self, column_name: str, *, model: type[Base] | None = None) -> InstrumentedAttribute[Any]:
+        resolved_model = model or self.model
+        column = getattr(resolved_model, column_name, None)
         if column is None:
-            raise RepositoryError(f"Column '{column_name}' does not exist on '{self.model.__name__}'")
+            raise RepositoryError(f"Column '{column_name}' does not exist on '{resolved_model.__name__}'")
         return column
 
-    def _build_sort_order(self, sort: str) -> tuple[Any, ...]:
+    @staticmethod
+    def _parse_sort(sort: str) -> tuple[str, bool]:
         descending = sort.startswith("-")
         column_name = sort[1:] if descending else sort
         if not column_name:
             raise RepositoryError("Sort field cannot be empty")
+        return column_name, descending
 
-        column = self._get_column(column_name)
+    def _build_sort_order(self, sort: str, *, model: type[Base] | None = None) -> tuple[Any, ...]:
+        column_name, descending = self._parse_sort(sort)
+        column = self._get_column(column_name, model=model)
         primary_order = column.desc() if descending else column.asc()
         if column_name == "id":
             return (primary_order,)
 
         # Add a deterministic tiebreaker so paginated responses stay stable.
-        return (primary_order, self._get_column("id").asc())
+        return (primary_order, self._get_column("id", model=model).asc())
+
+    def _decode_page_cursor(
+        self,
+        cursor: str,
+        *,
+        column_name: str,
+        model: type[Base] | None = None,
+    ) -> tuple[CursorValue, ...]:
+        invalid_cursor_error = RepositoryError(
+            "Invalid pagination cursor",
+            error_type=DomainErrorType.INVALID_INPUT,
+            details={"cursor": cursor},
+        )
+        try:
+            values = decode_cursor(cursor)
+        except InvalidCursorError as exc:
+            raise invalid_cursor_error from exc
+
+        column_names = ("id",) if column_name == "id" else (column_name, "id")
+        if len(values) != len(column_names):
+            raise invalid_cursor_error
+        for name, value in zip(column_names, values, strict=True):
+            if not isinstance(value, self._get_column(name, model=model).type.python_type):
+                raise invalid_cursor_error
+        return values
+
+    def _build_keyset_condition(
+        self,
+        sort: str,
+        values: tuple[CursorValue, ...],
+        *,
+        model: type[Base] | None = None,
+    ) -> ColumnElement[bool]:
+        column_name, descending = self._parse_sort(sort)
+        column = self._get_column(column_name, model=model)
+        if column_name == "id":
+            return column < values[0] if descending else column > values[0]
+
+        sort_value, id_value = values
+        id_column = self._get_column("id", model=model)
+        return or_(
+            column < sort_value if descending else column > sort_value,
+            and_(column == sort_value, id_column > id_value),
+        )
+
+    async def _paginate(
+        self,
+        query: Select[Any],
+        *,
+        page: PageRequest,
+        sort: str = DEFAULT_SORT,
+        model: type[Base] | None = None,
+    ) -> CursorPage[Any]:
+        if page.limit < 1:
+            raise RepositoryError("Limit must be greater than or equal to 1")
+
+        column_name, _ = self._parse_sort(sort)
+        if page.cursor is not None:
+            values = self._decode_page_cursor(page.cursor, column_name=column_name, model=model)
+            query = query.where(self._build_keyset_condition(sort, values, model=model))
+
+        limit = min(page.limit, MAX_LIST_LIMIT)
+        query = query.order_by(*self._build_sort_order(sort, model=model)).limit(limit + 1)
+        result = await self.session.execute(query)
+        rows = list(result.scalars().all())
+        if len(rows) <= limit:
+            return CursorPage(items=rows)
+
+        items = rows[:limit]
+        last_item = items[-1]
+        cursor_values = (last_item.id,) if column_name == "id" else (getattr(last_item, column_name), last_item.id)
+        return CursorPage(items=items, next_cursor=encode_cursor(cursor_values))
 
     def _build_query(
         self,
@@ -63,6 +151,24 @@ class BaseRepository[ModelType: Base]:
             query = query.order_by(*self._build_sort_order(sort))
         return query
 
+    def _supports_skip_locked(self) -> bool:
+        return self.session.get_bind().dialect.name != "sqlite"
+
+    async def _lock_for_claim(self, query: Select[tuple[ModelType]]) -> Select[tuple[ModelType]]:
+        if self._supports_skip_locked():
+            # Rows locked by another worker are skipped, so concurrent workers claim disjoint rows.
+            return query.with_for_update(skip_locked=True)
+
+        # SQLite has no row locks; an empty write takes the database write lock so workers claim one at a time.
+        primary_key = inspect(self.model).primary_key[0]
+        await self.session.execute(
+            update(self.model)
+            .where(false())
+            .values({primary_key: primary_key})
+            .execution_options(synchronize_session=False)
+        )
+        return query
+
     def _resolve_record_type[RecordType](
         self, record_type: type[SupportsFromDomain[RecordType]] | None
     ) -> type[SupportsFromDomain[RecordType]]:
@@ -87,6 +193,13 @@ class BaseRepository[ModelType: Base]:
         resolved_record_type = self._resolve_record_type(record_type)
         return [resolved_record_type.from_domain(payload) for payload in payloads]
 
+    def _to_record_page[RecordType](
+        self,
+        page: CursorPage[Any],
+        record_type: type[SupportsFromDomain[RecordType]] | None = None,
+    ) -> CursorPage[RecordType]:
+        return CursorPage(items=self._to_records(page.items, record_type), next_cursor=page.next_cursor)
+
     def build(self, **kwargs: Any) -> ModelType:
         return self.model(**kwargs)
 
@@ -123,6 +236,15 @@ class BaseRepository[ModelType: Base]:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def list_page(
+        self,
+        *,
+        page: PageRequest,
+        filters: Mapping[str, Any] | None = None,
+        sort: str = DEFAULT_SORT,
+    ) -> CursorPage[ModelType]:
+        return await self._paginate(self._build_query(filters=filters), page=page, sort=sort)
+
     async def update(self, entity: ModelType, **changes: Any) -> ModelType:
         for field, value in changes.items():
             self._get_column(field)
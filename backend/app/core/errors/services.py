@@ -56,6 +56,30 @@ class ConflictError(ServiceError):
         super().__init__(DomainErrorType.CONFLICT, message, details=details)
 
 
+class TooManyRequestsError(ServiceError):
+    def __init__(
+        self,
+        message: str = "Too many requests",
+        *,
+        details: Any | None = None,
+        retry_after_seconds: int | None = None,
+    ):
+        headers = {"Retry-After": str(retry_after_seconds)} if retry_after_seconds is not None else None
+        super().__init__(DomainErrorType.RATE_LIMITED, message, details=details, headers=headers)
+
+
+class ServiceUnavailableError(ServiceError):
+    def __init__(
+        self,
+        message: str = "Service temporarily unavailable",
+        *,
+        details: Any | None = None,
+        retry_after_seconds: int | None = None,
+    ):
+        headers = {"Retry-After": str(retry_after_seconds)} if retry_after_seconds is not None else None
+        super().__init__(DomainErrorType.SERVICE_UNAVAILABLE, message, details=details, headers=headers)
+
+
 class InternalError(ServiceError):
     def __init__(self, message: str = "Internal server error", *, details: Any | None = None):
         super().__init__(DomainErrorType.INTERNAL_ERROR, message, details=details)
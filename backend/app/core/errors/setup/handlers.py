@@ -16,6 +16,8 @@ ERROR_HTTP_STATUS_MAP: dict[DomainErrorType, int] = {
     DomainErrorType.FORBIDDEN: status.HTTP_403_FORBIDDEN,
     DomainErrorType.NOT_FOUND: status.HTTP_404_NOT_FOUND,
     DomainErrorType.CONFLICT: status.HTTP_409_CONFLICT,
+    DomainErrorType.RATE_LIMITED: status.HTTP_429_TOO_MANY_REQUESTS,
+    DomainErrorType.SERVICE_UNAVAILABLE: status.HTTP_503_SERVICE_UNAVAILABLE,
     DomainErrorType.INTERNAL_ERROR: status.HTTP_500_INTERNAL_SERVER_ERROR,
 }
 REQUEST_ID_HEADER = "X-Request-ID"
@@ -68,6 +70,10 @@ def map_status_to_error_type(status_code: int) -> DomainErrorType:
         return DomainErrorType.NOT_FOUND
     if status_code == status.HTTP_409_CONFLICT:
         return DomainErrorType.CONFLICT
+    if status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+        return DomainErrorType.RATE_LIMITED
+    if status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
+        return DomainErrorType.SERVICE_UNAVAILABLE
     if status_code in {status.HTTP_400_BAD_REQUEST, status.HTTP_422_UNPROCESSABLE_CONTENT}:
         return DomainErrorType.INVALID_INPUT
     return DomainErrorType.INTERNAL_ERROR
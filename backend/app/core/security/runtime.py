@@ -0,0 +1,69 @@
+from collections.abc import Callable
+from threading import RLock
+
+from app.core.config.settings import AuthSettings
+from app.core.security.service import (
+    Argon2PasswordService,
+    JwtTokenService,
+    PasswordHashingPool,
+    resolve_argon2_cost_profile,
+)
+
+
+class SecurityRuntime:
+    def __init__(self, settings_loader: Callable[[], AuthSettings] | None = None) -> None:
+        self._settings_loader = settings_loader or AuthSettings
+        self._auth_settings: AuthSettings | None = None
+        self._token_service: JwtTokenService | None = None
+        self._password_service: Argon2PasswordService | None = None
+        self._lock = RLock()
+
+    def get_auth_settings(self) -> AuthSettings:
+        if self._auth_settings is not None:
+            return self._auth_settings
+
+        with self._lock:
+            if self._auth_settings is None:
+                self._auth_settings = self._settings_loader()
+            return self._auth_settings
+
+    def get_token_service(self) -> JwtTokenService:
+        if self._token_service is not None:
+            return self._token_service
+
+        with self._lock:
+            if self._token_service is None:
+                self._token_service = JwtTokenService(self.get_auth_settings())
+            return self._token_service
+
+    def get_password_service(self) -> Argon2PasswordService:
+        if self._password_service is not None:
+            return self._password_service
+
+        with self._lock:
+            if self._password_service is None:
+                settings = self.get_auth_settings()
+                hashing_pool = PasswordHashingPool(
+                    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+                    max_queue_depth=settings.PASSWORD_HASH_MAX_QUEUE_DEPTH,
+                )
+                self._password_service = Argon2PasswordService(hashing_pool, resolve_argon2_cost_profile(settings))
+            return self._password_service
+
+    def reload(self) -> None:
+        # Instances already handed out keep their settings; the next lookup re-reads the environment.
+        with self._lock:
+            password_service = self._password_service
+            self._auth_settings = None
+            self._token_service = None
+            self._password_service = None
+        if password_service is not None:
+            # Hashes already queued still finish; the worker threads exit afterwards instead of leaking.
+            password_service.hashing_pool.shutdown(cancel_pending=False)
+
+
+security_runtime = SecurityRuntime()
+
+
+def reload_security_runtime() -> None:
+    security_runtime.reload()
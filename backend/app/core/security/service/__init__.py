@@ -1,2 +1,9 @@
-from app.core.security.service.password import Argon2PasswordService, PasswordServicePort
+from app.core.security.service.password import (
+    ARGON2_COST_PROFILES,
+    Argon2CostProfile,
+    Argon2PasswordService,
+    PasswordHashingPool,
+    PasswordServicePort,
+    resolve_argon2_cost_profile,
+)
 from app.core.security.service.token import JwtTokenService, TokenServicePort
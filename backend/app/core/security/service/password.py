@@ -1,24 +1,116 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
 from typing import Protocol
 
 from argon2 import PasswordHasher
 from argon2.exceptions import InvalidHashError, VerificationError, VerifyMismatchError
 
+from app.core.config.settings import AuthSettings
+from app.core.errors.services import ServiceUnavailableError
+
 
 class PasswordServicePort(Protocol):
-    def hash_password(self, plain_password: str) -> str: ...
+    async def hash_password(self, plain_password: str) -> str: ...
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool: ...
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool: ...
 
+    def needs_rehash(self, hashed_password: str) -> bool: ...
 
-class Argon2PasswordService:
-    def __init__(self):
-        self.password_hasher = PasswordHasher()
 
-    def hash_password(self, plain_password: str) -> str:
-        return self.password_hasher.hash(plain_password)
+@dataclass(frozen=True)
+class Argon2CostProfile:
+    time_cost: int
+    memory_cost_kib: int
+    parallelism: int
+
+
+ARGON2_COST_PROFILES: dict[str, Argon2CostProfile] = {
+    # OWASP minimum for Argon2id (19 MiB, 2 passes): for small hosts or very high login rates.
+    "low": Argon2CostProfile(time_cost=2, memory_cost_kib=19_456, parallelism=1),
+    # argon2-cffi defaults (RFC 9106 low-memory recommendation); existing hashes use these.
+    "default": Argon2CostProfile(time_cost=3, memory_cost_kib=65_536, parallelism=4),
+    "high": Argon2CostProfile(time_cost=4, memory_cost_kib=262_144, parallelism=4),
+}
+
+
+def resolve_argon2_cost_profile(settings: AuthSettings) -> Argon2CostProfile:
+    profile = ARGON2_COST_PROFILES[settings.PASSWORD_HASH_PROFILE]
+    return Argon2CostProfile(
+        time_cost=settings.PASSWORD_HASH_TIME_COST or profile.time_cost,
+        memory_cost_kib=settings.PASSWORD_HASH_MEMORY_COST_KIB or profile.memory_cost_kib,
+        parallelism=settings.PASSWORD_HASH_PARALLELISM or profile.parallelism,
+    )
+
+
+class PasswordHashingPool:
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 4,
+        max_queue_depth: int = 64,
+        retry_after_seconds: int = 1,
+    ) -> None:
+        # argon2-cffi releases the GIL while hashing, so threads hash in parallel without blocking the event loop.
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="password-hashing")
+        self._max_pending = max_concurrency + max_queue_depth
+        self._retry_after_seconds = retry_after_seconds
+        self._pending = 0
+        self._lock = Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def run[T](self, function: Callable[..., T], *args: object) -> T:
+        with self._lock:
+            if self._pending >= self._max_pending:
+                raise ServiceUnavailableError(
+                    message="Password hashing capacity exceeded. Retry shortly.",
+                    retry_after_seconds=self._retry_after_seconds,
+                )
+            self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def shutdown(self, *, cancel_pending: bool = True) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=cancel_pending)
+
+
+class Argon2PasswordService:
+    def __init__(
+        self,
+        hashing_pool: PasswordHashingPool | None = None,
+        cost_profile: Argon2CostProfile | None = None,
+    ):
+        cost_profile = cost_profile or ARGON2_COST_PROFILES["default"]
+        self.password_hasher = PasswordHasher(
+            time_cost=cost_profile.time_cost,
+            memory_cost=cost_profile.memory_cost_kib,
+            parallelism=cost_profile.parallelism,
+        )
+        self.hashing_pool = hashing_pool or PasswordHashingPool()
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    def _verify(self, plain_password: str, hashed_password: str) -> bool:
         try:
             return self.password_hasher.verify(hashed_password, plain_password)
         except VerifyMismatchError, VerificationError, InvalidHashError:
             return False
+
+    async def hash_password(self, plain_password: str) -> str:
+        return await self.hashing_pool.run(self.password_hasher.hash, plain_password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.hashing_pool.run(self._verify, plain_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # Parameters differing in either direction count, so lowering the profile also migrates stored hashes.
+        try:
+            return self.password_hasher.check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return False
@@ -7,7 +7,7 @@ from jwt import InvalidTokenError
 from pydantic import ValidationError
 
 from app.core.config.settings import AuthSettings
-from app.features.auth.schemas import AccessTokenPayload
+from app.features.auth.schemas import AccessTokenPayload, StatelessTokenClaims
 
 
 class TokenServicePort(Protocol):
@@ -17,6 +17,7 @@ class TokenServicePort(Protocol):
         *,
         rbac_version: str,
         expires_delta: timedelta | None = None,
+        stateless_claims: StatelessTokenClaims | None = None,
     ) -> str: ...
 
     def decode_access_token(self, token: str) -> AccessTokenPayload | None: ...
@@ -37,6 +38,7 @@ class JwtTokenService:
         *,
         rbac_version: str,
         expires_delta: timedelta | None = None,
+        stateless_claims: StatelessTokenClaims | None = None,
     ) -> str:
         expire_delta = expires_delta or timedelta(minutes=self.access_token_expire_minutes)
         issued_at = datetime.now(UTC)
@@ -50,6 +52,8 @@ class JwtTokenService:
             "jti": uuid4().hex,
             "rbac_version": rbac_version,
         }
+        if stateless_claims is not None:
+            payload.update(stateless_claims.model_dump())
         return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
 
     def decode_access_token(self, token: str) -> AccessTokenPayload | None:
@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.common.openapi import NEXT_CURSOR_HEADER
 from app.core.config.settings import ApiSettings
 
 
@@ -15,4 +16,5 @@ def configure_cors(app: FastAPI, settings: ApiSettings) -> None:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
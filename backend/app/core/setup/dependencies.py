@@ -3,19 +3,32 @@ from typing import Annotated, cast
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.authorization.snapshot_cache import AuthorizationSnapshotCachePort, get_authorization_snapshot_cache
 from app.core.config.settings import AuthSettings
 from app.core.db.database import get_async_session_factory
 from app.core.db.ports import UnitOfWorkPort
 from app.core.db.uow import UnitOfWork
-from app.core.security.service import Argon2PasswordService, JwtTokenService, PasswordServicePort, TokenServicePort
+from app.core.security.runtime import security_runtime
+from app.core.security.service import PasswordServicePort, TokenServicePort
+from app.core.setup.rate_limit import LoginRateLimiter, get_login_rate_limiter
 from app.features.audit_log.repository import AuditLogRepository
 from app.features.audit_log.service import AuditLogService, AuditLogServicePort
+from app.features.audit_log.writer import get_audit_log_writer
+from app.features.auth.rehash import get_password_rehasher
 from app.features.auth.repository import AuthRepository
-from app.features.auth.service import AuthService, AuthServicePort
+from app.features.auth.service import AuthService, AuthServicePort, PasswordRehasherPort, TokenWatermarkPort
+from app.features.auth.token_watermarks import get_token_watermark_table
+from app.features.jobs.repository import JobRepository
+from app.features.jobs.service import JobService
 from app.features.outbox.repository import OutboxRepository
 from app.features.outbox.service import OutboxService, OutboxServicePort
 from app.features.rbac.repository import RBACRepository
 from app.features.rbac.service import RBACService, RBACServicePort
+from app.features.search.repository import SearchRepository
+from app.features.search.service import SearchService
+from app.integrations.audit import AuditLogWriterPort
+from app.integrations.jobs import JobSchedulerPort
+from app.integrations.search import SearchIndexPort
 
 PermissionScopeCache = dict[tuple[int, str], str | None]
 _PERMISSION_SCOPE_CACHE_STATE_KEY = "_permission_scope_cache"
@@ -57,6 +70,37 @@ async def get_request_permission_scope_cache(request: Request) -> PermissionScop
 PermissionScopeCacheDependency = Annotated[PermissionScopeCache, Depends(get_request_permission_scope_cache)]
 
 
+async def get_request_authorization_snapshot_cache() -> AuthorizationSnapshotCachePort:
+    return get_authorization_snapshot_cache()
+
+
+AuthorizationSnapshotCacheDependency = Annotated[
+    AuthorizationSnapshotCachePort,
+    Depends(get_request_authorization_snapshot_cache),
+]
+
+
+async def get_request_audit_log_writer() -> AuditLogWriterPort:
+    return get_audit_log_writer()
+
+
+AuditLogWriterDependency = Annotated[AuditLogWriterPort, Depends(get_request_audit_log_writer)]
+
+
+async def get_request_login_rate_limiter() -> LoginRateLimiter:
+    return get_login_rate_limiter()
+
+
+LoginRateLimiterDependency = Annotated[LoginRateLimiter, Depends(get_request_login_rate_limiter)]
+
+
+async def get_request_password_rehasher() -> PasswordRehasherPort:
+    return get_password_rehasher()
+
+
+PasswordRehasherDependency = Annotated[PasswordRehasherPort, Depends(get_request_password_rehasher)]
+
+
 async def get_auth_repository(session: DbSessionDependency):
     return AuthRepository(session=session)
 
@@ -85,27 +129,50 @@ async def get_outbox_repository(session: DbSessionDependency):
 OutboxRepositoryDependency = Annotated[OutboxRepository, Depends(get_outbox_repository)]
 
 
+async def get_job_repository(session: DbSessionDependency):
+    return JobRepository(session=session)
+
+
+JobRepositoryDependency = Annotated[JobRepository, Depends(get_job_repository)]
+
+
+async def get_search_repository(session: DbSessionDependency):
+    return SearchRepository(session=session)
+
+
+SearchRepositoryDependency = Annotated[SearchRepository, Depends(get_search_repository)]
+
+
 async def get_auth_settings() -> AuthSettings:
-    return AuthSettings()
+    return security_runtime.get_auth_settings()
 
 
 AuthSettingsDependency = Annotated[AuthSettings, Depends(get_auth_settings)]
 
 
 async def get_password_service() -> PasswordServicePort:
-    return Argon2PasswordService()
+    return security_runtime.get_password_service()
 
 
 PasswordServiceDependency = Annotated[PasswordServicePort, Depends(get_password_service)]
 
 
-async def get_token_service(auth_settings: AuthSettingsDependency) -> TokenServicePort:
-    return JwtTokenService(auth_settings)
+async def get_token_service() -> TokenServicePort:
+    return security_runtime.get_token_service()
 
 
 TokenServiceDependency = Annotated[TokenServicePort, Depends(get_token_service)]
 
 
+async def get_request_token_watermarks(auth_settings: AuthSettingsDependency) -> TokenWatermarkPort | None:
+    if not auth_settings.AUTH_STATELESS_TOKENS_ENABLED:
+        return None
+    return get_token_watermark_table()
+
+
+TokenWatermarkDependency = Annotated[TokenWatermarkPort | None, Depends(get_request_token_watermarks)]
+
+
 async def get_auth_service(
     auth_repository: AuthRepositoryDependency,
     auth_settings: AuthSettingsDependency,
@@ -113,6 +180,9 @@ async def get_auth_service(
     password_service: PasswordServiceDependency,
     unit_of_work: UnitOfWorkDependency,
     permission_scope_cache: PermissionScopeCacheDependency,
+    authorization_snapshot_cache: AuthorizationSnapshotCacheDependency,
+    password_rehasher: PasswordRehasherDependency,
+    token_watermarks: TokenWatermarkDependency,
 ) -> AuthServicePort:
     return AuthService(
         auth_repository=auth_repository,
@@ -121,6 +191,9 @@ async def get_auth_service(
         token_service=token_service,
         password_service=password_service,
         permission_scope_cache=permission_scope_cache,
+        authorization_snapshot_cache=authorization_snapshot_cache,
+        password_rehasher=password_rehasher,
+        token_watermarks=token_watermarks,
     )
 
 
@@ -130,10 +203,16 @@ AuthServiceDependency = Annotated[AuthServicePort, Depends(get_auth_service)]
 async def get_rbac_service(
     rbac_repository: RBACRepositoryDependency,
     unit_of_work: UnitOfWorkDependency,
+    authorization_snapshot_cache: AuthorizationSnapshotCacheDependency,
+    audit_log_writer: AuditLogWriterDependency,
+    password_service: PasswordServiceDependency,
 ) -> RBACServicePort:
     return RBACService(
         rbac_repository=rbac_repository,
         unit_of_work=unit_of_work,
+        authorization_snapshot_cache=authorization_snapshot_cache,
+        audit_log_writer=audit_log_writer,
+        password_service=password_service,
     )
 
 
@@ -160,3 +239,29 @@ async def get_outbox_service(
 
 
 OutboxServiceDependency = Annotated[OutboxServicePort, Depends(get_outbox_service)]
+
+
+async def get_job_scheduler(
+    job_repository: JobRepositoryDependency,
+    unit_of_work: UnitOfWorkDependency,
+) -> JobSchedulerPort:
+    return JobService(
+        job_repository=job_repository,
+        unit_of_work=unit_of_work,
+    )
+
+
+JobSchedulerDependency = Annotated[JobSchedulerPort, Depends(get_job_scheduler)]
+
+
+async def get_search_index(
+    search_repository: SearchRepositoryDependency,
+    unit_of_work: UnitOfWorkDependency,
+) -> SearchIndexPort:
+    return SearchService(
+        search_repository=search_repository,
+        unit_of_work=unit_of_work,
+    )
+
+
+SearchIndexDependency = Annotated[SearchIndexPort, Depends(get_search_index)]
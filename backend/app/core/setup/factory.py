@@ -12,8 +12,13 @@ from pydantic import ValidationError
 from app.core.common.openapi import normalize_generated_openapi_schema
 from app.core.config.settings import ApiSettings, AuthSettings
 from app.core.errors.setup.handlers import REQUEST_ID_HEADER, configure_exception_handlers
+from app.core.security.runtime import reload_security_runtime, security_runtime
 from app.core.setup.cors import configure_cors
 from app.core.setup.routers import configure_routers
+from app.features.audit_log.writer import get_audit_log_writer
+from app.features.auth.rehash import get_password_rehasher, reset_password_rehasher
+from app.features.auth.token_watermarks import get_token_watermark_table
+from app.features.search.tracking import install_search_change_tracking
 
 
 def _build_openapi_schema(app: FastAPI) -> dict[str, Any]:
@@ -117,8 +122,21 @@ def configure_request_context_middleware(app: FastAPI) -> None:
 async def app_lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger = logging.getLogger("app.lifecycle")
     validate_auth_settings()
+    reload_security_runtime()
+    # The rehasher keeps the password service it was built with, so it is rebuilt on top of the reloaded one.
+    reset_password_rehasher()
+    audit_log_writer = get_audit_log_writer()
+    await audit_log_writer.start()
+    token_watermark_table = None
+    if security_runtime.get_auth_settings().AUTH_STATELESS_TOKENS_ENABLED:
+        token_watermark_table = get_token_watermark_table()
+        await token_watermark_table.start()
     logger.info("Backend startup.")
     yield
+    if token_watermark_table is not None:
+        await token_watermark_table.stop()
+    await get_password_rehasher().drain()
+    await audit_log_writer.stop()
     logger.info("Backend shutdown.")
 
 
@@ -131,5 +149,6 @@ def create_app(settings: ApiSettings | None = None) -> FastAPI:
     configure_cors(app, api_settings)
     configure_exception_handlers(app)
     configure_routers(app)
+    install_search_change_tracking()
 
     return app
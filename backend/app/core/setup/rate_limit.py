@@ -0,0 +1,135 @@
+import logging
+import math
+from collections.abc import Callable
+from threading import RLock
+
+from app.core.common.integration import TakeRateLimitTokenCommand
+from app.core.common.observability import log_layer_event
+from app.core.config.settings import RateLimitSettings
+from app.core.db.database import get_async_session_factory
+from app.core.errors.services import TooManyRequestsError
+from app.core.security.policies import UsernamePolicyError, normalize_username
+from app.features.rate_limit.store import DatabaseRateLimitStore
+from app.integrations.local_rate_limit import InMemoryRateLimitStore
+from app.integrations.rate_limit import RateLimitStorePort
+
+logger = logging.getLogger("app.rate_limit")
+
+
+class LoginRateLimiter:
+    def __init__(
+        self,
+        store: RateLimitStorePort,
+        *,
+        user_burst: int,
+        user_per_minute: float,
+        ip_burst: int,
+        ip_per_minute: float,
+        enabled: bool = True,
+    ) -> None:
+        self._store = store
+        self._user_burst = user_burst
+        self._user_refill_per_second = user_per_minute / 60
+        self._ip_burst = ip_burst
+        self._ip_refill_per_second = ip_per_minute / 60
+        self._enabled = enabled
+
+    @staticmethod
+    def _username_key(username: str) -> str:
+        try:
+            return normalize_username(username)
+        except UsernamePolicyError:
+            return username.strip().lower()
+
+    async def check(self, *, username: str, client_ip: str | None) -> None:
+        if not self._enabled:
+            return
+
+        # The IP bucket is checked first so a sprayed attempt never spends the targeted user's tokens.
+        commands: list[TakeRateLimitTokenCommand] = []
+        if client_ip:
+            commands.append(
+                TakeRateLimitTokenCommand(
+                    key=f"login:ip:{client_ip}",
+                    capacity=self._ip_burst,
+                    refill_per_second=self._ip_refill_per_second,
+                )
+            )
+        commands.append(
+            TakeRateLimitTokenCommand(
+                key=f"login:user:{self._username_key(username)}"[:255],
+                capacity=self._user_burst,
+                refill_per_second=self._user_refill_per_second,
+            )
+        )
+
+        for command in commands:
+            decision = await self._store.take(command)
+            if decision.allowed:
+                continue
+            retry_after_seconds = max(1, math.ceil(decision.retry_after_seconds))
+            log_layer_event(
+                logger,
+                layer="setup",
+                event="login_rate_limited",
+                level=logging.WARNING,
+                key=command.key,
+                retry_after_seconds=retry_after_seconds,
+            )
+            raise TooManyRequestsError(
+                message="Too many login attempts. Retry later.",
+                retry_after_seconds=retry_after_seconds,
+            )
+
+
+def build_rate_limit_store(settings: RateLimitSettings) -> RateLimitStorePort:
+    if settings.LOGIN_RATE_LIMIT_STORE == "database":
+        return DatabaseRateLimitStore(
+            session_factory=get_async_session_factory(),
+            prune_interval_seconds=settings.LOGIN_RATE_LIMIT_PRUNE_INTERVAL_SECONDS,
+        )
+    return InMemoryRateLimitStore(max_keys=settings.LOGIN_RATE_LIMIT_MAX_KEYS)
+
+
+class LoginRateLimiterRuntime:
+    def __init__(
+        self,
+        settings_loader: Callable[[], RateLimitSettings] | None = None,
+        store_factory: Callable[[RateLimitSettings], RateLimitStorePort] = build_rate_limit_store,
+    ) -> None:
+        self._settings_loader = settings_loader or RateLimitSettings
+        self._store_factory = store_factory
+        self._limiter: LoginRateLimiter | None = None
+        self._lock = RLock()
+
+    def get_limiter(self) -> LoginRateLimiter:
+        if self._limiter is not None:
+            return self._limiter
+
+        with self._lock:
+            if self._limiter is None:
+                settings = self._settings_loader()
+                self._limiter = LoginRateLimiter(
+                    self._store_factory(settings),
+                    user_burst=settings.LOGIN_RATE_LIMIT_USER_BURST,
+                    user_per_minute=settings.LOGIN_RATE_LIMIT_USER_PER_MINUTE,
+                    ip_burst=settings.LOGIN_RATE_LIMIT_IP_BURST,
+                    ip_per_minute=settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE,
+                    enabled=settings.LOGIN_RATE_LIMIT_ENABLED,
+                )
+            return self._limiter
+
+    def reset(self) -> None:
+        with self._lock:
+            self._limiter = None
+
+
+login_rate_limiter_runtime = LoginRateLimiterRuntime()
+
+
+def get_login_rate_limiter() -> LoginRateLimiter:
+    return login_rate_limiter_runtime.get_limiter()
+
+
+def reset_login_rate_limiter() -> None:
+    login_rate_limiter_runtime.reset()
@@ -6,7 +6,12 @@ from app.core.db.base import BaseModel
 
 class AuditLogEntry(BaseModel):
     __tablename__ = "audit_log_entries"
-    __table_args__ = (Index("ix_audit_log_entries_created_at_id", "created_at", "id"),)
+    __table_args__ = (
+        Index("ix_audit_log_entries_created_at_id", "created_at", "id"),
+        Index("ix_audit_log_entries_actor_user_id_created_at_id", "actor_user_id", "created_at", "id"),
+        Index("ix_audit_log_entries_action_created_at_id", "action", "created_at", "id"),
+        Index("ix_audit_log_entries_resource_type_created_at_id", "resource_type", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     actor_user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
@@ -1,16 +1,59 @@
-from typing import Any
+from datetime import datetime
+from typing import Annotated, Any
 
-from fastapi import status
+from fastapi import Query, status
 
 from app.core.authorization import PermissionId
-from app.core.common.openapi import INTERNAL_ERROR_EXAMPLE, build_error_response
+from app.core.common.openapi import INTERNAL_ERROR_EXAMPLE, NEXT_CURSOR_RESPONSE_HEADER, build_error_response
+from app.features.audit_log.service import DEFAULT_AUDIT_LOG_LIMIT, MAX_AUDIT_LOG_LIMIT
+
+AuditLogLimitQuery = Annotated[
+    int,
+    Query(ge=1, le=MAX_AUDIT_LOG_LIMIT, description="Maximum number of entries to return.", examples=[50]),
+]
+
+AuditLogBeforeQuery = Annotated[
+    str | None,
+    Query(
+        min_length=1,
+        max_length=512,
+        description="Opaque cursor copied from the `X-Next-Cursor` header; returns entries older than that page.",
+    ),
+]
+
+AuditLogActorUserIdQuery = Annotated[
+    int | None,
+    Query(ge=1, description="Only entries recorded for this actor user ID.", examples=[1]),
+]
+
+AuditLogActionQuery = Annotated[
+    str | None,
+    Query(min_length=1, max_length=100, description="Only entries with this action.", examples=["user.created"]),
+]
+
+AuditLogResourceTypeQuery = Annotated[
+    str | None,
+    Query(min_length=1, max_length=100, description="Only entries for this resource type.", examples=["user"]),
+]
+
+AuditLogCreatedFromQuery = Annotated[
+    datetime | None,
+    Query(description="Only entries created at or after this timestamp (inclusive)."),
+]
+
+AuditLogCreatedToQuery = Annotated[
+    datetime | None,
+    Query(description="Only entries created before this timestamp (exclusive)."),
+]
 
 GET_AUDIT_LOG_ENTRIES_DOC: dict[str, Any] = {
     "summary": "List audit log entries",
     "description": (
-        f"Return the most recent audit log entries for administrator review. Requires `{PermissionId.AUDIT_LOG_READ}`."
+        f"Return audit log entries newest first for administrator review. Requires `{PermissionId.AUDIT_LOG_READ}`. "
+        f"Returns at most `limit` entries (default {DEFAULT_AUDIT_LOG_LIMIT}); pass the `X-Next-Cursor` response "
+        "header back as `before` to read older entries with the same filters."
     ),
-    "response_description": "Most recent audit log entries.",
+    "response_description": "Audit log entries ordered by newest first.",
     "responses": {
         status.HTTP_200_OK: {
             "description": "Audit log entries returned.",
@@ -29,7 +72,17 @@ GET_AUDIT_LOG_ENTRIES_DOC: dict[str, Any] = {
                     ]
                 }
             },
+            "headers": NEXT_CURSOR_RESPONSE_HEADER,
         },
+        status.HTTP_400_BAD_REQUEST: build_error_response(
+            description="Invalid cursor, filter, or limit.",
+            example={
+                "detail": "Invalid pagination cursor",
+                "status": 400,
+                "code": "invalid_input",
+                "meta": {"before": "not-a-cursor"},
+            },
+        ),
         status.HTTP_401_UNAUTHORIZED: build_error_response(
             description="Missing, expired, or invalid token.",
             example={
@@ -1,16 +1,65 @@
-from sqlalchemy import select
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.common.integration import RecordAuditEntryCommand
 from app.core.db.repository_base import BaseRepository
 from app.features.audit_log.models import AuditLogEntry
-from app.features.audit_log.schemas.app import AuditLogEntryResult
+from app.features.audit_log.schemas.app import AuditLogEntryFilters, AuditLogEntryResult
 
 
 class AuditLogRepository(BaseRepository[AuditLogEntry]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, AuditLogEntry, default_record_type=AuditLogEntryResult)
 
-    async def list_recent_entries(self, *, limit: int) -> list[AuditLogEntryResult]:
-        query = select(AuditLogEntry).order_by(AuditLogEntry.created_at.desc(), AuditLogEntry.id.desc()).limit(limit)
+    @staticmethod
+    def _build_filter_conditions(filters: AuditLogEntryFilters) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = []
+        if filters.actor_user_id is not None:
+            conditions.append(AuditLogEntry.actor_user_id == filters.actor_user_id)
+        if filters.action is not None:
+            conditions.append(AuditLogEntry.action == filters.action)
+        if filters.resource_type is not None:
+            conditions.append(AuditLogEntry.resource_type == filters.resource_type)
+        if filters.created_from is not None:
+            conditions.append(AuditLogEntry.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            conditions.append(AuditLogEntry.created_at < filters.created_to)
+        return conditions
+
+    async def list_entries(
+        self,
+        *,
+        filters: AuditLogEntryFilters,
+        limit: int,
+        before: tuple[datetime, int] | None = None,
+    ) -> list[AuditLogEntryResult]:
+        query = select(AuditLogEntry).where(*self._build_filter_conditions(filters))
+        if before is not None:
+            # Row-value comparison keeps the seek on the (created_at, id) index prefixes.
+            query = query.where(tuple_(AuditLogEntry.created_at, AuditLogEntry.id) < tuple_(*before))
+
+        query = query.order_by(AuditLogEntry.created_at.desc(), AuditLogEntry.id.desc()).limit(limit)
         result = await self.session.execute(query)
         return self._to_records(list(result.scalars().all()))
+
+    async def insert_entries(self, entries: Sequence[RecordAuditEntryCommand]) -> int:
+        if not entries:
+            return 0
+
+        rows = [
+            {
+                "actor_user_id": entry.actor_user_id,
+                "action": entry.action,
+                "resource_type": entry.resource_type,
+                "resource_id": entry.resource_id,
+                "summary": entry.summary,
+                "created_at": entry.occurred_at,
+                "updated_at": entry.occurred_at,
+            }
+            for entry in entries
+        ]
+        await self.session.execute(insert(AuditLogEntry).values(rows))
+        return len(rows)
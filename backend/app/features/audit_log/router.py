@@ -1,9 +1,21 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
+from app.core.common.openapi import NEXT_CURSOR_HEADER
 from app.core.setup.dependencies import AuditLogServiceDependency
 from app.features.audit_log.dependencies import AuditLogReadAuth
-from app.features.audit_log.openapi import GET_AUDIT_LOG_ENTRIES_DOC
+from app.features.audit_log.openapi import (
+    GET_AUDIT_LOG_ENTRIES_DOC,
+    AuditLogActionQuery,
+    AuditLogActorUserIdQuery,
+    AuditLogBeforeQuery,
+    AuditLogCreatedFromQuery,
+    AuditLogCreatedToQuery,
+    AuditLogLimitQuery,
+    AuditLogResourceTypeQuery,
+)
 from app.features.audit_log.schemas.api import AuditLogEntryResponse
+from app.features.audit_log.schemas.app import AuditLogEntryFilters
+from app.features.audit_log.service import DEFAULT_AUDIT_LOG_LIMIT
 
 router = APIRouter(
     prefix="/audit-log",
@@ -15,6 +27,23 @@ router = APIRouter(
 async def list_audit_log_entries(
     audit_log_service: AuditLogServiceDependency,
     _authorized_user: AuditLogReadAuth,
+    response: Response,
+    limit: AuditLogLimitQuery = DEFAULT_AUDIT_LOG_LIMIT,
+    before: AuditLogBeforeQuery = None,
+    actor_user_id: AuditLogActorUserIdQuery = None,
+    action: AuditLogActionQuery = None,
+    resource_type: AuditLogResourceTypeQuery = None,
+    created_from: AuditLogCreatedFromQuery = None,
+    created_to: AuditLogCreatedToQuery = None,
 ) -> list[AuditLogEntryResponse]:
-    entries = await audit_log_service.list_recent_entries()
-    return [AuditLogEntryResponse.model_validate(entry) for entry in entries]
+    filters = AuditLogEntryFilters(
+        actor_user_id=actor_user_id,
+        action=action,
+        resource_type=resource_type,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    entry_page = await audit_log_service.list_entries(filters, limit=limit, before=before)
+    if entry_page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = entry_page.next_cursor
+    return [AuditLogEntryResponse.model_validate(entry) for entry in entry_page.items]
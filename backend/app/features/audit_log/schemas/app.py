@@ -15,3 +15,13 @@ class AuditLogEntryResult(ApplicationSchema):
     created_at: datetime
 
     model_config = ConfigDict(frozen=True, from_attributes=True)
+
+
+class AuditLogEntryFilters(ApplicationSchema):
+    actor_user_id: int | None = None
+    action: str | None = None
+    resource_type: str | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+    model_config = ConfigDict(frozen=True)
@@ -1,24 +1,92 @@
+from datetime import datetime
 from typing import Protocol
 
-from app.features.audit_log.schemas.app import AuditLogEntryResult
+from app.core.common.pagination import CursorPage, InvalidCursorError, decode_cursor, encode_cursor
+from app.core.errors.services import InvalidInputError
+from app.features.audit_log.schemas.app import AuditLogEntryFilters, AuditLogEntryResult
 
 DEFAULT_AUDIT_LOG_LIMIT = 50
 MAX_AUDIT_LOG_LIMIT = 100
 
 
 class AuditLogRepositoryPort(Protocol):
-    async def list_recent_entries(self, *, limit: int) -> list[AuditLogEntryResult]: ...
+    async def list_entries(
+        self,
+        *,
+        filters: AuditLogEntryFilters,
+        limit: int,
+        before: tuple[datetime, int] | None = None,
+    ) -> list[AuditLogEntryResult]: ...
 
 
 class AuditLogServicePort(Protocol):
-    async def list_recent_entries(self) -> list[AuditLogEntryResult]: ...
+    async def list_entries(
+        self,
+        filters: AuditLogEntryFilters | None = None,
+        *,
+        limit: int = DEFAULT_AUDIT_LOG_LIMIT,
+        before: str | None = None,
+    ) -> CursorPage[AuditLogEntryResult]: ...
 
 
 class AuditLogService:
     def __init__(self, audit_log_repository: AuditLogRepositoryPort):
         self.audit_log_repository = audit_log_repository
 
-    async def list_recent_entries(self) -> list[AuditLogEntryResult]:
-        return await self.audit_log_repository.list_recent_entries(
-            limit=min(DEFAULT_AUDIT_LOG_LIMIT, MAX_AUDIT_LOG_LIMIT)
+    @staticmethod
+    def _decode_before_cursor(before: str) -> tuple[datetime, int]:
+        invalid_cursor_error = InvalidInputError(message="Invalid pagination cursor", details={"before": before})
+        try:
+            values = decode_cursor(before)
+        except InvalidCursorError as exc:
+            raise invalid_cursor_error from exc
+
+        if len(values) != 2 or not isinstance(values[0], str) or not isinstance(values[1], int):
+            raise invalid_cursor_error
+        try:
+            return datetime.fromisoformat(values[0]), values[1]
+        except ValueError as exc:
+            raise invalid_cursor_error from exc
+
+    @staticmethod
+    def _encode_before_cursor(entry: AuditLogEntryResult) -> str:
+        return encode_cursor((entry.created_at.isoformat(), entry.id))
+
+    @staticmethod
+    def _validate_filters(filters: AuditLogEntryFilters) -> None:
+        if (
+            filters.created_from is not None
+            and filters.created_to is not None
+            and filters.created_from >= filters.created_to
+        ):
+            raise InvalidInputError(
+                message="created_from must be earlier than created_to",
+                details={
+                    "created_from": filters.created_from.isoformat(),
+                    "created_to": filters.created_to.isoformat(),
+                },
+            )
+
+    async def list_entries(
+        self,
+        filters: AuditLogEntryFilters | None = None,
+        *,
+        limit: int = DEFAULT_AUDIT_LOG_LIMIT,
+        before: str | None = None,
+    ) -> CursorPage[AuditLogEntryResult]:
+        resolved_filters = filters or AuditLogEntryFilters()
+        self._validate_filters(resolved_filters)
+        if limit < 1:
+            raise InvalidInputError(message="limit must be greater than or equal to 1", details={"limit": limit})
+
+        page_size = min(limit, MAX_AUDIT_LOG_LIMIT)
+        entries = await self.audit_log_repository.list_entries(
+            filters=resolved_filters,
+            limit=page_size + 1,
+            before=self._decode_before_cursor(before) if before is not None else None,
         )
+        if len(entries) <= page_size:
+            return CursorPage(items=entries)
+
+        page_entries = entries[:page_size]
+        return CursorPage(items=page_entries, next_cursor=self._encode_before_cursor(page_entries[-1]))
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import suppress
+from threading import RLock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.integration import RecordAuditEntryCommand
+from app.core.common.observability import log_layer_event
+from app.core.config.settings import AuditLogSettings
+from app.core.db.database import get_async_session_factory
+from app.core.db.uow import UnitOfWork
+from app.features.audit_log.repository import AuditLogRepository
+
+logger = logging.getLogger("app.audit_log")
+
+
+class AuditLogWriter:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        max_queue_size: int = 1_000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        enqueue_timeout_seconds: float = 0.05,
+        max_write_attempts: int = 5,
+        retry_backoff_seconds: float = 0.1,
+        max_retry_backoff_seconds: float = 5.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._enqueue_timeout_seconds = enqueue_timeout_seconds
+        self._max_write_attempts = max_write_attempts
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._max_retry_backoff_seconds = max_retry_backoff_seconds
+        self._stopping = False
+        self._queue: asyncio.Queue[RecordAuditEntryCommand] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+
+        # The queue is bound to the running loop, so each start gets a fresh one.
+        self._stopping = False
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._worker = asyncio.create_task(self._run(self._queue), name="audit-log-writer")
+
+    async def stop(self) -> None:
+        worker = self._worker
+        if worker is None:
+            return
+
+        # Batches still pending get one more attempt each instead of holding shutdown through the full backoff.
+        self._stopping = True
+        await self.flush()
+        worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await worker
+        self._queue = None
+        self._worker = None
+
+    async def flush(self) -> None:
+        if self._queue is not None and self.running:
+            await self._queue.join()
+
+    async def record(self, entry: RecordAuditEntryCommand) -> None:
+        if self._queue is None or not self.running:
+            await self._write_durably([entry], reason="writer_not_running")
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.put(entry), timeout=self._enqueue_timeout_seconds)
+        except TimeoutError:
+            await self._write_durably([entry], reason="queue_full")
+
+    async def _collect_batch(self, queue: asyncio.Queue[RecordAuditEntryCommand]) -> list[RecordAuditEntryCommand]:
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval_seconds
+        while len(batch) < self._batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+
+            remaining_seconds = max(deadline - loop.time(), 0)
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining_seconds))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self, queue: asyncio.Queue[RecordAuditEntryCommand]) -> None:
+        while True:
+            batch = await self._collect_batch(queue)
+            try:
+                await self._write_durably(batch, reason="batch")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write_batch(self, entries: list[RecordAuditEntryCommand]) -> int:
+        async with self._session_factory() as session, UnitOfWork(session=session):
+            return await AuditLogRepository(session=session).insert_entries(entries)
+
+    async def _write_durably(self, entries: list[RecordAuditEntryCommand], *, reason: str) -> None:
+        attempt = 1
+        backoff_seconds = self._retry_backoff_seconds
+        while True:
+            try:
+                written_count = await self._write_batch(entries)
+                break
+            except Exception:
+                logger.exception(
+                    "event=audit_log_write_failed layer=infrastructure entry_count=%s reason=%s attempt=%s",
+                    len(entries),
+                    reason,
+                    attempt,
+                )
+                if attempt >= self._max_write_attempts or self._stopping:
+                    logger.error(
+                        "event=audit_log_entries_dropped layer=infrastructure entry_count=%s reason=%s actions=%s",
+                        len(entries),
+                        reason,
+                        ",".join(entry.action for entry in entries),
+                    )
+                    return
+
+            await asyncio.sleep(backoff_seconds)
+            backoff_seconds = min(backoff_seconds * 2, self._max_retry_backoff_seconds)
+            attempt += 1
+
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="audit_log_entries_written",
+            entry_count=written_count,
+            reason=reason,
+            attempt=attempt,
+        )
+
+
+def _create_async_session() -> AsyncSession:
+    return get_async_session_factory()()
+
+
+class AuditLogWriterRuntime:
+    def __init__(
+        self,
+        settings_loader: Callable[[], AuditLogSettings] | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        self._settings_loader = settings_loader or AuditLogSettings
+        self._session_factory = session_factory or _create_async_session
+        self._writer: AuditLogWriter | None = None
+        self._lock = RLock()
+
+    def get_writer(self) -> AuditLogWriter:
+        if self._writer is not None:
+            return self._writer
+
+        with self._lock:
+            if self._writer is None:
+                settings = self._settings_loader()
+                self._writer = AuditLogWriter(
+                    session_factory=self._session_factory,
+                    max_queue_size=settings.AUDIT_LOG_QUEUE_MAX_SIZE,
+                    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+                    flush_interval_seconds=settings.AUDIT_LOG_FLUSH_INTERVAL_SECONDS,
+                    enqueue_timeout_seconds=settings.AUDIT_LOG_ENQUEUE_TIMEOUT_SECONDS,
+                    max_write_attempts=settings.AUDIT_LOG_WRITE_MAX_ATTEMPTS,
+                    retry_backoff_seconds=settings.AUDIT_LOG_WRITE_RETRY_BACKOFF_SECONDS,
+                )
+            return self._writer
+
+    def reset(self) -> None:
+        with self._lock:
+            self._writer = None
+
+
+audit_log_writer_runtime = AuditLogWriterRuntime()
+
+
+def get_audit_log_writer() -> AuditLogWriter:
+    return audit_log_writer_runtime.get_writer()
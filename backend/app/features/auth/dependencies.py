@@ -1,10 +1,10 @@
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
 from app.core.errors.services import ForbiddenError
-from app.core.setup.dependencies import AuthServiceDependency
+from app.core.setup.dependencies import AuthServiceDependency, LoginRateLimiterDependency
 from app.features.auth.principal import CurrentPrincipal
 from app.features.auth.schemas import LoginCredentialsRequest
 
@@ -19,6 +19,18 @@ async def get_auth_credentials(form_data: Annotated[OAuth2PasswordRequestForm, D
 AuthCredentialsDependency = Annotated[LoginCredentialsRequest, Depends(get_auth_credentials)]
 
 
+async def enforce_login_rate_limit(
+    request: Request,
+    credentials: AuthCredentialsDependency,
+    login_rate_limiter: LoginRateLimiterDependency,
+) -> None:
+    client_ip = request.client.host if request.client is not None else None
+    await login_rate_limiter.check(username=credentials.username, client_ip=client_ip)
+
+
+LoginRateLimitDependency = Annotated[None, Depends(enforce_login_rate_limit)]
+
+
 async def get_current_user(
     token: BearerTokenDependency,
     auth_service: AuthServiceDependency,
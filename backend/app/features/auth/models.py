@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Integer, String
+from sqlalchemy import Boolean, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db.base import BaseModel
@@ -6,9 +6,29 @@ from app.core.db.base import BaseModel
 
 class User(BaseModel):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_disabled_username_id", "disabled", "username", "id"),
+        Index("ix_users_tenant_id_username_id", "tenant_id", "username", "id"),
+        Index("ix_users_updated_at", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     username: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     disabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     tenant_id: Mapped[int | None] = mapped_column(Integer, nullable=True, default=None)
+    rbac_version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
+
+# Username search: trigrams serve substring matches, text_pattern_ops serves the short prefix matches.
+Index(
+    "ix_users_username_lower_trgm",
+    func.lower(User.username).label("username_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"username_lower": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_users_username_lower_pattern",
+    func.lower(User.username).label("username_lower"),
+    postgresql_ops={"username_lower": "text_pattern_ops"},
+).ddl_if(dialect="postgresql")
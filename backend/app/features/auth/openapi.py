@@ -2,7 +2,7 @@ from typing import Annotated, Any
 
 from fastapi import Body, status
 
-from app.core.common.openapi import INTERNAL_ERROR_EXAMPLE, build_error_response
+from app.core.common.openapi import INTERNAL_ERROR_EXAMPLE, PASSWORD_HASHING_UNAVAILABLE_EXAMPLE, build_error_response
 from app.features.auth.schemas import RegisterUserRequest, UpdateCurrentUserRequest
 
 TOKEN_RESPONSE_EXAMPLE: dict[str, Any] = {
@@ -106,10 +106,24 @@ LOGIN_FOR_ACCESS_TOKEN_DOC: dict[str, Any] = {
                 "code": "forbidden",
             },
         ),
+        status.HTTP_429_TOO_MANY_REQUESTS: build_error_response(
+            description="Too many login attempts for this username or client IP; retry after the `Retry-After` delay.",
+            example={
+                "detail": "Too many login attempts. Retry later.",
+                "status": 429,
+                "code": "rate_limited",
+            },
+            include_retry_after=True,
+        ),
         status.HTTP_500_INTERNAL_SERVER_ERROR: build_error_response(
             description="Unhandled internal server error.",
             example=INTERNAL_ERROR_EXAMPLE,
         ),
+        status.HTTP_503_SERVICE_UNAVAILABLE: build_error_response(
+            description="Password hashing is at capacity; retry after the `Retry-After` delay.",
+            example=PASSWORD_HASHING_UNAVAILABLE_EXAMPLE,
+            include_retry_after=True,
+        ),
     },
     "openapi_extra": {
         "requestBody": {
@@ -161,6 +175,11 @@ REGISTER_USER_DOC: dict[str, Any] = {
             description="Unhandled internal server error.",
             example=INTERNAL_ERROR_EXAMPLE,
         ),
+        status.HTTP_503_SERVICE_UNAVAILABLE: build_error_response(
+            description="Password hashing is at capacity; retry after the `Retry-After` delay.",
+            example=PASSWORD_HASHING_UNAVAILABLE_EXAMPLE,
+            include_retry_after=True,
+        ),
     },
 }
 
@@ -255,5 +274,10 @@ UPDATE_CURRENT_USER_DOC: dict[str, Any] = {
             description="Unhandled internal server error.",
             example=INTERNAL_ERROR_EXAMPLE,
         ),
+        status.HTTP_503_SERVICE_UNAVAILABLE: build_error_response(
+            description="Password hashing is at capacity; retry after the `Retry-After` delay.",
+            example=PASSWORD_HASHING_UNAVAILABLE_EXAMPLE,
+            include_retry_after=True,
+        ),
     },
 }
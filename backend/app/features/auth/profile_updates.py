@@ -16,6 +16,8 @@ class AuthProfileRepositoryPort(Protocol):
 
     async def update_user(self, user_id: int, **changes: Any) -> UserRecord: ...
 
+    async def replace_password_hash(self, user_id: int, *, current_hash: str, new_hash: str) -> bool: ...
+
 
 class AuthProfileUpdates:
     def __init__(
@@ -62,7 +64,7 @@ class AuthProfileUpdates:
 
         return normalized_username, {"username": normalized_username}
 
-    def build_password_change(
+    async def build_password_change(
         self,
         current_user: UserRecord,
         update_data: UpdateCurrentUserCommand,
@@ -74,23 +76,36 @@ class AuthProfileUpdates:
         if update_data.current_password is None:
             raise InvalidInputError(message="current_password is required to update password")
 
-        if not self._password_service.verify_password(update_data.current_password, current_user.hashed_password):
+        if not await self._password_service.verify_password(update_data.current_password, current_user.hashed_password):
             raise UnauthorizedError(message="Current password is invalid")
 
-        if self._password_service.verify_password(update_data.new_password, current_user.hashed_password):
+        if await self._password_service.verify_password(update_data.new_password, current_user.hashed_password):
             raise InvalidInputError(message="New password must be different from current password")
 
         self._validate_password_policy(update_data.new_password, normalized_username)
-        return {"hashed_password": self._password_service.hash_password(update_data.new_password)}
+        return {"hashed_password": await self._password_service.hash_password(update_data.new_password)}
 
     async def persist_user_changes(self, current_user: UserRecord, changes: dict[str, str]) -> UserRecord:
-        return await self._auth_repository.update_user(current_user.id, **changes)
+        remaining_changes = dict(changes)
+        new_hash = remaining_changes.pop("hashed_password", None)
+        # The current password was verified outside the transaction, so the hash is only replaced if it still matches.
+        if new_hash is not None and not await self._auth_repository.replace_password_hash(
+            current_user.id,
+            current_hash=current_user.hashed_password,
+            new_hash=new_hash,
+        ):
+            raise ConflictError(message="Password was changed by another request")
+        return await self._auth_repository.update_user(current_user.id, **remaining_changes)
 
     async def update_current_user(self, current_user: UserRecord, update_data: UpdateCurrentUserCommand) -> UserRecord:
         self.validate_update_request(update_data)
+        requested_username = (
+            current_user.username if update_data.username is None else self._normalize_username(update_data.username)
+        )
+        # Argon2 verification and hashing run before the unit of work, so the write transaction never waits on them.
+        password_change = await self.build_password_change(current_user, update_data, requested_username)
         async with self._unit_of_work:
-            normalized_username, username_change = await self.build_username_change(current_user, update_data.username)
-            password_change = self.build_password_change(current_user, update_data, normalized_username)
+            _, username_change = await self.build_username_change(current_user, update_data.username)
 
             changes = {**username_change, **password_change}
             if not changes:
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from threading import RLock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.observability import log_layer_event
+from app.core.db.database import get_async_session_factory
+from app.core.db.uow import UnitOfWork
+from app.core.errors.services import ServiceUnavailableError
+from app.core.security.runtime import security_runtime
+from app.core.security.service import PasswordServicePort
+from app.features.auth.repository import AuthRepository
+
+logger = logging.getLogger("app.auth")
+
+
+class PasswordRehasher:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        password_service: PasswordServicePort,
+        max_pending: int = 100,
+    ) -> None:
+        self._session_factory = session_factory
+        self._password_service = password_service
+        self._max_pending = max_pending
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def schedule(self, *, user_id: int, plain_password: str, current_hash: str) -> bool:
+        # Skipped work is not lost: the hash still needs a rehash, so the next login schedules it again.
+        if len(self._tasks) >= self._max_pending:
+            return False
+        task = asyncio.get_running_loop().create_task(
+            self._rehash(user_id=user_id, plain_password=plain_password, current_hash=current_hash),
+            name=f"password-rehash-{user_id}",
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def drain(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _rehash(self, *, user_id: int, plain_password: str, current_hash: str) -> None:
+        try:
+            new_hash = await self._password_service.hash_password(plain_password)
+            async with self._session_factory() as session, UnitOfWork(session=session):
+                replaced = await AuthRepository(session=session).replace_password_hash(
+                    user_id,
+                    current_hash=current_hash,
+                    new_hash=new_hash,
+                )
+        except ServiceUnavailableError:
+            log_layer_event(logger, layer="infrastructure", event="password_rehash_skipped", user_id=user_id)
+            return
+        except Exception:
+            logger.exception("event=password_rehash_failed layer=infrastructure user_id=%s", user_id)
+            return
+
+        log_layer_event(logger, layer="infrastructure", event="password_rehashed", user_id=user_id, replaced=replaced)
+
+
+class PasswordRehasherRuntime:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        password_service_loader: Callable[[], PasswordServicePort] | None = None,
+    ) -> None:
+        self._session_factory = session_factory or _create_async_session
+        self._password_service_loader = password_service_loader or security_runtime.get_password_service
+        self._rehasher: PasswordRehasher | None = None
+        self._lock = RLock()
+
+    def get_rehasher(self) -> PasswordRehasher:
+        if self._rehasher is not None:
+            return self._rehasher
+
+        with self._lock:
+            if self._rehasher is None:
+                self._rehasher = PasswordRehasher(
+                    session_factory=self._session_factory,
+                    password_service=self._password_service_loader(),
+                )
+            return self._rehasher
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rehasher = None
+
+
+def _create_async_session() -> AsyncSession:
+    return get_async_session_factory()()
+
+
+password_rehasher_runtime = PasswordRehasherRuntime()
+
+
+def get_password_rehasher() -> PasswordRehasher:
+    return password_rehasher_runtime.get_rehasher()
+
+
+def reset_password_rehasher() -> None:
+    password_rehasher_runtime.reset()
@@ -1,16 +1,17 @@
-import hashlib
+from collections.abc import Collection
+from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.authorization import PERMISSION_SCOPE_RANK
-from app.core.common.records import UserRecord
+from app.core.authorization import PERMISSION_SCOPE_RANK, encode_permission_scopes
+from app.core.common.records import UserRecord, UserTokenWatermarkRecord
 from app.core.db.repository_base import BaseRepository
 from app.core.errors.repositories import RepositoryConflictError, RepositoryInternalError
 from app.features.auth.models import User
-from app.features.rbac.models import RoleInheritance, RolePermission, UserRole
+from app.features.rbac.models import UserEffectivePermission
 
 
 class AuthRepository(BaseRepository[User]):
@@ -61,65 +62,88 @@ class AuthRepository(BaseRepository[User]):
                 ) from exc
             raise RepositoryInternalError() from exc
 
-    @staticmethod
-    def _build_effective_roles_cte(user_id: int):
-        effective_roles = (
-            select(UserRole.role_id.label("role_id"))
-            .where(UserRole.user_id == user_id)
-            .cte(name="effective_roles", recursive=True)
+    async def replace_password_hash(self, user_id: int, *, current_hash: str, new_hash: str) -> bool:
+        # Matching the old hash keeps a password changed since the login from being overwritten.
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id, User.hashed_password == current_hash)
+            .values(hashed_password=new_hash)
+            .returning(User.id)
         )
-        parent_roles = select(RoleInheritance.parent_role_id.label("role_id")).join(
-            effective_roles,
-            RoleInheritance.role_id == effective_roles.c.role_id,
-        )
-        return effective_roles.union(parent_roles)
+        return result.scalar_one_or_none() is not None
 
     async def get_rbac_version(self, user_id: int) -> str:
-        effective_roles = self._build_effective_roles_cte(user_id)
-        query = select(RolePermission.permission_id, RolePermission.scope).join(
-            effective_roles, RolePermission.role_id == effective_roles.c.role_id
-        )
-        result = await self.session.execute(query)
-
-        effective_scopes: dict[str, str] = {}
-        for permission_id, scope in result.all():
-            if scope not in PERMISSION_SCOPE_RANK:
-                continue
-
-            current_scope = effective_scopes.get(permission_id)
-            if current_scope is None or PERMISSION_SCOPE_RANK[scope] > PERMISSION_SCOPE_RANK[current_scope]:
-                effective_scopes[permission_id] = scope
-
-        serialized_scopes = "|".join(
-            f"{permission_id}:{effective_scopes[permission_id]}" for permission_id in sorted(effective_scopes)
+        result = await self.session.execute(select(User.rbac_version).where(User.id == user_id))
+        rbac_version = result.scalar_one_or_none()
+        return str(rbac_version or 0)
+
+    async def list_token_watermarks(self, *, updated_since: datetime) -> list[UserTokenWatermarkRecord]:
+        # Served by ix_users_updated_at, so each refresh reads only the recently changed users.
+        result = await self.session.execute(
+            select(User.id, User.username, User.disabled, User.tenant_id, User.rbac_version, User.updated_at)
+            .where(User.updated_at >= updated_since)
+            .order_by(User.updated_at.asc(), User.id.asc())
         )
-        return hashlib.sha256(serialized_scopes.encode("utf-8")).hexdigest()
+        return [
+            UserTokenWatermarkRecord(
+                id=user_id,
+                username=username,
+                disabled=disabled,
+                tenant_id=tenant_id,
+                rbac_version=str(rbac_version),
+                updated_at=updated_at if updated_at.tzinfo else updated_at.replace(tzinfo=UTC),
+            )
+            for user_id, username, disabled, tenant_id, rbac_version, updated_at in result.all()
+        ]
 
     async def get_user_effective_permission_ids(self, user_id: int) -> tuple[str, ...]:
-        effective_roles = self._build_effective_roles_cte(user_id)
-        query = select(RolePermission.permission_id).join(
-            effective_roles,
-            RolePermission.role_id == effective_roles.c.role_id,
+        query = (
+            select(UserEffectivePermission.permission_id)
+            .where(UserEffectivePermission.user_id == user_id)
+            .order_by(UserEffectivePermission.permission_id.asc())
         )
         result = await self.session.execute(query)
         permission_ids = sorted(set(result.scalars().all()))
         return tuple(permission_ids)
 
+    async def get_user_permission_bitset(self, user_id: int) -> int:
+        query = select(UserEffectivePermission.permission_id, UserEffectivePermission.scope).where(
+            UserEffectivePermission.user_id == user_id
+        )
+        result = await self.session.execute(query)
+        return encode_permission_scopes(
+            {permission_id: scope for permission_id, scope in result.all() if scope in PERMISSION_SCOPE_RANK}
+        )
+
     async def get_user_permission_scope(self, user_id: int, permission_id: str) -> str | None:
-        effective_roles = self._build_effective_roles_cte(user_id)
-        query = (
-            select(RolePermission.scope)
-            .join(effective_roles, RolePermission.role_id == effective_roles.c.role_id)
-            .where(
-                RolePermission.permission_id == permission_id,
-            )
+        query = select(UserEffectivePermission.scope).where(
+            UserEffectivePermission.user_id == user_id,
+            UserEffectivePermission.permission_id == permission_id,
         )
         result = await self.session.execute(query)
-        scopes = tuple(result.scalars().all())
-        valid_scopes = [scope for scope in scopes if scope in PERMISSION_SCOPE_RANK]
-        if not valid_scopes:
+        scope = result.scalar_one_or_none()
+        if scope not in PERMISSION_SCOPE_RANK:
             return None
-        return max(valid_scopes, key=lambda scope: PERMISSION_SCOPE_RANK[scope])
+        return scope
+
+    async def get_user_permission_scopes(
+        self,
+        user_id: int,
+        permission_ids: Collection[str],
+    ) -> dict[str, str | None]:
+        granted_scopes: dict[str, str | None] = dict.fromkeys(permission_ids)
+        if not granted_scopes:
+            return granted_scopes
+
+        query = select(UserEffectivePermission.permission_id, UserEffectivePermission.scope).where(
+            UserEffectivePermission.user_id == user_id,
+            UserEffectivePermission.permission_id.in_(tuple(granted_scopes)),
+        )
+        result = await self.session.execute(query)
+        for permission_id, scope in result.all():
+            if scope in PERMISSION_SCOPE_RANK:
+                granted_scopes[permission_id] = scope
+        return granted_scopes
 
     async def user_has_permission(self, user_id: int, permission_id: str) -> bool:
         return await self.get_user_permission_scope(user_id=user_id, permission_id=permission_id) is not None
@@ -2,7 +2,11 @@ from fastapi import APIRouter
 
 from app.core.authorization.dependencies import AuthenticatedReadAccessDependency
 from app.core.setup.dependencies import AuthServiceDependency
-from app.features.auth.dependencies import AuthCredentialsDependency, CurrentActiveUserDependency
+from app.features.auth.dependencies import (
+    AuthCredentialsDependency,
+    CurrentActiveUserDependency,
+    LoginRateLimitDependency,
+)
 from app.features.auth.openapi import (
     LOGIN_FOR_ACCESS_TOKEN_DOC,
     READ_CURRENT_USER_DOC,
@@ -26,6 +30,7 @@ router = APIRouter(tags=["auth"])
 async def login_for_access_token(
     credentials: AuthCredentialsDependency,
     auth_service: AuthServiceDependency,
+    _rate_limit: LoginRateLimitDependency,
 ) -> AccessTokenResponse:
     token = await auth_service.login(LoginCommand.from_api(credentials))
     return AccessTokenResponse.from_application(token)
@@ -11,5 +11,6 @@ from app.features.auth.schemas.app import (
     AuthenticatedUserResult,
     LoginCommand,
     RegisterUserCommand,
+    StatelessTokenClaims,
     UpdateCurrentUserCommand,
 )
@@ -33,6 +33,14 @@ class AuthenticatedUserResult(ApplicationSchema):
     model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
+class StatelessTokenClaims(ApplicationSchema):
+    uid: int
+    tid: int | None = None
+    dis: bool
+    perm: str
+    pbv: str
+
+
 class AccessTokenPayload(ApplicationSchema):
     sub: str = Field(min_length=1, max_length=255)
     iss: str = Field(min_length=1, max_length=255)
@@ -40,4 +48,15 @@ class AccessTokenPayload(ApplicationSchema):
     iat: int
     exp: int
     jti: str = Field(min_length=1, max_length=255)
-    rbac_version: str = Field(min_length=64, max_length=64)
+    rbac_version: str = Field(min_length=1, max_length=64)
+    uid: int | None = None
+    tid: int | None = None
+    dis: bool | None = None
+    perm: str | None = Field(default=None, pattern=r"^[0-9a-f]{1,64}$")
+    pbv: str | None = Field(default=None, max_length=16)
+
+    @property
+    def stateless_claims(self) -> StatelessTokenClaims | None:
+        if self.uid is None or self.dis is None or self.perm is None or self.pbv is None:
+            return None
+        return StatelessTokenClaims(uid=self.uid, tid=self.tid, dis=self.dis, perm=self.perm, pbv=self.pbv)
@@ -1,8 +1,14 @@
+from collections.abc import Collection, Sequence
 from typing import Any, Protocol
 
-from app.core.authorization import PermissionScope
+from app.core.authorization import (
+    PERMISSION_BITSET_VERSION,
+    PermissionScope,
+    decode_permission_scopes,
+)
 from app.core.authorization.permission_evaluator import PermissionEvaluator, PermissionEvaluatorPort
-from app.core.common.records import UserRecord
+from app.core.authorization.snapshot_cache import AuthorizationSnapshot, AuthorizationSnapshotCachePort
+from app.core.common.records import UserRecord, UserTokenWatermarkRecord
 from app.core.config.settings import AuthSettings
 from app.core.db.ports import UnitOfWorkPort
 from app.core.errors.services import ConflictError, ForbiddenError, InvalidInputError, UnauthorizedError
@@ -19,10 +25,12 @@ from app.core.security.service import Argon2PasswordService, JwtTokenService, Pa
 from app.features.auth.principal import CurrentPrincipal
 from app.features.auth.profile_updates import AuthProfileUpdates
 from app.features.auth.schemas import (
+    AccessTokenPayload,
     AccessTokenResult,
     AuthenticatedUserResult,
     LoginCommand,
     RegisterUserCommand,
+    StatelessTokenClaims,
     UpdateCurrentUserCommand,
 )
 
@@ -38,15 +46,35 @@ class AuthRepositoryPort(Protocol):
 
     async def update_user(self, user_id: int, **changes: Any) -> UserRecord: ...
 
+    async def replace_password_hash(self, user_id: int, *, current_hash: str, new_hash: str) -> bool: ...
+
     async def get_rbac_version(self, user_id: int) -> str: ...
 
     async def get_user_effective_permission_ids(self, user_id: int) -> tuple[str, ...]: ...
 
+    async def get_user_permission_bitset(self, user_id: int) -> int: ...
+
     async def get_user_permission_scope(self, user_id: int, permission_id: str) -> str | None: ...
 
+    async def get_user_permission_scopes(
+        self,
+        user_id: int,
+        permission_ids: Collection[str],
+    ) -> dict[str, str | None]: ...
+
     async def user_has_permission(self, user_id: int, permission_id: str) -> bool: ...
 
 
+class PasswordRehasherPort(Protocol):
+    def schedule(self, *, user_id: int, plain_password: str, current_hash: str) -> bool: ...
+
+
+class TokenWatermarkPort(Protocol):
+    def is_fresh(self) -> bool: ...
+
+    def get(self, user_id: int) -> UserTokenWatermarkRecord | None: ...
+
+
 class AuthServicePort(Protocol):
     async def login(self, credentials: LoginCommand) -> AccessTokenResult: ...
 
@@ -73,6 +101,17 @@ class AuthServicePort(Protocol):
         user_tenant_id: int | None = None,
     ) -> bool: ...
 
+    async def user_has_permissions(
+        self,
+        user_id: int,
+        permission_ids: Sequence[str],
+        *,
+        required_scope: str = PermissionScope.ANY,
+        resource_owner_id: int | None = None,
+        resource_tenant_id: int | None = None,
+        user_tenant_id: int | None = None,
+    ) -> dict[str, bool]: ...
+
 
 class AuthService:
     def __init__(
@@ -84,6 +123,9 @@ class AuthService:
         token_service: TokenServicePort | None = None,
         password_service: PasswordServicePort | None = None,
         permission_scope_cache: PermissionScopeCache | None = None,
+        authorization_snapshot_cache: AuthorizationSnapshotCachePort | None = None,
+        password_rehasher: PasswordRehasherPort | None = None,
+        token_watermarks: TokenWatermarkPort | None = None,
     ):
         settings = auth_settings or AuthSettings()
         self.auth_repository = auth_repository
@@ -92,6 +134,10 @@ class AuthService:
         self.token_service = token_service or JwtTokenService(settings)
         self.password_service = password_service or Argon2PasswordService()
         self.permission_scope_cache = permission_scope_cache
+        self.authorization_snapshot_cache = authorization_snapshot_cache
+        self.password_rehasher = password_rehasher
+        self.stateless_tokens_enabled = settings.AUTH_STATELESS_TOKENS_ENABLED
+        self.token_watermarks = token_watermarks
         self._profile_updates = AuthProfileUpdates(
             auth_repository=auth_repository,
             unit_of_work=unit_of_work,
@@ -126,7 +172,7 @@ class AuthService:
     async def _authenticate_or_raise(self, credentials: LoginCommand) -> UserRecord:
         username = self._normalize_username(credentials.username)
         user = await self.auth_repository.get_by_username(username)
-        if user is None or not self.password_service.verify_password(credentials.password, user.hashed_password):
+        if user is None or not await self.password_service.verify_password(credentials.password, user.hashed_password):
             raise UnauthorizedError(message="Invalid username or password")
 
         if user.disabled:
@@ -136,16 +182,37 @@ class AuthService:
 
     async def login(self, credentials: LoginCommand) -> AccessTokenResult:
         user = await self._authenticate_or_raise(credentials)
+        if self.password_rehasher is not None and self.password_service.needs_rehash(user.hashed_password):
+            self.password_rehasher.schedule(
+                user_id=user.id,
+                plain_password=credentials.password,
+                current_hash=user.hashed_password,
+            )
         rbac_version = await self.auth_repository.get_rbac_version(user.id)
+        stateless_claims = None
+        if self.stateless_tokens_enabled:
+            stateless_claims = await self._build_stateless_claims(user)
         access_token = self.token_service.encode_access_token(
             subject=user.username,
             rbac_version=rbac_version,
+            stateless_claims=stateless_claims,
         )
         return AccessTokenResult(access_token=access_token)
 
+    async def _build_stateless_claims(self, user: UserRecord) -> StatelessTokenClaims:
+        permission_bitset = await self.auth_repository.get_user_permission_bitset(user.id)
+        return StatelessTokenClaims(
+            uid=user.id,
+            tid=user.tenant_id,
+            dis=user.disabled,
+            perm=format(permission_bitset, "x"),
+            pbv=PERMISSION_BITSET_VERSION,
+        )
+
     async def register(self, registration: RegisterUserCommand) -> AuthenticatedUserResult:
         username = self._normalize_username(registration.username)
         self._validate_password_policy(registration.password, username)
+        hashed_password = await self.password_service.hash_password(registration.password)
 
         async with self.unit_of_work:
             if await self.auth_repository.username_exists(username):
@@ -156,7 +223,7 @@ class AuthService:
 
             user = await self.auth_repository.create_user(
                 username=username,
-                hashed_password=self.password_service.hash_password(registration.password),
+                hashed_password=hashed_password,
                 disabled=False,
             )
 
@@ -196,13 +263,13 @@ class AuthService:
     ) -> tuple[str, dict[str, str]]:
         return await self._profile_updates.build_username_change(current_user, username)
 
-    def _build_password_change(
+    async def _build_password_change(
         self,
         current_user: UserRecord,
         update_data: UpdateCurrentUserCommand,
         normalized_username: str,
     ) -> dict[str, str]:
-        return self._profile_updates.build_password_change(current_user, update_data, normalized_username)
+        return await self._profile_updates.build_password_change(current_user, update_data, normalized_username)
 
     async def _persist_user_changes(self, current_user: UserRecord, changes: dict[str, str]) -> UserRecord:
         return await self._profile_updates.persist_user_changes(current_user, changes)
@@ -217,25 +284,77 @@ class AuthService:
             raise UnauthorizedError(message="Could not validate credentials")
 
         updated_user = await self._profile_updates.update_current_user(persisted_user, update_data)
+        if self.authorization_snapshot_cache is not None:
+            self.authorization_snapshot_cache.invalidate_user(updated_user.id)
         return await self._build_authenticated_user_result(updated_user)
 
     async def get_authenticated_user(self, current_user: CurrentPrincipal) -> AuthenticatedUserResult:
         return await self._build_authenticated_user_result(current_user)
 
+    async def _load_authorization_snapshot(self, username: str) -> AuthorizationSnapshot | None:
+        user = await self.auth_repository.get_by_username(username)
+        if user is None:
+            return None
+
+        snapshot = AuthorizationSnapshot(
+            user=UserRecord.from_domain(user),
+            rbac_version=await self.auth_repository.get_rbac_version(user.id),
+            permission_bitset=await self.auth_repository.get_user_permission_bitset(user.id),
+        )
+        if self.authorization_snapshot_cache is not None:
+            self.authorization_snapshot_cache.store(snapshot)
+        return snapshot
+
+    def _prefill_permission_scope_cache(self, user_id: int, permission_bitset: int) -> None:
+        if self.permission_scope_cache is None:
+            return
+        for permission_id, granted_scope in decode_permission_scopes(permission_bitset).items():
+            self.permission_scope_cache.setdefault((user_id, permission_id), granted_scope)
+
+    def _get_stateless_principal(self, payload: AccessTokenPayload) -> CurrentPrincipal | None:
+        claims = payload.stateless_claims
+        if claims is None or claims.pbv != PERMISSION_BITSET_VERSION:
+            return None
+        if self.token_watermarks is None or not self.token_watermarks.is_fresh():
+            return None
+
+        # A user changed within the token lifetime is only trusted when the token still matches that change; anything
+        # else (revoked, or issued after the last refresh) is settled by the database path.
+        watermark = self.token_watermarks.get(claims.uid)
+        if watermark is not None and (
+            watermark.username != payload.sub
+            or watermark.rbac_version != payload.rbac_version
+            or watermark.disabled != claims.dis
+            or watermark.tenant_id != claims.tid
+        ):
+            return None
+
+        self._prefill_permission_scope_cache(claims.uid, int(claims.perm, 16))
+        return CurrentPrincipal(id=claims.uid, username=payload.sub, disabled=claims.dis, tenant_id=claims.tid)
+
     async def get_user_from_token(self, token: str) -> CurrentPrincipal:
         payload = self.token_service.decode_access_token(token)
         if payload is None:
             raise UnauthorizedError(message="Could not validate credentials")
 
-        user = await self.auth_repository.get_by_username(payload.sub)
-        if user is None:
-            raise UnauthorizedError(message="Could not validate credentials")
+        if self.stateless_tokens_enabled:
+            principal = self._get_stateless_principal(payload)
+            if principal is not None:
+                return principal
+
+        snapshot = None
+        if self.authorization_snapshot_cache is not None:
+            snapshot = self.authorization_snapshot_cache.get_by_username(payload.sub)
+
+        if snapshot is None or snapshot.rbac_version != payload.rbac_version:
+            snapshot = await self._load_authorization_snapshot(payload.sub)
 
-        current_rbac_version = await self.auth_repository.get_rbac_version(user.id)
-        if payload.rbac_version != current_rbac_version:
+        if snapshot is None or snapshot.rbac_version != payload.rbac_version:
             raise UnauthorizedError(message="Could not validate credentials")
 
-        return CurrentPrincipal.from_domain(user)
+        if snapshot.permission_bitset is not None:
+            self._prefill_permission_scope_cache(snapshot.user.id, snapshot.permission_bitset)
+        return CurrentPrincipal.from_domain(snapshot.user)
 
     async def _get_granted_scope(self, *, user_id: int, permission_id: str) -> str | None:
         if self.permission_scope_cache is None:
@@ -255,6 +374,23 @@ class AuthService:
         self.permission_scope_cache[cache_key] = granted_scope
         return granted_scope
 
+    async def _get_granted_scopes(self, *, user_id: int, permission_ids: Sequence[str]) -> dict[str, str | None]:
+        scope_cache = self.permission_scope_cache if self.permission_scope_cache is not None else {}
+        missing_permission_ids = tuple(
+            permission_id
+            for permission_id in dict.fromkeys(permission_ids)
+            if (user_id, permission_id) not in scope_cache
+        )
+        if missing_permission_ids:
+            granted_scopes = await self.auth_repository.get_user_permission_scopes(
+                user_id=user_id,
+                permission_ids=missing_permission_ids,
+            )
+            for permission_id in missing_permission_ids:
+                scope_cache[(user_id, permission_id)] = granted_scopes.get(permission_id)
+
+        return {permission_id: scope_cache[(user_id, permission_id)] for permission_id in permission_ids}
+
     async def user_has_permission(
         self,
         user_id: int,
@@ -278,3 +414,30 @@ class AuthService:
             user_tenant_id=user_tenant_id,
             resource_tenant_id=resource_tenant_id,
         )
+
+    async def user_has_permissions(
+        self,
+        user_id: int,
+        permission_ids: Sequence[str],
+        *,
+        required_scope: str = PermissionScope.ANY,
+        resource_owner_id: int | None = None,
+        resource_tenant_id: int | None = None,
+        user_tenant_id: int | None = None,
+    ) -> dict[str, bool]:
+        normalized_required_scope = self.permission_evaluator.normalize_required_scope(required_scope)
+        granted_scopes = await self._get_granted_scopes(
+            user_id=user_id,
+            permission_ids=permission_ids,
+        )
+        return {
+            permission_id: self.permission_evaluator.is_granted_scope_allowed(
+                granted_scope=granted_scope,
+                required_scope=normalized_required_scope,
+                user_id=user_id,
+                resource_owner_id=resource_owner_id,
+                user_tenant_id=user_tenant_id,
+                resource_tenant_id=resource_tenant_id,
+            )
+            for permission_id, granted_scope in granted_scopes.items()
+        }
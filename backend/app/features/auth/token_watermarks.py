@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from threading import Lock, RLock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.observability import log_layer_event
+from app.core.common.records import UserTokenWatermarkRecord
+from app.core.config.settings import AuthSettings
+from app.core.db.database import get_async_session_factory
+from app.core.security.runtime import security_runtime
+from app.features.auth.repository import AuthRepository
+
+logger = logging.getLogger("app.auth")
+
+
+class TokenWatermarkTable:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        retention_seconds: float,
+        refresh_interval_seconds: float = 5.0,
+        overlap_seconds: float = 30.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._session_factory = session_factory
+        self._retention = timedelta(seconds=retention_seconds)
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._overlap = timedelta(seconds=overlap_seconds)
+        # Past this age the table may miss a revocation, so callers fall back to the database.
+        self._max_staleness = timedelta(seconds=refresh_interval_seconds * 3)
+        self._clock = clock
+        self._entries: dict[int, UserTokenWatermarkRecord] = {}
+        self._refreshed_at: datetime | None = None
+        self._lock = Lock()
+        self._worker: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def is_fresh(self) -> bool:
+        refreshed_at = self._refreshed_at
+        return refreshed_at is not None and self._clock() - refreshed_at <= self._max_staleness
+
+    def get(self, user_id: int) -> UserTokenWatermarkRecord | None:
+        return self._entries.get(user_id)
+
+    async def refresh(self) -> int:
+        started_at = self._clock()
+        # A token outlives no change older than its lifetime, so the first load only needs that window. Later loads
+        # re-read an overlap so rows committed after a previous refresh started are not missed.
+        refreshed_at = self._refreshed_at
+        updated_since = started_at - self._retention if refreshed_at is None else refreshed_at - self._overlap
+        async with self._session_factory() as session:
+            watermarks = await AuthRepository(session=session).list_token_watermarks(updated_since=updated_since)
+
+        expired_before = started_at - self._retention
+        with self._lock:
+            for watermark in watermarks:
+                self._entries[watermark.id] = watermark
+            for user_id in [user_id for user_id, entry in self._entries.items() if entry.updated_at < expired_before]:
+                del self._entries[user_id]
+            self._refreshed_at = started_at
+        return len(watermarks)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+
+        await self._refresh_logged()
+        self._worker = asyncio.create_task(self._run(), name="token-watermark-refresher")
+
+    async def stop(self) -> None:
+        worker = self._worker
+        if worker is None:
+            return
+
+        worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await worker
+        self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval_seconds)
+            await self._refresh_logged()
+
+    async def _refresh_logged(self) -> None:
+        try:
+            changed_count = await self.refresh()
+        except Exception:
+            logger.exception("event=token_watermarks_refresh_failed layer=infrastructure")
+            return
+
+        if changed_count:
+            log_layer_event(
+                logger,
+                layer="infrastructure",
+                event="token_watermarks_refreshed",
+                changed_count=changed_count,
+                entry_count=len(self._entries),
+            )
+
+
+def _create_async_session() -> AsyncSession:
+    return get_async_session_factory()()
+
+
+class TokenWatermarkTableRuntime:
+    def __init__(
+        self,
+        settings_loader: Callable[[], AuthSettings] | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        self._settings_loader = settings_loader or security_runtime.get_auth_settings
+        self._session_factory = session_factory or _create_async_session
+        self._table: TokenWatermarkTable | None = None
+        self._lock = RLock()
+
+    def get_table(self) -> TokenWatermarkTable:
+        if self._table is not None:
+            return self._table
+
+        with self._lock:
+            if self._table is None:
+                settings = self._settings_loader()
+                self._table = TokenWatermarkTable(
+                    session_factory=self._session_factory,
+                    retention_seconds=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                    refresh_interval_seconds=settings.AUTH_TOKEN_WATERMARK_REFRESH_SECONDS,
+                )
+            return self._table
+
+    def reset(self) -> None:
+        with self._lock:
+            self._table = None
+
+
+token_watermark_table_runtime = TokenWatermarkTableRuntime()
+
+
+def get_token_watermark_table() -> TokenWatermarkTable:
+    return token_watermark_table_runtime.get_table()
+
+
+def reset_token_watermark_table() -> None:
+    token_watermark_table_runtime.reset()
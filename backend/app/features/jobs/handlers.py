@@ -0,0 +1,10 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+CpuBoundJobHandler = Callable[[dict[str, Any]], None]
+
+# Features register their handlers by job name. CPU-bound handlers run in the worker's process pool
+# (or a thread when no pool is configured), so they must be picklable module-level functions.
+JOB_HANDLERS: dict[str, JobHandler] = {}
+CPU_BOUND_JOB_HANDLERS: dict[str, CpuBoundJobHandler] = {}
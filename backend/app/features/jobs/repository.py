@@ -0,0 +1,143 @@
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.observability import log_layer_event
+from app.core.db.repository_base import BaseRepository
+from app.core.errors.repositories import RepositoryError
+from app.features.jobs.models import Job, JobStatus
+from app.features.jobs.schemas import JobRecord
+
+logger = logging.getLogger("app.jobs")
+
+
+class JobRepository(BaseRepository[Job]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, Job, default_record_type=JobRecord)
+
+    async def create_job(
+        self,
+        *,
+        job_name: str,
+        payload: dict[str, Any],
+        priority: int = 0,
+        run_at: datetime | None = None,
+        max_attempts: int = 3,
+    ) -> JobRecord:
+        job = await self.create(
+            job_name=job_name,
+            payload=payload,
+            priority=priority,
+            run_at=run_at,
+            max_attempts=max_attempts,
+        )
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="job_persisted",
+            job_id=job.id,
+            job_name=job.job_name,
+            priority=job.priority,
+        )
+        return self._to_record(job)
+
+    async def get_job(self, job_id: int) -> JobRecord | None:
+        job = await self.get(job_id)
+        if job is None:
+            return None
+        return self._to_record(job)
+
+    async def claim_next(
+        self,
+        *,
+        limit: int = 1,
+        visibility_timeout: timedelta,
+        now: datetime | None = None,
+    ) -> list[JobRecord]:
+        if limit < 1:
+            raise RepositoryError("Limit must be greater than or equal to 1")
+
+        now = now or datetime.now(UTC)
+        query = (
+            select(Job)
+            .where(
+                or_(
+                    and_(Job.status == JobStatus.QUEUED, Job.run_at <= now),
+                    # A running job whose visibility timeout expired belongs to a worker that died or stalled.
+                    and_(Job.status == JobStatus.RUNNING, Job.locked_until <= now),
+                )
+            )
+            .order_by(Job.priority.desc(), Job.run_at.asc(), Job.id.asc())
+            .limit(limit)
+        )
+        query = await self._lock_for_claim(query)
+
+        result = await self.session.execute(query)
+        jobs = list(result.scalars().all())
+        for job in jobs:
+            job.status = JobStatus.RUNNING
+            job.attempts += 1
+            job.locked_until = now + visibility_timeout
+        await self.session.flush()
+        return self._to_records(jobs)
+
+    async def _finish_claim(self, job: JobRecord, **values: Any) -> bool:
+        # Matching the claimed attempt keeps a worker that outlived its visibility timeout from
+        # overwriting the outcome of the worker that reclaimed the job.
+        result = await self.session.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.status == JobStatus.RUNNING, Job.attempts == job.attempts)
+            .values(locked_until=None, **values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def mark_succeeded(self, job: JobRecord, *, finished_at: datetime | None = None) -> bool:
+        finished = await self._finish_claim(
+            job,
+            status=JobStatus.SUCCEEDED,
+            last_error=None,
+            finished_at=finished_at or datetime.now(UTC),
+        )
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="job_marked_succeeded",
+            job_id=job.id,
+            attempts=job.attempts,
+            stale=not finished,
+        )
+        return finished
+
+    async def schedule_retry(self, job: JobRecord, *, last_error: str, run_at: datetime) -> bool:
+        scheduled = await self._finish_claim(job, status=JobStatus.QUEUED, last_error=last_error, run_at=run_at)
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="job_retry_scheduled",
+            job_id=job.id,
+            attempts=job.attempts,
+            run_at=run_at.isoformat(),
+            stale=not scheduled,
+        )
+        return scheduled
+
+    async def mark_failed(self, job: JobRecord, *, last_error: str, finished_at: datetime | None = None) -> bool:
+        failed = await self._finish_claim(
+            job,
+            status=JobStatus.FAILED,
+            last_error=last_error,
+            finished_at=finished_at or datetime.now(UTC),
+        )
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="job_marked_failed",
+            job_id=job.id,
+            attempts=job.attempts,
+            stale=not failed,
+        )
+        return failed
@@ -0,0 +1 @@
+from app.features.jobs.schemas.app import JobRecord
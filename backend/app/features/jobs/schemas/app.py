@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import ConfigDict
+
+from app.core.common.schema import ApplicationSchema
+
+
+class JobRecord(ApplicationSchema):
+    id: int
+    job_name: str
+    payload: dict[str, Any]
+    status: str
+    priority: int
+    run_at: datetime
+    attempts: int
+    max_attempts: int
+    locked_until: datetime | None = None
+    last_error: str | None = None
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(frozen=True, from_attributes=True)
@@ -0,0 +1,51 @@
+import logging
+from datetime import datetime
+from typing import Any, Protocol
+
+from app.core.common.integration import EnqueueJobCommand
+from app.core.common.observability import log_layer_event
+from app.core.db.ports import UnitOfWorkPort
+from app.features.jobs.schemas import JobRecord
+
+logger = logging.getLogger("app.jobs")
+
+
+class JobRepositoryPort(Protocol):
+    async def create_job(
+        self,
+        *,
+        job_name: str,
+        payload: dict[str, Any],
+        priority: int = 0,
+        run_at: datetime | None = None,
+        max_attempts: int = 3,
+    ) -> JobRecord: ...
+
+
+class JobService:
+    def __init__(
+        self,
+        job_repository: JobRepositoryPort,
+        unit_of_work: UnitOfWorkPort,
+    ):
+        self.job_repository = job_repository
+        self.unit_of_work = unit_of_work
+
+    async def enqueue(self, job: EnqueueJobCommand) -> str:
+        async with self.unit_of_work:
+            job_record = await self.job_repository.create_job(
+                job_name=job.job_name,
+                payload=job.payload,
+                priority=job.priority,
+                run_at=job.run_at,
+                max_attempts=job.max_attempts,
+            )
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="job_enqueued",
+            job_id=job_record.id,
+            job_name=job_record.job_name,
+            priority=job_record.priority,
+        )
+        return str(job_record.id)
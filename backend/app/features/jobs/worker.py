@@ -0,0 +1,201 @@
+import asyncio
+import logging
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.observability import log_layer_event
+from app.core.db.uow import UnitOfWork
+from app.features.jobs.handlers import CpuBoundJobHandler, JobHandler
+from app.features.jobs.repository import JobRepository
+from app.features.jobs.schemas import JobRecord
+
+logger = logging.getLogger("app.jobs")
+
+_MAX_ERROR_LENGTH = 1_000
+
+
+@dataclass
+class JobWorkerMetrics:
+    succeeded_count: int = 0
+    retried_count: int = 0
+    failed_count: int = 0
+    error_count: int = 0
+
+    @property
+    def processed_count(self) -> int:
+        return self.succeeded_count + self.retried_count + self.failed_count
+
+
+@dataclass(frozen=True)
+class _JobOutcome:
+    error: str | None = None
+    retryable: bool = True
+
+
+def _describe_error(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"[:_MAX_ERROR_LENGTH]
+
+
+class JobWorker:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        handlers: Mapping[str, JobHandler] | None = None,
+        cpu_bound_handlers: Mapping[str, CpuBoundJobHandler] | None = None,
+        process_pool: Executor | None = None,
+        concurrency: int = 4,
+        visibility_timeout_seconds: float = 300.0,
+        poll_interval_seconds: float = 1.0,
+        max_poll_interval_seconds: float = 10.0,
+        retry_base_seconds: float = 1.0,
+        retry_max_seconds: float = 300.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._session_factory = session_factory
+        self._handlers = dict(handlers or {})
+        self._cpu_bound_handlers = dict(cpu_bound_handlers or {})
+        self._process_pool = process_pool
+        self._concurrency = concurrency
+        self._visibility_timeout = timedelta(seconds=visibility_timeout_seconds)
+        self._poll_interval_seconds = poll_interval_seconds
+        self._max_poll_interval_seconds = max(max_poll_interval_seconds, poll_interval_seconds)
+        self._retry_base_seconds = retry_base_seconds
+        self._retry_max_seconds = retry_max_seconds
+        self._clock = clock
+        self._metrics = JobWorkerMetrics()
+
+    @property
+    def metrics(self) -> JobWorkerMetrics:
+        return self._metrics
+
+    def retry_delay(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self._retry_base_seconds * 2 ** (attempts - 1), self._retry_max_seconds))
+
+    async def _claim(self) -> JobRecord | None:
+        async with self._session_factory() as session:
+            job_repository = JobRepository(session=session)
+            async with UnitOfWork(session=session):
+                jobs = await job_repository.claim_next(visibility_timeout=self._visibility_timeout, now=self._clock())
+        return jobs[0] if jobs else None
+
+    async def _run_handler(self, job: JobRecord) -> None:
+        cpu_bound_handler = self._cpu_bound_handlers.get(job.job_name)
+        if cpu_bound_handler is not None:
+            # Keeps CPU-bound work (password hashing, bulk imports) off the event loop the other slots share.
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._process_pool, cpu_bound_handler, job.payload)
+            return
+        await self._handlers[job.job_name](job.payload)
+
+    async def _execute(self, job: JobRecord) -> _JobOutcome:
+        if job.attempts > job.max_attempts:
+            return _JobOutcome(error="Visibility timeout expired on the last attempt", retryable=False)
+        if job.job_name not in self._handlers and job.job_name not in self._cpu_bound_handlers:
+            return _JobOutcome(error=f"No handler registered for job '{job.job_name}'", retryable=False)
+
+        try:
+            # The job must finish within its visibility timeout, or another worker may claim it again.
+            await asyncio.wait_for(self._run_handler(job), timeout=self._visibility_timeout.total_seconds())
+        except Exception as exc:
+            logger.exception(
+                "event=job_failed layer=integration job_id=%s job_name=%s attempts=%s",
+                job.id,
+                job.job_name,
+                job.attempts,
+            )
+            return _JobOutcome(error=_describe_error(exc))
+        return _JobOutcome()
+
+    async def _record_outcome(self, job: JobRecord, outcome: _JobOutcome) -> None:
+        now = self._clock()
+        async with self._session_factory() as session:
+            job_repository = JobRepository(session=session)
+            async with UnitOfWork(session=session):
+                if outcome.error is None:
+                    await job_repository.mark_succeeded(job, finished_at=now)
+                    self._metrics.succeeded_count += 1
+                elif outcome.retryable and job.attempts < job.max_attempts:
+                    await job_repository.schedule_retry(
+                        job,
+                        last_error=outcome.error,
+                        run_at=now + self.retry_delay(job.attempts),
+                    )
+                    self._metrics.retried_count += 1
+                else:
+                    await job_repository.mark_failed(job, last_error=outcome.error, finished_at=now)
+                    self._metrics.failed_count += 1
+
+    async def process_next(self) -> bool:
+        # The claim commits before the handler runs, so no transaction stays open for the length of a job.
+        job = await self._claim()
+        if job is None:
+            return False
+        outcome = await self._execute(job)
+        await self._record_outcome(job, outcome)
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="job_processed",
+            job_id=job.id,
+            job_name=job.job_name,
+            attempts=job.attempts,
+            succeeded=outcome.error is None,
+        )
+        return True
+
+    async def _drain_slot(self) -> int:
+        processed_count = 0
+        while await self.process_next():
+            processed_count += 1
+        return processed_count
+
+    async def drain(self) -> int:
+        processed_counts = await asyncio.gather(*(self._drain_slot() for _ in range(self._concurrency)))
+        return sum(processed_counts)
+
+    async def _run_slot(self, stop_event: asyncio.Event) -> None:
+        poll_interval_seconds = self._poll_interval_seconds
+        while not stop_event.is_set():
+            try:
+                processed = await self.process_next()
+            except Exception:
+                # A job claimed before the failure is reclaimed once its visibility timeout lapses.
+                self._metrics.error_count += 1
+                logger.exception(
+                    "event=job_slot_failed layer=integration retry_in_seconds=%s",
+                    poll_interval_seconds,
+                )
+                processed = False
+            if processed:
+                poll_interval_seconds = self._poll_interval_seconds
+                continue
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=poll_interval_seconds)
+            except TimeoutError:
+                # Idle or failing slots back off exponentially so the queue is not polled in a tight loop.
+                poll_interval_seconds = min(poll_interval_seconds * 2, self._max_poll_interval_seconds)
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="job_worker_started",
+            concurrency=self._concurrency,
+            process_pool=self._process_pool is not None,
+        )
+        # Each slot finishes its current job before it observes the stop event.
+        await asyncio.gather(*(self._run_slot(stop_event) for _ in range(self._concurrency)))
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="job_worker_stopped",
+            succeeded_count=self._metrics.succeeded_count,
+            retried_count=self._metrics.retried_count,
+            failed_count=self._metrics.failed_count,
+            error_count=self._metrics.error_count,
+        )
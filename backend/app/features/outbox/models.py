@@ -1,20 +1,57 @@
+import zlib
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, Index, Integer, String
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db.base import BaseModel
 
 
+def outbox_shard_key(aggregate_type: str, aggregate_id: str) -> int:
+    # A stable hash (unlike hash()), so every process and SQL filter maps an aggregate to the same shard.
+    return zlib.crc32(f"{aggregate_type}:{aggregate_id}".encode()) & 0x7FFFFFFF
+
+
+def _default_shard_key(context: DefaultExecutionContext) -> int:
+    parameters = context.get_current_parameters()
+    return outbox_shard_key(parameters["aggregate_type"], parameters["aggregate_id"])
+
+
 class OutboxEvent(BaseModel):
     __tablename__ = "outbox_events"
-    __table_args__ = (Index("ix_outbox_events_published_at_id", "published_at", "id"),)
+    # On PostgreSQL the table is range-partitioned by month on occurred_at (primary key (id, occurred_at)).
+    __table_args__ = (
+        Index(
+            "ix_outbox_events_pending_occurred_at_id",
+            "occurred_at",
+            "id",
+            postgresql_where=text("published_at IS NULL"),
+            sqlite_where=text("published_at IS NULL"),
+        ),
+        # Lets a claim check cheaply whether an earlier event of the same aggregate is waiting for a retry.
+        Index(
+            "ix_outbox_events_pending_aggregate",
+            "aggregate_type",
+            "aggregate_id",
+            "occurred_at",
+            "id",
+            postgresql_where=text("published_at IS NULL"),
+            sqlite_where=text("published_at IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     aggregate_type: Mapped[str] = mapped_column(String(100), nullable=False)
     aggregate_id: Mapped[str] = mapped_column(String(100), nullable=False)
     event_type: Mapped[str] = mapped_column(String(150), nullable=False)
+    shard_key: Mapped[int] = mapped_column(
+        Integer,
+        default=_default_shard_key,
+        server_default=text("0"),
+        nullable=False,
+    )
     payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
     occurred_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -22,3 +59,30 @@ class OutboxEvent(BaseModel):
         nullable=False,
     )
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, default=None)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default=text("0"), nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True, default=None)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+class OutboxDeadLetter(BaseModel):
+    __tablename__ = "outbox_dead_letters"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    outbox_event_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    aggregate_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    aggregate_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(150), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    dead_lettered_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Any
+
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.common.observability import log_layer_event
+from app.core.db.database import DatabaseManager
+from app.features.outbox.repository import OUTBOX_NOTIFY_CHANNEL
+
+logger = logging.getLogger("app.outbox")
+
+
+class OutboxNotificationListener:
+    def __init__(
+        self,
+        *,
+        database_url: URL,
+        channel: str = OUTBOX_NOTIFY_CHANNEL,
+        reconnect_backoff_seconds: float = 1.0,
+        max_reconnect_backoff_seconds: float = 30.0,
+    ) -> None:
+        self._database_url = database_url
+        self._channel = channel
+        self._reconnect_backoff_seconds = reconnect_backoff_seconds
+        self._max_reconnect_backoff_seconds = max(max_reconnect_backoff_seconds, reconnect_backoff_seconds)
+        self._engine: AsyncEngine | None = None
+        self._connection: AsyncConnection | None = None
+        self._driver_connection: Any = None
+        self._callback: Callable[..., None] | None = None
+        self._termination_callback: Callable[..., None] | None = None
+        self._on_notify: Callable[[], None] | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
+
+    @property
+    def supported(self) -> bool:
+        return self._database_url.get_backend_name() == "postgresql"
+
+    @property
+    def listening(self) -> bool:
+        return self._callback is not None
+
+    async def start(self, on_notify: Callable[[], None]) -> bool:
+        if not self.supported:
+            return False
+        if self._on_notify is not None:
+            return True
+
+        await self._listen(on_notify)
+        self._on_notify = on_notify
+        log_layer_event(logger, layer="infrastructure", event="outbox_listener_started", channel=self._channel)
+        return True
+
+    async def stop(self) -> None:
+        started = self._on_notify is not None
+        # Cleared first so the termination callback fired by closing the connection does not schedule a reconnect.
+        self._on_notify = None
+        reconnect_task = self._reconnect_task
+        if reconnect_task is not None:
+            reconnect_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await reconnect_task
+        if self._callback is not None and self._driver_connection is not None:
+            with suppress(Exception):
+                await self._driver_connection.remove_listener(self._channel, self._callback)
+        if started:
+            log_layer_event(logger, layer="infrastructure", event="outbox_listener_stopped", channel=self._channel)
+        await self._close()
+
+    async def _listen(self, on_notify: Callable[[], None]) -> None:
+        # The listening connection is held for the relay's lifetime, so it gets its own engine instead of a pooled slot.
+        self._engine = DatabaseManager.build_engine(self._database_url)
+        try:
+            self._connection = await self._engine.connect()
+            raw_connection = await self._connection.get_raw_connection()
+            self._driver_connection = raw_connection.driver_connection
+
+            def callback(*_args: object) -> None:
+                on_notify()
+
+            def termination_callback(*_args: object) -> None:
+                self._handle_connection_lost()
+
+            await self._driver_connection.add_listener(self._channel, callback)
+            self._driver_connection.add_termination_listener(termination_callback)
+        except Exception:
+            await self._close()
+            raise
+
+        self._callback = callback
+        self._termination_callback = termination_callback
+
+    def _handle_connection_lost(self) -> None:
+        on_notify = self._on_notify
+        if on_notify is None or self._reconnect_task is not None:
+            return
+
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_listener_lost",
+            level=logging.WARNING,
+            channel=self._channel,
+        )
+        self._callback = None
+        # Notifications sent while the connection is down are lost, so the relay polls instead of waiting for one.
+        on_notify()
+        self._reconnect_task = asyncio.get_running_loop().create_task(
+            self._reconnect(on_notify),
+            name="outbox-listener-reconnect",
+        )
+
+    async def _reconnect(self, on_notify: Callable[[], None]) -> None:
+        backoff_seconds = self._reconnect_backoff_seconds
+        try:
+            await self._close()
+            while True:
+                try:
+                    await self._listen(on_notify)
+                except Exception:
+                    logger.exception(
+                        "event=outbox_listener_reconnect_failed layer=infrastructure channel=%s retry_in_seconds=%s",
+                        self._channel,
+                        backoff_seconds,
+                    )
+                    await asyncio.sleep(backoff_seconds)
+                    backoff_seconds = min(backoff_seconds * 2, self._max_reconnect_backoff_seconds)
+                    continue
+
+                log_layer_event(
+                    logger,
+                    layer="infrastructure",
+                    event="outbox_listener_reconnected",
+                    channel=self._channel,
+                )
+                on_notify()
+                return
+        finally:
+            self._reconnect_task = None
+
+    async def _close(self) -> None:
+        if self._termination_callback is not None and self._driver_connection is not None:
+            with suppress(Exception):
+                self._driver_connection.remove_termination_listener(self._termination_callback)
+        if self._connection is not None:
+            with suppress(Exception):
+                await self._connection.close()
+        if self._engine is not None:
+            await self._engine.dispose()
+        self._engine = None
+        self._connection = None
+        self._driver_connection = None
+        self._callback = None
+        self._termination_callback = None
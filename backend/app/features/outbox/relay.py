@@ -0,0 +1,310 @@
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+from typing import Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.integration import PublishMessageCommand
+from app.core.common.observability import log_layer_event
+from app.core.db.uow import UnitOfWork
+from app.features.outbox.repository import OutboxRepository
+from app.features.outbox.schemas import OutboxDeliveryFailure, OutboxEventRecord
+from app.integrations.broker import MessageBrokerPort
+
+logger = logging.getLogger("app.outbox")
+
+_MAX_ERROR_LENGTH = 1_000
+
+
+class OutboxNotificationListenerPort(Protocol):
+    async def start(self, on_notify: Callable[[], None]) -> bool: ...
+
+    async def stop(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class OutboxRelayBatchResult:
+    claimed_count: int
+    published_count: int
+    retried_count: int = 0
+    dead_lettered_count: int = 0
+
+    @property
+    def failed(self) -> bool:
+        return self.published_count < self.claimed_count
+
+
+@dataclass
+class OutboxShardMetrics:
+    shard_index: int
+    batch_count: int = 0
+    claimed_count: int = 0
+    published_count: int = 0
+    failed_batch_count: int = 0
+    retried_count: int = 0
+    dead_lettered_count: int = 0
+    error_count: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        if self.busy_seconds <= 0:
+            return 0.0
+        return self.published_count / self.busy_seconds
+
+    def record_batch(self, result: OutboxRelayBatchResult, *, duration_seconds: float) -> None:
+        self.batch_count += 1
+        self.claimed_count += result.claimed_count
+        self.published_count += result.published_count
+        self.failed_batch_count += int(result.failed)
+        self.retried_count += result.retried_count
+        self.dead_lettered_count += result.dead_lettered_count
+        self.busy_seconds += duration_seconds
+
+
+def _describe_error(exc: Exception) -> str:
+    return f"{type(exc).__name__}: {exc}"[:_MAX_ERROR_LENGTH]
+
+
+def to_publish_message_command(event: OutboxEventRecord) -> PublishMessageCommand:
+    return PublishMessageCommand(
+        topic=event.aggregate_type,
+        key=event.aggregate_id,
+        payload={
+            "event_id": event.id,
+            "event_type": event.event_type,
+            "aggregate_type": event.aggregate_type,
+            "aggregate_id": event.aggregate_id,
+            "occurred_at": event.occurred_at.isoformat(),
+            "payload": event.payload,
+        },
+    )
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        message_broker: MessageBrokerPort,
+        batch_size: int = 100,
+        poll_interval_seconds: float = 1.0,
+        max_poll_interval_seconds: float = 10.0,
+        notification_listener: OutboxNotificationListenerPort | None = None,
+        shard_count: int = 1,
+        shard_indexes: Sequence[int] | None = None,
+        max_attempts: int = 10,
+        retry_base_seconds: float = 1.0,
+        retry_max_seconds: float = 300.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._session_factory = session_factory
+        self._message_broker = message_broker
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._max_poll_interval_seconds = max(max_poll_interval_seconds, poll_interval_seconds)
+        self._notification_listener = notification_listener
+        self._shard_count = shard_count
+        self._shard_indexes = tuple(range(shard_count)) if shard_indexes is None else tuple(shard_indexes)
+        self._metrics = {shard_index: OutboxShardMetrics(shard_index) for shard_index in self._shard_indexes}
+        self._wakeups = {shard_index: asyncio.Event() for shard_index in self._shard_indexes}
+        self._max_attempts = max_attempts
+        self._retry_base_seconds = retry_base_seconds
+        self._retry_max_seconds = retry_max_seconds
+        self._clock = clock
+
+    @property
+    def shard_metrics(self) -> dict[int, OutboxShardMetrics]:
+        return dict(self._metrics)
+
+    def wake(self) -> None:
+        for wakeup in self._wakeups.values():
+            wakeup.set()
+
+    def retry_delay(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self._retry_base_seconds * 2 ** (attempts - 1), self._retry_max_seconds))
+
+    async def _publish(self, events: list[OutboxEventRecord]) -> tuple[list[int], list[OutboxDeliveryFailure]]:
+        published_ids: list[int] = []
+        failures: list[OutboxDeliveryFailure] = []
+        failed_aggregates: set[tuple[str, str]] = set()
+        for event in events:
+            aggregate = (event.aggregate_type, event.aggregate_id)
+            if aggregate in failed_aggregates:
+                # Later events of a failed aggregate wait for it, so they are never published out of order.
+                continue
+            try:
+                await self._message_broker.publish(to_publish_message_command(event))
+            except Exception as exc:
+                logger.exception(
+                    "event=outbox_relay_publish_failed layer=integration outbox_event_id=%s event_type=%s attempts=%s",
+                    event.id,
+                    event.event_type,
+                    event.attempts + 1,
+                )
+                failed_aggregates.add(aggregate)
+                failures.append(OutboxDeliveryFailure(event=event, error=_describe_error(exc)))
+                continue
+            published_ids.append(event.id)
+        return published_ids, failures
+
+    async def _record_failures(
+        self,
+        outbox_repository: OutboxRepository,
+        failures: list[OutboxDeliveryFailure],
+        *,
+        now: datetime,
+    ) -> tuple[int, int]:
+        dead_letters = [failure for failure in failures if failure.attempts >= self._max_attempts]
+        retries = [failure for failure in failures if failure.attempts < self._max_attempts]
+        for failure in retries:
+            await outbox_repository.schedule_retry(
+                failure.event.id,
+                attempts=failure.attempts,
+                last_error=failure.error,
+                available_at=now + self.retry_delay(failure.attempts),
+            )
+        dead_lettered_count = await outbox_repository.move_to_dead_letters(dead_letters, dead_lettered_at=now)
+        return len(retries), dead_lettered_count
+
+    async def relay_batch(self, shard_index: int | None = None) -> OutboxRelayBatchResult:
+        shard_index = self._shard_indexes[0] if shard_index is None else shard_index
+        started_at = perf_counter()
+        async with self._session_factory() as session:
+            outbox_repository = OutboxRepository(session=session)
+            async with UnitOfWork(session=session):
+                now = self._clock()
+                events = await outbox_repository.claim_pending(
+                    limit=self._batch_size,
+                    shard_count=self._shard_count,
+                    shard_index=shard_index,
+                    now=now,
+                )
+                published_ids, failures = await self._publish(events)
+                await outbox_repository.mark_published_many(published_ids)
+                retried_count, dead_lettered_count = await self._record_failures(
+                    outbox_repository,
+                    failures,
+                    now=now,
+                )
+
+        result = OutboxRelayBatchResult(
+            claimed_count=len(events),
+            published_count=len(published_ids),
+            retried_count=retried_count,
+            dead_lettered_count=dead_lettered_count,
+        )
+        if result.claimed_count:
+            metrics = self._metrics[shard_index]
+            metrics.record_batch(result, duration_seconds=perf_counter() - started_at)
+            log_layer_event(
+                logger,
+                layer="integration",
+                event="outbox_relay_batch_published",
+                shard=shard_index,
+                claimed_count=result.claimed_count,
+                published_count=result.published_count,
+                retried_count=result.retried_count,
+                dead_lettered_count=result.dead_lettered_count,
+                shard_published_total=metrics.published_count,
+                shard_events_per_second=round(metrics.events_per_second, 1),
+            )
+        return result
+
+    async def _drain_shard(self, shard_index: int) -> int:
+        published_count = 0
+        while True:
+            result = await self.relay_batch(shard_index)
+            published_count += result.published_count
+            if result.failed or result.claimed_count < self._batch_size:
+                return published_count
+
+    async def drain(self) -> int:
+        # Shards drain concurrently; events of one aggregate always hash to the same shard and stay in order.
+        published_counts = await asyncio.gather(
+            *(self._drain_shard(shard_index) for shard_index in self._shard_indexes)
+        )
+        return sum(published_counts)
+
+    async def _start_listening(self) -> bool:
+        if self._notification_listener is None:
+            return False
+        try:
+            return await self._notification_listener.start(self.wake)
+        except Exception:
+            logger.exception("event=outbox_relay_listen_failed layer=integration fallback=polling")
+            return False
+
+    async def _wait_for_wakeup(self, stop_event: asyncio.Event, wakeup: asyncio.Event, *, timeout: float) -> bool:
+        waiters = {asyncio.ensure_future(stop_event.wait()), asyncio.ensure_future(wakeup.wait())}
+        done, pending = await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in pending:
+            waiter.cancel()
+        return bool(done)
+
+    async def _run_shard(self, shard_index: int, stop_event: asyncio.Event) -> None:
+        wakeup = self._wakeups[shard_index]
+        poll_interval_seconds = self._poll_interval_seconds
+        while not stop_event.is_set():
+            # Cleared before draining so a notification that lands mid-drain triggers another pass.
+            wakeup.clear()
+            try:
+                published_count = await self._drain_shard(shard_index)
+            except Exception:
+                self._metrics[shard_index].error_count += 1
+                logger.exception(
+                    "event=outbox_relay_batch_failed layer=integration shard=%s retry_in_seconds=%s",
+                    shard_index,
+                    poll_interval_seconds,
+                )
+                # Wakeups do not cut this wait short, so a database outage is not retried in a tight loop.
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(stop_event.wait(), timeout=poll_interval_seconds)
+                poll_interval_seconds = min(poll_interval_seconds * 2, self._max_poll_interval_seconds)
+                continue
+
+            if published_count:
+                poll_interval_seconds = self._poll_interval_seconds
+            if await self._wait_for_wakeup(stop_event, wakeup, timeout=poll_interval_seconds):
+                poll_interval_seconds = self._poll_interval_seconds
+            else:
+                # Idle polls back off exponentially; they only cover missed notifications or backends without them.
+                poll_interval_seconds = min(poll_interval_seconds * 2, self._max_poll_interval_seconds)
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        self._wakeups = {shard_index: asyncio.Event() for shard_index in self._shard_indexes}
+        listening = await self._start_listening()
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="outbox_relay_started",
+            batch_size=self._batch_size,
+            listening=listening,
+            shard_count=self._shard_count,
+            shards=",".join(str(shard_index) for shard_index in self._shard_indexes),
+        )
+        try:
+            await asyncio.gather(*(self._run_shard(shard_index, stop_event) for shard_index in self._shard_indexes))
+        finally:
+            if listening and self._notification_listener is not None:
+                await self._notification_listener.stop()
+        for metrics in self._metrics.values():
+            log_layer_event(
+                logger,
+                layer="integration",
+                event="outbox_relay_shard_stopped",
+                shard=metrics.shard_index,
+                batch_count=metrics.batch_count,
+                published_count=metrics.published_count,
+                failed_batch_count=metrics.failed_batch_count,
+                error_count=metrics.error_count,
+                retried_count=metrics.retried_count,
+                dead_lettered_count=metrics.dead_lettered_count,
+                events_per_second=round(metrics.events_per_second, 1),
+            )
+        log_layer_event(logger, layer="integration", event="outbox_relay_stopped")
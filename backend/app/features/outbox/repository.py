@@ -1,17 +1,44 @@
 import logging
-from datetime import UTC, datetime
+import re
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select, text, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.core.common.observability import log_layer_event
 from app.core.db.repository_base import BaseRepository
 from app.core.errors.repositories import RepositoryError
-from app.features.outbox.models import OutboxEvent
-from app.features.outbox.schemas import OutboxEventRecord
+from app.features.outbox.models import OutboxDeadLetter, OutboxEvent
+from app.features.outbox.schemas import EnqueueOutboxEventCommand, OutboxDeliveryFailure, OutboxEventRecord
 
 logger = logging.getLogger("app.outbox")
 
+OUTBOX_NOTIFY_CHANNEL = "outbox_events"
+
+_DEFAULT_PARTITION_NAME = "outbox_events_default"
+_DEFAULT_ARCHIVE_NAME = "outbox_events_archive_default"
+_PARTITION_NAME_PATTERN = re.compile(r"^outbox_events_p(\d{4})(\d{2})$")
+_LIST_PARTITIONS_SQL = text(
+    """
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = 'outbox_events'
+    """
+)
+
+
+def add_months(month_start: date, months: int) -> date:
+    month_index = month_start.month - 1 + months
+    return date(month_start.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def outbox_partition_name(month_start: date) -> str:
+    return f"outbox_events_p{month_start:%Y%m}"
+
 
 class OutboxRepository(BaseRepository[OutboxEvent]):
     def __init__(self, session: AsyncSession):
@@ -44,6 +71,24 @@ class OutboxRepository(BaseRepository[OutboxEvent]):
         )
         return self._to_record(outbox_event)
 
+    async def create_events(self, events: Sequence[EnqueueOutboxEventCommand]) -> list[OutboxEventRecord]:
+        if not events:
+            return []
+
+        # Executemany with RETURNING is sent as batched multi-row INSERT ... RETURNING statements.
+        result = await self.session.scalars(
+            insert(OutboxEvent).returning(OutboxEvent, sort_by_parameter_order=True),
+            [event.model_dump() for event in events],
+        )
+        outbox_events = list(result.all())
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_events_persisted",
+            event_count=len(outbox_events),
+        )
+        return self._to_records(outbox_events)
+
     async def list_pending(self, *, limit: int = 100) -> list[OutboxEventRecord]:
         if limit < 1:
             raise RepositoryError("Limit must be greater than or equal to 1")
@@ -58,6 +103,147 @@ class OutboxRepository(BaseRepository[OutboxEvent]):
         outbox_events = list(result.scalars().all())
         return self._to_records(outbox_events)
 
+    async def notify_pending(self) -> None:
+        if self.session.get_bind().dialect.name != "postgresql":
+            return
+
+        # NOTIFY is transactional: listening relays are woken only once the enqueueing transaction commits.
+        await self.session.execute(select(func.pg_notify(OUTBOX_NOTIFY_CHANNEL, "")))
+
+    async def claim_pending(
+        self,
+        *,
+        limit: int = 100,
+        shard_count: int = 1,
+        shard_index: int = 0,
+        now: datetime | None = None,
+    ) -> list[OutboxEventRecord]:
+        if limit < 1:
+            raise RepositoryError("Limit must be greater than or equal to 1")
+        if shard_count < 1 or not 0 <= shard_index < shard_count:
+            raise RepositoryError("Shard index must be between 0 and shard count - 1")
+
+        now = now or datetime.now(UTC)
+        earlier_event = aliased(OutboxEvent)
+        # An event waiting for its retry holds back the later events of its aggregate, so they stay in order.
+        retry_pending_before = (
+            select(earlier_event.id)
+            .where(
+                earlier_event.aggregate_type == OutboxEvent.aggregate_type,
+                earlier_event.aggregate_id == OutboxEvent.aggregate_id,
+                earlier_event.published_at.is_(None),
+                earlier_event.available_at > now,
+                tuple_(earlier_event.occurred_at, earlier_event.id) < tuple_(OutboxEvent.occurred_at, OutboxEvent.id),
+            )
+            .exists()
+        )
+        query = (
+            select(OutboxEvent)
+            .where(
+                OutboxEvent.published_at.is_(None),
+                OutboxEvent.available_at <= now,
+                ~retry_pending_before,
+            )
+            .order_by(OutboxEvent.occurred_at.asc(), OutboxEvent.id.asc())
+            .limit(limit)
+        )
+        if shard_count > 1:
+            query = query.where(OutboxEvent.shard_key % shard_count == shard_index)
+        query = await self._lock_for_claim(query)
+
+        result = await self.session.execute(query)
+        return self._to_records(list(result.scalars().all()))
+
+    async def mark_published_many(
+        self,
+        event_ids: Sequence[int],
+        *,
+        published_at: datetime | None = None,
+    ) -> int:
+        if not event_ids:
+            return 0
+
+        result = await self.session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(event_ids), OutboxEvent.published_at.is_(None))
+            .values(published_at=published_at or datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+        published_count = result.rowcount
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_events_marked_published",
+            requested_count=len(event_ids),
+            published_count=published_count,
+        )
+        return published_count
+
+    async def schedule_retry(
+        self,
+        event_id: int,
+        *,
+        attempts: int,
+        last_error: str,
+        available_at: datetime,
+    ) -> None:
+        await self.session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id == event_id)
+            .values(attempts=attempts, last_error=last_error, available_at=available_at)
+            .execution_options(synchronize_session=False)
+        )
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_event_retry_scheduled",
+            outbox_event_id=event_id,
+            attempts=attempts,
+            available_at=available_at.isoformat(),
+        )
+
+    async def move_to_dead_letters(
+        self,
+        failures: Sequence[OutboxDeliveryFailure],
+        *,
+        dead_lettered_at: datetime | None = None,
+    ) -> int:
+        if not failures:
+            return 0
+
+        dead_lettered_at = dead_lettered_at or datetime.now(UTC)
+        await self.session.execute(
+            insert(OutboxDeadLetter).values(
+                [
+                    {
+                        "outbox_event_id": failure.event.id,
+                        "aggregate_type": failure.event.aggregate_type,
+                        "aggregate_id": failure.event.aggregate_id,
+                        "event_type": failure.event.event_type,
+                        "payload": failure.event.payload,
+                        "occurred_at": failure.event.occurred_at,
+                        "attempts": failure.attempts,
+                        "last_error": failure.error,
+                        "dead_lettered_at": dead_lettered_at,
+                    }
+                    for failure in failures
+                ]
+            )
+        )
+        result = await self.session.execute(
+            delete(OutboxEvent)
+            .where(OutboxEvent.id.in_([failure.event.id for failure in failures]))
+            .execution_options(synchronize_session=False)
+        )
+        moved_count = result.rowcount
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_events_dead_lettered",
+            moved_count=moved_count,
+        )
+        return moved_count
+
     async def get_event(self, event_id: int) -> OutboxEventRecord | None:
         outbox_event = await self.get(event_id)
         if outbox_event is None:
@@ -85,3 +271,128 @@ class OutboxRepository(BaseRepository[OutboxEvent]):
             outbox_event_id=outbox_event.id,
         )
         return self._to_record(outbox_event)
+
+    def supports_partitions(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    async def list_partition_months(self) -> list[date]:
+        result = await self.session.execute(_LIST_PARTITIONS_SQL)
+        return sorted(
+            date(int(match.group(1)), int(match.group(2)), 1)
+            for partition_name in result.scalars()
+            if (match := _PARTITION_NAME_PATTERN.match(partition_name))
+        )
+
+    async def create_partition(self, month_start: date) -> str:
+        # Partition names and bounds are derived from dates only, so they are safe to inline in DDL.
+        partition_name = outbox_partition_name(month_start)
+        month_start_literal = month_start.isoformat()
+        month_end_literal = add_months(month_start, 1).isoformat()
+        in_month = f"occurred_at >= '{month_start_literal}' AND occurred_at < '{month_end_literal}'"
+        create_sql = text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name} PARTITION OF outbox_events "
+            f"FOR VALUES FROM ('{month_start_literal}') TO ('{month_end_literal}')"
+        )
+        # Blocks writes into the default partition until commit, so no row for the month lands there after the check.
+        await self.session.execute(text(f"LOCK TABLE {_DEFAULT_PARTITION_NAME} IN EXCLUSIVE MODE"))
+        result = await self.session.execute(
+            text(f"SELECT EXISTS (SELECT 1 FROM {_DEFAULT_PARTITION_NAME} WHERE {in_month})")
+        )
+        moved_count = 0
+        if not result.scalar():
+            await self.session.execute(create_sql)
+        else:
+            # PostgreSQL rejects a partition whose range already has rows in the default partition, so those rows are
+            # moved into the new partition while the default is detached.
+            columns = ", ".join(column.name for column in OutboxEvent.__table__.columns)
+            await self.session.execute(text(f"ALTER TABLE outbox_events DETACH PARTITION {_DEFAULT_PARTITION_NAME}"))
+            await self.session.execute(create_sql)
+            moved = await self.session.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {_DEFAULT_PARTITION_NAME} WHERE {in_month} RETURNING {columns}) "
+                    f"INSERT INTO {partition_name} ({columns}) SELECT {columns} FROM moved"
+                )
+            )
+            moved_count = moved.rowcount
+            await self.session.execute(
+                text(f"ALTER TABLE outbox_events ATTACH PARTITION {_DEFAULT_PARTITION_NAME} DEFAULT")
+            )
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_partition_created",
+            partition=partition_name,
+            moved_from_default_count=moved_count,
+        )
+        return partition_name
+
+    async def partition_has_pending(self, month_start: date) -> bool:
+        partition_name = outbox_partition_name(month_start)
+        # Blocks writes into the partition until the transaction ends, so nothing turns pending before it is removed.
+        await self.session.execute(text(f"LOCK TABLE {partition_name} IN SHARE MODE"))
+        result = await self.session.execute(
+            text(f"SELECT EXISTS (SELECT 1 FROM {partition_name} WHERE published_at IS NULL)")
+        )
+        return bool(result.scalar())
+
+    async def remove_partition(self, month_start: date, *, archive: bool = False) -> str:
+        partition_name = outbox_partition_name(month_start)
+        await self.session.execute(text(f"ALTER TABLE outbox_events DETACH PARTITION {partition_name}"))
+        if archive:
+            archived_name = f"outbox_events_archive_{month_start:%Y%m}"
+            await self.session.execute(text(f"ALTER TABLE {partition_name} RENAME TO {archived_name}"))
+        else:
+            await self.session.execute(text(f"DROP TABLE {partition_name}"))
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_partition_removed",
+            partition=partition_name,
+            archived=archive,
+        )
+        return partition_name
+
+    async def delete_published_before(self, cutoff: datetime) -> int:
+        # Events are published after they occur, so the occurred_at bound only lets PostgreSQL prune recent partitions.
+        result = await self.session.execute(
+            delete(OutboxEvent)
+            .where(
+                OutboxEvent.published_at.is_not(None),
+                OutboxEvent.published_at < cutoff,
+                OutboxEvent.occurred_at < cutoff,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        deleted_count = result.rowcount
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_published_events_deleted",
+            deleted_count=deleted_count,
+        )
+        return deleted_count
+
+    async def archive_default_published_before(self, cutoff: datetime) -> int:
+        # Rows in the default partition are never rotated out with a monthly partition, so archive mode moves them
+        # into a standing archive table instead.
+        columns = ", ".join(column.name for column in OutboxEvent.__table__.columns)
+        await self.session.execute(
+            text(f"CREATE TABLE IF NOT EXISTS {_DEFAULT_ARCHIVE_NAME} (LIKE outbox_events INCLUDING DEFAULTS)")
+        )
+        result = await self.session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {_DEFAULT_PARTITION_NAME} "
+                "WHERE published_at IS NOT NULL AND published_at < :cutoff AND occurred_at < :cutoff "
+                f"RETURNING {columns}) "
+                f"INSERT INTO {_DEFAULT_ARCHIVE_NAME} ({columns}) SELECT {columns} FROM moved"
+            ),
+            {"cutoff": cutoff},
+        )
+        archived_count = result.rowcount
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_default_partition_archived",
+            archived_count=archived_count,
+        )
+        return archived_count
@@ -0,0 +1,100 @@
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, time, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.observability import log_layer_event
+from app.core.db.uow import UnitOfWork
+from app.features.outbox.repository import OutboxRepository, add_months, outbox_partition_name
+
+logger = logging.getLogger("app.outbox")
+
+
+@dataclass(frozen=True)
+class OutboxRetentionReport:
+    created_partitions: tuple[str, ...] = ()
+    removed_partitions: tuple[str, ...] = ()
+    kept_partitions: tuple[str, ...] = ()
+    deleted_count: int = 0
+    archived_count: int = 0
+
+
+class OutboxRetention:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        retention_days: int = 30,
+        archive: bool = False,
+        premake_months: int = 3,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._session_factory = session_factory
+        self._retention_days = retention_days
+        self._archive = archive
+        self._premake_months = premake_months
+        self._clock = clock
+
+    async def run(self) -> OutboxRetentionReport:
+        now = self._clock()
+        cutoff = now - timedelta(days=self._retention_days)
+        created_partitions: list[str] = []
+        removed_partitions: list[str] = []
+        kept_partitions: list[str] = []
+        deleted_count = 0
+        archived_count = 0
+
+        async with self._session_factory() as session:
+            outbox_repository = OutboxRepository(session=session)
+            unit_of_work = UnitOfWork(session=session)
+            if outbox_repository.supports_partitions():
+                async with unit_of_work:
+                    partition_months = await outbox_repository.list_partition_months()
+                    current_month = now.date().replace(day=1)
+                    for offset in range(self._premake_months + 1):
+                        month_start = add_months(current_month, offset)
+                        if month_start not in partition_months:
+                            created_partitions.append(await outbox_repository.create_partition(month_start))
+
+                for month_start in partition_months:
+                    partition_end = datetime.combine(add_months(month_start, 1), time.min, tzinfo=UTC)
+                    if partition_end > cutoff:
+                        continue
+                    # One transaction per partition keeps each partition lock short.
+                    async with unit_of_work:
+                        if await outbox_repository.partition_has_pending(month_start):
+                            kept_partitions.append(outbox_partition_name(month_start))
+                            continue
+                        removed_partitions.append(
+                            await outbox_repository.remove_partition(month_start, archive=self._archive)
+                        )
+
+            if not self._archive:
+                # Covers SQLite and rows that landed in the PostgreSQL default partition.
+                async with unit_of_work:
+                    deleted_count = await outbox_repository.delete_published_before(cutoff)
+            elif outbox_repository.supports_partitions():
+                async with unit_of_work:
+                    archived_count = await outbox_repository.archive_default_published_before(cutoff)
+
+        report = OutboxRetentionReport(
+            created_partitions=tuple(created_partitions),
+            removed_partitions=tuple(removed_partitions),
+            kept_partitions=tuple(kept_partitions),
+            deleted_count=deleted_count,
+            archived_count=archived_count,
+        )
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="outbox_retention_completed",
+            created_count=len(report.created_partitions),
+            removed_count=len(report.removed_partitions),
+            kept_count=len(report.kept_partitions),
+            deleted_count=report.deleted_count,
+            archived_count=report.archived_count,
+            archive=self._archive,
+        )
+        return report
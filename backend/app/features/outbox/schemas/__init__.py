@@ -1,5 +1,6 @@
 from app.features.outbox.schemas.app import (
     EnqueueOutboxEventCommand,
+    OutboxDeliveryFailure,
     OutboxEventRecord,
     OutboxEventResult,
 )
@@ -21,9 +21,21 @@ class OutboxEventRecord(ApplicationSchema):
     payload: dict[str, Any]
     occurred_at: datetime
     published_at: datetime | None
+    attempts: int = 0
+    last_error: str | None = None
+    available_at: datetime | None = None
 
     model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 class OutboxEventResult(OutboxEventRecord):
     pass
+
+
+class OutboxDeliveryFailure(ApplicationSchema):
+    event: OutboxEventRecord
+    error: str
+
+    @property
+    def attempts(self) -> int:
+        return self.event.attempts + 1
@@ -1,4 +1,6 @@
 import logging
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Protocol
 
 from app.core.common.observability import log_layer_event
@@ -14,10 +16,14 @@ OutboxRepositoryPort = OutboxPersistencePort
 class OutboxServicePort(Protocol):
     async def enqueue(self, event: EnqueueOutboxEventCommand) -> OutboxEventResult: ...
 
+    async def enqueue_many(self, events: Sequence[EnqueueOutboxEventCommand]) -> list[OutboxEventResult]: ...
+
     async def list_pending(self, *, limit: int = 100) -> list[OutboxEventResult]: ...
 
     async def mark_published(self, event_id: int) -> OutboxEventResult | None: ...
 
+    async def mark_published_many(self, event_ids: Sequence[int], *, published_at: datetime | None = None) -> int: ...
+
 
 class OutboxService:
     def __init__(
@@ -36,6 +42,7 @@ class OutboxService:
                 event_type=event.event_type,
                 payload=event.payload,
             )
+            await self.outbox_repository.notify_pending()
         log_layer_event(
             logger,
             layer="integration",
@@ -46,6 +53,21 @@ class OutboxService:
         )
         return OutboxEventResult.from_domain(outbox_event)
 
+    async def enqueue_many(self, events: Sequence[EnqueueOutboxEventCommand]) -> list[OutboxEventResult]:
+        if not events:
+            return []
+
+        async with self.unit_of_work:
+            outbox_events = await self.outbox_repository.create_events(events)
+            await self.outbox_repository.notify_pending()
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="outbox_events_enqueued",
+            event_count=len(outbox_events),
+        )
+        return OutboxEventResult.from_domain_list(outbox_events)
+
     async def list_pending(self, *, limit: int = 100) -> list[OutboxEventResult]:
         outbox_events = await self.outbox_repository.list_pending(limit=limit)
         log_layer_event(
@@ -76,3 +98,18 @@ class OutboxService:
             outbox_event_id=outbox_event.id,
         )
         return OutboxEventResult.from_domain(outbox_event)
+
+    async def mark_published_many(self, event_ids: Sequence[int], *, published_at: datetime | None = None) -> int:
+        if not event_ids:
+            return 0
+
+        async with self.unit_of_work:
+            published_count = await self.outbox_repository.mark_published_many(event_ids, published_at=published_at)
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="outbox_publish_marked_many",
+            requested_count=len(event_ids),
+            published_count=published_count,
+        )
+        return published_count
@@ -0,0 +1 @@
+"""Backend feature package for Rate Limit."""
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db.base import BaseModel
+
+
+class RateLimitBucket(BaseModel):
+    __tablename__ = "rate_limit_buckets"
+    __table_args__ = (
+        # Pruning deletes the buckets that have refilled completely, which behave exactly like a missing row.
+        Index("ix_rate_limit_buckets_full_at", "full_at"),
+    )
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    tokens: Mapped[float] = mapped_column(Float, nullable=False)
+    refilled_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    full_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,48 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.integration import RateLimitDecision, TakeRateLimitTokenCommand
+from app.core.db.repository_base import BaseRepository
+from app.core.errors.repositories import RepositoryInternalError
+from app.features.rate_limit.models import RateLimitBucket
+from app.integrations.rate_limit import refill_and_take
+
+
+class RateLimitRepository(BaseRepository[RateLimitBucket]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, RateLimitBucket)
+
+    async def take(self, command: TakeRateLimitTokenCommand, *, now: datetime) -> RateLimitDecision:
+        # Inserting a full bucket first lets every worker lock the same row, even for a key none of them has seen.
+        insert = postgresql.insert if self.session.get_bind().dialect.name == "postgresql" else sqlite.insert
+        await self.session.execute(
+            insert(RateLimitBucket)
+            .values(key=command.key, tokens=float(command.capacity), refilled_at=now, full_at=now)
+            .on_conflict_do_nothing(index_elements=[RateLimitBucket.key])
+        )
+        bucket = await self.session.scalar(
+            select(RateLimitBucket)
+            .where(RateLimitBucket.key == command.key)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        if bucket is None:
+            raise RepositoryInternalError(message=f"Rate limit bucket {command.key} not found")
+
+        refilled_at = bucket.refilled_at if bucket.refilled_at.tzinfo else bucket.refilled_at.replace(tzinfo=UTC)
+        tokens, decision = refill_and_take(bucket.tokens, (now - refilled_at).total_seconds(), command)
+        bucket.tokens = tokens
+        bucket.refilled_at = now
+        bucket.full_at = now + timedelta(seconds=(command.capacity - tokens) / command.refill_per_second)
+        await self.session.flush()
+        return decision
+
+    async def delete_full_buckets(self, *, now: datetime) -> int:
+        # A bucket past full_at holds its whole capacity again, which is what a missing row starts with.
+        result = await self.session.execute(
+            delete(RateLimitBucket).where(RateLimitBucket.full_at <= now).execution_options(synchronize_session=False)
+        )
+        return result.rowcount
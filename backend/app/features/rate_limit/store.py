@@ -0,0 +1,54 @@
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.integration import RateLimitDecision, TakeRateLimitTokenCommand
+from app.core.common.observability import log_layer_event
+from app.core.db.uow import UnitOfWork
+from app.features.rate_limit.repository import RateLimitRepository
+
+logger = logging.getLogger("app.rate_limit")
+
+
+class DatabaseRateLimitStore:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        prune_interval_seconds: float = 60.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._session_factory = session_factory
+        self._prune_interval = timedelta(seconds=prune_interval_seconds)
+        self._clock = clock
+        self._pruned_at: datetime | None = None
+
+    async def take(self, command: TakeRateLimitTokenCommand) -> RateLimitDecision:
+        now = self._clock()
+        # Each check commits on its own session, so the row lock is held only for this read-modify-write.
+        async with self._session_factory() as session, UnitOfWork(session=session):
+            decision = await RateLimitRepository(session).take(command, now=now)
+
+        if self._pruned_at is None or now - self._pruned_at >= self._prune_interval:
+            self._pruned_at = now
+            await self._prune_logged(now)
+        return decision
+
+    async def prune(self, *, now: datetime | None = None) -> int:
+        async with self._session_factory() as session, UnitOfWork(session=session):
+            return await RateLimitRepository(session).delete_full_buckets(now=now or self._clock())
+
+    async def _prune_logged(self, now: datetime) -> None:
+        # Pruning only bounds the table size, so a failure must not fail the login that triggered it.
+        try:
+            deleted_count = await self.prune(now=now)
+        except Exception:
+            logger.exception("event=rate_limit_prune_failed layer=infrastructure")
+            return
+
+        if deleted_count:
+            log_layer_event(
+                logger, layer="infrastructure", event="rate_limit_buckets_pruned", deleted_count=deleted_count
+            )
@@ -1,8 +1,16 @@
 from collections.abc import Iterable
 
-from app.core.authorization import PERMISSION_SCOPE_RANK
+from app.core.authorization import (
+    PERMISSION_SCOPE_RANK,
+    decode_permission_scopes,
+    merge_permission_bitsets,
+    split_permission_scopes,
+)
 from app.core.common.records import RoleInheritanceRecord, RolePermissionRecord
 
+# Catalog permissions as a scope bitset, plus the scopes of any permission ids outside the catalog.
+RoleGrants = tuple[int, dict[str, str]]
+
 
 def merge_scope(current_scope: str | None, candidate_scope: str) -> str:
     if current_scope is None:
@@ -35,48 +43,65 @@ def build_parents_map(role_inheritances: Iterable[RoleInheritanceRecord]) -> dic
     return parents_by_role_id
 
 
+def merge_role_grants(current: RoleGrants, candidate: RoleGrants) -> RoleGrants:
+    bitset = merge_permission_bitsets(current[0], candidate[0])
+    if not candidate[1]:
+        return bitset, current[1]
+
+    uncataloged_scopes = dict(current[1])
+    for permission_id, scope in candidate[1].items():
+        uncataloged_scopes[permission_id] = merge_scope(uncataloged_scopes.get(permission_id), scope)
+    return bitset, uncataloged_scopes
+
+
 def _resolve_target_role_ids(
     *,
     role_ids: tuple[int, ...] | None,
-    direct_permissions_by_role_id: dict[int, dict[str, str]],
+    direct_grants_by_role_id: dict[int, RoleGrants],
     parents_by_role_id: dict[int, tuple[int, ...]],
 ) -> list[int]:
     if role_ids is None:
-        return sorted(set(direct_permissions_by_role_id) | set(parents_by_role_id))
+        return sorted(set(direct_grants_by_role_id) | set(parents_by_role_id))
     return sorted(set(role_ids))
 
 
-def _resolve_effective_permissions_for_role(
+def _resolve_effective_grants_for_role(
     *,
     role_id: int,
     parents_by_role_id: dict[int, tuple[int, ...]],
-    direct_permissions_by_role_id: dict[int, dict[str, str]],
-    memoized_effective_permissions: dict[int, dict[str, str]],
+    direct_grants_by_role_id: dict[int, RoleGrants],
+    memoized_effective_grants: dict[int, RoleGrants],
     resolving_role_ids: set[int],
-) -> dict[str, str]:
-    cached = memoized_effective_permissions.get(role_id)
+) -> RoleGrants:
+    cached = memoized_effective_grants.get(role_id)
     if cached is not None:
         return cached
     if role_id in resolving_role_ids:
-        return {}
+        return 0, {}
 
     resolving_role_ids.add(role_id)
-    effective_permissions = dict(direct_permissions_by_role_id.get(role_id, {}))
+    effective_grants = direct_grants_by_role_id.get(role_id, (0, {}))
     for parent_role_id in parents_by_role_id.get(role_id, ()):
-        parent_permissions = _resolve_effective_permissions_for_role(
+        parent_grants = _resolve_effective_grants_for_role(
             role_id=parent_role_id,
             parents_by_role_id=parents_by_role_id,
-            direct_permissions_by_role_id=direct_permissions_by_role_id,
-            memoized_effective_permissions=memoized_effective_permissions,
+            direct_grants_by_role_id=direct_grants_by_role_id,
+            memoized_effective_grants=memoized_effective_grants,
             resolving_role_ids=resolving_role_ids,
         )
-        for permission_id, parent_scope in parent_permissions.items():
-            existing_scope = effective_permissions.get(permission_id)
-            effective_permissions[permission_id] = merge_scope(existing_scope, parent_scope)
+        effective_grants = merge_role_grants(effective_grants, parent_grants)
 
     resolving_role_ids.remove(role_id)
-    memoized_effective_permissions[role_id] = effective_permissions
-    return effective_permissions
+    memoized_effective_grants[role_id] = effective_grants
+    return effective_grants
+
+
+def _to_permission_scopes(grants: RoleGrants) -> dict[str, str]:
+    bitset, uncataloged_scopes = grants
+    catalog_scopes = {
+        permission_id: scope for permission_id, scope in decode_permission_scopes(bitset).items() if scope is not None
+    }
+    return catalog_scopes | uncataloged_scopes
 
 
 def resolve_effective_role_permissions(
@@ -89,23 +114,28 @@ def resolve_effective_role_permissions(
         return []
 
     parents_by_role_id = build_parents_map(role_inheritances)
-    direct_permissions_by_role_id = build_direct_permission_map(role_permissions)
+    direct_grants_by_role_id = {
+        role_id: split_permission_scopes(permission_scopes)
+        for role_id, permission_scopes in build_direct_permission_map(role_permissions).items()
+    }
     target_role_ids = _resolve_target_role_ids(
         role_ids=role_ids,
-        direct_permissions_by_role_id=direct_permissions_by_role_id,
+        direct_grants_by_role_id=direct_grants_by_role_id,
         parents_by_role_id=parents_by_role_id,
     )
 
-    memoized_effective_permissions: dict[int, dict[str, str]] = {}
+    memoized_effective_grants: dict[int, RoleGrants] = {}
     resolving_role_ids: set[int] = set()
     effective_role_permissions: list[RolePermissionRecord] = []
     for role_id in target_role_ids:
-        effective_permissions = _resolve_effective_permissions_for_role(
-            role_id=role_id,
-            parents_by_role_id=parents_by_role_id,
-            direct_permissions_by_role_id=direct_permissions_by_role_id,
-            memoized_effective_permissions=memoized_effective_permissions,
-            resolving_role_ids=resolving_role_ids,
+        effective_permissions = _to_permission_scopes(
+            _resolve_effective_grants_for_role(
+                role_id=role_id,
+                parents_by_role_id=parents_by_role_id,
+                direct_grants_by_role_id=direct_grants_by_role_id,
+                memoized_effective_grants=memoized_effective_grants,
+                resolving_role_ids=resolving_role_ids,
+            )
         )
         for permission_id in sorted(effective_permissions):
             effective_role_permissions.append(
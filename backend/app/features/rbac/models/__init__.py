@@ -2,4 +2,5 @@ from app.features.rbac.models.permission import Permission
 from app.features.rbac.models.role import Role
 from app.features.rbac.models.role_inheritance import RoleInheritance
 from app.features.rbac.models.role_permission import RolePermission
+from app.features.rbac.models.user_effective_permission import UserEffectivePermission
 from app.features.rbac.models.user_role import UserRole
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db.base import BaseModel
@@ -9,3 +9,17 @@ class Role(BaseModel):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+
+
+# Role name search: trigrams serve substring matches, text_pattern_ops serves the short prefix matches.
+Index(
+    "ix_roles_name_lower_trgm",
+    func.lower(Role.name).label("name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"name_lower": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_roles_name_lower_pattern",
+    func.lower(Role.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+).ddl_if(dialect="postgresql")
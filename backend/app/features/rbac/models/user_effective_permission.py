@@ -0,0 +1,19 @@
+from sqlalchemy import CheckConstraint, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.authorization import PERMISSION_SCOPES
+from app.core.db.database import Base
+
+
+class UserEffectivePermission(Base):
+    __tablename__ = "user_effective_permissions"
+    __table_args__ = (
+        CheckConstraint(
+            f"scope IN ({', '.join(repr(scope) for scope in PERMISSION_SCOPES)})",
+            name="ck_user_effective_permissions_scope",
+        ),
+    )
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    permission_id: Mapped[str] = mapped_column(ForeignKey("permissions.id"), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(20), nullable=False)
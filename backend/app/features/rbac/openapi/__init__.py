@@ -21,11 +21,18 @@ from app.features.rbac.openapi.docs import (
 from app.features.rbac.openapi.params import (
     CreateAdminUserPayload,
     CreateRolePayload,
+    PageCursorQuery,
+    PageLimitQuery,
     ParentRoleIdPath,
     PermissionIdPath,
     RoleIdPath,
+    RoleSearchQuery,
     SetRolePermissionPayload,
     UpdateAdminUserPayload,
     UpdateRolePayload,
+    UserDisabledQuery,
     UserIdPath,
+    UserRoleIdQuery,
+    UserSearchQuery,
+    UserTenantIdQuery,
 )
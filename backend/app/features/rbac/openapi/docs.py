@@ -3,7 +3,12 @@ from typing import Any
 from fastapi import status
 
 from app.core.authorization import PermissionId, PermissionScope
-from app.core.common.openapi import INTERNAL_ERROR_EXAMPLE, build_error_response
+from app.core.common.openapi import (
+    INTERNAL_ERROR_EXAMPLE,
+    NEXT_CURSOR_RESPONSE_HEADER,
+    PASSWORD_HASHING_UNAVAILABLE_EXAMPLE,
+    build_error_response,
+)
 
 PERMISSION_EXAMPLE: dict[str, Any] = {
     "id": PermissionId.ROLE_MANAGE,
@@ -70,6 +75,18 @@ def _unauthorized_response() -> dict[str, Any]:
     )
 
 
+def _invalid_pagination_response(description: str = "Invalid pagination parameters.") -> dict[str, Any]:
+    return build_error_response(
+        description=description,
+        example={
+            "detail": "Invalid pagination cursor",
+            "status": 400,
+            "code": "invalid_input",
+            "meta": {"cursor": "not-a-cursor"},
+        },
+    )
+
+
 def _forbidden_response(permission_id: str, description: str) -> dict[str, Any]:
     return build_error_response(
         description=description,
@@ -84,13 +101,19 @@ def _forbidden_response(permission_id: str, description: str) -> dict[str, Any]:
 
 GET_ROLES_DOC: dict[str, Any] = {
     "summary": "List roles",
-    "description": f"List all roles and their permission grants. Requires `{PermissionId.ROLE_MANAGE}`.",
+    "description": (
+        f"List all roles and their permission grants. Requires `{PermissionId.ROLE_MANAGE}`."
+        " Filter by name with `q`."
+        " Send `limit` (and `cursor` from the `X-Next-Cursor` header) to page through results."
+    ),
     "response_description": "Roles ordered by name.",
     "responses": {
         status.HTTP_200_OK: {
             "description": "Roles fetched successfully.",
             "content": {"application/json": {"example": [ROLE_EXAMPLE]}},
+            "headers": NEXT_CURSOR_RESPONSE_HEADER,
         },
+        status.HTTP_400_BAD_REQUEST: _invalid_pagination_response(),
         status.HTTP_401_UNAUTHORIZED: _unauthorized_response(),
         status.HTTP_403_FORBIDDEN: _forbidden_response(
             PermissionId.ROLE_MANAGE,
@@ -499,13 +522,19 @@ REMOVE_USER_ROLE_DOC: dict[str, Any] = {
 
 GET_ADMIN_USERS_DOC: dict[str, Any] = {
     "summary": "List users",
-    "description": f"List all users managed by RBAC admin APIs. Requires `{PermissionId.USER_MANAGE}`.",
+    "description": (
+        f"List all users managed by RBAC admin APIs. Requires `{PermissionId.USER_MANAGE}`."
+        " Filter with `q` (username search), `disabled`, `role_id` and `tenant_id`; filters combine with AND."
+        " Send `limit` (and `cursor` from the `X-Next-Cursor` header) to page through results."
+    ),
     "response_description": "Users ordered by username.",
     "responses": {
         status.HTTP_200_OK: {
             "description": "Users fetched successfully.",
             "content": {"application/json": {"example": [ADMIN_USER_EXAMPLE]}},
+            "headers": NEXT_CURSOR_RESPONSE_HEADER,
         },
+        status.HTTP_400_BAD_REQUEST: _invalid_pagination_response(),
         status.HTTP_401_UNAUTHORIZED: _unauthorized_response(),
         status.HTTP_403_FORBIDDEN: _forbidden_response(
             PermissionId.USER_MANAGE,
@@ -605,6 +634,11 @@ CREATE_ADMIN_USER_DOC: dict[str, Any] = {
             description="Unhandled internal server error.",
             example=INTERNAL_ERROR_EXAMPLE,
         ),
+        status.HTTP_503_SERVICE_UNAVAILABLE: build_error_response(
+            description="Password hashing is at capacity; retry after the `Retry-After` delay.",
+            example=PASSWORD_HASHING_UNAVAILABLE_EXAMPLE,
+            include_retry_after=True,
+        ),
     },
 }
 
@@ -652,6 +686,11 @@ UPDATE_ADMIN_USER_DOC: dict[str, Any] = {
             description="Unhandled internal server error.",
             example=INTERNAL_ERROR_EXAMPLE,
         ),
+        status.HTTP_503_SERVICE_UNAVAILABLE: build_error_response(
+            description="Password hashing is at capacity; retry after the `Retry-After` delay.",
+            example=PASSWORD_HASHING_UNAVAILABLE_EXAMPLE,
+            include_retry_after=True,
+        ),
     },
 }
 
@@ -699,15 +738,17 @@ GET_USER_ROLES_DOC: dict[str, Any] = {
     "description": (
         "List roles directly assigned to a user (does not include inherited parent roles). "
         f"Requires `{PermissionId.USER_ROLE_MANAGE}`."
+        " Send `limit` (and `cursor` from the `X-Next-Cursor` header) to page through results."
     ),
     "response_description": "Direct role assignments ordered by role name.",
     "responses": {
         status.HTTP_200_OK: {
             "description": "User roles fetched successfully.",
             "content": {"application/json": {"example": [ASSIGNED_ROLE_EXAMPLE]}},
+            "headers": NEXT_CURSOR_RESPONSE_HEADER,
         },
         status.HTTP_400_BAD_REQUEST: build_error_response(
-            description="Invalid user ID.",
+            description="Invalid user ID or pagination parameters.",
             example={
                 "detail": "Request validation error",
                 "status": 400,
@@ -738,15 +779,19 @@ GET_USER_ROLES_DOC: dict[str, Any] = {
 
 GET_ROLE_USERS_DOC: dict[str, Any] = {
     "summary": "List users assigned to a role",
-    "description": f"List users directly assigned to a role. Requires `{PermissionId.USER_ROLE_MANAGE}`.",
+    "description": (
+        f"List users directly assigned to a role. Requires `{PermissionId.USER_ROLE_MANAGE}`."
+        " Send `limit` (and `cursor` from the `X-Next-Cursor` header) to page through results."
+    ),
     "response_description": "Direct user assignments ordered by username.",
     "responses": {
         status.HTTP_200_OK: {
             "description": "Role users fetched successfully.",
             "content": {"application/json": {"example": [ASSIGNED_USER_EXAMPLE]}},
+            "headers": NEXT_CURSOR_RESPONSE_HEADER,
         },
         status.HTTP_400_BAD_REQUEST: build_error_response(
-            description="Invalid role ID.",
+            description="Invalid role ID or pagination parameters.",
             example={
                 "detail": "Request validation error",
                 "status": 400,
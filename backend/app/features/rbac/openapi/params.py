@@ -1,8 +1,9 @@
 from typing import Annotated
 
-from fastapi import Body, Path
+from fastapi import Body, Path, Query
 
 from app.core.authorization import PERMISSION_ID_PATTERN, PermissionId, PermissionScope
+from app.core.common.pagination import MAX_LIST_LIMIT
 from app.features.rbac.schemas import (
     CreateAdminUserRequest,
     CreateRoleRequest,
@@ -49,6 +50,66 @@ PermissionIdPath = Annotated[
     ),
 ]
 
+PageLimitQuery = Annotated[
+    int | None,
+    Query(
+        ge=1,
+        le=MAX_LIST_LIMIT,
+        description="Page size. When omitted (and no `cursor` is sent) the full list is returned.",
+        examples=[50],
+    ),
+]
+
+PageCursorQuery = Annotated[
+    str | None,
+    Query(
+        min_length=1,
+        max_length=512,
+        description="Opaque cursor copied from the `X-Next-Cursor` header of the previous page.",
+    ),
+]
+
+UserSearchQuery = Annotated[
+    str | None,
+    Query(
+        min_length=1,
+        max_length=100,
+        description=(
+            "Case-insensitive username search. Terms of three or more characters match anywhere in the username;"
+            " shorter terms match its prefix."
+        ),
+        examples=["ali"],
+    ),
+]
+
+RoleSearchQuery = Annotated[
+    str | None,
+    Query(
+        min_length=1,
+        max_length=100,
+        description=(
+            "Case-insensitive role name search. Terms of three or more characters match anywhere in the name;"
+            " shorter terms match its prefix."
+        ),
+        examples=["edit"],
+    ),
+]
+
+UserDisabledQuery = Annotated[
+    bool | None,
+    Query(description="Only users with this disabled state.", examples=[False]),
+]
+
+UserRoleIdQuery = Annotated[
+    int | None,
+    Query(ge=1, description="Only users directly assigned this role ID.", examples=[2]),
+]
+
+UserTenantIdQuery = Annotated[
+    int | None,
+    Query(ge=1, description="Only users that belong to this tenant ID.", examples=[1]),
+]
+
 CreateRolePayload = Annotated[
     CreateRoleRequest,
     Body(
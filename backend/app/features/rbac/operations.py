@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from app.core.authorization import normalize_permission_scope
+from app.core.common.integration import RecordAuditEntryCommand
+from app.core.common.pagination import CursorPage, PageRequest
 from app.core.common.records import (
     PermissionRecord,
     RoleInheritanceRecord,
@@ -30,11 +32,13 @@ from app.features.rbac.schemas import (
     CreateAdminUserCommand,
     CreateRoleCommand,
     PermissionResult,
+    RoleListFilters,
     RolePermissionResult,
     RoleResult,
     SetRolePermissionCommand,
     UpdateAdminUserCommand,
     UpdateRoleCommand,
+    UserListFilters,
     UserRoleAssignmentResult,
 )
 from app.features.rbac.service_mappers import (
@@ -49,6 +53,7 @@ from app.features.rbac.service_mappers import (
     to_role_permission_result,
     to_role_result,
 )
+from app.integrations.audit import AuditLogWriterPort
 
 if TYPE_CHECKING:
     from app.features.rbac.service import RBACRepositoryPort
@@ -80,6 +85,33 @@ class RBACEntityLookup:
         return user
 
 
+class RBACAuditTrail:
+    def __init__(self, audit_log_writer: AuditLogWriterPort | None = None):
+        self._audit_log_writer = audit_log_writer
+
+    async def record(
+        self,
+        *,
+        actor_user_id: int | None,
+        action: str,
+        resource_type: str,
+        resource_id: int | str,
+        summary: str,
+    ) -> None:
+        if self._audit_log_writer is None:
+            return
+
+        await self._audit_log_writer.record(
+            RecordAuditEntryCommand(
+                actor_user_id=actor_user_id,
+                action=action,
+                resource_type=resource_type,
+                resource_id=str(resource_id),
+                summary=summary,
+            )
+        )
+
+
 class RBACRoleOperations:
     def __init__(
         self,
@@ -87,10 +119,12 @@ class RBACRoleOperations:
         rbac_repository: RBACRepositoryPort,
         unit_of_work: UnitOfWorkPort,
         entity_lookup: RBACEntityLookup,
+        audit_trail: RBACAuditTrail | None = None,
     ):
         self._rbac_repository = rbac_repository
         self._unit_of_work = unit_of_work
         self._entity_lookup = entity_lookup
+        self._audit_trail = audit_trail or RBACAuditTrail()
 
     async def _list_effective_role_permissions(
         self,
@@ -108,6 +142,10 @@ class RBACRoleOperations:
             role_ids=role_ids,
         )
 
+    async def _rebuild_role_dependent_effective_permissions(self, role_id: int) -> None:
+        user_ids = await self._rbac_repository.list_role_dependent_user_ids(role_id)
+        await self._rbac_repository.rebuild_user_effective_permissions(user_ids=tuple(user_ids))
+
     async def _build_role_response(self, role: RoleRecord) -> RoleResult:
         permissions = await self._rbac_repository.list_permissions()
         permission_names = build_permission_name_map(permissions)
@@ -124,8 +162,20 @@ class RBACRoleOperations:
             parent_role_ids=parent_role_ids_by_role_id.get(role.id, ()),
         )
 
-    async def list_roles(self) -> list[RoleResult]:
-        roles = await self._rbac_repository.list_roles()
+    async def list_roles(self, filters: RoleListFilters | None = None) -> list[RoleResult]:
+        roles = await self._rbac_repository.list_roles(filters=filters)
+        return await self._build_role_results(roles)
+
+    async def list_roles_page(
+        self, page: PageRequest, filters: RoleListFilters | None = None
+    ) -> CursorPage[RoleResult]:
+        role_page = await self._rbac_repository.list_roles_page(page=page, filters=filters)
+        return CursorPage(
+            items=await self._build_role_results(role_page.items),
+            next_cursor=role_page.next_cursor,
+        )
+
+    async def _build_role_results(self, roles: list[RoleRecord]) -> list[RoleResult]:
         if not roles:
             return []
 
@@ -153,7 +203,7 @@ class RBACRoleOperations:
         permissions = await self._rbac_repository.list_permissions()
         return to_permission_results(permissions)
 
-    async def create_role(self, role_data: CreateRoleCommand) -> RoleResult:
+    async def create_role(self, role_data: CreateRoleCommand, *, actor_user_id: int | None = None) -> RoleResult:
         normalized_name = normalize_role_name(role_data.name)
         async with self._unit_of_work:
             if await self._rbac_repository.role_name_exists(normalized_name):
@@ -163,9 +213,22 @@ class RBACRoleOperations:
                 )
             role = await self._rbac_repository.create_role(name=normalized_name)
 
+        await self._audit_trail.record(
+            actor_user_id=actor_user_id,
+            action="role.created",
+            resource_type="role",
+            resource_id=role.id,
+            summary=f"Created role {role.name}",
+        )
         return await self._build_role_response(role)
 
-    async def update_role(self, role_id: int, role_data: UpdateRoleCommand) -> RoleResult:
+    async def update_role(
+        self,
+        role_id: int,
+        role_data: UpdateRoleCommand,
+        *,
+        actor_user_id: int | None = None,
+    ) -> RoleResult:
         normalized_name = normalize_role_name(role_data.name)
         async with self._unit_of_work:
             role = await self._entity_lookup.get_role_or_raise(role_id)
@@ -177,21 +240,42 @@ class RBACRoleOperations:
                     message="Role name already exists",
                     details={"name": normalized_name},
                 )
+            previous_name = role.name
             if normalized_name != role.name:
                 role = await self._rbac_repository.update_role(role.id, name=normalized_name)
 
+        if role.name != previous_name:
+            await self._audit_trail.record(
+                actor_user_id=actor_user_id,
+                action="role.updated",
+                resource_type="role",
+                resource_id=role.id,
+                summary=f"Renamed role {previous_name} to {role.name}",
+            )
         return await self._build_role_response(role)
 
-    async def delete_role(self, role_id: int) -> None:
+    async def delete_role(self, role_id: int, *, actor_user_id: int | None = None) -> None:
         async with self._unit_of_work:
             role = await self._entity_lookup.get_role_or_raise(role_id)
+            user_ids = await self._rbac_repository.list_role_dependent_user_ids(role.id)
             await self._rbac_repository.delete_role(role.id)
+            await self._rbac_repository.rebuild_user_effective_permissions(user_ids=tuple(user_ids))
+
+        await self._audit_trail.record(
+            actor_user_id=actor_user_id,
+            action="role.deleted",
+            resource_type="role",
+            resource_id=role.id,
+            summary=f"Deleted role {role.name}",
+        )
 
     async def assign_role_permission(
         self,
         role_id: int,
         permission_id: str,
         assignment: SetRolePermissionCommand,
+        *,
+        actor_user_id: int | None = None,
     ) -> RolePermissionResult:
         try:
             normalized_scope = normalize_permission_scope(assignment.scope)
@@ -206,20 +290,45 @@ class RBACRoleOperations:
                 permission_id=permission.id,
                 scope=normalized_scope,
             )
-
+            await self._rebuild_role_dependent_effective_permissions(role.id)
+
+        await self._audit_trail.record(
+            actor_user_id=actor_user_id,
+            action="role_permission.assigned",
+            resource_type="role",
+            resource_id=role.id,
+            summary=f"Granted {permission.id} with scope {role_permission.scope} to role {role.name}",
+        )
         return to_role_permission_result(
             role_permission,
             {permission.id: permission.name},
         )
 
-    async def remove_role_permission(self, role_id: int, permission_id: str) -> None:
+    async def remove_role_permission(
+        self,
+        role_id: int,
+        permission_id: str,
+        *,
+        actor_user_id: int | None = None,
+    ) -> None:
         async with self._unit_of_work:
             role = await self._entity_lookup.get_role_or_raise(role_id)
             permission = await self._entity_lookup.get_permission_or_raise(permission_id)
-            await self._rbac_repository.delete_role_permission(
+            removed = await self._rbac_repository.delete_role_permission(
                 role_id=role.id,
                 permission_id=permission.id,
             )
+            if removed:
+                await self._rebuild_role_dependent_effective_permissions(role.id)
+
+        if removed:
+            await self._audit_trail.record(
+                actor_user_id=actor_user_id,
+                action="role_permission.removed",
+                resource_type="role",
+                resource_id=role.id,
+                summary=f"Revoked {permission.id} from role {role.name}",
+            )
 
     @staticmethod
     def _role_reaches_target(
@@ -240,7 +349,13 @@ class RBACRoleOperations:
             pending_role_ids.extend(parents_by_role_id.get(role_id, ()))
         return False
 
-    async def assign_role_inheritance(self, role_id: int, parent_role_id: int) -> None:
+    async def assign_role_inheritance(
+        self,
+        role_id: int,
+        parent_role_id: int,
+        *,
+        actor_user_id: int | None = None,
+    ) -> None:
         if role_id == parent_role_id:
             raise InvalidInputError(message="Role cannot inherit from itself")
 
@@ -271,15 +386,41 @@ class RBACRoleOperations:
                 role_id=role.id,
                 parent_role_id=parent_role.id,
             )
+            await self._rebuild_role_dependent_effective_permissions(role.id)
+
+        await self._audit_trail.record(
+            actor_user_id=actor_user_id,
+            action="role_inheritance.assigned",
+            resource_type="role",
+            resource_id=role.id,
+            summary=f"Role {role.name} now inherits from role {parent_role.name}",
+        )
 
-    async def remove_role_inheritance(self, role_id: int, parent_role_id: int) -> None:
+    async def remove_role_inheritance(
+        self,
+        role_id: int,
+        parent_role_id: int,
+        *,
+        actor_user_id: int | None = None,
+    ) -> None:
         async with self._unit_of_work:
             role = await self._entity_lookup.get_role_or_raise(role_id)
             parent_role = await self._entity_lookup.get_role_or_raise(parent_role_id)
-            await self._rbac_repository.remove_role_inheritance(
+            removed = await self._rbac_repository.remove_role_inheritance(
                 role_id=role.id,
                 parent_role_id=parent_role.id,
             )
+            if removed:
+                await self._rebuild_role_dependent_effective_permissions(role.id)
+
+        if removed:
+            await self._audit_trail.record(
+                actor_user_id=actor_user_id,
+                action="role_inheritance.removed",
+                resource_type="role",
+                resource_id=role.id,
+                summary=f"Role {role.name} no longer inherits from role {parent_role.name}",
+            )
 
 
 class RBACUserRoleAssignments:
@@ -289,41 +430,80 @@ class RBACUserRoleAssignments:
         rbac_repository: RBACRepositoryPort,
         unit_of_work: UnitOfWorkPort,
         entity_lookup: RBACEntityLookup,
+        audit_trail: RBACAuditTrail | None = None,
     ):
         self._rbac_repository = rbac_repository
         self._unit_of_work = unit_of_work
         self._entity_lookup = entity_lookup
+        self._audit_trail = audit_trail or RBACAuditTrail()
 
-    async def assign_user_role(self, user_id: int, role_id: int) -> UserRoleAssignmentResult:
+    async def assign_user_role(
+        self,
+        user_id: int,
+        role_id: int,
+        *,
+        actor_user_id: int | None = None,
+    ) -> UserRoleAssignmentResult:
         async with self._unit_of_work:
-            await self._entity_lookup.get_user_or_raise(user_id)
+            user = await self._entity_lookup.get_user_or_raise(user_id)
             role = await self._entity_lookup.get_role_or_raise(role_id)
-            await self._rbac_repository.assign_user_role(
-                user_id=user_id,
+            assigned = await self._rbac_repository.assign_user_role(
+                user_id=user.id,
                 role_id=role.id,
             )
+            if assigned:
+                await self._rbac_repository.rebuild_user_effective_permissions(user_ids=(user.id,))
+
+        if assigned:
+            await self._audit_trail.record(
+                actor_user_id=actor_user_id,
+                action="user_role.assigned",
+                resource_type="user",
+                resource_id=user.id,
+                summary=f"Assigned role {role.name} to user {user.username}",
+            )
+        return UserRoleAssignmentResult(user_id=user.id, role_id=role.id)
 
-        return UserRoleAssignmentResult(user_id=user_id, role_id=role.id)
-
-    async def remove_user_role(self, user_id: int, role_id: int) -> None:
+    async def remove_user_role(self, user_id: int, role_id: int, *, actor_user_id: int | None = None) -> None:
         async with self._unit_of_work:
-            await self._entity_lookup.get_user_or_raise(user_id)
+            user = await self._entity_lookup.get_user_or_raise(user_id)
             role = await self._entity_lookup.get_role_or_raise(role_id)
-            await self._rbac_repository.remove_user_role(
-                user_id=user_id,
+            removed = await self._rbac_repository.remove_user_role(
+                user_id=user.id,
                 role_id=role.id,
             )
+            if removed:
+                await self._rbac_repository.rebuild_user_effective_permissions(user_ids=(user.id,))
+
+        if removed:
+            await self._audit_trail.record(
+                actor_user_id=actor_user_id,
+                action="user_role.removed",
+                resource_type="user",
+                resource_id=user.id,
+                summary=f"Removed role {role.name} from user {user.username}",
+            )
 
     async def list_user_roles(self, user_id: int) -> list[AssignedRoleResult]:
         await self._entity_lookup.get_user_or_raise(user_id)
         roles = await self._rbac_repository.list_user_roles(user_id=user_id)
         return to_assigned_role_results(roles)
 
+    async def list_user_roles_page(self, user_id: int, page: PageRequest) -> CursorPage[AssignedRoleResult]:
+        await self._entity_lookup.get_user_or_raise(user_id)
+        role_page = await self._rbac_repository.list_user_roles_page(user_id=user_id, page=page)
+        return CursorPage(items=to_assigned_role_results(role_page.items), next_cursor=role_page.next_cursor)
+
     async def list_role_users(self, role_id: int) -> list[AssignedUserResult]:
         await self._entity_lookup.get_role_or_raise(role_id)
         users = await self._rbac_repository.list_role_users(role_id=role_id)
         return to_assigned_user_results(users)
 
+    async def list_role_users_page(self, role_id: int, page: PageRequest) -> CursorPage[AssignedUserResult]:
+        await self._entity_lookup.get_role_or_raise(role_id)
+        user_page = await self._rbac_repository.list_role_users_page(role_id=role_id, page=page)
+        return CursorPage(items=to_assigned_user_results(user_page.items), next_cursor=user_page.next_cursor)
+
 
 class RBACUserManagement:
     def __init__(
@@ -333,10 +513,12 @@ class RBACUserManagement:
         unit_of_work: UnitOfWorkPort,
         entity_lookup: RBACEntityLookup,
         password_service: PasswordServicePort | None = None,
+        audit_trail: RBACAuditTrail | None = None,
     ):
         self._rbac_repository = rbac_repository
         self._unit_of_work = unit_of_work
         self._entity_lookup = entity_lookup
+        self._audit_trail = audit_trail or RBACAuditTrail()
         self._password_service = password_service or Argon2PasswordService()
 
     @staticmethod
@@ -382,21 +564,49 @@ class RBACUserManagement:
         for role_id in role_ids:
             await self._entity_lookup.get_role_or_raise(role_id)
 
-    async def list_users(self) -> list[AdminUserResult]:
-        users = await self._rbac_repository.list_users()
-        user_results: list[AdminUserResult] = []
-        for user in users:
-            role_ids = await self._rbac_repository.list_user_role_ids(user_id=user.id)
-            user_results.append(to_admin_user_result(user, role_ids=role_ids))
-        return user_results
+    async def _build_admin_user_results(self, users: list[UserRecord]) -> list[AdminUserResult]:
+        role_ids_by_user_id = await self._rbac_repository.list_role_ids_by_user_ids(
+            user_ids=tuple(user.id for user in users)
+        )
+        return self._to_admin_user_results(users, role_ids_by_user_id)
+
+    @staticmethod
+    def _to_admin_user_results(
+        users: list[UserRecord],
+        role_ids_by_user_id: dict[int, list[int]],
+    ) -> list[AdminUserResult]:
+        return [to_admin_user_result(user, role_ids=role_ids_by_user_id.get(user.id, [])) for user in users]
+
+    async def list_users(self, filters: UserListFilters | None = None) -> list[AdminUserResult]:
+        users = await self._rbac_repository.list_users(filters=filters)
+        # The unpaginated list can hold every user, so roles are fetched by the same filters rather than by id.
+        role_ids_by_user_id = await self._rbac_repository.list_role_ids_by_user_filters(filters=filters)
+        return self._to_admin_user_results(users, role_ids_by_user_id)
+
+    async def list_users_page(
+        self,
+        page: PageRequest,
+        filters: UserListFilters | None = None,
+    ) -> CursorPage[AdminUserResult]:
+        user_page = await self._rbac_repository.list_users_page(page=page, filters=filters)
+        return CursorPage(
+            items=await self._build_admin_user_results(user_page.items),
+            next_cursor=user_page.next_cursor,
+        )
 
     async def get_user(self, user_id: int) -> AdminUserResult:
         return await self._build_admin_user_result(user_id)
 
-    async def create_user(self, user_data: CreateAdminUserCommand) -> AdminUserResult:
+    async def create_user(
+        self,
+        user_data: CreateAdminUserCommand,
+        *,
+        actor_user_id: int | None = None,
+    ) -> AdminUserResult:
         normalized_username = self._normalize_username_or_raise(user_data.username)
         self._validate_password_or_raise(user_data.password, normalized_username)
         normalized_role_ids = self._normalize_role_ids(user_data.role_ids)
+        hashed_password = await self._password_service.hash_password(user_data.password)
 
         async with self._unit_of_work:
             if await self._rbac_repository.username_exists(normalized_username):
@@ -408,12 +618,21 @@ class RBACUserManagement:
             await self._validate_roles_exist(normalized_role_ids)
             user = await self._rbac_repository.create_user(
                 username=normalized_username,
-                hashed_password=self._password_service.hash_password(user_data.password),
+                hashed_password=hashed_password,
                 disabled=False,
             )
             for role_id in normalized_role_ids:
                 await self._rbac_repository.assign_user_role(user_id=user.id, role_id=role_id)
-
+            if normalized_role_ids:
+                await self._rbac_repository.rebuild_user_effective_permissions(user_ids=(user.id,))
+
+        await self._audit_trail.record(
+            actor_user_id=actor_user_id,
+            action="user.created",
+            resource_type="user",
+            resource_id=user.id,
+            summary=f"Created user {user.username}",
+        )
         return await self._build_admin_user_result(user.id)
 
     @staticmethod
@@ -453,27 +672,31 @@ class RBACUserManagement:
         changes["username"] = normalized_username
         return normalized_username
 
-    def _apply_password_update(
+    async def _prepare_password_update(
         self,
         *,
         user: UserRecord,
         current_password: str | None,
         new_password: str | None,
         normalized_username: str,
-        changes: dict[str, object],
-    ) -> None:
+    ) -> str | None:
         if new_password is None:
-            return
+            return None
 
         if current_password is None:
             raise InvalidInputError(message="current_password is required to update password")
 
-        if not self._password_service.verify_password(current_password, user.hashed_password):
+        if not await self._password_service.verify_password(current_password, user.hashed_password):
             raise UnauthorizedError(message="Current password is invalid")
-        if self._password_service.verify_password(new_password, user.hashed_password):
+        if await self._password_service.verify_password(new_password, user.hashed_password):
             raise InvalidInputError(message="New password must be different from current password")
         self._validate_password_or_raise(new_password, normalized_username)
-        changes["hashed_password"] = self._password_service.hash_password(new_password)
+        return await self._password_service.hash_password(new_password)
+
+    async def _replace_password_hash_or_raise(self, *, user_id: int, current_hash: str, new_hash: str) -> None:
+        # The current password was verified outside the transaction, so the hash is only replaced if it still matches.
+        if not await self._rbac_repository.replace_password_hash(user_id, current_hash=current_hash, new_hash=new_hash):
+            raise ConflictError(message="Password was changed by another request", details={"id": user_id})
 
     @staticmethod
     def _apply_disabled_update(
@@ -491,9 +714,9 @@ class RBACUserManagement:
         *,
         user_id: int,
         role_ids: list[int] | None,
-    ) -> None:
+    ) -> bool:
         if role_ids is None:
-            return
+            return False
 
         normalized_role_ids = self._normalize_role_ids(role_ids)
         await self._validate_roles_exist(normalized_role_ids)
@@ -505,9 +728,31 @@ class RBACUserManagement:
             await self._rbac_repository.remove_user_role(user_id=user_id, role_id=role_id)
         for role_id in sorted(target_role_ids - existing_role_ids):
             await self._rbac_repository.assign_user_role(user_id=user_id, role_id=role_id)
+        if existing_role_ids == target_role_ids:
+            return False
+
+        await self._rbac_repository.rebuild_user_effective_permissions(user_ids=(user_id,))
+        return True
 
-    async def update_user(self, user_id: int, user_data: UpdateAdminUserCommand) -> AdminUserResult:
+    async def update_user(
+        self,
+        user_id: int,
+        user_data: UpdateAdminUserCommand,
+        *,
+        actor_user_id: int | None = None,
+    ) -> AdminUserResult:
         self._validate_update_payload(user_data)
+        user = await self._entity_lookup.get_user_or_raise(user_id)
+        verified_hash = user.hashed_password
+        # Argon2 verification and hashing run before the unit of work, so the write transaction never waits on them.
+        new_hash = await self._prepare_password_update(
+            user=user,
+            current_password=user_data.current_password,
+            new_password=user_data.new_password,
+            normalized_username=(
+                user.username if user_data.username is None else self._normalize_username_or_raise(user_data.username)
+            ),
+        )
 
         async with self._unit_of_work:
             user = await self._entity_lookup.get_user_or_raise(user_id)
@@ -517,27 +762,47 @@ class RBACUserManagement:
                 requested_username=user_data.username,
                 changes=changes,
             )
-            self._apply_password_update(
-                user=user,
-                current_password=user_data.current_password,
-                new_password=user_data.new_password,
-                normalized_username=normalized_username,
-                changes=changes,
-            )
             self._apply_disabled_update(
                 user=user,
                 requested_disabled=user_data.disabled,
                 changes=changes,
             )
+            if new_hash is not None:
+                await self._replace_password_hash_or_raise(
+                    user_id=user.id,
+                    current_hash=verified_hash,
+                    new_hash=new_hash,
+                )
             if changes:
                 await self._rbac_repository.update_user(user.id, **changes)
-            await self._apply_role_ids_update(user_id=user.id, role_ids=user_data.role_ids)
-
+            if new_hash is not None:
+                changes["hashed_password"] = new_hash
+            role_ids_changed = await self._apply_role_ids_update(user_id=user.id, role_ids=user_data.role_ids)
+
+        if changes or role_ids_changed:
+            changed_fields = sorted("password" if field == "hashed_password" else field for field in changes)
+            if role_ids_changed:
+                changed_fields.append("role_ids")
+            await self._audit_trail.record(
+                actor_user_id=actor_user_id,
+                action="user.updated",
+                resource_type="user",
+                resource_id=user.id,
+                summary=f"Updated user {normalized_username}: {', '.join(changed_fields)}",
+            )
         return await self._build_admin_user_result(user_id)
 
-    async def delete_user(self, user_id: int) -> None:
+    async def delete_user(self, user_id: int, *, actor_user_id: int | None = None) -> None:
         async with self._unit_of_work:
             user = await self._entity_lookup.get_user_or_raise(user_id)
             if user.disabled:
                 return
             await self._rbac_repository.update_user(user.id, disabled=True)
+
+        await self._audit_trail.record(
+            actor_user_id=actor_user_id,
+            action="user.disabled",
+            resource_type="user",
+            resource_id=user.id,
+            summary=f"Disabled user {user.username}",
+        )
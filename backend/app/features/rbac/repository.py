@@ -1,7 +1,9 @@
-from sqlalchemy import delete, or_, select
+from sqlalchemy import ColumnElement, Select, case, delete, exists, func, insert, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.authorization import PERMISSION_SCOPE_RANK
+from app.core.common.pagination import DEFAULT_LIST_LIMIT, CursorPage, PageRequest
 from app.core.common.records import (
     PermissionRecord,
     RoleInheritanceRecord,
@@ -12,21 +14,167 @@ from app.core.common.records import (
 from app.core.db.repository_base import BaseRepository
 from app.core.errors.repositories import RepositoryConflictError, RepositoryError
 from app.features.auth.models import User
-from app.features.rbac.models import Permission, Role, RoleInheritance, RolePermission, UserRole
+from app.features.rbac.models import (
+    Permission,
+    Role,
+    RoleInheritance,
+    RolePermission,
+    UserEffectivePermission,
+    UserRole,
+)
+from app.features.rbac.schemas import RoleListFilters, UserListFilters
+
+# pg_trgm needs at least three characters to narrow a search, so shorter terms match as prefixes.
+_TRIGRAM_MIN_LENGTH = 3
+_LIKE_ESCAPE = "\\"
+_USER_ID_LOOKUP_CHUNK_SIZE = 1_000
+
+
+def _name_search_condition(column: ColumnElement[str], q: str) -> ColumnElement[bool]:
+    term = q.strip().lower()
+    escaped = term.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2).replace("%", "\\%").replace("_", "\\_")
+    pattern = f"{escaped}%" if len(term) < _TRIGRAM_MIN_LENGTH else f"%{escaped}%"
+    return func.lower(column).like(pattern, escape=_LIKE_ESCAPE)
 
 
 class RBACRepository(BaseRepository[Role]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Role, default_record_type=RoleRecord)
 
-    async def list_roles(self) -> list[RoleRecord]:
-        roles = await self.list(sort="name")
-        return self._to_records(roles)
+    @staticmethod
+    def _build_dependent_roles_cte(role_id: int):
+        dependent_roles = (
+            select(Role.id.label("role_id")).where(Role.id == role_id).cte(name="dependent_roles", recursive=True)
+        )
+        child_roles = select(RoleInheritance.role_id.label("role_id")).join(
+            dependent_roles,
+            RoleInheritance.parent_role_id == dependent_roles.c.role_id,
+        )
+        return dependent_roles.union(child_roles)
+
+    async def _bump_rbac_versions(self, user_ids: tuple[int, ...] | Select[tuple[int]]) -> None:
+        await self.session.execute(
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(rbac_version=User.rbac_version + 1)
+            .execution_options(synchronize_session="fetch")
+        )
+
+    def _build_role_dependent_user_ids_query(self, role_id: int) -> Select[tuple[int]]:
+        dependent_roles = self._build_dependent_roles_cte(role_id)
+        return (
+            select(UserRole.user_id)
+            .join(dependent_roles, UserRole.role_id == dependent_roles.c.role_id)
+            .distinct()
+            .order_by(UserRole.user_id.asc())
+        )
+
+    async def _bump_role_dependent_rbac_versions(self, role_id: int) -> None:
+        await self._bump_rbac_versions(self._build_role_dependent_user_ids_query(role_id).order_by(None))
+
+    async def list_role_dependent_user_ids(self, role_id: int) -> list[int]:
+        result = await self.session.execute(self._build_role_dependent_user_ids_query(role_id))
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _build_effective_permission_grants_query(user_ids: tuple[int, ...] | None) -> Select:
+        effective_roles_anchor = select(UserRole.user_id.label("user_id"), UserRole.role_id.label("role_id"))
+        if user_ids is not None:
+            effective_roles_anchor = effective_roles_anchor.where(UserRole.user_id.in_(user_ids))
+        effective_roles = effective_roles_anchor.cte(name="user_effective_roles", recursive=True)
+        parent_roles = select(
+            effective_roles.c.user_id,
+            RoleInheritance.parent_role_id.label("role_id"),
+        ).join(effective_roles, RoleInheritance.role_id == effective_roles.c.role_id)
+        effective_roles = effective_roles.union(parent_roles)
+
+        max_scope_rank = func.max(case(PERMISSION_SCOPE_RANK, value=RolePermission.scope))
+        grants = (
+            select(
+                effective_roles.c.user_id,
+                RolePermission.permission_id,
+                max_scope_rank.label("scope_rank"),
+            )
+            .join(RolePermission, RolePermission.role_id == effective_roles.c.role_id)
+            .where(RolePermission.scope.in_(tuple(PERMISSION_SCOPE_RANK)))
+            .group_by(effective_roles.c.user_id, RolePermission.permission_id)
+            .subquery("effective_grants")
+        )
+        scope_by_rank = {rank: scope for scope, rank in PERMISSION_SCOPE_RANK.items()}
+        return select(
+            grants.c.user_id,
+            grants.c.permission_id,
+            case(scope_by_rank, value=grants.c.scope_rank),
+        )
+
+    async def rebuild_user_effective_permissions(self, *, user_ids: tuple[int, ...] | None = None) -> None:
+        if user_ids == ():
+            return
+
+        clear_query = delete(UserEffectivePermission)
+        if user_ids is not None:
+            clear_query = clear_query.where(UserEffectivePermission.user_id.in_(user_ids))
+        await self.session.execute(clear_query)
+        await self.session.execute(
+            insert(UserEffectivePermission).from_select(
+                ["user_id", "permission_id", "scope"],
+                self._build_effective_permission_grants_query(user_ids),
+            )
+        )
 
-    async def list_users(self) -> list[UserRecord]:
-        users = await self.session.execute(select(User).order_by(User.username.asc()))
+    @staticmethod
+    def _build_role_filter_conditions(filters: RoleListFilters | None) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = []
+        if filters is not None and filters.q is not None and filters.q.strip():
+            conditions.append(_name_search_condition(Role.name, filters.q))
+        return conditions
+
+    @staticmethod
+    def _build_user_filter_conditions(filters: UserListFilters | None) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = []
+        if filters is None:
+            return conditions
+        if filters.q is not None and filters.q.strip():
+            conditions.append(_name_search_condition(User.username, filters.q))
+        if filters.disabled is not None:
+            conditions.append(User.disabled.is_(filters.disabled))
+        if filters.role_id is not None:
+            conditions.append(exists().where(UserRole.user_id == User.id, UserRole.role_id == filters.role_id))
+        if filters.tenant_id is not None:
+            conditions.append(User.tenant_id == filters.tenant_id)
+        return conditions
+
+    async def list_roles(self, *, filters: RoleListFilters | None = None) -> list[RoleRecord]:
+        query = self._build_query(sort="name").where(*self._build_role_filter_conditions(filters))
+        result = await self.session.execute(query.limit(DEFAULT_LIST_LIMIT))
+        return self._to_records(list(result.scalars().all()))
+
+    async def list_roles_page(
+        self,
+        *,
+        page: PageRequest,
+        filters: RoleListFilters | None = None,
+    ) -> CursorPage[RoleRecord]:
+        query = select(Role).where(*self._build_role_filter_conditions(filters))
+        role_page = await self._paginate(query, page=page, sort="name")
+        return self._to_record_page(role_page)
+
+    async def list_users(self, *, filters: UserListFilters | None = None) -> list[UserRecord]:
+        users = await self.session.execute(
+            select(User).where(*self._build_user_filter_conditions(filters)).order_by(User.username.asc())
+        )
         return self._to_records(list(users.scalars().all()), UserRecord)
 
+    async def list_users_page(
+        self,
+        *,
+        page: PageRequest,
+        filters: UserListFilters | None = None,
+    ) -> CursorPage[UserRecord]:
+        query = select(User).where(*self._build_user_filter_conditions(filters))
+        user_page = await self._paginate(query, page=page, sort="username", model=User)
+        return self._to_record_page(user_page, UserRecord)
+
     async def list_permissions(self) -> list[PermissionRecord]:
         result = await self.session.execute(select(Permission).order_by(Permission.id.asc()))
         permissions = list(result.scalars().all())
@@ -117,6 +265,7 @@ class RBACRepository(BaseRepository[Role]):
         if role is None:
             return False
 
+        await self._bump_role_dependent_rbac_versions(role_id)
         await self.session.execute(
             delete(RoleInheritance).where(
                 or_(
@@ -155,10 +304,13 @@ class RBACRepository(BaseRepository[Role]):
                 scope=scope,
             )
             self.session.add(role_permission)
+        elif role_permission.scope == scope:
+            return self._to_record(role_permission, RolePermissionRecord)
         else:
             role_permission.scope = scope
 
         await self.session.flush()
+        await self._bump_role_dependent_rbac_versions(role_id)
         return self._to_record(role_permission, RolePermissionRecord)
 
     async def delete_role_permission(self, *, role_id: int, permission_id: str) -> bool:
@@ -171,6 +323,7 @@ class RBACRepository(BaseRepository[Role]):
 
         await self.session.delete(role_permission)
         await self.session.flush()
+        await self._bump_role_dependent_rbac_versions(role_id)
         return True
 
     async def get_user(self, user_id: int) -> UserRecord | None:
@@ -220,6 +373,16 @@ class RBACRepository(BaseRepository[Role]):
                 ) from exc
             raise RepositoryError("Failed to update user") from exc
 
+    async def replace_password_hash(self, user_id: int, *, current_hash: str, new_hash: str) -> bool:
+        # Matching the old hash keeps a password changed since it was verified from being overwritten.
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id, User.hashed_password == current_hash)
+            .values(hashed_password=new_hash)
+            .returning(User.id)
+        )
+        return result.scalar_one_or_none() is not None
+
     async def assign_user_role(self, *, user_id: int, role_id: int) -> bool:
         user_role = await self.session.get(
             UserRole,
@@ -230,6 +393,7 @@ class RBACRepository(BaseRepository[Role]):
 
         self.session.add(UserRole(user_id=user_id, role_id=role_id))
         await self.session.flush()
+        await self._bump_rbac_versions((user_id,))
         return True
 
     async def remove_user_role(self, *, user_id: int, role_id: int) -> bool:
@@ -242,6 +406,7 @@ class RBACRepository(BaseRepository[Role]):
 
         await self.session.delete(user_role)
         await self.session.flush()
+        await self._bump_rbac_versions((user_id,))
         return True
 
     async def list_user_role_ids(self, *, user_id: int) -> list[int]:
@@ -250,6 +415,33 @@ class RBACRepository(BaseRepository[Role]):
         )
         return list(result.scalars().all())
 
+    async def list_role_ids_by_user_ids(self, *, user_ids: tuple[int, ...]) -> dict[int, list[int]]:
+        role_ids_by_user_id: dict[int, list[int]] = {user_id: [] for user_id in user_ids}
+        unique_user_ids = tuple(role_ids_by_user_id)
+        # Chunked so a large id list stays well under the driver's bind-parameter limit (32767 on asyncpg).
+        for offset in range(0, len(unique_user_ids), _USER_ID_LOOKUP_CHUNK_SIZE):
+            result = await self.session.execute(
+                select(UserRole.user_id, UserRole.role_id)
+                .where(UserRole.user_id.in_(unique_user_ids[offset : offset + _USER_ID_LOOKUP_CHUNK_SIZE]))
+                .order_by(UserRole.user_id.asc(), UserRole.role_id.asc())
+            )
+            for user_id, role_id in result.all():
+                role_ids_by_user_id[user_id].append(role_id)
+        return role_ids_by_user_id
+
+    async def list_role_ids_by_user_filters(self, *, filters: UserListFilters | None = None) -> dict[int, list[int]]:
+        # Reuses the user filters as a subquery instead of binding every listed user id into an IN clause.
+        filtered_user_ids = select(User.id).where(*self._build_user_filter_conditions(filters))
+        result = await self.session.execute(
+            select(UserRole.user_id, UserRole.role_id)
+            .where(UserRole.user_id.in_(filtered_user_ids))
+            .order_by(UserRole.user_id.asc(), UserRole.role_id.asc())
+        )
+        role_ids_by_user_id: dict[int, list[int]] = {}
+        for user_id, role_id in result.all():
+            role_ids_by_user_id.setdefault(user_id, []).append(role_id)
+        return role_ids_by_user_id
+
     async def list_user_roles(self, *, user_id: int) -> list[RoleRecord]:
         query = (
             select(Role)
@@ -261,6 +453,11 @@ class RBACRepository(BaseRepository[Role]):
         roles = list(result.scalars().all())
         return self._to_records(roles, RoleRecord)
 
+    async def list_user_roles_page(self, *, user_id: int, page: PageRequest) -> CursorPage[RoleRecord]:
+        query = select(Role).join(UserRole, UserRole.role_id == Role.id).where(UserRole.user_id == user_id)
+        role_page = await self._paginate(query, page=page, sort="name")
+        return self._to_record_page(role_page, RoleRecord)
+
     async def list_role_users(self, *, role_id: int) -> list[UserRecord]:
         query = (
             select(User)
@@ -272,6 +469,11 @@ class RBACRepository(BaseRepository[Role]):
         users = list(result.scalars().all())
         return self._to_records(users, UserRecord)
 
+    async def list_role_users_page(self, *, role_id: int, page: PageRequest) -> CursorPage[UserRecord]:
+        query = select(User).join(UserRole, UserRole.user_id == User.id).where(UserRole.role_id == role_id)
+        user_page = await self._paginate(query, page=page, sort="username", model=User)
+        return self._to_record_page(user_page, UserRecord)
+
     async def assign_role_inheritance(self, *, role_id: int, parent_role_id: int) -> bool:
         role_inheritance = await self.session.get(
             RoleInheritance,
@@ -282,6 +484,7 @@ class RBACRepository(BaseRepository[Role]):
 
         self.session.add(RoleInheritance(role_id=role_id, parent_role_id=parent_role_id))
         await self.session.flush()
+        await self._bump_role_dependent_rbac_versions(role_id)
         return True
 
     async def remove_role_inheritance(self, *, role_id: int, parent_role_id: int) -> bool:
@@ -294,4 +497,5 @@ class RBACRepository(BaseRepository[Role]):
 
         await self.session.delete(role_inheritance)
         await self.session.flush()
+        await self._bump_role_dependent_rbac_versions(role_id)
         return True
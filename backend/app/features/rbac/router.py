@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from app.core.setup.dependencies import RBACServiceDependency
 from app.features.rbac.dependencies import (
@@ -28,21 +28,30 @@ from app.features.rbac.openapi import (
     UPSERT_ROLE_PERMISSION_DOC,
     CreateAdminUserPayload,
     CreateRolePayload,
+    PageCursorQuery,
+    PageLimitQuery,
     ParentRoleIdPath,
     PermissionIdPath,
     RoleIdPath,
+    RoleSearchQuery,
     SetRolePermissionPayload,
     UpdateAdminUserPayload,
     UpdateRolePayload,
+    UserDisabledQuery,
     UserIdPath,
+    UserRoleIdQuery,
+    UserSearchQuery,
+    UserTenantIdQuery,
 )
 from app.features.rbac.router_mappers import (
+    set_next_cursor_header,
     to_admin_user_response,
     to_admin_user_response_list,
     to_assigned_role_response_list,
     to_assigned_user_response_list,
     to_create_admin_user_command,
     to_create_role_command,
+    to_page_request,
     to_permission_response_list,
     to_role_permission_response,
     to_role_response,
@@ -59,6 +68,8 @@ from app.features.rbac.schemas import (
     RBACPermission,
     RBACRole,
     RBACRolePermission,
+    RoleListFilters,
+    UserListFilters,
     UserRoleAssignmentResponse,
 )
 
@@ -72,9 +83,22 @@ router = APIRouter(
 async def list_users(
     rbac_service: RBACServiceDependency,
     _authorized_user: RBACUserAdminAuth,
+    response: Response,
+    limit: PageLimitQuery = None,
+    cursor: PageCursorQuery = None,
+    q: UserSearchQuery = None,
+    disabled: UserDisabledQuery = None,
+    role_id: UserRoleIdQuery = None,
+    tenant_id: UserTenantIdQuery = None,
 ) -> list[AdminUserResponse]:
-    users = await rbac_service.list_users()
-    return to_admin_user_response_list(users)
+    filters = UserListFilters(q=q, disabled=disabled, role_id=role_id, tenant_id=tenant_id)
+    page = to_page_request(limit, cursor)
+    if page is None:
+        return to_admin_user_response_list(await rbac_service.list_users(filters))
+
+    user_page = await rbac_service.list_users_page(page, filters)
+    set_next_cursor_header(response, user_page.next_cursor)
+    return to_admin_user_response_list(user_page.items)
 
 
 @router.get("/users/{user_id}", response_model=AdminUserResponse, **GET_ADMIN_USER_DOC)
@@ -90,40 +114,52 @@ async def get_user(
 @router.post("/users", response_model=AdminUserResponse, **CREATE_ADMIN_USER_DOC)
 async def create_user(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACUserAdminAuth,
+    authorized_user: RBACUserAdminAuth,
     user_data: CreateAdminUserPayload,
 ) -> AdminUserResponse:
-    user = await rbac_service.create_user(to_create_admin_user_command(user_data))
+    user = await rbac_service.create_user(to_create_admin_user_command(user_data), actor_user_id=authorized_user.id)
     return to_admin_user_response(user)
 
 
 @router.put("/users/{user_id}", response_model=AdminUserResponse, **UPDATE_ADMIN_USER_DOC)
 async def update_user(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACUserAdminAuth,
+    authorized_user: RBACUserAdminAuth,
     user_id: UserIdPath,
     user_data: UpdateAdminUserPayload,
 ) -> AdminUserResponse:
-    user = await rbac_service.update_user(user_id, to_update_admin_user_command(user_data))
+    user = await rbac_service.update_user(
+        user_id, to_update_admin_user_command(user_data), actor_user_id=authorized_user.id
+    )
     return to_admin_user_response(user)
 
 
 @router.delete("/users/{user_id}", **DELETE_ADMIN_USER_DOC)
 async def delete_user(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACUserAdminAuth,
+    authorized_user: RBACUserAdminAuth,
     user_id: UserIdPath,
 ) -> None:
-    await rbac_service.delete_user(user_id)
+    await rbac_service.delete_user(user_id, actor_user_id=authorized_user.id)
 
 
 @router.get("/roles", response_model=list[RBACRole], **GET_ROLES_DOC)
 async def list_roles(
     rbac_service: RBACServiceDependency,
     _authorized_user: RBACRoleAdminAuth,
+    response: Response,
+    limit: PageLimitQuery = None,
+    cursor: PageCursorQuery = None,
+    q: RoleSearchQuery = None,
 ) -> list[RBACRole]:
-    roles = await rbac_service.list_roles()
-    return to_role_response_list(roles)
+    filters = RoleListFilters(q=q)
+    page = to_page_request(limit, cursor)
+    if page is None:
+        return to_role_response_list(await rbac_service.list_roles(filters))
+
+    role_page = await rbac_service.list_roles_page(page, filters)
+    set_next_cursor_header(response, role_page.next_cursor)
+    return to_role_response_list(role_page.items)
 
 
 @router.get("/permissions", response_model=list[RBACPermission], **GET_PERMISSIONS_DOC)
@@ -138,31 +174,31 @@ async def list_permissions(
 @router.post("/roles", response_model=RBACRole, **CREATE_ROLE_DOC)
 async def create_role(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACRoleAdminAuth,
+    authorized_user: RBACRoleAdminAuth,
     role_data: CreateRolePayload,
 ) -> RBACRole:
-    role = await rbac_service.create_role(to_create_role_command(role_data))
+    role = await rbac_service.create_role(to_create_role_command(role_data), actor_user_id=authorized_user.id)
     return to_role_response(role)
 
 
 @router.put("/roles/{role_id}", response_model=RBACRole, **UPDATE_ROLE_DOC)
 async def update_role(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACRoleAdminAuth,
+    authorized_user: RBACRoleAdminAuth,
     role_id: RoleIdPath,
     role_data: UpdateRolePayload,
 ) -> RBACRole:
-    role = await rbac_service.update_role(role_id, to_update_role_command(role_data))
+    role = await rbac_service.update_role(role_id, to_update_role_command(role_data), actor_user_id=authorized_user.id)
     return to_role_response(role)
 
 
 @router.delete("/roles/{role_id}", **DELETE_ROLE_DOC)
 async def delete_role(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACRoleAdminAuth,
+    authorized_user: RBACRoleAdminAuth,
     role_id: RoleIdPath,
 ) -> None:
-    await rbac_service.delete_role(role_id)
+    await rbac_service.delete_role(role_id, actor_user_id=authorized_user.id)
 
 
 @router.put(
@@ -171,11 +207,11 @@ async def delete_role(
 )
 async def assign_role_inheritance(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACRoleAdminAuth,
+    authorized_user: RBACRoleAdminAuth,
     role_id: RoleIdPath,
     parent_role_id: ParentRoleIdPath,
 ) -> None:
-    await rbac_service.assign_role_inheritance(role_id, parent_role_id)
+    await rbac_service.assign_role_inheritance(role_id, parent_role_id, actor_user_id=authorized_user.id)
 
 
 @router.delete(
@@ -184,11 +220,11 @@ async def assign_role_inheritance(
 )
 async def remove_role_inheritance(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACRoleAdminAuth,
+    authorized_user: RBACRoleAdminAuth,
     role_id: RoleIdPath,
     parent_role_id: ParentRoleIdPath,
 ) -> None:
-    await rbac_service.remove_role_inheritance(role_id, parent_role_id)
+    await rbac_service.remove_role_inheritance(role_id, parent_role_id, actor_user_id=authorized_user.id)
 
 
 @router.put(
@@ -198,7 +234,7 @@ async def remove_role_inheritance(
 )
 async def assign_role_permission(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACRolePermissionAdminAuth,
+    authorized_user: RBACRolePermissionAdminAuth,
     role_id: RoleIdPath,
     permission_id: PermissionIdPath,
     assignment: SetRolePermissionPayload,
@@ -207,6 +243,7 @@ async def assign_role_permission(
         role_id,
         permission_id,
         to_set_role_permission_command(assignment),
+        actor_user_id=authorized_user.id,
     )
     return to_role_permission_response(role_permission)
 
@@ -217,11 +254,11 @@ async def assign_role_permission(
 )
 async def remove_role_permission(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACRolePermissionAdminAuth,
+    authorized_user: RBACRolePermissionAdminAuth,
     role_id: RoleIdPath,
     permission_id: PermissionIdPath,
 ) -> None:
-    await rbac_service.remove_role_permission(role_id, permission_id)
+    await rbac_service.remove_role_permission(role_id, permission_id, actor_user_id=authorized_user.id)
 
 
 @router.put(
@@ -231,11 +268,11 @@ async def remove_role_permission(
 )
 async def assign_user_role(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACUserRoleAdminAuth,
+    authorized_user: RBACUserRoleAdminAuth,
     user_id: UserIdPath,
     role_id: RoleIdPath,
 ) -> UserRoleAssignmentResponse:
-    assignment = await rbac_service.assign_user_role(user_id, role_id)
+    assignment = await rbac_service.assign_user_role(user_id, role_id, actor_user_id=authorized_user.id)
     return to_user_role_assignment_response(assignment)
 
 
@@ -244,9 +281,17 @@ async def list_user_roles(
     rbac_service: RBACServiceDependency,
     _authorized_user: RBACUserRoleAdminAuth,
     user_id: UserIdPath,
+    response: Response,
+    limit: PageLimitQuery = None,
+    cursor: PageCursorQuery = None,
 ) -> list[AssignedRole]:
-    roles = await rbac_service.list_user_roles(user_id)
-    return to_assigned_role_response_list(roles)
+    page = to_page_request(limit, cursor)
+    if page is None:
+        return to_assigned_role_response_list(await rbac_service.list_user_roles(user_id))
+
+    role_page = await rbac_service.list_user_roles_page(user_id, page)
+    set_next_cursor_header(response, role_page.next_cursor)
+    return to_assigned_role_response_list(role_page.items)
 
 
 @router.get("/roles/{role_id}/users", response_model=list[AssignedUser], **GET_ROLE_USERS_DOC)
@@ -254,16 +299,24 @@ async def list_role_users(
     rbac_service: RBACServiceDependency,
     _authorized_user: RBACUserRoleAdminAuth,
     role_id: RoleIdPath,
+    response: Response,
+    limit: PageLimitQuery = None,
+    cursor: PageCursorQuery = None,
 ) -> list[AssignedUser]:
-    users = await rbac_service.list_role_users(role_id)
-    return to_assigned_user_response_list(users)
+    page = to_page_request(limit, cursor)
+    if page is None:
+        return to_assigned_user_response_list(await rbac_service.list_role_users(role_id))
+
+    user_page = await rbac_service.list_role_users_page(role_id, page)
+    set_next_cursor_header(response, user_page.next_cursor)
+    return to_assigned_user_response_list(user_page.items)
 
 
 @router.delete("/users/{user_id}/roles/{role_id}", **REMOVE_USER_ROLE_DOC)
 async def remove_user_role(
     rbac_service: RBACServiceDependency,
-    _authorized_user: RBACUserRoleAdminAuth,
+    authorized_user: RBACUserRoleAdminAuth,
     user_id: UserIdPath,
     role_id: RoleIdPath,
 ) -> None:
-    await rbac_service.remove_user_role(user_id, role_id)
+    await rbac_service.remove_user_role(user_id, role_id, actor_user_id=authorized_user.id)
@@ -1,3 +1,7 @@
+from fastapi import Response
+
+from app.core.common.openapi import NEXT_CURSOR_HEADER
+from app.core.common.pagination import DEFAULT_LIST_LIMIT, PageRequest
 from app.features.rbac.schemas import (
     AdminUserResponse,
     AdminUserResult,
@@ -96,3 +100,14 @@ def to_assigned_user_response(user: AssignedUserResult) -> AssignedUser:
 
 def to_assigned_user_response_list(users: list[AssignedUserResult]) -> list[AssignedUser]:
     return [to_assigned_user_response(user) for user in users]
+
+
+def to_page_request(limit: int | None, cursor: str | None) -> PageRequest | None:
+    if limit is None and cursor is None:
+        return None
+    return PageRequest(limit=limit or DEFAULT_LIST_LIMIT, cursor=cursor)
+
+
+def set_next_cursor_header(response: Response, next_cursor: str | None) -> None:
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
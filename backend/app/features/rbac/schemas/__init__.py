@@ -19,10 +19,12 @@ from app.features.rbac.schemas.app import (
     CreateAdminUserCommand,
     CreateRoleCommand,
     PermissionResult,
+    RoleListFilters,
     RolePermissionResult,
     RoleResult,
     SetRolePermissionCommand,
     UpdateAdminUserCommand,
     UpdateRoleCommand,
+    UserListFilters,
     UserRoleAssignmentResult,
 )
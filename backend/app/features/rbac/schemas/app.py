@@ -1,4 +1,4 @@
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from app.core.common.schema import ApplicationSchema
 
@@ -68,3 +68,18 @@ class UpdateAdminUserCommand(ApplicationSchema):
     new_password: str | None = None
     disabled: bool | None = None
     role_ids: list[int] | None = None
+
+
+class UserListFilters(ApplicationSchema):
+    q: str | None = None
+    disabled: bool | None = None
+    role_id: int | None = None
+    tenant_id: int | None = None
+
+    model_config = ConfigDict(frozen=True)
+
+
+class RoleListFilters(ApplicationSchema):
+    q: str | None = None
+
+    model_config = ConfigDict(frozen=True)
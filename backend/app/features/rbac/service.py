@@ -1,5 +1,7 @@
 from typing import Protocol
 
+from app.core.authorization.snapshot_cache import AuthorizationSnapshotCachePort
+from app.core.common.pagination import CursorPage, PageRequest
 from app.core.common.records import (
     PermissionRecord,
     RoleInheritanceRecord,
@@ -8,7 +10,9 @@ from app.core.common.records import (
     UserRecord,
 )
 from app.core.db.ports import UnitOfWorkPort
+from app.core.security.service import PasswordServicePort
 from app.features.rbac.operations import (
+    RBACAuditTrail,
     RBACEntityLookup,
     RBACRoleOperations,
     RBACUserManagement,
@@ -21,19 +25,36 @@ from app.features.rbac.schemas import (
     CreateAdminUserCommand,
     CreateRoleCommand,
     PermissionResult,
+    RoleListFilters,
     RolePermissionResult,
     RoleResult,
     SetRolePermissionCommand,
     UpdateAdminUserCommand,
     UpdateRoleCommand,
+    UserListFilters,
     UserRoleAssignmentResult,
 )
+from app.integrations.audit import AuditLogWriterPort
 
 
 class RBACRepositoryPort(Protocol):
-    async def list_users(self) -> list[UserRecord]: ...
+    async def list_users(self, *, filters: UserListFilters | None = None) -> list[UserRecord]: ...
 
-    async def list_roles(self) -> list[RoleRecord]: ...
+    async def list_users_page(
+        self,
+        *,
+        page: PageRequest,
+        filters: UserListFilters | None = None,
+    ) -> CursorPage[UserRecord]: ...
+
+    async def list_roles(self, *, filters: RoleListFilters | None = None) -> list[RoleRecord]: ...
+
+    async def list_roles_page(
+        self,
+        *,
+        page: PageRequest,
+        filters: RoleListFilters | None = None,
+    ) -> CursorPage[RoleRecord]: ...
 
     async def list_permissions(self) -> list[PermissionRecord]: ...
 
@@ -79,146 +100,320 @@ class RBACRepositoryPort(Protocol):
 
     async def update_user(self, user_id: int, **changes: object) -> UserRecord: ...
 
+    async def replace_password_hash(self, user_id: int, *, current_hash: str, new_hash: str) -> bool: ...
+
     async def list_user_role_ids(self, *, user_id: int) -> list[int]: ...
 
+    async def list_role_ids_by_user_ids(self, *, user_ids: tuple[int, ...]) -> dict[int, list[int]]: ...
+
+    async def list_role_ids_by_user_filters(
+        self,
+        *,
+        filters: UserListFilters | None = None,
+    ) -> dict[int, list[int]]: ...
+
     async def assign_user_role(self, *, user_id: int, role_id: int) -> bool: ...
 
     async def remove_user_role(self, *, user_id: int, role_id: int) -> bool: ...
 
     async def list_user_roles(self, *, user_id: int) -> list[RoleRecord]: ...
 
+    async def list_user_roles_page(self, *, user_id: int, page: PageRequest) -> CursorPage[RoleRecord]: ...
+
     async def list_role_users(self, *, role_id: int) -> list[UserRecord]: ...
 
+    async def list_role_users_page(self, *, role_id: int, page: PageRequest) -> CursorPage[UserRecord]: ...
+
     async def assign_role_inheritance(self, *, role_id: int, parent_role_id: int) -> bool: ...
 
     async def remove_role_inheritance(self, *, role_id: int, parent_role_id: int) -> bool: ...
 
+    async def list_role_dependent_user_ids(self, role_id: int) -> list[int]: ...
+
+    async def rebuild_user_effective_permissions(self, *, user_ids: tuple[int, ...] | None = None) -> None: ...
+
 
 class RBACServicePort(Protocol):
-    async def list_users(self) -> list[AdminUserResult]: ...
+    async def list_users(self, filters: UserListFilters | None = None) -> list[AdminUserResult]: ...
+
+    async def list_users_page(
+        self,
+        page: PageRequest,
+        filters: UserListFilters | None = None,
+    ) -> CursorPage[AdminUserResult]: ...
 
     async def get_user(self, user_id: int) -> AdminUserResult: ...
 
-    async def create_user(self, user_data: CreateAdminUserCommand) -> AdminUserResult: ...
+    async def create_user(
+        self,
+        user_data: CreateAdminUserCommand,
+        *,
+        actor_user_id: int | None = None,
+    ) -> AdminUserResult: ...
 
-    async def update_user(self, user_id: int, user_data: UpdateAdminUserCommand) -> AdminUserResult: ...
+    async def update_user(
+        self,
+        user_id: int,
+        user_data: UpdateAdminUserCommand,
+        *,
+        actor_user_id: int | None = None,
+    ) -> AdminUserResult: ...
 
-    async def delete_user(self, user_id: int) -> None: ...
+    async def delete_user(self, user_id: int, *, actor_user_id: int | None = None) -> None: ...
 
-    async def list_roles(self) -> list[RoleResult]: ...
+    async def list_roles(self, filters: RoleListFilters | None = None) -> list[RoleResult]: ...
+
+    async def list_roles_page(
+        self,
+        page: PageRequest,
+        filters: RoleListFilters | None = None,
+    ) -> CursorPage[RoleResult]: ...
 
     async def list_permissions(self) -> list[PermissionResult]: ...
 
-    async def create_role(self, role_data: CreateRoleCommand) -> RoleResult: ...
+    async def create_role(self, role_data: CreateRoleCommand, *, actor_user_id: int | None = None) -> RoleResult: ...
 
-    async def update_role(self, role_id: int, role_data: UpdateRoleCommand) -> RoleResult: ...
+    async def update_role(
+        self,
+        role_id: int,
+        role_data: UpdateRoleCommand,
+        *,
+        actor_user_id: int | None = None,
+    ) -> RoleResult: ...
 
-    async def delete_role(self, role_id: int) -> None: ...
+    async def delete_role(self, role_id: int, *, actor_user_id: int | None = None) -> None: ...
 
     async def assign_role_permission(
         self,
         role_id: int,
         permission_id: str,
         assignment: SetRolePermissionCommand,
+        *,
+        actor_user_id: int | None = None,
     ) -> RolePermissionResult: ...
 
-    async def remove_role_permission(self, role_id: int, permission_id: str) -> None: ...
+    async def remove_role_permission(
+        self,
+        role_id: int,
+        permission_id: str,
+        *,
+        actor_user_id: int | None = None,
+    ) -> None: ...
 
-    async def assign_role_inheritance(self, role_id: int, parent_role_id: int) -> None: ...
+    async def assign_role_inheritance(
+        self,
+        role_id: int,
+        parent_role_id: int,
+        *,
+        actor_user_id: int | None = None,
+    ) -> None: ...
 
-    async def remove_role_inheritance(self, role_id: int, parent_role_id: int) -> None: ...
+    async def remove_role_inheritance(
+        self,
+        role_id: int,
+        parent_role_id: int,
+        *,
+        actor_user_id: int | None = None,
+    ) -> None: ...
 
-    async def assign_user_role(self, user_id: int, role_id: int) -> UserRoleAssignmentResult: ...
+    async def assign_user_role(
+        self,
+        user_id: int,
+        role_id: int,
+        *,
+        actor_user_id: int | None = None,
+    ) -> UserRoleAssignmentResult: ...
 
-    async def remove_user_role(self, user_id: int, role_id: int) -> None: ...
+    async def remove_user_role(self, user_id: int, role_id: int, *, actor_user_id: int | None = None) -> None: ...
 
     async def list_user_roles(self, user_id: int) -> list[AssignedRoleResult]: ...
 
+    async def list_user_roles_page(self, user_id: int, page: PageRequest) -> CursorPage[AssignedRoleResult]: ...
+
     async def list_role_users(self, role_id: int) -> list[AssignedUserResult]: ...
 
+    async def list_role_users_page(self, role_id: int, page: PageRequest) -> CursorPage[AssignedUserResult]: ...
+
 
 class RBACService:
     def __init__(
         self,
         rbac_repository: RBACRepositoryPort,
         unit_of_work: UnitOfWorkPort,
+        authorization_snapshot_cache: AuthorizationSnapshotCachePort | None = None,
+        audit_log_writer: AuditLogWriterPort | None = None,
+        password_service: PasswordServicePort | None = None,
     ):
+        self._authorization_snapshot_cache = authorization_snapshot_cache
         entity_lookup = RBACEntityLookup(rbac_repository)
+        audit_trail = RBACAuditTrail(audit_log_writer)
         self._role_operations = RBACRoleOperations(
             rbac_repository=rbac_repository,
             unit_of_work=unit_of_work,
             entity_lookup=entity_lookup,
+            audit_trail=audit_trail,
         )
         self._user_management = RBACUserManagement(
             rbac_repository=rbac_repository,
             unit_of_work=unit_of_work,
             entity_lookup=entity_lookup,
+            audit_trail=audit_trail,
+            password_service=password_service,
         )
         self._user_role_assignments = RBACUserRoleAssignments(
             rbac_repository=rbac_repository,
             unit_of_work=unit_of_work,
             entity_lookup=entity_lookup,
+            audit_trail=audit_trail,
         )
 
-    async def list_users(self) -> list[AdminUserResult]:
-        return await self._user_management.list_users()
+    def _invalidate_user_snapshot(self, user_id: int) -> None:
+        if self._authorization_snapshot_cache is not None:
+            self._authorization_snapshot_cache.invalidate_user(user_id)
+
+    def _invalidate_all_snapshots(self) -> None:
+        if self._authorization_snapshot_cache is not None:
+            self._authorization_snapshot_cache.clear()
+
+    async def list_users(self, filters: UserListFilters | None = None) -> list[AdminUserResult]:
+        return await self._user_management.list_users(filters)
+
+    async def list_users_page(
+        self,
+        page: PageRequest,
+        filters: UserListFilters | None = None,
+    ) -> CursorPage[AdminUserResult]:
+        return await self._user_management.list_users_page(page, filters)
 
     async def get_user(self, user_id: int) -> AdminUserResult:
         return await self._user_management.get_user(user_id)
 
-    async def create_user(self, user_data: CreateAdminUserCommand) -> AdminUserResult:
-        return await self._user_management.create_user(user_data)
+    async def create_user(
+        self,
+        user_data: CreateAdminUserCommand,
+        *,
+        actor_user_id: int | None = None,
+    ) -> AdminUserResult:
+        return await self._user_management.create_user(user_data, actor_user_id=actor_user_id)
 
-    async def update_user(self, user_id: int, user_data: UpdateAdminUserCommand) -> AdminUserResult:
-        return await self._user_management.update_user(user_id, user_data)
+    async def update_user(
+        self,
+        user_id: int,
+        user_data: UpdateAdminUserCommand,
+        *,
+        actor_user_id: int | None = None,
+    ) -> AdminUserResult:
+        updated_user = await self._user_management.update_user(user_id, user_data, actor_user_id=actor_user_id)
+        self._invalidate_user_snapshot(user_id)
+        return updated_user
 
-    async def delete_user(self, user_id: int) -> None:
-        await self._user_management.delete_user(user_id)
+    async def delete_user(self, user_id: int, *, actor_user_id: int | None = None) -> None:
+        await self._user_management.delete_user(user_id, actor_user_id=actor_user_id)
+        self._invalidate_user_snapshot(user_id)
 
-    async def list_roles(self) -> list[RoleResult]:
-        return await self._role_operations.list_roles()
+    async def list_roles(self, filters: RoleListFilters | None = None) -> list[RoleResult]:
+        return await self._role_operations.list_roles(filters)
+
+    async def list_roles_page(
+        self,
+        page: PageRequest,
+        filters: RoleListFilters | None = None,
+    ) -> CursorPage[RoleResult]:
+        return await self._role_operations.list_roles_page(page, filters)
 
     async def list_permissions(self) -> list[PermissionResult]:
         return await self._role_operations.list_permissions()
 
-    async def create_role(self, role_data: CreateRoleCommand) -> RoleResult:
-        return await self._role_operations.create_role(role_data)
+    async def create_role(self, role_data: CreateRoleCommand, *, actor_user_id: int | None = None) -> RoleResult:
+        return await self._role_operations.create_role(role_data, actor_user_id=actor_user_id)
 
-    async def update_role(self, role_id: int, role_data: UpdateRoleCommand) -> RoleResult:
-        return await self._role_operations.update_role(role_id, role_data)
+    async def update_role(
+        self,
+        role_id: int,
+        role_data: UpdateRoleCommand,
+        *,
+        actor_user_id: int | None = None,
+    ) -> RoleResult:
+        return await self._role_operations.update_role(role_id, role_data, actor_user_id=actor_user_id)
 
-    async def delete_role(self, role_id: int) -> None:
-        await self._role_operations.delete_role(role_id)
+    async def delete_role(self, role_id: int, *, actor_user_id: int | None = None) -> None:
+        await self._role_operations.delete_role(role_id, actor_user_id=actor_user_id)
+        self._invalidate_all_snapshots()
 
     async def assign_role_permission(
         self,
         role_id: int,
         permission_id: str,
         assignment: SetRolePermissionCommand,
+        *,
+        actor_user_id: int | None = None,
     ) -> RolePermissionResult:
-        return await self._role_operations.assign_role_permission(
+        role_permission = await self._role_operations.assign_role_permission(
             role_id,
             permission_id,
             assignment,
+            actor_user_id=actor_user_id,
         )
+        self._invalidate_all_snapshots()
+        return role_permission
 
-    async def remove_role_permission(self, role_id: int, permission_id: str) -> None:
-        await self._role_operations.remove_role_permission(role_id, permission_id)
+    async def remove_role_permission(
+        self,
+        role_id: int,
+        permission_id: str,
+        *,
+        actor_user_id: int | None = None,
+    ) -> None:
+        await self._role_operations.remove_role_permission(role_id, permission_id, actor_user_id=actor_user_id)
+        self._invalidate_all_snapshots()
 
-    async def assign_role_inheritance(self, role_id: int, parent_role_id: int) -> None:
-        await self._role_operations.assign_role_inheritance(role_id, parent_role_id)
+    async def assign_role_inheritance(
+        self,
+        role_id: int,
+        parent_role_id: int,
+        *,
+        actor_user_id: int | None = None,
+    ) -> None:
+        await self._role_operations.assign_role_inheritance(role_id, parent_role_id, actor_user_id=actor_user_id)
+        self._invalidate_all_snapshots()
 
-    async def remove_role_inheritance(self, role_id: int, parent_role_id: int) -> None:
-        await self._role_operations.remove_role_inheritance(role_id, parent_role_id)
+    async def remove_role_inheritance(
+        self,
+        role_id: int,
+        parent_role_id: int,
+        *,
+        actor_user_id: int | None = None,
+    ) -> None:
+        await self._role_operations.remove_role_inheritance(role_id, parent_role_id, actor_user_id=actor_user_id)
+        self._invalidate_all_snapshots()
 
-    async def assign_user_role(self, user_id: int, role_id: int) -> UserRoleAssignmentResult:
-        return await self._user_role_assignments.assign_user_role(user_id, role_id)
+    async def assign_user_role(
+        self,
+        user_id: int,
+        role_id: int,
+        *,
+        actor_user_id: int | None = None,
+    ) -> UserRoleAssignmentResult:
+        assignment = await self._user_role_assignments.assign_user_role(
+            user_id,
+            role_id,
+            actor_user_id=actor_user_id,
+        )
+        self._invalidate_user_snapshot(user_id)
+        return assignment
 
-    async def remove_user_role(self, user_id: int, role_id: int) -> None:
-        await self._user_role_assignments.remove_user_role(user_id, role_id)
+    async def remove_user_role(self, user_id: int, role_id: int, *, actor_user_id: int | None = None) -> None:
+        await self._user_role_assignments.remove_user_role(user_id, role_id, actor_user_id=actor_user_id)
+        self._invalidate_user_snapshot(user_id)
 
     async def list_user_roles(self, user_id: int) -> list[AssignedRoleResult]:
         return await self._user_role_assignments.list_user_roles(user_id)
 
     async def list_role_users(self, role_id: int) -> list[AssignedUserResult]:
         return await self._user_role_assignments.list_role_users(role_id)
+
+    async def list_user_roles_page(self, user_id: int, page: PageRequest) -> CursorPage[AssignedRoleResult]:
+        return await self._user_role_assignments.list_user_roles_page(user_id, page)
+
+    async def list_role_users_page(self, role_id: int, page: PageRequest) -> CursorPage[AssignedUserResult]:
+        return await self._user_role_assignments.list_role_users_page(role_id, page)
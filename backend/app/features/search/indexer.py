@@ -0,0 +1,104 @@
+import logging
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.integration import DeleteSearchDocumentCommand, PublishMessageCommand, SearchDocumentUpsertCommand
+from app.core.common.observability import log_layer_event
+from app.core.db.uow import UnitOfWork
+from app.features.search.repository import SearchRepository
+from app.features.search.service import SearchService
+from app.features.search.tracking import SEARCH_TRACKED_MODELS
+
+logger = logging.getLogger("app.search")
+
+# Outbox aggregate type -> search index name.
+SEARCH_INDEXES: dict[str, str] = {
+    aggregate_type: f"{aggregate_type}s" for aggregate_type, _ in SEARCH_TRACKED_MODELS.values()
+}
+
+SearchChange = SearchDocumentUpsertCommand | DeleteSearchDocumentCommand
+
+
+def to_search_change(message: PublishMessageCommand) -> SearchChange | None:
+    index = SEARCH_INDEXES.get(message.topic)
+    if index is None or message.key is None:
+        return None
+    if message.payload["event_type"].endswith(".deleted"):
+        return DeleteSearchDocumentCommand(index=index, document_id=message.key)
+    return SearchDocumentUpsertCommand(index=index, document_id=message.key, body=message.payload["payload"])
+
+
+class SearchIndexer:
+    def __init__(self, *, session_factory: Callable[[], AsyncSession], reindex_page_size: int = 500) -> None:
+        self._session_factory = session_factory
+        self._reindex_page_size = reindex_page_size
+
+    async def publish(self, message: PublishMessageCommand) -> None:
+        await self.publish_many([message])
+
+    async def publish_many(self, messages: Sequence[PublishMessageCommand]) -> None:
+        # Messages arrive in outbox order, so the last change of each document is its current state.
+        changes: dict[tuple[str, str], SearchChange] = {}
+        for message in messages:
+            change = to_search_change(message)
+            if change is not None:
+                changes[(change.index, change.document_id)] = change
+        if not changes:
+            return
+
+        async with self._session_factory() as session:
+            service = SearchService(search_repository=SearchRepository(session), unit_of_work=UnitOfWork(session))
+            upserted_count, deleted_count = await service.apply_changes(
+                upserts=[change for change in changes.values() if isinstance(change, SearchDocumentUpsertCommand)],
+                deletes=[change for change in changes.values() if isinstance(change, DeleteSearchDocumentCommand)],
+            )
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="search_changes_indexed",
+            upserted_count=upserted_count,
+            deleted_count=deleted_count,
+        )
+
+    async def _iter_document_pages(
+        self,
+        session: AsyncSession,
+        model: type[Any],
+        index: str,
+    ) -> AsyncIterator[list[SearchDocumentUpsertCommand]]:
+        _, fields = SEARCH_TRACKED_MODELS[model]
+        last_id = 0
+        while True:
+            result = await session.execute(
+                select(model.id, *(getattr(model, field) for field in fields))
+                .where(model.id > last_id)
+                .order_by(model.id)
+                .limit(self._reindex_page_size)
+            )
+            rows = result.all()
+            if not rows:
+                return
+            yield [
+                SearchDocumentUpsertCommand(
+                    index=index,
+                    document_id=str(row[0]),
+                    body=dict(zip(fields, row[1:], strict=True)),
+                )
+                for row in rows
+            ]
+            last_id = rows[-1][0]
+
+    async def reindex(self) -> dict[str, int]:
+        indexed_counts: dict[str, int] = {}
+        async with self._session_factory() as session:
+            service = SearchService(search_repository=SearchRepository(session), unit_of_work=UnitOfWork(session))
+            for model, (aggregate_type, _) in SEARCH_TRACKED_MODELS.items():
+                index = SEARCH_INDEXES[aggregate_type]
+                indexed_counts[index] = await service.rebuild_index(
+                    index,
+                    self._iter_document_pages(session, model, index),
+                )
+        return indexed_counts
@@ -0,0 +1,40 @@
+from typing import Any
+
+from sqlalchemy import DDL, JSON, Index, Integer, String, Text, UniqueConstraint, event, func, literal_column
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db.base import BaseModel
+
+SEARCH_TEXT_CONFIG = "simple"
+SEARCH_FTS_TABLE = "search_documents_fts"
+
+
+class SearchDocument(BaseModel):
+    __tablename__ = "search_documents"
+    __table_args__ = (UniqueConstraint("index_name", "document_id", name="uq_search_documents_index_document"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    index_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    document_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    body: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+
+
+def search_vector() -> Any:
+    return func.to_tsvector(literal_column(f"'{SEARCH_TEXT_CONFIG}'"), SearchDocument.content)
+
+
+# PostgreSQL matches against a GIN index over the tsvector of content; SQLite keeps an FTS5 table keyed by id instead.
+Index("ix_search_documents_content_tsvector", search_vector(), postgresql_using="gin").ddl_if(dialect="postgresql")
+event.listen(
+    SearchDocument.__table__,
+    "after_create",
+    DDL(f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS_TABLE} USING fts5(content, tokenize='unicode61')").execute_if(
+        dialect="sqlite"
+    ),
+)
+event.listen(
+    SearchDocument.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
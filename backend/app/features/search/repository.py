@@ -0,0 +1,160 @@
+import logging
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, bindparam, column, delete, func, literal_column, select, table, text, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.integration import (
+    DeleteSearchDocumentCommand,
+    SearchDocumentsQuery,
+    SearchDocumentUpsertCommand,
+    SearchHit,
+)
+from app.core.common.observability import log_layer_event
+from app.core.db.repository_base import BaseRepository
+from app.features.search.models import SEARCH_FTS_TABLE, SEARCH_TEXT_CONFIG, SearchDocument, search_vector
+
+logger = logging.getLogger("app.search")
+
+_MAX_QUERY_TERMS = 8
+_TERM_PATTERN = re.compile(r"[^\W_]+")
+_FTS_TABLE = table(SEARCH_FTS_TABLE, column("rowid"))
+_DELETE_FTS_ROW_SQL = text(f"DELETE FROM {SEARCH_FTS_TABLE} WHERE rowid = :rowid")
+_INSERT_FTS_ROW_SQL = text(f"INSERT INTO {SEARCH_FTS_TABLE} (rowid, content) VALUES (:rowid, :content)")
+
+
+def searchable_text(body: dict[str, Any]) -> str:
+    return " ".join(
+        str(value) for value in body.values() if isinstance(value, str | int) and not isinstance(value, bool)
+    )
+
+
+def search_terms(query_text: str) -> list[str]:
+    # Terms are reduced to letters and digits, so they can never inject tsquery or FTS5 query syntax.
+    return _TERM_PATTERN.findall(query_text.lower())[:_MAX_QUERY_TERMS]
+
+
+class SearchRepository(BaseRepository[SearchDocument]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, SearchDocument)
+
+    def _dialect_name(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    async def upsert_documents(self, commands: Sequence[SearchDocumentUpsertCommand]) -> int:
+        # The last command per document wins, since one statement cannot update the same row twice.
+        rows_by_document = {
+            (command.index, command.document_id): {
+                "index_name": command.index,
+                "document_id": command.document_id,
+                "body": command.body,
+                "content": searchable_text(command.body),
+            }
+            for command in commands
+        }
+        if not rows_by_document:
+            return 0
+
+        insert = postgresql.insert if self._dialect_name() == "postgresql" else sqlite.insert
+        statement = insert(SearchDocument)
+        statement = statement.on_conflict_do_update(
+            index_elements=[SearchDocument.index_name, SearchDocument.document_id],
+            set_={
+                "body": statement.excluded.body,
+                "content": statement.excluded.content,
+                "updated_at": statement.excluded.updated_at,
+            },
+        ).returning(SearchDocument.id, SearchDocument.content)
+        result = await self.session.execute(statement, list(rows_by_document.values()))
+        upserted_rows = [{"rowid": row.id, "content": row.content} for row in result.all()]
+        if self._dialect_name() == "sqlite":
+            await self.session.execute(_DELETE_FTS_ROW_SQL, [{"rowid": row["rowid"]} for row in upserted_rows])
+            await self.session.execute(_INSERT_FTS_ROW_SQL, upserted_rows)
+
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="search_documents_upserted",
+            document_count=len(upserted_rows),
+        )
+        return len(upserted_rows)
+
+    async def _delete_where(self, condition: ColumnElement[bool]) -> int:
+        result = await self.session.execute(
+            delete(SearchDocument)
+            .where(condition)
+            .returning(SearchDocument.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted_ids = list(result.scalars().all())
+        if deleted_ids and self._dialect_name() == "sqlite":
+            await self.session.execute(_DELETE_FTS_ROW_SQL, [{"rowid": document_id} for document_id in deleted_ids])
+        return len(deleted_ids)
+
+    async def delete_documents(self, commands: Sequence[DeleteSearchDocumentCommand]) -> int:
+        document_keys = list(dict.fromkeys((command.index, command.document_id) for command in commands))
+        if not document_keys:
+            return 0
+
+        deleted_count = await self._delete_where(
+            tuple_(SearchDocument.index_name, SearchDocument.document_id).in_(document_keys)
+        )
+        log_layer_event(
+            logger,
+            layer="infrastructure",
+            event="search_documents_deleted",
+            requested_count=len(document_keys),
+            deleted_count=deleted_count,
+        )
+        return deleted_count
+
+    async def clear_index(self, index: str) -> int:
+        return await self._delete_where(SearchDocument.index_name == index)
+
+    def _build_postgres_search(self, query: SearchDocumentsQuery, terms: list[str]) -> Any:
+        ts_query = func.to_tsquery(
+            literal_column(f"'{SEARCH_TEXT_CONFIG}'"),
+            bindparam("ts_query", " & ".join(f"{term}:*" for term in terms)),
+        )
+        score = func.ts_rank(search_vector(), ts_query)
+        return (
+            select(SearchDocument, score.label("score"))
+            .where(SearchDocument.index_name == query.index, search_vector().op("@@")(ts_query))
+            .order_by(score.desc(), SearchDocument.id.asc())
+        )
+
+    def _build_sqlite_search(self, query: SearchDocumentsQuery, terms: list[str]) -> Any:
+        # bm25() is lower for better matches, so it is negated to match ts_rank's direction.
+        score = -literal_column(f"bm25({SEARCH_FTS_TABLE})")
+        return (
+            select(SearchDocument, score.label("score"))
+            .join(_FTS_TABLE, _FTS_TABLE.c.rowid == SearchDocument.id)
+            .where(
+                SearchDocument.index_name == query.index,
+                literal_column(SEARCH_FTS_TABLE).op("MATCH")(" ".join(f'"{term}"*' for term in terms)),
+            )
+            .order_by(score.desc(), SearchDocument.id.asc())
+        )
+
+    async def search(self, query: SearchDocumentsQuery) -> list[SearchHit]:
+        terms = search_terms(query.text)
+        if not terms:
+            return []
+
+        if self._dialect_name() == "postgresql":
+            statement = self._build_postgres_search(query, terms)
+        else:
+            statement = self._build_sqlite_search(query, terms)
+        result = await self.session.execute(statement.limit(query.limit))
+        return [
+            SearchHit(
+                index=document.index_name,
+                document_id=document.document_id,
+                score=float(score),
+                body=document.body,
+            )
+            for document, score in result.all()
+        ]
@@ -0,0 +1,91 @@
+import logging
+from collections.abc import AsyncIterable, Sequence
+from typing import Protocol
+
+from app.core.common.integration import (
+    DeleteSearchDocumentCommand,
+    SearchDocumentsQuery,
+    SearchDocumentUpsertCommand,
+    SearchHit,
+)
+from app.core.common.observability import log_layer_event
+from app.core.db.ports import UnitOfWorkPort
+
+logger = logging.getLogger("app.search")
+
+
+class SearchRepositoryPort(Protocol):
+    async def upsert_documents(self, commands: Sequence[SearchDocumentUpsertCommand]) -> int: ...
+
+    async def delete_documents(self, commands: Sequence[DeleteSearchDocumentCommand]) -> int: ...
+
+    async def clear_index(self, index: str) -> int: ...
+
+    async def search(self, query: SearchDocumentsQuery) -> list[SearchHit]: ...
+
+
+class SearchService:
+    def __init__(
+        self,
+        search_repository: SearchRepositoryPort,
+        unit_of_work: UnitOfWorkPort,
+    ):
+        self.search_repository = search_repository
+        self.unit_of_work = unit_of_work
+
+    async def upsert_document(self, command: SearchDocumentUpsertCommand) -> None:
+        await self.upsert_documents([command])
+
+    async def upsert_documents(self, commands: Sequence[SearchDocumentUpsertCommand]) -> int:
+        if not commands:
+            return 0
+
+        async with self.unit_of_work:
+            return await self.search_repository.upsert_documents(commands)
+
+    async def delete_document(self, command: DeleteSearchDocumentCommand) -> None:
+        await self.delete_documents([command])
+
+    async def delete_documents(self, commands: Sequence[DeleteSearchDocumentCommand]) -> int:
+        if not commands:
+            return 0
+
+        async with self.unit_of_work:
+            return await self.search_repository.delete_documents(commands)
+
+    async def apply_changes(
+        self,
+        *,
+        upserts: Sequence[SearchDocumentUpsertCommand],
+        deletes: Sequence[DeleteSearchDocumentCommand],
+    ) -> tuple[int, int]:
+        async with self.unit_of_work:
+            upserted_count = await self.search_repository.upsert_documents(upserts) if upserts else 0
+            deleted_count = await self.search_repository.delete_documents(deletes) if deletes else 0
+        return upserted_count, deleted_count
+
+    async def rebuild_index(
+        self,
+        index: str,
+        pages: AsyncIterable[Sequence[SearchDocumentUpsertCommand]],
+    ) -> int:
+        indexed_count = 0
+        async with self.unit_of_work:
+            # Readers keep seeing the previous index until the rebuild commits.
+            await self.search_repository.clear_index(index)
+            async for commands in pages:
+                indexed_count += await self.search_repository.upsert_documents(commands)
+        log_layer_event(logger, layer="integration", event="search_index_rebuilt", index=index, count=indexed_count)
+        return indexed_count
+
+    async def search(self, query: SearchDocumentsQuery) -> list[SearchHit]:
+        hits = await self.search_repository.search(query)
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="search_performed",
+            index=query.index,
+            hit_count=len(hits),
+            limit=query.limit,
+        )
+        return hits
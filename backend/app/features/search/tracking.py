@@ -0,0 +1,63 @@
+from typing import Any
+
+from sqlalchemy import event, func, insert, inspect, select
+from sqlalchemy.orm import Session, UOWTransaction
+
+from app.features.auth.models import User
+from app.features.outbox.models import OutboxEvent
+from app.features.outbox.repository import OUTBOX_NOTIFY_CHANNEL
+from app.features.rbac.models import Role
+
+# Searchable models, with the outbox aggregate type their changes are published under and the indexed fields.
+SEARCH_TRACKED_MODELS: dict[type[Any], tuple[str, tuple[str, ...]]] = {
+    User: ("user", ("username", "disabled")),
+    Role: ("role", ("name",)),
+}
+
+
+def _search_field_changed(instance: Any, fields: tuple[str, ...]) -> bool:
+    state = inspect(instance)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+def _outbox_row(instance: Any, *, deleted: bool) -> dict[str, Any] | None:
+    tracked = SEARCH_TRACKED_MODELS.get(type(instance))
+    if tracked is None:
+        return None
+    aggregate_type, fields = tracked
+    return {
+        "aggregate_type": aggregate_type,
+        "aggregate_id": str(instance.id),
+        "event_type": f"{aggregate_type}.{'deleted' if deleted else 'upserted'}",
+        "payload": {} if deleted else {field: getattr(instance, field) for field in fields},
+    }
+
+
+def _collect_search_changes(session: Session) -> list[dict[str, Any]]:
+    rows = [_outbox_row(instance, deleted=False) for instance in session.new]
+    rows += [
+        _outbox_row(instance, deleted=False)
+        for instance in session.dirty
+        if type(instance) in SEARCH_TRACKED_MODELS
+        and _search_field_changed(instance, SEARCH_TRACKED_MODELS[type(instance)][1])
+    ]
+    rows += [_outbox_row(instance, deleted=True) for instance in session.deleted]
+    return [row for row in rows if row is not None]
+
+
+def _record_search_changes(session: Session, flush_context: UOWTransaction) -> None:
+    # after_flush still sees the pre-flush new/dirty/deleted sets, now with generated ids.
+    rows = _collect_search_changes(session)
+    if not rows:
+        return
+
+    # The events join the flushing transaction, so the index only ever follows committed changes.
+    connection = session.connection()
+    connection.execute(insert(OutboxEvent.__table__), rows)
+    if connection.dialect.name == "postgresql":
+        connection.execute(select(func.pg_notify(OUTBOX_NOTIFY_CHANNEL, "")))
+
+
+def install_search_change_tracking() -> None:
+    if not event.contains(Session, "after_flush", _record_search_changes):
+        event.listen(Session, "after_flush", _record_search_changes)
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from app.core.common.integration import RecordAuditEntryCommand
+
+
+class AuditLogWriterPort(Protocol):
+    async def record(self, entry: RecordAuditEntryCommand) -> None: ...
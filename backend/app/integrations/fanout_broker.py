@@ -0,0 +1,15 @@
+from collections.abc import Sequence
+
+from app.core.common.integration import PublishMessageCommand
+from app.integrations.broker import MessageBrokerPort
+
+
+class FanOutMessageBroker:
+    def __init__(self, brokers: Sequence[MessageBrokerPort]) -> None:
+        self._brokers = tuple(brokers)
+
+    async def publish(self, message: PublishMessageCommand) -> None:
+        # A failure stops the fan-out and the relay retries the whole message, so every broker
+        # must tolerate receiving a message more than once.
+        for broker in self._brokers:
+            await broker.publish(message)
@@ -1,9 +1,18 @@
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Protocol
 
-from app.core.common.integration import StoredFileResult, StoreFileCommand
+from app.core.common.integration import StoredFileResult, StoreFileCommand, StoreFileStreamCommand
 
 
 class FileStoragePort(Protocol):
     async def store(self, command: StoreFileCommand) -> StoredFileResult: ...
 
+    async def store_stream(
+        self,
+        command: StoreFileStreamCommand,
+        chunks: AsyncIterable[bytes],
+    ) -> StoredFileResult: ...
+
+    def read_stream(self, *, bucket: str, path: str) -> AsyncIterator[bytes]: ...
+
     async def delete(self, *, bucket: str, path: str) -> bool: ...
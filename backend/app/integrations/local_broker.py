@@ -0,0 +1,202 @@
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+
+from app.core.common.integration import PublishMessageCommand
+from app.core.common.observability import log_layer_event
+
+logger = logging.getLogger("app.integrations.broker")
+
+ALL_TOPICS = "*"
+
+
+class OverflowPolicy(StrEnum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    FAIL = "fail"
+
+
+class BrokerOverflowError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class DeliveredMessage:
+    offset: int
+    message: PublishMessageCommand
+
+
+class BrokerSubscription:
+    def __init__(
+        self,
+        *,
+        topic: str,
+        max_queue_size: int,
+        batch_size: int,
+        overflow_policy: OverflowPolicy,
+    ) -> None:
+        self.topic = topic
+        self.batch_size = batch_size
+        self.overflow_policy = overflow_policy
+        self.delivered_count = 0
+        self.dropped_count = 0
+        self._queue: asyncio.Queue[DeliveredMessage] = asyncio.Queue(maxsize=max_queue_size)
+
+    def matches(self, topic: str) -> bool:
+        return self.topic in (ALL_TOPICS, topic)
+
+    @property
+    def pending_count(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def free_count(self) -> int:
+        return self._queue.maxsize - self._queue.qsize()
+
+    async def offer(self, delivered_message: DeliveredMessage) -> None:
+        if self.overflow_policy == OverflowPolicy.BLOCK:
+            await self._queue.put(delivered_message)
+            return
+
+        self.offer_nowait(delivered_message)
+
+    def offer_nowait(self, delivered_message: DeliveredMessage) -> None:
+        if self._queue.full():
+            if self.overflow_policy == OverflowPolicy.FAIL:
+                raise BrokerOverflowError(f"Subscription queue for topic {self.topic!r} is full")
+            self._queue.get_nowait()
+            self.dropped_count += 1
+        self._queue.put_nowait(delivered_message)
+
+    async def get_batch(self, *, timeout: float | None = None) -> list[DeliveredMessage]:
+        try:
+            batch = [await asyncio.wait_for(self._queue.get(), timeout=timeout)]
+        except TimeoutError:
+            return []
+
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        self.delivered_count += len(batch)
+        return batch
+
+
+class InProcessMessageBroker:
+    def __init__(self, *, log_path: Path | None = None, fsync: bool = False) -> None:
+        self._log_path = log_path
+        self._fsync = fsync
+        self._subscriptions: list[BrokerSubscription] = []
+        self._log_lock = asyncio.Lock()
+        self._next_offset = self._count_logged_messages()
+
+    def _count_logged_messages(self) -> int:
+        if self._log_path is None or not self._log_path.exists():
+            return 0
+        with self._log_path.open("rb") as log_file:
+            return sum(1 for _ in log_file)
+
+    def subscribe(
+        self,
+        topic: str = ALL_TOPICS,
+        *,
+        max_queue_size: int = 1_000,
+        batch_size: int = 100,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> BrokerSubscription:
+        subscription = BrokerSubscription(
+            topic=topic,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+            overflow_policy=overflow_policy,
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: BrokerSubscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    async def publish(self, message: PublishMessageCommand) -> None:
+        await self.publish_many([message])
+
+    async def publish_many(self, messages: list[PublishMessageCommand]) -> None:
+        if not messages:
+            return
+
+        delivered_messages = await self._append(messages)
+        for delivered_message in delivered_messages:
+            for subscription in self._subscriptions:
+                if subscription.overflow_policy == OverflowPolicy.BLOCK and subscription.matches(
+                    delivered_message.message.topic
+                ):
+                    # BLOCK waits for room here, so a slow subscriber pushes back on the publisher.
+                    await subscription.offer(delivered_message)
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="broker_messages_published",
+            message_count=len(delivered_messages),
+            last_offset=delivered_messages[-1].offset,
+        )
+
+    def _check_fail_capacity(self, messages: list[PublishMessageCommand]) -> None:
+        for subscription in self._subscriptions:
+            if subscription.overflow_policy != OverflowPolicy.FAIL:
+                continue
+            incoming_count = sum(1 for message in messages if subscription.matches(message.topic))
+            if incoming_count > subscription.free_count:
+                raise BrokerOverflowError(f"Subscription queue for topic {subscription.topic!r} is full")
+
+    async def _append(self, messages: list[PublishMessageCommand]) -> list[DeliveredMessage]:
+        async with self._log_lock:
+            # A rejected batch is neither logged nor delivered anywhere, so the caller can retry all of it.
+            self._check_fail_capacity(messages)
+            first_offset = self._next_offset
+            delivered_messages = [
+                DeliveredMessage(offset=first_offset + index, message=message) for index, message in enumerate(messages)
+            ]
+            if self._log_path is not None:
+                # The log is written before any subscriber sees the batch, so replay never misses a delivery.
+                await asyncio.to_thread(self._write_log, self._log_path, delivered_messages)
+            self._next_offset = first_offset + len(messages)
+            # Non-blocking subscriptions are filled under the lock, so no other publisher takes the room checked above.
+            for delivered_message in delivered_messages:
+                for subscription in self._subscriptions:
+                    if subscription.overflow_policy != OverflowPolicy.BLOCK and subscription.matches(
+                        delivered_message.message.topic
+                    ):
+                        subscription.offer_nowait(delivered_message)
+        return delivered_messages
+
+    def _write_log(self, log_path: Path, delivered_messages: list[DeliveredMessage]) -> None:
+        lines = "".join(
+            json.dumps(
+                {"offset": delivered.offset, **delivered.message.model_dump(mode="json")},
+                separators=(",", ":"),
+            )
+            + "\n"
+            for delivered in delivered_messages
+        )
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with log_path.open("a", encoding="utf-8") as log_file:
+            log_file.write(lines)
+            log_file.flush()
+            if self._fsync:
+                os.fsync(log_file.fileno())
+
+    def replay(self, *, from_offset: int = 0, topic: str = ALL_TOPICS) -> list[DeliveredMessage]:
+        if self._log_path is None or not self._log_path.exists():
+            return []
+
+        replayed: list[DeliveredMessage] = []
+        with self._log_path.open(encoding="utf-8") as log_file:
+            for line in log_file:
+                entry = json.loads(line)
+                offset = entry.pop("offset")
+                if offset < from_offset or topic not in (ALL_TOPICS, entry["topic"]):
+                    continue
+                replayed.append(DeliveredMessage(offset=offset, message=PublishMessageCommand.model_validate(entry)))
+        return replayed
@@ -0,0 +1,131 @@
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+from typing import BinaryIO
+
+from starlette.responses import FileResponse
+
+from app.core.common.integration import StoredFileResult, StoreFileCommand, StoreFileStreamCommand
+from app.core.common.observability import log_layer_event
+
+logger = logging.getLogger("app.integrations.files")
+
+DEFAULT_READ_CHUNK_SIZE = 64 * 1024
+
+
+class InvalidFilePathError(ValueError):
+    pass
+
+
+async def _single_chunk(body: bytes) -> AsyncIterator[bytes]:
+    yield body
+
+
+class LocalFileStorage:
+    def __init__(
+        self,
+        root: Path,
+        *,
+        fsync: bool = True,
+        read_chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+    ) -> None:
+        self._root = root.resolve()
+        self._fsync = fsync
+        self._read_chunk_size = read_chunk_size
+
+    def local_path(self, *, bucket: str, path: str) -> Path:
+        relative_path = Path(bucket, path)
+        if relative_path.is_absolute() or ".." in relative_path.parts or not bucket or not path:
+            raise InvalidFilePathError(f"Invalid file location {bucket!r}/{path!r}")
+        resolved_path = (self._root / relative_path).resolve()
+        # Symlinks inside the root must not lead outside of it either.
+        if not resolved_path.is_relative_to(self._root):
+            raise InvalidFilePathError(f"Invalid file location {bucket!r}/{path!r}")
+        return resolved_path
+
+    async def store(self, command: StoreFileCommand) -> StoredFileResult:
+        return await self.store_stream(
+            StoreFileStreamCommand(bucket=command.bucket, path=command.path, content_type=command.content_type),
+            _single_chunk(command.body),
+        )
+
+    def _open_temporary_file(self, target_path: Path) -> tuple[Path, BinaryIO]:
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        # The temporary file sits next to the target, so the final rename never crosses filesystems.
+        temporary_path = target_path.with_name(f".{target_path.name}.{uuid.uuid4().hex}.tmp")
+        return temporary_path, temporary_path.open("xb")
+
+    def _commit_file(self, temporary_file: BinaryIO, temporary_path: Path, target_path: Path) -> None:
+        temporary_file.flush()
+        if self._fsync:
+            os.fsync(temporary_file.fileno())
+        temporary_file.close()
+        os.replace(temporary_path, target_path)
+
+    def _discard_file(self, temporary_file: BinaryIO, temporary_path: Path) -> None:
+        temporary_file.close()
+        temporary_path.unlink(missing_ok=True)
+
+    async def store_stream(
+        self,
+        command: StoreFileStreamCommand,
+        chunks: AsyncIterable[bytes],
+    ) -> StoredFileResult:
+        target_path = self.local_path(bucket=command.bucket, path=command.path)
+        temporary_path, temporary_file = await asyncio.to_thread(self._open_temporary_file, target_path)
+        etag = hashlib.md5(usedforsecurity=False)
+        size = 0
+        try:
+            async for chunk in chunks:
+                # Only one chunk is held at a time, so memory stays flat regardless of the file size.
+                etag.update(chunk)
+                size += len(chunk)
+                await asyncio.to_thread(temporary_file.write, chunk)
+            await asyncio.to_thread(self._commit_file, temporary_file, temporary_path, target_path)
+        except BaseException:
+            await asyncio.to_thread(self._discard_file, temporary_file, temporary_path)
+            raise
+
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="file_stored",
+            bucket=command.bucket,
+            path=command.path,
+            size=size,
+        )
+        return StoredFileResult(bucket=command.bucket, path=command.path, etag=etag.hexdigest(), size=size)
+
+    async def read_stream(self, *, bucket: str, path: str) -> AsyncIterator[bytes]:
+        local_path = self.local_path(bucket=bucket, path=path)
+        stored_file = await asyncio.to_thread(local_path.open, "rb")
+        try:
+            while chunk := await asyncio.to_thread(stored_file.read, self._read_chunk_size):
+                yield chunk
+        finally:
+            stored_file.close()
+
+    def file_response(self, *, bucket: str, path: str, media_type: str | None = None) -> FileResponse:
+        local_path = self.local_path(bucket=bucket, path=path)
+        if not local_path.is_file():
+            raise FileNotFoundError(f"Stored file {bucket!r}/{path!r} does not exist")
+        # FileResponse hands the path to servers that support the ASGI pathsend extension (sendfile)
+        # and otherwise streams it in chunks, so the file is never loaded into memory.
+        return FileResponse(
+            local_path,
+            media_type=media_type or mimetypes.guess_type(local_path.name)[0] or "application/octet-stream",
+        )
+
+    async def delete(self, *, bucket: str, path: str) -> bool:
+        local_path = self.local_path(bucket=bucket, path=path)
+        try:
+            await asyncio.to_thread(local_path.unlink)
+        except FileNotFoundError:
+            return False
+        log_layer_event(logger, layer="integration", event="file_deleted", bucket=bucket, path=path)
+        return True
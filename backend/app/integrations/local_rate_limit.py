@@ -0,0 +1,51 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from time import monotonic
+from zlib import crc32
+
+from app.core.common.integration import RateLimitDecision, TakeRateLimitTokenCommand
+from app.integrations.rate_limit import refill_and_take
+
+
+class _BucketShard:
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        # key -> (tokens, refilled_at); ordered from least to most recently used.
+        self.buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self.lock = Lock()
+
+
+class InMemoryRateLimitStore:
+    def __init__(
+        self,
+        *,
+        shard_count: int = 16,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        max_keys_per_shard = max(1, -(-max_keys // shard_count))
+        self._shards = tuple(_BucketShard(max_keys_per_shard) for _ in range(shard_count))
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
+
+    def _shard(self, key: str) -> _BucketShard:
+        return self._shards[crc32(key.encode()) % len(self._shards)]
+
+    async def take(self, command: TakeRateLimitTokenCommand) -> RateLimitDecision:
+        shard = self._shard(command.key)
+        now = self._clock()
+        with shard.lock:
+            bucket = shard.buckets.get(command.key)
+            if bucket is None:
+                tokens, decision = refill_and_take(float(command.capacity), 0.0, command)
+            else:
+                tokens, decision = refill_and_take(bucket[0], now - bucket[1], command)
+            shard.buckets[command.key] = (tokens, now)
+            shard.buckets.move_to_end(command.key)
+            # Evicting an idle bucket only forgets spent tokens, so the key starts again from a full bucket.
+            while len(shard.buckets) > shard.max_keys:
+                shard.buckets.popitem(last=False)
+        return decision
@@ -0,0 +1,17 @@
+import logging
+
+from app.core.common.integration import PublishMessageCommand
+from app.core.common.observability import log_layer_event
+
+logger = logging.getLogger("app.integrations.broker")
+
+
+class LoggingMessageBroker:
+    async def publish(self, message: PublishMessageCommand) -> None:
+        log_layer_event(
+            logger,
+            layer="integration",
+            event="broker_message_published",
+            topic=message.topic,
+            key=message.key,
+        )
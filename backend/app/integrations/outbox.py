@@ -1,6 +1,8 @@
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Protocol
 
-from app.features.outbox.schemas import OutboxEventRecord
+from app.features.outbox.schemas import EnqueueOutboxEventCommand, OutboxEventRecord
 
 
 class OutboxPersistencePort(Protocol):
@@ -13,8 +15,19 @@ class OutboxPersistencePort(Protocol):
         payload: dict[str, object],
     ) -> OutboxEventRecord: ...
 
+    async def create_events(self, events: Sequence[EnqueueOutboxEventCommand]) -> list[OutboxEventRecord]: ...
+
+    async def notify_pending(self) -> None: ...
+
     async def list_pending(self, *, limit: int = 100) -> list[OutboxEventRecord]: ...
 
     async def get_event(self, event_id: int) -> OutboxEventRecord | None: ...
 
     async def mark_published(self, event: OutboxEventRecord) -> OutboxEventRecord: ...
+
+    async def mark_published_many(
+        self,
+        event_ids: Sequence[int],
+        *,
+        published_at: datetime | None = None,
+    ) -> int: ...
@@ -0,0 +1,21 @@
+from typing import Protocol
+
+from app.core.common.integration import RateLimitDecision, TakeRateLimitTokenCommand
+
+
+class RateLimitStorePort(Protocol):
+    async def take(self, command: TakeRateLimitTokenCommand) -> RateLimitDecision: ...
+
+
+def refill_and_take(
+    tokens: float,
+    elapsed_seconds: float,
+    command: TakeRateLimitTokenCommand,
+) -> tuple[float, RateLimitDecision]:
+    available = min(float(command.capacity), tokens + max(elapsed_seconds, 0.0) * command.refill_per_second)
+    if available >= 1.0:
+        return available - 1.0, RateLimitDecision(allowed=True)
+    return available, RateLimitDecision(
+        allowed=False,
+        retry_after_seconds=(1.0 - available) / command.refill_per_second,
+    )
@@ -1,9 +1,21 @@
+from collections.abc import Sequence
 from typing import Protocol
 
-from app.core.common.integration import DeleteSearchDocumentCommand, SearchDocumentUpsertCommand
+from app.core.common.integration import (
+    DeleteSearchDocumentCommand,
+    SearchDocumentsQuery,
+    SearchDocumentUpsertCommand,
+    SearchHit,
+)
 
 
 class SearchIndexPort(Protocol):
     async def upsert_document(self, command: SearchDocumentUpsertCommand) -> None: ...
 
+    async def upsert_documents(self, commands: Sequence[SearchDocumentUpsertCommand]) -> int: ...
+
     async def delete_document(self, command: DeleteSearchDocumentCommand) -> None: ...
+
+    async def delete_documents(self, commands: Sequence[DeleteSearchDocumentCommand]) -> int: ...
+
+    async def search(self, query: SearchDocumentsQuery) -> list[SearchHit]: ...
@@ -9,12 +9,32 @@ from argon2 import PasswordHasher
 from starlette.testclient import TestClient
 
 from app.core.authorization import PERMISSION_SPECS
+from app.core.authorization.snapshot_cache import reset_authorization_snapshot_cache
 from app.core.db.database import Base
-from app.core.setup.dependencies import get_db_session
+from app.core.security.runtime import security_runtime
+from app.core.setup.dependencies import (
+    get_db_session,
+    get_request_audit_log_writer,
+    get_request_login_rate_limiter,
+    get_request_password_rehasher,
+)
+from app.core.setup.rate_limit import LoginRateLimiter
 from app.features.audit_log.models import AuditLogEntry
+from app.features.audit_log.writer import AuditLogWriter
 from app.features.auth.models import User
+from app.features.auth.rehash import PasswordRehasher
+from app.features.jobs.models import Job
 from app.features.outbox.models import OutboxEvent
-from app.features.rbac.models import Permission, Role, RoleInheritance, RolePermission, UserRole
+from app.features.rbac.models import (
+    Permission,
+    Role,
+    RoleInheritance,
+    RolePermission,
+    UserEffectivePermission,
+    UserRole,
+)
+from app.features.search.models import SearchDocument
+from app.integrations.local_rate_limit import InMemoryRateLimitStore
 from app.main import app
 from utils.testing_support.database import MockDatabase
 from utils.testing_support.fixtures import load_mock_data
@@ -76,6 +96,11 @@ def mock_role_permissions() -> list[dict[str, Any]]:
     return [{"role_id": 1, "permission_id": permission_id} for permission_id, _ in PERMISSION_SPECS]
 
 
+@pytest.fixture(scope="module")
+def mock_user_effective_permissions() -> list[dict[str, Any]]:
+    return [{"user_id": 1, "permission_id": permission_id, "scope": "any"} for permission_id, _ in PERMISSION_SPECS]
+
+
 @pytest.fixture(scope="module")
 def mock_data(
     mock_users: list[dict[str, Any]],
@@ -83,6 +108,7 @@ def mock_data(
     mock_permissions: list[dict[str, Any]],
     mock_user_roles: list[dict[str, Any]],
     mock_role_permissions: list[dict[str, Any]],
+    mock_user_effective_permissions: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
     return [
         {"class": User, "json": mock_users},
@@ -91,8 +117,11 @@ def mock_data(
         {"class": UserRole, "json": mock_user_roles},
         {"class": RolePermission, "json": mock_role_permissions},
         {"class": RoleInheritance, "json": []},
+        {"class": UserEffectivePermission, "json": mock_user_effective_permissions},
         {"class": OutboxEvent, "json": []},
         {"class": AuditLogEntry, "json": []},
+        {"class": Job, "json": []},
+        {"class": SearchDocument, "json": []},
     ]
 
 
@@ -108,17 +137,52 @@ def mock_database(mock_data: list[dict[str, Any]]) -> Generator[MockDatabase]:
         asyncio.run(mock_db.close())
 
 
+@pytest.fixture
+def mock_audit_log_writer(mock_database: MockDatabase) -> AuditLogWriter:
+    return AuditLogWriter(session_factory=mock_database.Session, flush_interval_seconds=0.01)
+
+
+@pytest.fixture
+def mock_login_rate_limiter() -> LoginRateLimiter:
+    # Router tests log in many times from one client; rate limiting tests override this with tight limits.
+    return LoginRateLimiter(
+        InMemoryRateLimitStore(),
+        user_burst=1_000,
+        user_per_minute=1_000,
+        ip_burst=1_000,
+        ip_per_minute=1_000,
+    )
+
+
+@pytest.fixture
+def mock_password_rehasher(mock_database: MockDatabase) -> PasswordRehasher:
+    return PasswordRehasher(
+        session_factory=mock_database.Session,
+        password_service=security_runtime.get_password_service(),
+    )
+
+
 @pytest.fixture
 def mock_client(
     mock_database: MockDatabase,
+    mock_audit_log_writer: AuditLogWriter,
+    mock_login_rate_limiter: LoginRateLimiter,
+    mock_password_rehasher: PasswordRehasher,
 ) -> Generator[TestClient]:
     async def override_db_session() -> AsyncGenerator[Any]:
         async with mock_database.Session() as session:
             yield session
 
     app.dependency_overrides[get_db_session] = override_db_session
+    app.dependency_overrides[get_request_audit_log_writer] = lambda: mock_audit_log_writer
+    app.dependency_overrides[get_request_login_rate_limiter] = lambda: mock_login_rate_limiter
+    app.dependency_overrides[get_request_password_rehasher] = lambda: mock_password_rehasher
+    reset_authorization_snapshot_cache()
     try:
         with TestClient(app) as client:
+            client.portal.call(mock_audit_log_writer.start)
             yield client
+            client.portal.call(mock_audit_log_writer.stop)
     finally:
         app.dependency_overrides.clear()
+        reset_authorization_snapshot_cache()
@@ -101,3 +101,23 @@ def test_resolve_effective_role_permissions_without_role_filter_uses_all_referen
         1: {"roles:manage": "tenant"},
         2: {"roles:manage": "tenant"},
     }
+
+
+def test_resolve_effective_role_permissions_merges_permissions_outside_catalog() -> None:
+    direct_permissions = [
+        RolePermission(role_id=1, permission_id="reports:export", scope="own"),
+        RolePermission(role_id=2, permission_id="reports:export", scope="any"),
+        RolePermission(role_id=2, permission_id="users:manage", scope="tenant"),
+    ]
+    inheritances = [RoleInheritance(role_id=1, parent_role_id=2)]
+
+    effective_permissions = resolve_effective_role_permissions(
+        role_permissions=direct_permissions,
+        role_inheritances=inheritances,
+        role_ids=(1,),
+    )
+
+    assert [(permission.permission_id, permission.scope) for permission in effective_permissions] == [
+        ("reports:export", "any"),
+        ("users:manage", "tenant"),
+    ]
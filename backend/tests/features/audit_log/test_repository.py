@@ -2,8 +2,10 @@ import asyncio
 from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
+from app.core.common.integration import RecordAuditEntryCommand
 from app.features.audit_log.models import AuditLogEntry
 from app.features.audit_log.repository import AuditLogRepository
+from app.features.audit_log.schemas.app import AuditLogEntryFilters
 from utils.testing_support.repositories import build_session_mock
 
 
@@ -13,7 +15,7 @@ def _scalar_result(rows: list[object]) -> MagicMock:
     return result
 
 
-def test_audit_log_repository_lists_recent_entries_by_newest_first() -> None:
+def test_audit_log_repository_lists_entries_by_newest_first() -> None:
     session = build_session_mock()
     repository = AuditLogRepository(session=session)
     session.execute.return_value = _scalar_result(
@@ -42,7 +44,7 @@ def test_audit_log_repository_lists_recent_entries_by_newest_first() -> None:
     )
 
     async def run_test() -> None:
-        entries = await repository.list_recent_entries(limit=50)
+        entries = await repository.list_entries(filters=AuditLogEntryFilters(), limit=50)
 
         assert [entry.id for entry in entries] == [2, 1]
         assert entries[0].action == "user.updated"
@@ -50,5 +52,67 @@ def test_audit_log_repository_lists_recent_entries_by_newest_first() -> None:
         query = session.execute.await_args.args[0]
         assert "ORDER BY audit_log_entries.created_at DESC, audit_log_entries.id DESC" in str(query)
         assert "LIMIT" in str(query)
+        assert "WHERE" not in str(query)
+
+    asyncio.run(run_test())
+
+
+def test_audit_log_repository_applies_filters_and_before_keyset() -> None:
+    session = build_session_mock()
+    repository = AuditLogRepository(session=session)
+    session.execute.return_value = _scalar_result([])
+    filters = AuditLogEntryFilters(
+        actor_user_id=1,
+        action="user.updated",
+        resource_type="user",
+        created_from=datetime(2026, 5, 1, tzinfo=UTC),
+        created_to=datetime(2026, 5, 2, tzinfo=UTC),
+    )
+
+    async def run_test() -> None:
+        entries = await repository.list_entries(
+            filters=filters,
+            limit=11,
+            before=(datetime(2026, 5, 1, 12, 5, tzinfo=UTC), 2),
+        )
+
+        assert entries == []
+        query = str(session.execute.await_args.args[0])
+        assert "audit_log_entries.actor_user_id = :actor_user_id_1" in query
+        assert "audit_log_entries.action = :action_1" in query
+        assert "audit_log_entries.resource_type = :resource_type_1" in query
+        assert "audit_log_entries.created_at >= :created_at_1" in query
+        assert "audit_log_entries.created_at < :created_at_2" in query
+        assert "(audit_log_entries.created_at, audit_log_entries.id) < (:param_1, :param_2)" in query
+
+    asyncio.run(run_test())
+
+
+def test_audit_log_repository_inserts_entries_in_one_multi_row_statement() -> None:
+    session = build_session_mock()
+    repository = AuditLogRepository(session=session)
+    occurred_at = datetime(2026, 5, 1, 12, 0, tzinfo=UTC)
+    entries = [
+        RecordAuditEntryCommand(
+            actor_user_id=1,
+            action="role.created",
+            resource_type="role",
+            resource_id=str(role_id),
+            summary=f"Created role role_{role_id}",
+            occurred_at=occurred_at,
+        )
+        for role_id in (4, 5)
+    ]
+
+    async def run_test() -> None:
+        assert await repository.insert_entries([]) == 0
+        session.execute.assert_not_awaited()
+
+        assert await repository.insert_entries(entries) == 2
+        session.execute.assert_awaited_once()
+        statement = session.execute.await_args.args[0]
+        assert str(statement).startswith("INSERT INTO audit_log_entries")
+        assert statement.compile().params["created_at_m1"] == occurred_at
+        assert statement.compile().params["resource_id_m1"] == "5"
 
     asyncio.run(run_test())
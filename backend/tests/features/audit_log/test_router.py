@@ -75,3 +75,88 @@ def test_audit_log_requires_read_permission(mock_client: TestClient) -> None:
         code="forbidden",
         meta={"permission_id": PermissionId.AUDIT_LOG_READ},
     )
+
+
+async def _seed_probe_audit_log_entries(mock_database: MockDatabase, *, prefix: str) -> None:
+    # The module-scoped database is shared, so each test seeds its own resource types.
+    async with mock_database.Session() as session, session.begin():
+        session.add_all(
+            [
+                AuditLogEntry(
+                    actor_user_id=1 if minute % 2 == 0 else 3,
+                    action=f"{prefix}.updated" if minute % 3 else f"{prefix}.created",
+                    resource_type=f"{prefix}_user" if minute % 3 else f"{prefix}_role",
+                    resource_id=str(minute),
+                    summary=f"Entry {minute}",
+                    created_at=datetime(2026, 6, 1, 12, minute, tzinfo=UTC),
+                    updated_at=datetime(2026, 6, 1, 12, minute, tzinfo=UTC),
+                )
+                for minute in range(7)
+            ]
+        )
+
+
+def test_audit_log_pages_backwards_with_before_cursor(mock_client: TestClient, mock_database: MockDatabase) -> None:
+    asyncio.run(_seed_probe_audit_log_entries(mock_database, prefix="paging"))
+    headers = _admin_headers(mock_client)
+
+    resource_ids: list[str] = []
+    params: dict[str, str | int] = {"limit": 2, "action": "paging.updated"}
+    while True:
+        response = mock_client.get("/v1/audit-log", params=params, headers=headers)
+        assert response.status_code == HTTPStatus.OK
+        resource_ids.extend(entry["resource_id"] for entry in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params = {**params, "before": next_cursor}
+
+    assert resource_ids == ["5", "4", "2", "1"]
+
+
+def test_audit_log_filters_by_actor_action_resource_and_time_range(
+    mock_client: TestClient,
+    mock_database: MockDatabase,
+) -> None:
+    asyncio.run(_seed_probe_audit_log_entries(mock_database, prefix="filter"))
+    headers = _admin_headers(mock_client)
+
+    actor_response = mock_client.get(
+        "/v1/audit-log",
+        params={"actor_user_id": 3, "resource_type": "filter_user"},
+        headers=headers,
+    )
+    action_response = mock_client.get(
+        "/v1/audit-log",
+        params={"action": "filter.created", "resource_type": "filter_role"},
+        headers=headers,
+    )
+    range_response = mock_client.get(
+        "/v1/audit-log",
+        params={
+            "resource_type": "filter_user",
+            "created_from": "2026-06-01T12:02:00Z",
+            "created_to": "2026-06-01T12:05:00Z",
+        },
+        headers=headers,
+    )
+
+    assert [entry["resource_id"] for entry in actor_response.json()] == ["5", "1"]
+    assert [entry["resource_id"] for entry in action_response.json()] == ["6", "3", "0"]
+    assert [entry["resource_id"] for entry in range_response.json()] == ["4", "2"]
+
+
+def test_audit_log_rejects_invalid_before_cursor(mock_client: TestClient) -> None:
+    response = mock_client.get(
+        "/v1/audit-log",
+        params={"before": "not-a-cursor"},
+        headers=_admin_headers(mock_client),
+    )
+
+    assert_error_response(
+        response,
+        detail="Invalid pagination cursor",
+        status_code=HTTPStatus.BAD_REQUEST,
+        code="invalid_input",
+        meta={"before": "not-a-cursor"},
+    )
@@ -1,18 +1,107 @@
 import asyncio
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
-from app.features.audit_log.service import DEFAULT_AUDIT_LOG_LIMIT, AuditLogService
+import pytest
 
+from app.core.common.pagination import encode_cursor
+from app.core.errors.services import InvalidInputError
+from app.features.audit_log.schemas.app import AuditLogEntryFilters, AuditLogEntryResult
+from app.features.audit_log.service import DEFAULT_AUDIT_LOG_LIMIT, MAX_AUDIT_LOG_LIMIT, AuditLogService
 
-def test_audit_log_service_lists_recent_entries_with_default_limit() -> None:
+
+def _entry(entry_id: int, minute: int) -> AuditLogEntryResult:
+    return AuditLogEntryResult(
+        id=entry_id,
+        actor_user_id=1,
+        action="user.updated",
+        resource_type="user",
+        resource_id="3",
+        summary="Updated user reader_user",
+        created_at=datetime(2026, 5, 1, 12, minute, tzinfo=UTC),
+    )
+
+
+def _build_service(entries: list[AuditLogEntryResult] | None = None) -> tuple[AuditLogService, MagicMock]:
     repository = MagicMock()
-    repository.list_recent_entries = AsyncMock(return_value=[])
-    service = AuditLogService(audit_log_repository=repository)
+    repository.list_entries = AsyncMock(return_value=entries or [])
+    return AuditLogService(audit_log_repository=repository), repository
+
+
+def test_audit_log_service_lists_entries_with_default_limit() -> None:
+    service, repository = _build_service()
+
+    async def run_test() -> None:
+        page = await service.list_entries()
+
+        assert page.items == []
+        assert page.next_cursor is None
+        repository.list_entries.assert_awaited_once_with(
+            filters=AuditLogEntryFilters(),
+            limit=DEFAULT_AUDIT_LOG_LIMIT + 1,
+            before=None,
+        )
+
+    asyncio.run(run_test())
+
+
+def test_audit_log_service_returns_before_cursor_when_more_entries_exist() -> None:
+    service, repository = _build_service([_entry(3, 10), _entry(2, 5), _entry(1, 0)])
+    filters = AuditLogEntryFilters(action="user.updated")
+
+    async def run_test() -> None:
+        page = await service.list_entries(filters, limit=2)
+
+        assert [entry.id for entry in page.items] == [3, 2]
+        assert page.next_cursor == encode_cursor(("2026-05-01T12:05:00+00:00", 2))
+        repository.list_entries.assert_awaited_once_with(filters=filters, limit=3, before=None)
+
+        await service.list_entries(filters, limit=MAX_AUDIT_LOG_LIMIT + 50, before=page.next_cursor)
+
+        assert repository.list_entries.await_args.kwargs == {
+            "filters": filters,
+            "limit": MAX_AUDIT_LOG_LIMIT + 1,
+            "before": (datetime(2026, 5, 1, 12, 5, tzinfo=UTC), 2),
+        }
+
+    asyncio.run(run_test())
+
+
+@pytest.mark.parametrize(
+    "before",
+    [
+        "not-a-cursor",
+        encode_cursor((2,)),
+        encode_cursor(("2026-05-01T12:05:00", "2")),
+        encode_cursor(("yesterday", 2)),
+    ],
+)
+def test_audit_log_service_rejects_invalid_before_cursor(before: str) -> None:
+    service, repository = _build_service()
+
+    async def run_test() -> None:
+        with pytest.raises(InvalidInputError, match="Invalid pagination cursor") as exc_info:
+            await service.list_entries(before=before)
+
+        assert exc_info.value.details == {"before": before}
+        repository.list_entries.assert_not_awaited()
+
+    asyncio.run(run_test())
+
+
+def test_audit_log_service_rejects_invalid_limit_and_time_range() -> None:
+    service, repository = _build_service()
+    reversed_range = AuditLogEntryFilters(
+        created_from=datetime(2026, 5, 2, tzinfo=UTC),
+        created_to=datetime(2026, 5, 1, tzinfo=UTC),
+    )
 
     async def run_test() -> None:
-        entries = await service.list_recent_entries()
+        with pytest.raises(InvalidInputError, match="limit must be greater than or equal to 1"):
+            await service.list_entries(limit=0)
+        with pytest.raises(InvalidInputError, match="created_from must be earlier than created_to"):
+            await service.list_entries(reversed_range)
 
-        assert entries == []
-        repository.list_recent_entries.assert_awaited_once_with(limit=DEFAULT_AUDIT_LOG_LIMIT)
+        repository.list_entries.assert_not_awaited()
 
     asyncio.run(run_test())
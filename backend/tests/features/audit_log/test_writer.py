@@ -0,0 +1,221 @@
+import asyncio
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from app.core.common.integration import RecordAuditEntryCommand
+from app.core.config.settings import AuditLogSettings
+from app.features.audit_log.models import AuditLogEntry
+from app.features.audit_log.writer import AuditLogWriter, AuditLogWriterRuntime
+from utils.testing_support.database import MockDatabase
+
+
+def _entry(action: str, resource_id: str = "1") -> RecordAuditEntryCommand:
+    return RecordAuditEntryCommand(
+        actor_user_id=1,
+        action=action,
+        resource_type="writer_probe",
+        resource_id=resource_id,
+        summary=f"Probe {action}",
+    )
+
+
+async def _list_actions(mock_database: MockDatabase, *, prefix: str) -> list[str]:
+    async with mock_database.Session() as session:
+        result = await session.execute(
+            select(AuditLogEntry.action)
+            .where(AuditLogEntry.action.startswith(prefix))
+            .order_by(AuditLogEntry.created_at, AuditLogEntry.id)
+        )
+        return list(result.scalars().all())
+
+
+def _track_batches(writer: AuditLogWriter) -> list[list[str]]:
+    batches: list[list[str]] = []
+    write_batch = writer._write_batch  # pyright: ignore[reportPrivateUsage]
+
+    async def tracked_write_batch(entries: list[RecordAuditEntryCommand]) -> int:
+        batches.append([entry.action for entry in entries])
+        return await write_batch(entries)
+
+    writer._write_batch = tracked_write_batch  # type: ignore[method-assign]
+    return batches
+
+
+def test_audit_log_writer_flushes_queued_entries_in_batches(mock_database: MockDatabase) -> None:
+    writer = AuditLogWriter(session_factory=mock_database.Session, batch_size=2, flush_interval_seconds=0.01)
+    batches = _track_batches(writer)
+
+    async def run_test() -> None:
+        await writer.start()
+        await writer.start()
+        assert writer.running
+
+        for index in range(3):
+            await writer.record(_entry(f"batched.{index}"))
+        await writer.flush()
+
+        assert batches == [["batched.0", "batched.1"], ["batched.2"]]
+        assert await _list_actions(mock_database, prefix="batched.") == ["batched.0", "batched.1", "batched.2"]
+
+        await writer.stop()
+        await writer.stop()
+        assert not writer.running
+
+    asyncio.run(run_test())
+
+
+def test_audit_log_writer_writes_directly_when_not_running(mock_database: MockDatabase) -> None:
+    writer = AuditLogWriter(session_factory=mock_database.Session)
+    batches = _track_batches(writer)
+
+    async def run_test() -> None:
+        await writer.record(_entry("direct.created"))
+        await writer.flush()
+
+        assert batches == [["direct.created"]]
+        assert await _list_actions(mock_database, prefix="direct.") == ["direct.created"]
+
+    asyncio.run(run_test())
+
+
+def test_audit_log_writer_falls_back_to_direct_write_when_queue_is_full(mock_database: MockDatabase) -> None:
+    writer = AuditLogWriter(
+        session_factory=mock_database.Session,
+        max_queue_size=1,
+        batch_size=1,
+        enqueue_timeout_seconds=0.01,
+    )
+    batches: list[list[str]] = []
+
+    async def run_test() -> None:
+        release_worker = asyncio.Event()
+
+        async def blocking_write_batch(entries: list[RecordAuditEntryCommand]) -> int:
+            batches.append([entry.action for entry in entries])
+            if entries[0].action == "overflow.blocked":
+                await release_worker.wait()
+            return len(entries)
+
+        writer._write_batch = blocking_write_batch  # type: ignore[method-assign]
+        await writer.start()
+        await writer.record(_entry("overflow.blocked"))
+        await asyncio.sleep(0.01)
+        await writer.record(_entry("overflow.queued"))
+        await writer.record(_entry("overflow.fallback"))
+
+        assert batches == [["overflow.blocked"], ["overflow.fallback"]]
+
+        release_worker.set()
+        await writer.stop()
+        assert batches[-1] == ["overflow.queued"]
+
+    asyncio.run(run_test())
+
+
+def test_audit_log_writer_retries_failed_writes_before_succeeding(mock_database: MockDatabase) -> None:
+    writer = AuditLogWriter(session_factory=mock_database.Session, retry_backoff_seconds=0)
+    write_batch = writer._write_batch  # pyright: ignore[reportPrivateUsage]
+    attempts: list[str] = []
+
+    async def flaky_write_batch(entries: list[RecordAuditEntryCommand]) -> int:
+        attempts.append(entries[0].action)
+        if len(attempts) < 3:
+            raise RuntimeError("database unavailable")
+        return await write_batch(entries)
+
+    writer._write_batch = flaky_write_batch  # type: ignore[method-assign]
+
+    async def run_test() -> None:
+        await writer.start()
+        await writer.record(_entry("retried.created"))
+        await writer.flush()
+        await writer.stop()
+
+        assert attempts == ["retried.created"] * 3
+        assert await _list_actions(mock_database, prefix="retried.") == ["retried.created"]
+
+    asyncio.run(run_test())
+
+
+def test_audit_log_writer_logs_dropped_entries_after_last_attempt(
+    mock_database: MockDatabase,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    writer = AuditLogWriter(session_factory=mock_database.Session, max_write_attempts=3, retry_backoff_seconds=0)
+    attempts: list[str] = []
+
+    async def failing_write_batch(entries: list[RecordAuditEntryCommand]) -> int:
+        attempts.append(entries[0].action)
+        raise RuntimeError("database unavailable")
+
+    writer._write_batch = failing_write_batch  # type: ignore[method-assign]
+
+    with caplog.at_level(logging.ERROR, logger="app.audit_log"):
+        asyncio.run(writer.record(_entry("failed.created")))
+
+    assert attempts == ["failed.created"] * 3
+    assert "event=audit_log_write_failed" in caplog.text
+    assert "attempt=3" in caplog.text
+    assert "event=audit_log_entries_dropped" in caplog.text
+    assert "reason=writer_not_running" in caplog.text
+    assert "actions=failed.created" in caplog.text
+
+
+def test_audit_log_writer_stops_retrying_once_shutdown_starts(
+    mock_database: MockDatabase,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    writer = AuditLogWriter(session_factory=mock_database.Session, retry_backoff_seconds=60)
+    attempts: list[str] = []
+
+    async def run_test() -> None:
+        write_started = asyncio.Event()
+        release_write = asyncio.Event()
+
+        async def failing_write_batch(entries: list[RecordAuditEntryCommand]) -> int:
+            attempts.append(entries[0].action)
+            write_started.set()
+            await release_write.wait()
+            raise RuntimeError("database unavailable")
+
+        writer._write_batch = failing_write_batch  # type: ignore[method-assign]
+        await writer.start()
+        await writer.record(_entry("shutdown.created"))
+        await write_started.wait()
+
+        stopping = asyncio.create_task(writer.stop())
+        await asyncio.sleep(0)
+        release_write.set()
+        await asyncio.wait_for(stopping, timeout=1)
+
+    with caplog.at_level(logging.ERROR, logger="app.audit_log"):
+        asyncio.run(run_test())
+
+    assert attempts == ["shutdown.created"]
+    assert "event=audit_log_entries_dropped" in caplog.text
+
+
+def test_audit_log_writer_runtime_builds_writer_once_from_settings() -> None:
+    runtime = AuditLogWriterRuntime(
+        settings_loader=lambda: AuditLogSettings(AUDIT_LOG_QUEUE_MAX_SIZE=5, AUDIT_LOG_BATCH_SIZE=2),
+    )
+
+    writer = runtime.get_writer()
+
+    assert runtime.get_writer() is writer
+    assert writer._max_queue_size == 5  # pyright: ignore[reportPrivateUsage]
+    assert writer._batch_size == 2  # pyright: ignore[reportPrivateUsage]
+
+    runtime.reset()
+    assert runtime.get_writer() is not writer
+
+
+def test_audit_log_writer_runtime_opens_sessions_from_database_runtime() -> None:
+    session = MagicMock()
+    writer = AuditLogWriterRuntime(settings_loader=AuditLogSettings).get_writer()
+
+    with patch("app.features.audit_log.writer.get_async_session_factory", return_value=lambda: session):
+        assert writer._session_factory() is session  # pyright: ignore[reportPrivateUsage]
@@ -0,0 +1,74 @@
+import asyncio
+
+from argon2 import PasswordHasher
+from sqlalchemy import select, update
+
+from app.core.security.service import Argon2PasswordService
+from app.features.auth.models import User
+from app.features.auth.rehash import PasswordRehasher
+from utils.testing_support.database import MockDatabase
+
+_LOW_COST_HASHER = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+
+
+async def _set_password_hash(mock_database: MockDatabase, user_id: int, hashed_password: str) -> None:
+    async with mock_database.Session() as session:
+        await session.execute(update(User).where(User.id == user_id).values(hashed_password=hashed_password))
+        await session.commit()
+
+
+async def _get_password_hash(mock_database: MockDatabase, user_id: int) -> str:
+    async with mock_database.Session() as session:
+        hashed_password = await session.scalar(select(User.hashed_password).where(User.id == user_id))
+    assert hashed_password is not None
+    return hashed_password
+
+
+def test_rehasher_replaces_outdated_hash_in_background(mock_database: MockDatabase) -> None:
+    password_service = Argon2PasswordService()
+    rehasher = PasswordRehasher(session_factory=mock_database.Session, password_service=password_service)
+    outdated_hash = _LOW_COST_HASHER.hash("reader123")
+
+    async def run_test() -> None:
+        await _set_password_hash(mock_database, 3, outdated_hash)
+
+        assert rehasher.schedule(user_id=3, plain_password="reader123", current_hash=outdated_hash) is True
+        await rehasher.drain()
+
+        new_hash = await _get_password_hash(mock_database, 3)
+        assert new_hash != outdated_hash
+        assert password_service.needs_rehash(new_hash) is False
+        assert await password_service.verify_password("reader123", new_hash) is True
+        assert rehasher.pending == 0
+
+    asyncio.run(run_test())
+
+
+def test_rehasher_keeps_hash_changed_since_login(mock_database: MockDatabase) -> None:
+    rehasher = PasswordRehasher(session_factory=mock_database.Session, password_service=Argon2PasswordService())
+    stale_hash = _LOW_COST_HASHER.hash("reader123")
+    changed_hash = _LOW_COST_HASHER.hash("Changed123")
+
+    async def run_test() -> None:
+        await _set_password_hash(mock_database, 3, changed_hash)
+
+        rehasher.schedule(user_id=3, plain_password="reader123", current_hash=stale_hash)
+        await rehasher.drain()
+
+        assert await _get_password_hash(mock_database, 3) == changed_hash
+
+    asyncio.run(run_test())
+
+
+def test_rehasher_skips_scheduling_beyond_max_pending(mock_database: MockDatabase) -> None:
+    rehasher = PasswordRehasher(
+        session_factory=mock_database.Session,
+        password_service=Argon2PasswordService(),
+        max_pending=0,
+    )
+
+    async def run_test() -> None:
+        assert rehasher.schedule(user_id=3, plain_password="reader123", current_hash="unused") is False
+        assert rehasher.pending == 0
+
+    asyncio.run(run_test())
@@ -0,0 +1,75 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import update
+
+from app.features.auth.models import User
+from app.features.auth.token_watermarks import TokenWatermarkTable
+from utils.testing_support.database import MockDatabase
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime.now(UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def _touch_user(mock_database: MockDatabase, user_id: int, *, updated_at: datetime, **changes: object) -> None:
+    async with mock_database.Session() as session:
+        await session.execute(update(User).where(User.id == user_id).values(updated_at=updated_at, **changes))
+        await session.commit()
+
+
+def test_refresh_loads_users_changed_within_token_lifetime(mock_database: MockDatabase) -> None:
+    clock = _Clock()
+    table = TokenWatermarkTable(session_factory=mock_database.Session, retention_seconds=1_800, clock=clock)
+
+    async def run_test() -> None:
+        await _touch_user(mock_database, 1, updated_at=clock.now - timedelta(hours=2))
+        await _touch_user(mock_database, 2, updated_at=clock.now - timedelta(hours=2))
+        await _touch_user(mock_database, 3, updated_at=clock.now - timedelta(minutes=5), rbac_version=4)
+
+        assert table.is_fresh() is False
+        assert await table.refresh() == 1
+
+        watermark = table.get(3)
+        assert watermark is not None
+        assert (watermark.username, watermark.rbac_version, watermark.disabled) == ("reader_user", "4", False)
+        assert table.get(1) is None
+        assert table.is_fresh() is True
+
+    asyncio.run(run_test())
+
+
+def test_refresh_picks_up_new_changes_and_prunes_expired_entries(mock_database: MockDatabase) -> None:
+    clock = _Clock()
+    table = TokenWatermarkTable(
+        session_factory=mock_database.Session,
+        retention_seconds=1_800,
+        refresh_interval_seconds=5,
+        clock=clock,
+    )
+
+    async def run_test() -> None:
+        await _touch_user(mock_database, 1, updated_at=clock.now - timedelta(hours=2))
+        await _touch_user(mock_database, 2, updated_at=clock.now - timedelta(hours=2))
+        await _touch_user(mock_database, 3, updated_at=clock.now - timedelta(minutes=25))
+        await table.refresh()
+        assert len(table) == 1
+
+        clock.now += timedelta(minutes=10)
+        await _touch_user(mock_database, 1, updated_at=clock.now - timedelta(seconds=1), disabled=True)
+        await table.refresh()
+
+        # User 3 changed more than a token lifetime ago, so no unexpired token predates that change.
+        assert table.get(3) is None
+        admin_watermark = table.get(1)
+        assert admin_watermark is not None
+        assert admin_watermark.disabled is True
+
+        clock.now += timedelta(seconds=16)
+        assert table.is_fresh() is False
+
+    asyncio.run(run_test())
@@ -1,10 +1,10 @@
 import asyncio
-import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.exc import IntegrityError
 
+from app.core.authorization import decode_permission_scopes
 from app.core.errors.repositories import RepositoryConflictError, RepositoryInternalError
 from app.features.auth.models import User
 from app.features.auth.repository import AuthRepository
@@ -29,24 +29,46 @@ def test_auth_repository_user_has_permission_delegates_to_scope_lookup() -> None
     asyncio.run(run_test())
 
 
-def test_auth_repository_get_rbac_version_returns_stable_digest_for_effective_permissions() -> None:
+def test_auth_repository_get_rbac_version_reads_persisted_user_version() -> None:
+    session = build_session_mock()
+    repository = AuthRepository(session=session)
+    result = MagicMock()
+    result.scalar_one_or_none.side_effect = [4, None]
+    session.execute.return_value = result
+
+    async def run_test() -> None:
+        assert await repository.get_rbac_version(user_id=7) == "4"
+        assert await repository.get_rbac_version(user_id=8) == "0"
+        query = session.execute.await_args_list[0].args[0]
+        assert "users.rbac_version" in str(query)
+        assert "users.id = " in str(query)
+
+    asyncio.run(run_test())
+
+
+def test_auth_repository_get_user_permission_bitset_packs_valid_scopes() -> None:
     session = build_session_mock()
     repository = AuthRepository(session=session)
     result = MagicMock()
     result.all.return_value = [
-        ("role_permissions:manage", "own"),
-        ("role_permissions:manage", "any"),
         ("roles:manage", "tenant"),
-        ("ignored", "invalid"),
+        ("users:manage", "any"),
+        ("user_roles:manage", "regional"),
     ]
     session.execute.return_value = result
 
     async def run_test() -> None:
-        rbac_version = await repository.get_rbac_version(user_id=7)
-
-        expected = hashlib.sha256(b"role_permissions:manage:any|roles:manage:tenant").hexdigest()
-        assert rbac_version == expected
-        session.execute.assert_awaited_once()
+        permission_bitset = await repository.get_user_permission_bitset(user_id=7)
+
+        assert decode_permission_scopes(permission_bitset) == {
+            "audit_logs:read": None,
+            "roles:manage": "tenant",
+            "role_permissions:manage": None,
+            "user_roles:manage": None,
+            "users:manage": "any",
+        }
+        query = session.execute.await_args_list[0].args[0]
+        assert "user_effective_permissions.user_id = " in str(query)
 
     asyncio.run(run_test())
 
@@ -78,6 +100,48 @@ def test_auth_repository_get_user_effective_permission_ids_returns_sorted_unique
     asyncio.run(run_test())
 
 
+def test_auth_repository_get_user_permission_scope_reads_closure_row() -> None:
+    session = build_session_mock()
+    repository = AuthRepository(session=session)
+    result = MagicMock()
+    result.scalar_one_or_none.side_effect = ["tenant", None, "regional"]
+    session.execute.return_value = result
+
+    async def run_test() -> None:
+        assert await repository.get_user_permission_scope(user_id=7, permission_id="roles:manage") == "tenant"
+        assert await repository.get_user_permission_scope(user_id=7, permission_id="users:manage") is None
+        assert await repository.get_user_permission_scope(user_id=7, permission_id="audit_logs:read") is None
+        query = str(session.execute.await_args_list[0].args[0])
+        assert "FROM user_effective_permissions" in query
+        assert "role_inheritances" not in query
+
+    asyncio.run(run_test())
+
+
+def test_auth_repository_get_user_permission_scopes_reads_all_rows_in_one_query() -> None:
+    session = build_session_mock()
+    repository = AuthRepository(session=session)
+    result = MagicMock()
+    result.all.return_value = [("roles:manage", "tenant"), ("audit_logs:read", "regional")]
+    session.execute.return_value = result
+
+    async def run_test() -> None:
+        granted_scopes = await repository.get_user_permission_scopes(
+            user_id=7,
+            permission_ids=("roles:manage", "users:manage", "audit_logs:read"),
+        )
+
+        assert granted_scopes == {"roles:manage": "tenant", "users:manage": None, "audit_logs:read": None}
+        session.execute.assert_awaited_once()
+        query = str(session.execute.await_args_list[0].args[0])
+        assert "FROM user_effective_permissions" in query
+        assert "IN" in query
+        assert await repository.get_user_permission_scopes(user_id=7, permission_ids=()) == {}
+        session.execute.assert_awaited_once()
+
+    asyncio.run(run_test())
+
+
 def test_auth_repository_create_user_translates_integrity_error_to_repository_conflict() -> None:
     session = build_session_mock()
     session.flush.side_effect = IntegrityError("insert", {}, Exception("duplicate"))
@@ -2,9 +2,12 @@ import asyncio
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
+from app.core.common.pagination import PageRequest, encode_cursor
 from app.core.common.records import RoleRecord
 from app.core.db.repository_base import BaseRepository
+from app.core.errors.domain import DomainErrorType
 from app.core.errors.repositories import RepositoryError
 from app.features.rbac.models import Role
 from utils.testing_support.repositories import build_session_mock
@@ -25,6 +28,30 @@ def test_get_column_raises_when_column_is_missing() -> None:
     assert "Column 'missing' does not exist on 'Role'" in str(exc_info.value)
 
 
+def test_lock_for_claim_skips_locked_rows_on_postgres() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    repository = BaseRepository(session=session, model=Role)
+
+    query = asyncio.run(repository._lock_for_claim(repository._build_query()))
+
+    assert str(query.compile(dialect=postgresql.dialect())).endswith("FOR UPDATE SKIP LOCKED")
+    session.execute.assert_not_awaited()
+
+
+def test_lock_for_claim_takes_write_lock_on_sqlite() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "sqlite"
+    repository = BaseRepository(session=session, model=Role)
+
+    query = asyncio.run(repository._lock_for_claim(repository._build_query()))
+
+    assert "FOR UPDATE" not in str(query)
+    lock_statement = str(session.execute.await_args.args[0])
+    assert lock_statement.startswith("UPDATE roles SET id=roles.id")
+    assert lock_statement.endswith("WHERE false")
+
+
 def test_to_record_maps_model_to_record() -> None:
     repository = BaseRepository(session=build_session_mock(), model=Role)
     role = Role(id=42, name="ops_role")
@@ -187,6 +214,101 @@ def test_list_raises_when_limit_is_less_than_one() -> None:
     asyncio.run(run_test())
 
 
+def _entities_result(entities: list[Role]) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = entities
+    return result
+
+
+def test_list_page_fetches_one_extra_row_and_returns_keyset_cursor() -> None:
+    session = build_session_mock()
+    repository = BaseRepository(session=session, model=Role)
+    session.execute.return_value = _entities_result(
+        [Role(id=4, name="admin_role"), Role(id=2, name="reader_role"), Role(id=9, name="writer_role")]
+    )
+
+    async def run_test() -> None:
+        page = await repository.list_page(page=PageRequest(limit=2), sort="name")
+
+        assert [role.id for role in page.items] == [4, 2]
+        assert page.next_cursor == encode_cursor(("reader_role", 2))
+        query_text = str(session.execute.await_args.args[0])
+        assert "ORDER BY roles.name ASC, roles.id ASC" in query_text
+        assert "WHERE" not in query_text
+        assert session.execute.await_args.args[0]._limit_clause.value == 3
+
+    asyncio.run(run_test())
+
+
+def test_list_page_filters_after_cursor_and_ends_without_next_cursor() -> None:
+    session = build_session_mock()
+    repository = BaseRepository(session=session, model=Role)
+    session.execute.return_value = _entities_result([Role(id=9, name="writer_role")])
+
+    async def run_test() -> None:
+        page = await repository.list_page(
+            page=PageRequest(limit=2, cursor=encode_cursor(("reader_role", 2))),
+            sort="-name",
+        )
+
+        assert [role.id for role in page.items] == [9]
+        assert page.next_cursor is None
+        query_text = str(session.execute.await_args.args[0])
+        assert "roles.name < :name_1 OR roles.name = :name_2 AND roles.id > :id_1" in query_text
+        assert "ORDER BY roles.name DESC, roles.id ASC" in query_text
+
+    asyncio.run(run_test())
+
+
+def test_list_page_uses_single_value_cursor_for_id_sort() -> None:
+    session = build_session_mock()
+    repository = BaseRepository(session=session, model=Role)
+    session.execute.return_value = _entities_result([Role(id=3, name="a"), Role(id=2, name="b")])
+
+    async def run_test() -> None:
+        page = await repository.list_page(page=PageRequest(limit=1, cursor=encode_cursor((5,))), sort="-id")
+
+        assert page.next_cursor == encode_cursor((3,))
+        assert "roles.id < :id_1" in str(session.execute.await_args.args[0])
+
+    asyncio.run(run_test())
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64 json",
+        encode_cursor((1,)),
+        encode_cursor((1, 2)),
+        encode_cursor(("reader_role", "2")),
+    ],
+)
+def test_list_page_rejects_invalid_cursor_as_invalid_input(cursor: str) -> None:
+    session = build_session_mock()
+    repository = BaseRepository(session=session, model=Role)
+
+    async def run_test() -> None:
+        with pytest.raises(RepositoryError) as exc_info:
+            await repository.list_page(page=PageRequest(cursor=cursor), sort="name")
+
+        assert exc_info.value.error_type is DomainErrorType.INVALID_INPUT
+        assert exc_info.value.details == {"cursor": cursor}
+        session.execute.assert_not_awaited()
+
+    asyncio.run(run_test())
+
+
+def test_list_page_raises_when_limit_is_less_than_one() -> None:
+    session = build_session_mock()
+    repository = BaseRepository(session=session, model=Role)
+
+    async def run_test() -> None:
+        with pytest.raises(RepositoryError, match="Limit must be greater than or equal to 1"):
+            await repository.list_page(page=PageRequest(limit=0))
+
+    asyncio.run(run_test())
+
+
 def test_update_merges_and_refreshes_entity() -> None:
     session = build_session_mock()
     repository = BaseRepository(session=session, model=Role)
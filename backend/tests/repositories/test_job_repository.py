@@ -0,0 +1,154 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.core.db.uow import UnitOfWork
+from app.core.errors.repositories import RepositoryError
+from app.features.jobs.models import Job, JobStatus
+from app.features.jobs.repository import JobRepository
+from utils.testing_support.database import MockDatabase
+from utils.testing_support.repositories import build_session_mock
+
+_NOW = datetime(2026, 5, 8, 12, 0, tzinfo=UTC)
+_VISIBILITY_TIMEOUT = timedelta(minutes=5)
+
+
+def _scalar_result(rows: list[object]) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+def test_job_repository_claims_by_priority_then_run_at_and_hides_claimed_jobs(mock_database: MockDatabase) -> None:
+    async def run_test() -> None:
+        async with mock_database.Session() as session:
+            repository = JobRepository(session=session)
+            async with UnitOfWork(session=session):
+                low = await repository.create_job(job_name="repo.low", payload={}, run_at=_NOW - timedelta(hours=1))
+                high = await repository.create_job(job_name="repo.high", payload={"n": 1}, priority=5, run_at=_NOW)
+                later = await repository.create_job(
+                    job_name="repo.later",
+                    payload={},
+                    priority=9,
+                    run_at=_NOW + timedelta(hours=1),
+                )
+
+            async with UnitOfWork(session=session):
+                claimed = await repository.claim_next(limit=5, visibility_timeout=_VISIBILITY_TIMEOUT, now=_NOW)
+            assert [job.id for job in claimed] == [high.id, low.id]
+            assert [job.status for job in claimed] == [JobStatus.RUNNING, JobStatus.RUNNING]
+            assert [job.attempts for job in claimed] == [1, 1]
+            assert claimed[0].locked_until == _NOW + _VISIBILITY_TIMEOUT
+
+            async with UnitOfWork(session=session):
+                assert await repository.claim_next(visibility_timeout=_VISIBILITY_TIMEOUT, now=_NOW) == []
+                assert await repository.mark_succeeded(claimed[0], finished_at=_NOW)
+                assert await repository.mark_failed(claimed[1], last_error="boom", finished_at=_NOW)
+
+            succeeded = await repository.get_job(high.id)
+            failed = await repository.get_job(low.id)
+            assert succeeded is not None and succeeded.status == JobStatus.SUCCEEDED
+            assert succeeded.locked_until is None
+            assert failed is not None and (failed.status, failed.last_error) == (JobStatus.FAILED, "boom")
+            assert await repository.get_job(later.id + 1_000) is None
+
+            async with UnitOfWork(session=session):
+                later_claim = await repository.claim_next(
+                    visibility_timeout=_VISIBILITY_TIMEOUT,
+                    now=_NOW + timedelta(hours=1),
+                )
+                assert [job.id for job in later_claim] == [later.id]
+                assert await repository.mark_succeeded(later_claim[0])
+
+    asyncio.run(run_test())
+
+
+def test_job_repository_reclaims_jobs_after_the_visibility_timeout(mock_database: MockDatabase) -> None:
+    async def run_test() -> None:
+        async with mock_database.Session() as session:
+            repository = JobRepository(session=session)
+            async with UnitOfWork(session=session):
+                job = await repository.create_job(job_name="repo.stalled", payload={}, run_at=_NOW)
+
+            async with UnitOfWork(session=session):
+                (first_claim,) = await repository.claim_next(visibility_timeout=_VISIBILITY_TIMEOUT, now=_NOW)
+            async with UnitOfWork(session=session):
+                (second_claim,) = await repository.claim_next(
+                    visibility_timeout=_VISIBILITY_TIMEOUT,
+                    now=_NOW + _VISIBILITY_TIMEOUT,
+                )
+            assert second_claim.id == job.id
+            assert second_claim.attempts == 2
+
+            async with UnitOfWork(session=session):
+                # The stalled worker no longer owns the job, so its late outcome is ignored.
+                assert not await repository.mark_succeeded(first_claim)
+                assert await repository.schedule_retry(
+                    second_claim,
+                    last_error="timeout",
+                    run_at=_NOW + timedelta(days=365),
+                )
+
+            retried = await repository.get_job(job.id)
+            assert retried is not None
+            assert (retried.status, retried.attempts, retried.last_error) == (JobStatus.QUEUED, 2, "timeout")
+
+            async with UnitOfWork(session=session):
+                (final_claim,) = await repository.claim_next(
+                    visibility_timeout=_VISIBILITY_TIMEOUT,
+                    now=_NOW + timedelta(days=365),
+                )
+                assert await repository.mark_succeeded(final_claim)
+
+    asyncio.run(run_test())
+
+
+def test_job_repository_claim_next_skips_locked_rows_on_postgres() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    repository = JobRepository(session=session)
+    session.execute.return_value = _scalar_result([])
+
+    async def run_test() -> None:
+        assert await repository.claim_next(visibility_timeout=_VISIBILITY_TIMEOUT, now=_NOW) == []
+
+        session.execute.assert_awaited_once()
+        query_text = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "jobs.status = %(status_1)s AND jobs.run_at <= %(run_at_1)s" in query_text
+        assert "jobs.status = %(status_2)s AND jobs.locked_until <= %(locked_until_1)s" in query_text
+        assert "ORDER BY jobs.priority DESC, jobs.run_at ASC, jobs.id ASC" in query_text
+        assert query_text.endswith("FOR UPDATE SKIP LOCKED")
+
+        with pytest.raises(RepositoryError, match="Limit must be greater than or equal to 1"):
+            await repository.claim_next(limit=0, visibility_timeout=_VISIBILITY_TIMEOUT)
+
+    asyncio.run(run_test())
+
+
+def test_job_repository_claim_next_takes_write_lock_first_on_sqlite() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "sqlite"
+    repository = JobRepository(session=session)
+    session.execute.side_effect = [MagicMock(), _scalar_result([])]
+
+    async def run_test() -> None:
+        assert await repository.claim_next(visibility_timeout=_VISIBILITY_TIMEOUT) == []
+
+        lock_statement, claim_query = (awaited.args[0] for awaited in session.execute.await_args_list)
+        assert str(lock_statement).startswith("UPDATE jobs")
+        assert "FOR UPDATE" not in str(claim_query)
+
+    asyncio.run(run_test())
+
+
+def test_job_claim_index_matches_the_claim_order() -> None:
+    (claim_index,) = (index for index in Job.__table__.indexes if index.name.startswith("ix_jobs_claimable"))
+
+    statement = str(CreateIndex(claim_index).compile(dialect=postgresql.dialect()))
+
+    assert "ON jobs (priority DESC, run_at, id)" in statement
+    assert "WHERE status IN ('queued', 'running')" in statement
@@ -1,13 +1,17 @@
 import asyncio
-from datetime import UTC, datetime
-from unittest.mock import MagicMock
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 
+from app.core.db.uow import UnitOfWork
 from app.core.errors.repositories import RepositoryError
 from app.features.outbox.models import OutboxEvent
-from app.features.outbox.repository import OutboxRepository
-from app.features.outbox.schemas import OutboxEventRecord
+from app.features.outbox.repository import OutboxRepository, add_months, outbox_partition_name
+from app.features.outbox.schemas import EnqueueOutboxEventCommand, OutboxEventRecord
+from utils.testing_support.database import MockDatabase
 from utils.testing_support.repositories import build_session_mock
 
 
@@ -26,6 +30,7 @@ def test_outbox_repository_create_event_persists_outbox_record() -> None:
         entity.id = 101
         entity.occurred_at = expected_occurred_at
         entity.published_at = None
+        entity.attempts = 0
 
     session.refresh.side_effect = refresh
 
@@ -60,6 +65,7 @@ def test_outbox_repository_create_event_preserves_explicit_occurred_at() -> None
     async def refresh(entity: OutboxEvent) -> None:
         entity.id = 202
         entity.published_at = None
+        entity.attempts = 0
 
     session.refresh.side_effect = refresh
 
@@ -89,6 +95,7 @@ def test_outbox_repository_list_pending_filters_unpublished_events() -> None:
         payload={"book_id": 7},
         occurred_at=datetime(2026, 3, 5, 12, 30, tzinfo=UTC),
         published_at=None,
+        attempts=0,
     )
     session.execute.return_value = _scalar_result([pending_event])
 
@@ -136,6 +143,7 @@ def test_outbox_repository_get_event_returns_record_when_event_exists() -> None:
         payload={"book_id": 303},
         occurred_at=datetime(2026, 3, 5, 13, 0, tzinfo=UTC),
         published_at=None,
+        attempts=0,
     )
     session.get.return_value = outbox_event_model
 
@@ -173,6 +181,7 @@ def test_outbox_repository_mark_published_updates_timestamp() -> None:
         payload={"book_id": 11},
         occurred_at=datetime(2026, 3, 5, 11, 0, tzinfo=UTC),
         published_at=None,
+        attempts=0,
     )
     outbox_event = OutboxEventRecord.from_domain(outbox_event_model)
     expected_published_at = datetime(2026, 3, 5, 12, 0, tzinfo=UTC)
@@ -207,6 +216,7 @@ def test_outbox_repository_mark_published_raises_when_event_is_missing() -> None
         payload={"book_id": 404},
         occurred_at=datetime(2026, 3, 5, 15, 0, tzinfo=UTC),
         published_at=None,
+        attempts=0,
     )
     session.get.return_value = None
 
@@ -215,3 +225,315 @@ def test_outbox_repository_mark_published_raises_when_event_is_missing() -> None
             await repository.mark_published(missing_event)
 
     asyncio.run(run_test())
+
+
+def test_outbox_repository_claim_pending_skips_locked_rows_on_postgres() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    repository = OutboxRepository(session=session)
+    session.execute.return_value = _scalar_result([])
+
+    async def run_test() -> None:
+        assert await repository.claim_pending(limit=10) == []
+
+        session.execute.assert_awaited_once()
+        query_text = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "outbox_events.published_at IS NULL" in query_text
+        assert "ORDER BY outbox_events.occurred_at ASC, outbox_events.id ASC" in query_text
+        assert query_text.endswith("FOR UPDATE SKIP LOCKED")
+
+        with pytest.raises(RepositoryError, match="Limit must be greater than or equal to 1"):
+            await repository.claim_pending(limit=0)
+
+    asyncio.run(run_test())
+
+
+def test_outbox_repository_claim_pending_takes_write_lock_first_on_sqlite() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "sqlite"
+    repository = OutboxRepository(session=session)
+    session.execute.side_effect = [MagicMock(), _scalar_result([])]
+
+    async def run_test() -> None:
+        assert await repository.claim_pending(limit=10) == []
+
+        lock_statement, claim_query = (awaited.args[0] for awaited in session.execute.await_args_list)
+        assert str(lock_statement).startswith("UPDATE outbox_events")
+        assert "FOR UPDATE" not in str(claim_query)
+
+    asyncio.run(run_test())
+
+
+def test_outbox_repository_mark_published_many_uses_one_bulk_update() -> None:
+    session = build_session_mock()
+    repository = OutboxRepository(session=session)
+    session.execute.return_value = MagicMock(rowcount=2)
+    published_at = datetime(2026, 3, 5, 12, 0, tzinfo=UTC)
+
+    async def run_test() -> None:
+        assert await repository.mark_published_many([]) == 0
+        session.execute.assert_not_awaited()
+
+        assert await repository.mark_published_many([4, 5], published_at=published_at) == 2
+        session.execute.assert_awaited_once()
+        statement = session.execute.await_args.args[0]
+        statement_text = str(statement)
+        assert statement_text.startswith("UPDATE outbox_events SET published_at=")
+        assert "outbox_events.id IN" in statement_text
+        assert "outbox_events.published_at IS NULL" in statement_text
+        assert statement.compile().params["published_at"] == published_at
+
+    asyncio.run(run_test())
+
+
+def test_outbox_repository_create_events_inserts_batch_with_returning(mock_database: MockDatabase) -> None:
+    commands = [
+        EnqueueOutboxEventCommand(
+            aggregate_type="bulk_book",
+            aggregate_id=str(index),
+            event_type="book.created",
+            payload={"book_id": index},
+        )
+        for index in range(3)
+    ]
+
+    async def run_test() -> None:
+        async with mock_database.Session() as session:
+            repository = OutboxRepository(session=session)
+            assert await repository.create_events([]) == []
+
+            async with UnitOfWork(session=session):
+                events = await repository.create_events(commands)
+
+        assert [event.aggregate_id for event in events] == ["0", "1", "2"]
+        assert events[0].id < events[1].id < events[2].id
+        assert all(event.published_at is None and event.occurred_at is not None for event in events)
+
+        async with mock_database.Session() as session:
+            persisted_ids = await session.scalars(
+                select(OutboxEvent.id).where(OutboxEvent.aggregate_type == "bulk_book").order_by(OutboxEvent.id)
+            )
+            assert list(persisted_ids) == [event.id for event in events]
+
+    asyncio.run(run_test())
+
+
+def test_outbox_repository_create_events_uses_one_statement() -> None:
+    session = build_session_mock()
+    session.scalars = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    repository = OutboxRepository(session=session)
+    command = EnqueueOutboxEventCommand(aggregate_type="book", aggregate_id="1", event_type="book.created", payload={})
+
+    async def run_test() -> None:
+        await repository.create_events([command, command])
+
+        session.scalars.assert_awaited_once()
+        statement, rows = session.scalars.await_args.args
+        assert str(statement).startswith("INSERT INTO outbox_events")
+        assert "RETURNING" in str(statement)
+        assert rows == [command.model_dump(), command.model_dump()]
+        session.add.assert_not_called()
+        session.refresh.assert_not_awaited()
+
+    asyncio.run(run_test())
+
+
+def test_outbox_repository_notify_pending_emits_pg_notify_on_postgres() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    repository = OutboxRepository(session=session)
+
+    asyncio.run(repository.notify_pending())
+
+    session.execute.assert_awaited_once()
+    query_text = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "pg_notify" in query_text
+
+
+def test_outbox_repository_notify_pending_is_a_noop_on_sqlite() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "sqlite"
+    repository = OutboxRepository(session=session)
+
+    asyncio.run(repository.notify_pending())
+
+    session.execute.assert_not_awaited()
+
+
+def _executed_sql(session: MagicMock) -> list[str]:
+    return [str(call.args[0].compile(dialect=postgresql.dialect())) for call in session.execute.await_args_list]
+
+
+def test_outbox_partition_helpers_step_through_months() -> None:
+    assert add_months(date(2026, 11, 1), 1) == date(2026, 12, 1)
+    assert add_months(date(2026, 12, 1), 1) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), 14) == date(2027, 3, 1)
+    assert outbox_partition_name(date(2026, 4, 1)) == "outbox_events_p202604"
+
+
+def test_outbox_repository_list_partition_months_parses_monthly_partitions() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute.return_value = MagicMock(
+        scalars=MagicMock(
+            return_value=["outbox_events_p202605", "outbox_events_default", "outbox_events_p202604"],
+        )
+    )
+    repository = OutboxRepository(session=session)
+
+    months = asyncio.run(repository.list_partition_months())
+
+    assert repository.supports_partitions()
+    assert months == [date(2026, 4, 1), date(2026, 5, 1)]
+    assert "pg_inherits" in _executed_sql(session)[0]
+
+
+def test_outbox_repository_create_partition_covers_one_month() -> None:
+    session = build_session_mock()
+    session.execute.side_effect = [MagicMock(), MagicMock(scalar=MagicMock(return_value=False)), MagicMock()]
+    repository = OutboxRepository(session=session)
+
+    assert asyncio.run(repository.create_partition(date(2026, 12, 1))) == "outbox_events_p202612"
+    assert _executed_sql(session) == [
+        "LOCK TABLE outbox_events_default IN EXCLUSIVE MODE",
+        "SELECT EXISTS (SELECT 1 FROM outbox_events_default "
+        "WHERE occurred_at >= '2026-12-01' AND occurred_at < '2027-01-01')",
+        "CREATE TABLE IF NOT EXISTS outbox_events_p202612 PARTITION OF outbox_events "
+        "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')",
+    ]
+
+
+def test_outbox_repository_create_partition_moves_rows_out_of_default_partition() -> None:
+    session = build_session_mock()
+    session.execute.side_effect = [
+        MagicMock(),
+        MagicMock(scalar=MagicMock(return_value=True)),
+        MagicMock(),
+        MagicMock(),
+        MagicMock(rowcount=3),
+        MagicMock(),
+    ]
+    repository = OutboxRepository(session=session)
+
+    assert asyncio.run(repository.create_partition(date(2026, 12, 1))) == "outbox_events_p202612"
+    statements = _executed_sql(session)
+    assert statements[2] == "ALTER TABLE outbox_events DETACH PARTITION outbox_events_default"
+    assert statements[3].startswith("CREATE TABLE IF NOT EXISTS outbox_events_p202612 PARTITION OF outbox_events")
+    assert statements[4].startswith(
+        "WITH moved AS (DELETE FROM outbox_events_default "
+        "WHERE occurred_at >= '2026-12-01' AND occurred_at < '2027-01-01' RETURNING id, "
+    )
+    assert "INSERT INTO outbox_events_p202612 (id, " in statements[4]
+    assert statements[5] == "ALTER TABLE outbox_events ATTACH PARTITION outbox_events_default DEFAULT"
+
+
+def test_outbox_repository_partition_has_pending_locks_partition_first() -> None:
+    session = build_session_mock()
+    session.execute.side_effect = [MagicMock(), MagicMock(scalar=MagicMock(return_value=True))]
+    repository = OutboxRepository(session=session)
+
+    assert asyncio.run(repository.partition_has_pending(date(2026, 1, 1))) is True
+    assert _executed_sql(session) == [
+        "LOCK TABLE outbox_events_p202601 IN SHARE MODE",
+        "SELECT EXISTS (SELECT 1 FROM outbox_events_p202601 WHERE published_at IS NULL)",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("archive", "last_statement"),
+    [
+        (False, "DROP TABLE outbox_events_p202601"),
+        (True, "ALTER TABLE outbox_events_p202601 RENAME TO outbox_events_archive_202601"),
+    ],
+)
+def test_outbox_repository_remove_partition_detaches_before_drop_or_archive(archive: bool, last_statement: str) -> None:
+    session = build_session_mock()
+    repository = OutboxRepository(session=session)
+
+    assert asyncio.run(repository.remove_partition(date(2026, 1, 1), archive=archive)) == "outbox_events_p202601"
+    assert _executed_sql(session) == [
+        "ALTER TABLE outbox_events DETACH PARTITION outbox_events_p202601",
+        last_statement,
+    ]
+
+
+def test_outbox_repository_delete_published_before_uses_one_bulk_delete() -> None:
+    session = build_session_mock()
+    session.execute.return_value = MagicMock(rowcount=4)
+    repository = OutboxRepository(session=session)
+
+    deleted_count = asyncio.run(repository.delete_published_before(datetime(2026, 3, 1, tzinfo=UTC)))
+
+    assert deleted_count == 4
+    session.execute.assert_awaited_once()
+    query_text = _executed_sql(session)[0]
+    assert query_text.startswith("DELETE FROM outbox_events")
+    assert "outbox_events.published_at IS NOT NULL" in query_text
+    assert "outbox_events.occurred_at <" in query_text
+
+
+def test_outbox_repository_claim_pending_filters_by_shard() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute.return_value = _scalar_result([])
+    repository = OutboxRepository(session=session)
+
+    asyncio.run(repository.claim_pending(limit=5, shard_count=4, shard_index=3))
+
+    statement = session.execute.await_args.args[0]
+    query_text = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "outbox_events.shard_key %% 4 = 3" in query_text
+
+    with pytest.raises(RepositoryError, match="Shard index"):
+        asyncio.run(repository.claim_pending(limit=5, shard_count=4, shard_index=4))
+
+
+def test_outbox_repository_schedule_retry_updates_attempt_tracking() -> None:
+    session = build_session_mock()
+    repository = OutboxRepository(session=session)
+    available_at = datetime(2026, 3, 5, 10, 0, 4, tzinfo=UTC)
+
+    asyncio.run(repository.schedule_retry(7, attempts=3, last_error="RuntimeError: down", available_at=available_at))
+
+    statement = session.execute.await_args.args[0]
+    query_text = str(statement.compile(dialect=postgresql.dialect()))
+    assert query_text.startswith("UPDATE outbox_events SET attempts=")
+    assert statement.compile().params["attempts"] == 3
+    assert statement.compile().params["available_at"] == available_at
+
+
+def test_outbox_repository_move_to_dead_letters_skips_empty_batches() -> None:
+    session = build_session_mock()
+    repository = OutboxRepository(session=session)
+
+    assert asyncio.run(repository.move_to_dead_letters([])) == 0
+    session.execute.assert_not_awaited()
+
+
+def test_outbox_repository_claim_pending_holds_back_aggregates_waiting_for_retry() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute.return_value = _scalar_result([])
+    repository = OutboxRepository(session=session)
+
+    asyncio.run(repository.claim_pending(limit=5, now=datetime(2026, 3, 5, tzinfo=UTC)))
+
+    query_text = _executed_sql(session)[0]
+    assert "outbox_events.available_at <= " in query_text
+    assert "NOT (EXISTS (SELECT outbox_events_1.id" in query_text
+
+
+def test_outbox_repository_archive_default_published_before_moves_expired_rows() -> None:
+    session = build_session_mock()
+    session.execute.side_effect = [MagicMock(), MagicMock(rowcount=5)]
+    repository = OutboxRepository(session=session)
+    cutoff = datetime(2026, 3, 1, tzinfo=UTC)
+
+    assert asyncio.run(repository.archive_default_published_before(cutoff)) == 5
+    statements = _executed_sql(session)
+    assert statements[0] == (
+        "CREATE TABLE IF NOT EXISTS outbox_events_archive_default (LIKE outbox_events INCLUDING DEFAULTS)"
+    )
+    assert statements[1].startswith("WITH moved AS (DELETE FROM outbox_events_default WHERE published_at IS NOT NULL")
+    assert "INSERT INTO outbox_events_archive_default (id, " in statements[1]
+    assert session.execute.await_args_list[1].args[1] == {"cutoff": cutoff}
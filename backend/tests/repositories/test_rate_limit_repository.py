@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.core.common.integration import TakeRateLimitTokenCommand
+from app.features.rate_limit.models import RateLimitBucket
+from app.features.rate_limit.store import DatabaseRateLimitStore
+from utils.testing_support.database import MockDatabase
+
+
+def test_database_store_shares_buckets_across_store_instances(mock_database: MockDatabase) -> None:
+    now = datetime(2026, 5, 11, 12, 0, tzinfo=UTC)
+    first_worker = DatabaseRateLimitStore(session_factory=mock_database.Session, clock=lambda: now)
+    second_worker = DatabaseRateLimitStore(session_factory=mock_database.Session, clock=lambda: now)
+    command = TakeRateLimitTokenCommand(key="login:ip:10.0.0.9", capacity=2, refill_per_second=0.5)
+
+    async def run_test() -> None:
+        assert (await first_worker.take(command)).allowed is True
+        assert (await second_worker.take(command)).allowed is True
+        denied = await first_worker.take(command)
+        assert denied.allowed is False
+        assert denied.retry_after_seconds == pytest.approx(2.0)
+
+        later = DatabaseRateLimitStore(session_factory=mock_database.Session, clock=lambda: now + timedelta(seconds=2))
+        assert (await later.take(command)).allowed is True
+
+        async with mock_database.Session() as session:
+            bucket = await session.scalar(select(RateLimitBucket).where(RateLimitBucket.key == command.key))
+        assert bucket is not None
+        assert bucket.tokens == pytest.approx(0.0)
+
+    asyncio.run(run_test())
+
+
+def test_database_store_prunes_refilled_buckets_once_per_interval(mock_database: MockDatabase) -> None:
+    now = datetime(2026, 5, 13, 12, 0, tzinfo=UTC)
+    clock = iter([now, now + timedelta(seconds=30), now + timedelta(seconds=90)])
+    store = DatabaseRateLimitStore(
+        session_factory=mock_database.Session, prune_interval_seconds=60, clock=lambda: next(clock)
+    )
+    slow = TakeRateLimitTokenCommand(key="login:user:prune-slow", capacity=2, refill_per_second=0.01)
+    fast = TakeRateLimitTokenCommand(key="login:user:prune-fast", capacity=2, refill_per_second=1.0)
+
+    async def list_keys() -> list[str]:
+        async with mock_database.Session() as session:
+            result = await session.scalars(
+                select(RateLimitBucket.key).where(RateLimitBucket.key.startswith("login:user:prune-"))
+            )
+            return sorted(result.all())
+
+    async def run_test() -> None:
+        await store.take(slow)
+        await store.take(fast)
+        async with mock_database.Session() as session:
+            bucket = await session.scalar(select(RateLimitBucket).where(RateLimitBucket.key == fast.key))
+        assert bucket is not None
+        assert bucket.full_at.replace(tzinfo=UTC) == now + timedelta(seconds=31)
+
+        # The first check pruned nothing yet, the second is inside the interval, and the third prunes the fast bucket
+        # that refilled at +31s while the slow one still needs 100s.
+        await store.take(TakeRateLimitTokenCommand(key="login:user:prune-third", capacity=1, refill_per_second=0.001))
+        assert await list_keys() == ["login:user:prune-slow", "login:user:prune-third"]
+
+    asyncio.run(run_test())
+
+
+def test_database_store_logs_prune_failures_without_failing_the_check(
+    mock_database: MockDatabase,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    store = DatabaseRateLimitStore(session_factory=mock_database.Session)
+    command = TakeRateLimitTokenCommand(key="login:ip:10.0.0.77", capacity=1, refill_per_second=1.0)
+
+    async def failing_prune(*, now: datetime | None = None) -> int:
+        raise RuntimeError("database unavailable")
+
+    store.prune = failing_prune  # type: ignore[method-assign]
+
+    with caplog.at_level(logging.ERROR, logger="app.rate_limit"):
+        assert asyncio.run(store.take(command)).allowed is True
+
+    assert "event=rate_limit_prune_failed" in caplog.text
@@ -2,12 +2,14 @@ import asyncio
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 
 from app.core.errors.repositories import RepositoryConflictError, RepositoryError
 from app.features.auth.models import User
 from app.features.rbac.models import Permission, Role, RoleInheritance, RolePermission, UserRole
 from app.features.rbac.repository import RBACRepository
+from app.features.rbac.schemas import RoleListFilters, UserListFilters
 from utils.testing_support.repositories import build_session_mock
 
 
@@ -181,6 +183,117 @@ def test_rbac_repository_list_users_orders_by_username() -> None:
     asyncio.run(run_test())
 
 
+def test_rbac_repository_list_users_applies_filters_for_index_backed_search() -> None:
+    session = build_session_mock()
+    repository = RBACRepository(session=session)
+    session.execute.return_value = _scalar_result([])
+
+    async def run_test() -> None:
+        await repository.list_users(filters=UserListFilters(q=" 50%_off ", disabled=False, role_id=2, tenant_id=7))
+        await repository.list_users(filters=UserListFilters(q="Ad"))
+
+        filtered_query, prefix_query = (awaited.args[0] for awaited in session.execute.await_args_list)
+        query_text = str(filtered_query.compile(dialect=postgresql.dialect()))
+        assert "lower(users.username) LIKE %(lower_1)s ESCAPE " in query_text
+        assert "users.disabled IS false" in query_text
+        assert "EXISTS (SELECT * \nFROM user_roles \nWHERE user_roles.user_id = users.id" in query_text
+        assert "users.tenant_id = %(tenant_id_1)s" in query_text
+        assert filtered_query.compile().params["lower_1"] == "%50\\%\\_off%"
+        assert prefix_query.compile().params["lower_1"] == "ad%"
+
+    asyncio.run(run_test())
+
+
+def test_rbac_repository_list_roles_filters_by_name() -> None:
+    session = build_session_mock()
+    repository = RBACRepository(session=session)
+    session.execute.return_value = _scalar_result([Role(id=2, name="reader_role")])
+
+    async def run_test() -> None:
+        roles = await repository.list_roles(filters=RoleListFilters(q="reader"))
+
+        assert [role.name for role in roles] == ["reader_role"]
+        query = session.execute.await_args.args[0]
+        assert "lower(roles.name) LIKE" in str(query)
+        assert query.compile().params["lower_1"] == "%reader%"
+
+    asyncio.run(run_test())
+
+
+def test_rbac_repository_list_role_ids_by_user_ids_groups_rows_from_one_query() -> None:
+    session = build_session_mock()
+    repository = RBACRepository(session=session)
+    result = MagicMock()
+    result.all.return_value = [(1, 1), (1, 3), (4, 2)]
+    session.execute.return_value = result
+
+    async def run_test() -> None:
+        role_ids_by_user_id = await repository.list_role_ids_by_user_ids(user_ids=(1, 2, 4))
+
+        assert role_ids_by_user_id == {1: [1, 3], 2: [], 4: [2]}
+        session.execute.assert_awaited_once()
+        query = str(session.execute.await_args.args[0])
+        assert "user_roles.user_id IN" in query
+        assert "ORDER BY user_roles.user_id ASC, user_roles.role_id ASC" in query
+
+    asyncio.run(run_test())
+
+
+def test_rbac_repository_list_role_ids_by_user_ids_skips_query_for_empty_user_ids() -> None:
+    session = build_session_mock()
+    repository = RBACRepository(session=session)
+
+    async def run_test() -> None:
+        assert await repository.list_role_ids_by_user_ids(user_ids=()) == {}
+        session.execute.assert_not_awaited()
+
+    asyncio.run(run_test())
+
+
+def test_rbac_repository_list_role_ids_by_user_ids_chunks_large_id_lists() -> None:
+    session = build_session_mock()
+    repository = RBACRepository(session=session)
+    first_chunk = MagicMock()
+    first_chunk.all.return_value = [(1, 7)]
+    second_chunk = MagicMock()
+    second_chunk.all.return_value = [(1_001, 8)]
+    session.execute.side_effect = [first_chunk, second_chunk]
+
+    async def run_test() -> None:
+        role_ids_by_user_id = await repository.list_role_ids_by_user_ids(user_ids=tuple(range(1, 1_502)))
+
+        assert len(role_ids_by_user_id) == 1_501
+        assert role_ids_by_user_id[1] == [7]
+        assert role_ids_by_user_id[1_001] == [8]
+        assert session.execute.await_count == 2
+        chunk_sizes = [len(call.args[0].compile().params["user_id_1"]) for call in session.execute.await_args_list]
+        assert chunk_sizes == [1_000, 501]
+
+    asyncio.run(run_test())
+
+
+def test_rbac_repository_list_role_ids_by_user_filters_selects_from_filtered_users() -> None:
+    session = build_session_mock()
+    repository = RBACRepository(session=session)
+    result = MagicMock()
+    result.all.return_value = [(1, 1), (1, 3), (4, 2)]
+    session.execute.return_value = result
+
+    async def run_test() -> None:
+        role_ids_by_user_id = await repository.list_role_ids_by_user_filters(
+            filters=UserListFilters(disabled=False, role_id=2)
+        )
+
+        assert role_ids_by_user_id == {1: [1, 3], 4: [2]}
+        query = session.execute.await_args.args[0]
+        assert "user_roles.user_id IN (SELECT users.id" in str(query)
+        assert "users.disabled" in str(query)
+        assert "EXISTS" in str(query)
+        assert query.compile().params == {"role_id_1": 2}
+
+    asyncio.run(run_test())
+
+
 def test_rbac_repository_list_user_role_ids_returns_sorted_ids() -> None:
     session = build_session_mock()
     repository = RBACRepository(session=session)
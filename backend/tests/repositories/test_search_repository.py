@@ -0,0 +1,111 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.common.integration import DeleteSearchDocumentCommand, SearchDocumentsQuery, SearchDocumentUpsertCommand
+from app.core.db.uow import UnitOfWork
+from app.features.search.repository import SearchRepository, search_terms, searchable_text
+from utils.testing_support.database import MockDatabase
+from utils.testing_support.repositories import build_session_mock
+
+
+def _upsert(index: str, document_id: str, **body: object) -> SearchDocumentUpsertCommand:
+    return SearchDocumentUpsertCommand(index=index, document_id=document_id, body=body)
+
+
+def test_search_terms_strip_query_syntax_and_cap_the_term_count() -> None:
+    assert search_terms('Ali* & "ce" | -bob_o') == ["ali", "ce", "bob", "o"]
+    assert search_terms("a b c d e f g h i j") == ["a", "b", "c", "d", "e", "f", "g", "h"]
+    assert search_terms("*:& ") == []
+
+
+def test_searchable_text_indexes_strings_and_numbers_only() -> None:
+    assert searchable_text({"username": "alice", "age": 7, "disabled": True, "tags": ["x"]}) == "alice 7"
+
+
+def test_search_repository_bulk_upserts_searches_and_deletes_on_sqlite(mock_database: MockDatabase) -> None:
+    async def run_test() -> None:
+        async with mock_database.Session() as session:
+            repository = SearchRepository(session=session)
+            async with UnitOfWork(session=session):
+                upserted = await repository.upsert_documents(
+                    [
+                        _upsert("repo_users", "1", username="alice.search"),
+                        _upsert("repo_users", "2", username="alina.search"),
+                        _upsert("repo_users", "3", username="bob.search"),
+                        _upsert("repo_roles", "1", name="alice.role"),
+                        _upsert("repo_users", "3", username="bobby.search"),
+                    ]
+                )
+            assert upserted == 4
+
+            hits = await repository.search(SearchDocumentsQuery(index="repo_users", text="ali"))
+            assert sorted(hit.document_id for hit in hits) == ["1", "2"]
+            assert {hit.index for hit in hits} == {"repo_users"}
+
+            (bobby,) = await repository.search(SearchDocumentsQuery(index="repo_users", text="bobby"))
+            assert (bobby.document_id, bobby.body) == ("3", {"username": "bobby.search"})
+            assert await repository.search(SearchDocumentsQuery(index="repo_users", text="bob.search OR")) == []
+
+            async with UnitOfWork(session=session):
+                await repository.upsert_documents([_upsert("repo_users", "1", username="carol.search")])
+                deleted = await repository.delete_documents(
+                    [
+                        DeleteSearchDocumentCommand(index="repo_users", document_id="2"),
+                        DeleteSearchDocumentCommand(index="repo_users", document_id="2"),
+                        DeleteSearchDocumentCommand(index="repo_users", document_id="404"),
+                    ]
+                )
+            assert deleted == 1
+            assert await repository.search(SearchDocumentsQuery(index="repo_users", text="ali")) == []
+            (carol,) = await repository.search(SearchDocumentsQuery(index="repo_users", text="carol"))
+            assert carol.document_id == "1"
+
+            async with UnitOfWork(session=session):
+                assert await repository.clear_index("repo_users") == 2
+                assert await repository.clear_index("repo_roles") == 1
+            assert await repository.search(SearchDocumentsQuery(index="repo_users", text="carol")) == []
+
+            assert await repository.upsert_documents([]) == 0
+            assert await repository.delete_documents([]) == 0
+            assert await repository.search(SearchDocumentsQuery(index="repo_users", text="**")) == []
+
+    asyncio.run(run_test())
+
+
+def test_search_repository_uses_tsvector_prefix_queries_on_postgres() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    repository = SearchRepository(session=session)
+    session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+
+    async def run_test() -> None:
+        assert await repository.search(SearchDocumentsQuery(index="users", text="Ali Sm", limit=5)) == []
+
+        statement = session.execute.await_args.args[0]
+        query_text = str(statement.compile(dialect=postgresql.dialect()))
+        assert "to_tsvector('simple', search_documents.content) @@ to_tsquery('simple', %(ts_query)s)" in query_text
+        assert "ORDER BY ts_rank(" in query_text
+        assert query_text.endswith("DESC, search_documents.id ASC \n LIMIT %(param_1)s")
+        assert statement.compile().params["ts_query"] == "ali:* & sm:*"
+
+    asyncio.run(run_test())
+
+
+def test_search_repository_upserts_with_on_conflict_on_postgres() -> None:
+    session = build_session_mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    repository = SearchRepository(session=session)
+    session.execute.return_value = MagicMock(all=MagicMock(return_value=[MagicMock(id=1, content="alice")]))
+
+    async def run_test() -> None:
+        assert await repository.upsert_documents([_upsert("users", "1", username="alice")]) == 1
+
+        session.execute.assert_awaited_once()
+        statement, rows = session.execute.await_args.args
+        query_text = str(statement.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (index_name, document_id) DO UPDATE" in query_text
+        assert rows == [{"index_name": "users", "document_id": "1", "body": {"username": "alice"}, "content": "alice"}]
+
+    asyncio.run(run_test())
@@ -1,17 +1,30 @@
-import hashlib
 from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 from typing import Any
+from unittest.mock import patch
 
 import jwt
 from starlette.testclient import TestClient
 
 from app.core.authorization import PERMISSION_SPECS
 from app.core.config.settings import AuthSettings
+from app.core.errors.services import ServiceUnavailableError
+from app.core.setup.dependencies import (
+    get_auth_settings,
+    get_password_service,
+    get_request_login_rate_limiter,
+    get_request_token_watermarks,
+)
+from app.core.setup.rate_limit import LoginRateLimiter
+from app.features.auth.repository import AuthRepository
+from app.features.auth.token_watermarks import TokenWatermarkTable
+from app.integrations.local_rate_limit import InMemoryRateLimitStore
+from app.main import app
 from utils.testing_support.api_assertions import assert_error_response
+from utils.testing_support.database import MockDatabase
 
 
-def _build_access_token(username: str) -> str:
+def _build_access_token(username: str, *, rbac_version: str = "1") -> str:
     settings = AuthSettings()
     issued_at = datetime.now(UTC)
     expire_at = issued_at + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -22,7 +35,7 @@ def _build_access_token(username: str) -> str:
         "iat": int(issued_at.timestamp()),
         "exp": int(expire_at.timestamp()),
         "jti": f"test-{username}",
-        "rbac_version": hashlib.sha256(b"").hexdigest(),
+        "rbac_version": rbac_version,
     }
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
@@ -65,6 +78,55 @@ def test_token_rejects_invalid_credentials_variants(mock_client: TestClient) ->
         assert response.headers["www-authenticate"] == "Bearer"
 
 
+class _SaturatedPasswordService:
+    async def hash_password(self, plain_password: str) -> str:
+        raise ServiceUnavailableError(
+            message="Password hashing capacity exceeded. Retry shortly.", retry_after_seconds=1
+        )
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        raise ServiceUnavailableError(
+            message="Password hashing capacity exceeded. Retry shortly.", retry_after_seconds=1
+        )
+
+
+def test_token_returns_service_unavailable_when_password_hashing_is_saturated(mock_client: TestClient) -> None:
+    app.dependency_overrides[get_password_service] = _SaturatedPasswordService
+
+    response = mock_client.post(
+        "/v1/token",
+        data={
+            "username": "admin",
+            "password": "admin123",  # pragma: allowlist secret
+        },
+    )
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    _assert_error_payload(response, "service_unavailable", "Password hashing capacity exceeded. Retry shortly.")
+    assert response.headers["retry-after"] == "1"
+
+
+def test_token_rate_limits_attempts_per_username_before_verifying_password(mock_client: TestClient) -> None:
+    limiter = LoginRateLimiter(
+        InMemoryRateLimitStore(), user_burst=2, user_per_minute=1, ip_burst=100, ip_per_minute=100
+    )
+    app.dependency_overrides[get_request_login_rate_limiter] = lambda: limiter
+    credentials = {"username": "admin", "password": "wrong-password"}  # pragma: allowlist secret
+
+    for _ in range(2):
+        assert mock_client.post("/v1/token", data=credentials).status_code == HTTPStatus.UNAUTHORIZED
+
+    # The correct password is rejected too: the limit applies before Argon2 runs.
+    response = mock_client.post(
+        "/v1/token",
+        data={"username": "admin", "password": "admin123"},  # pragma: allowlist secret
+    )
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    _assert_error_payload(response, "rate_limited", "Too many login attempts. Retry later.")
+    assert response.headers["retry-after"] == "60"
+
+
 def test_token_disabled_user(mock_client: TestClient) -> None:
     response = mock_client.post(
         "/v1/token",
@@ -100,6 +162,33 @@ def test_get_current_active_user(mock_client: TestClient) -> None:
     }
 
 
+def test_stateless_token_authorizes_requests_without_auth_queries(
+    mock_client: TestClient,
+    mock_database: MockDatabase,
+) -> None:
+    token_watermarks = TokenWatermarkTable(session_factory=mock_database.Session, retention_seconds=1_800)
+    mock_client.portal.call(token_watermarks.refresh)
+    app.dependency_overrides[get_auth_settings] = lambda: AuthSettings(AUTH_STATELESS_TOKENS_ENABLED=True)
+    app.dependency_overrides[get_request_token_watermarks] = lambda: token_watermarks
+    token_response = mock_client.post(
+        "/v1/token",
+        data={
+            "username": "admin",
+            "password": "admin123",  # pragma: allowlist secret
+        },
+    )
+    headers = {"Authorization": f"Bearer {token_response.json()['access_token']}"}
+
+    with (
+        patch.object(AuthRepository, "get_by_username", side_effect=AssertionError("user lookup")),
+        patch.object(AuthRepository, "get_user_permission_scope", side_effect=AssertionError("scope lookup")),
+        patch.object(AuthRepository, "get_user_permission_scopes", side_effect=AssertionError("scope lookup")),
+    ):
+        response = mock_client.get("/v1/rbac/permissions", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+
+
 def test_get_current_active_user_rejects_invalid_tokens_and_inactive_user(mock_client: TestClient) -> None:
     authorizations = (
         "Bearer not-a-valid-token",
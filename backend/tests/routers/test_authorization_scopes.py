@@ -1,12 +1,18 @@
+from collections.abc import Awaitable, Callable
 from http import HTTPStatus
 from typing import Annotated, Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from fastapi import Depends, FastAPI
 from starlette.testclient import TestClient
 
 from app.core.authorization import PermissionId, PermissionScope
-from app.core.authorization.dependencies import PermissionResourceContext, require_permission
+from app.core.authorization.dependencies import (
+    PermissionResourceContext,
+    require_permission,
+    require_permissions,
+)
 from app.core.config.settings import AuthSettings
 from app.core.errors.setup.handlers import configure_exception_handlers
 from app.core.setup.dependencies import get_auth_service
@@ -28,6 +34,9 @@ def _build_scoped_auth_service(
     repository.create_user = AsyncMock()
     repository.update_user = AsyncMock()
     repository.get_user_permission_scope = AsyncMock(return_value=granted_scope)
+    repository.get_user_permission_scopes = AsyncMock(
+        side_effect=lambda user_id, permission_ids: dict.fromkeys(permission_ids, granted_scope)
+    )
     repository.user_has_permission = AsyncMock()
 
     unit_of_work = MagicMock()
@@ -46,6 +55,36 @@ def _build_scoped_auth_service(
     )
 
 
+def _add_batch_scope_routes(app: FastAPI, conditional_policy: Callable[..., Awaitable[bool]]) -> None:
+    batch_permission_check = require_permissions(
+        PermissionId.ROLE_MANAGE,
+        PermissionId.USER_MANAGE,
+        required_scope=PermissionScope.ANY,
+    )
+
+    @app.get("/scope/batch")
+    async def batch_scope_route(
+        _: Annotated[None, Depends(batch_permission_check)],
+        __: Annotated[None, Depends(require_permission(PermissionId.USER_MANAGE))],
+    ) -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/scope/batch/conditional/{conditional_allow}")
+    async def batch_conditional_route(
+        _: Annotated[
+            None,
+            Depends(
+                require_permissions(
+                    PermissionId.ROLE_MANAGE,
+                    PermissionId.USER_MANAGE,
+                    conditional_policy_dependency=conditional_policy,
+                )
+            ),
+        ],
+    ) -> dict[str, str]:
+        return {"status": "ok"}
+
+
 def _build_scoped_test_app() -> FastAPI:
     app = FastAPI()
     configure_request_context_middleware(app)
@@ -130,9 +169,34 @@ def _build_scoped_test_app() -> FastAPI:
     ) -> dict[str, str]:
         return {"status": "ok"}
 
+    _add_batch_scope_routes(app, conditional_policy)
     return app
 
 
+def _request_with_service(path: str, auth_service: AuthService) -> Any:
+    app = _build_scoped_test_app()
+    current_user = CurrentPrincipal(
+        id=10,
+        username="scope-user",
+        disabled=False,
+        tenant_id=7,
+    )
+
+    async def override_current_active_user() -> CurrentPrincipal:
+        return current_user
+
+    async def override_auth_service() -> AuthService:
+        return auth_service
+
+    app.dependency_overrides[get_current_active_user] = override_current_active_user
+    app.dependency_overrides[get_auth_service] = override_auth_service
+    try:
+        with TestClient(app) as client:
+            return client.get(path)
+    finally:
+        app.dependency_overrides.clear()
+
+
 def _request_with_scope(
     path: str,
     *,
@@ -277,3 +341,72 @@ def test_scoped_authorization_reuses_permission_lookup_within_request() -> None:
         user_id=10,
         permission_id=PermissionId.ROLE_PERMISSION_MANAGE,
     )
+
+
+def test_require_permissions_resolves_all_permissions_with_one_lookup_and_prefills_request_cache() -> None:
+    permission_scope_cache: dict[tuple[int, str], str | None] = {}
+    auth_service = _build_scoped_auth_service(PermissionScope.ANY, permission_scope_cache=permission_scope_cache)
+
+    with patch("app.core.authorization.dependencies.logger") as authz_logger:
+        response = _request_with_service("/scope/batch", auth_service)
+
+    assert response.status_code == HTTPStatus.OK
+    repository = cast(MagicMock, auth_service.auth_repository)
+    repository.get_user_permission_scopes.assert_awaited_once_with(
+        user_id=10,
+        permission_ids=(PermissionId.ROLE_MANAGE, PermissionId.USER_MANAGE),
+    )
+    repository.get_user_permission_scope.assert_not_awaited()
+    assert permission_scope_cache == {
+        (10, PermissionId.ROLE_MANAGE): PermissionScope.ANY,
+        (10, PermissionId.USER_MANAGE): PermissionScope.ANY,
+    }
+    assert [log_call.args[5] for log_call in authz_logger.info.call_args_list] == ["allow", "allow", "allow"]
+
+
+def test_require_permissions_denies_with_every_missing_permission() -> None:
+    auth_service = _build_scoped_auth_service(None)
+    repository = cast(MagicMock, auth_service.auth_repository)
+    repository.get_user_permission_scopes.side_effect = None
+    repository.get_user_permission_scopes.return_value = {
+        PermissionId.ROLE_MANAGE: None,
+        PermissionId.USER_MANAGE: PermissionScope.ANY,
+    }
+
+    response = _request_with_service("/scope/batch", auth_service)
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert_error_response(
+        response,
+        detail=f"Missing required permission: {PermissionId.ROLE_MANAGE}",
+        status_code=HTTPStatus.FORBIDDEN,
+        code="forbidden",
+        meta={
+            "permission_id": PermissionId.ROLE_MANAGE,
+            "permission_ids": [PermissionId.ROLE_MANAGE],
+        },
+    )
+
+
+def test_require_permissions_applies_conditional_policy_after_grants() -> None:
+    auth_service = _build_scoped_auth_service(PermissionScope.ANY)
+
+    allowed_response = _request_with_service("/scope/batch/conditional/true", auth_service)
+    denied_response = _request_with_service("/scope/batch/conditional/false", auth_service)
+
+    assert allowed_response.status_code == HTTPStatus.OK
+    assert_error_response(
+        denied_response,
+        detail=f"Conditional policy denied access: {PermissionId.ROLE_MANAGE}, {PermissionId.USER_MANAGE}",
+        status_code=HTTPStatus.FORBIDDEN,
+        code="forbidden",
+        meta={
+            "permission_ids": [PermissionId.ROLE_MANAGE, PermissionId.USER_MANAGE],
+            "authorization_stage": "conditional_policy",
+        },
+    )
+
+
+def test_require_permissions_requires_at_least_one_permission() -> None:
+    with pytest.raises(ValueError, match="at least one permission id"):
+        require_permissions()
@@ -6,6 +6,8 @@ from sqlalchemy import select
 from starlette.testclient import TestClient
 
 from app.core.authorization import PERMISSION_SPECS, PermissionId
+from app.features.audit_log.writer import AuditLogWriter
+from app.features.auth.models import User
 from app.features.rbac.models import Role, RoleInheritance, RolePermission, UserRole
 from utils.testing_support.api_assertions import assert_error_response
 from utils.testing_support.database import MockDatabase
@@ -718,3 +720,246 @@ def test_rbac_admin_not_found_matrix(mock_client: TestClient) -> None:
             code="not_found",
             meta=case["meta"],
         )
+
+
+async def _get_user_rbac_version(mock_database: MockDatabase, user_id: int) -> int | None:
+    async with mock_database.Session() as session:
+        return await session.scalar(select(User.rbac_version).where(User.id == user_id))
+
+
+def test_rbac_writes_bump_rbac_version_of_affected_users_only(
+    mock_client: TestClient,
+    mock_database: MockDatabase,
+) -> None:
+    admin_headers = _admin_headers(mock_client)
+    reader_headers = _auth_headers(mock_client, "reader_user", "reader123")
+    admin_version = asyncio.run(_get_user_rbac_version(mock_database, 1))
+    reader_version = asyncio.run(_get_user_rbac_version(mock_database, 3))
+    assert reader_version is not None
+
+    parent_role_response = mock_client.post("/v1/rbac/roles", json={"name": "version_parent"}, headers=admin_headers)
+    assert parent_role_response.status_code == HTTPStatus.CREATED
+    parent_role_id = parent_role_response.json()["id"]
+
+    inherit_response = mock_client.put(f"/v1/rbac/roles/2/inherits/{parent_role_id}", headers=admin_headers)
+    assert inherit_response.status_code == HTTPStatus.NO_CONTENT
+    assert asyncio.run(_get_user_rbac_version(mock_database, 3)) == reader_version + 1
+    assert mock_client.get("/v1/users/me", headers=reader_headers).status_code == HTTPStatus.UNAUTHORIZED
+
+    reader_headers = _auth_headers(mock_client, "reader_user", "reader123")
+    permission_response = mock_client.put(
+        f"/v1/rbac/roles/{parent_role_id}/permissions/{PermissionId.AUDIT_LOG_READ}",
+        json={"scope": "any"},
+        headers=admin_headers,
+    )
+    assert permission_response.status_code == HTTPStatus.OK
+    assert asyncio.run(_get_user_rbac_version(mock_database, 3)) == reader_version + 2
+    assert mock_client.get("/v1/users/me", headers=reader_headers).status_code == HTTPStatus.UNAUTHORIZED
+
+    reader_headers = _auth_headers(mock_client, "reader_user", "reader123")
+    unchanged_response = mock_client.put(
+        f"/v1/rbac/roles/{parent_role_id}/permissions/{PermissionId.AUDIT_LOG_READ}",
+        json={"scope": "any"},
+        headers=admin_headers,
+    )
+    assert unchanged_response.status_code == HTTPStatus.OK
+    assert mock_client.get("/v1/users/me", headers=reader_headers).status_code == HTTPStatus.OK
+
+    delete_response = mock_client.delete(f"/v1/rbac/roles/{parent_role_id}", headers=admin_headers)
+    assert delete_response.status_code == HTTPStatus.NO_CONTENT
+    assert asyncio.run(_get_user_rbac_version(mock_database, 3)) == reader_version + 3
+    assert asyncio.run(_get_user_rbac_version(mock_database, 1)) == admin_version
+    assert mock_client.get("/v1/users/me", headers=admin_headers).status_code == HTTPStatus.OK
+
+
+def test_rbac_writes_keep_effective_permissions_in_sync(mock_client: TestClient) -> None:
+    admin_headers = _admin_headers(mock_client)
+
+    def reader_permissions() -> list[str]:
+        response = mock_client.get(
+            "/v1/users/me",
+            headers=_auth_headers(mock_client, "reader_user", "reader123"),
+        )
+        assert response.status_code == HTTPStatus.OK
+        return response.json()["permissions"]
+
+    grandparent_response = mock_client.post("/v1/rbac/roles", json={"name": "sync_root"}, headers=admin_headers)
+    parent_response = mock_client.post("/v1/rbac/roles", json={"name": "sync_middle"}, headers=admin_headers)
+    grandparent_role_id = grandparent_response.json()["id"]
+    parent_role_id = parent_response.json()["id"]
+    assert (
+        mock_client.put(
+            f"/v1/rbac/roles/{grandparent_role_id}/permissions/{PermissionId.USER_MANAGE}",
+            json={"scope": "tenant"},
+            headers=admin_headers,
+        ).status_code
+        == HTTPStatus.OK
+    )
+    assert (
+        mock_client.put(
+            f"/v1/rbac/roles/{parent_role_id}/inherits/{grandparent_role_id}",
+            headers=admin_headers,
+        ).status_code
+        == HTTPStatus.NO_CONTENT
+    )
+    assert reader_permissions() == []
+
+    assert (
+        mock_client.put(
+            f"/v1/rbac/roles/2/inherits/{parent_role_id}",
+            headers=admin_headers,
+        ).status_code
+        == HTTPStatus.NO_CONTENT
+    )
+    assert reader_permissions() == [PermissionId.USER_MANAGE]
+
+    assert (
+        mock_client.delete(
+            f"/v1/rbac/roles/{grandparent_role_id}/permissions/{PermissionId.USER_MANAGE}",
+            headers=admin_headers,
+        ).status_code
+        == HTTPStatus.NO_CONTENT
+    )
+    assert reader_permissions() == []
+
+    assert (
+        mock_client.put(
+            f"/v1/rbac/roles/{parent_role_id}/permissions/{PermissionId.ROLE_MANAGE}",
+            json={"scope": "any"},
+            headers=admin_headers,
+        ).status_code
+        == HTTPStatus.OK
+    )
+    assert reader_permissions() == [PermissionId.ROLE_MANAGE]
+
+    assert mock_client.delete(f"/v1/rbac/roles/{parent_role_id}", headers=admin_headers).status_code == (
+        HTTPStatus.NO_CONTENT
+    )
+    assert reader_permissions() == []
+    assert mock_client.delete(f"/v1/rbac/roles/{grandparent_role_id}", headers=admin_headers).status_code == (
+        HTTPStatus.NO_CONTENT
+    )
+
+
+def _collect_pages(mock_client: TestClient, path: str, *, limit: int, **filters: str) -> tuple[list[Any], int]:
+    headers = _admin_headers(mock_client)
+    items: list[Any] = []
+    page_count = 0
+    params: dict[str, str | int] = {"limit": limit, **filters}
+    while True:
+        response = mock_client.get(path, params=params, headers=headers)
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()) <= limit
+        items.extend(response.json())
+        page_count += 1
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            return items, page_count
+        params = {"limit": limit, "cursor": next_cursor, **filters}
+
+
+def test_rbac_list_endpoints_support_keyset_pagination(mock_client: TestClient) -> None:
+    admin_headers = _admin_headers(mock_client)
+    for index in range(3):
+        assert (
+            mock_client.post(
+                "/v1/rbac/users",
+                json={"username": f"paged_user_{index}", "password": "StrongPass1", "role_ids": [2]},
+                headers=admin_headers,
+            ).status_code
+            == HTTPStatus.CREATED
+        )
+
+    for path in ("/v1/rbac/users", "/v1/rbac/roles", "/v1/rbac/roles/2/users", "/v1/rbac/users/1/roles"):
+        full_response = mock_client.get(path, headers=admin_headers)
+        assert full_response.status_code == HTTPStatus.OK
+        assert "X-Next-Cursor" not in full_response.headers
+
+        paged_items, page_count = _collect_pages(mock_client, path, limit=2)
+
+        assert paged_items == full_response.json()
+        assert page_count == max(1, (len(paged_items) + 1) // 2)
+
+
+def test_rbac_list_endpoints_filter_users_and_roles_server_side(mock_client: TestClient) -> None:
+    admin_headers = _admin_headers(mock_client)
+    created_user_ids: dict[str, int] = {}
+    for username, role_ids in (("filter_alpha_one", [2]), ("filter_alpha_two", []), ("filter_beta", [2])):
+        create_response = mock_client.post(
+            "/v1/rbac/users",
+            json={"username": username, "password": "StrongPass1", "role_ids": role_ids},
+            headers=admin_headers,
+        )
+        assert create_response.status_code == HTTPStatus.CREATED
+        created_user_ids[username] = create_response.json()["id"]
+
+    def list_usernames(path: str, **params: Any) -> list[str]:
+        response = mock_client.get(path, params=params, headers=admin_headers)
+        assert response.status_code == HTTPStatus.OK
+        return [item.get("username", item.get("name")) for item in response.json()]
+
+    assert list_usernames("/v1/rbac/users", q="ALPHA") == ["filter_alpha_one", "filter_alpha_two"]
+    assert list_usernames("/v1/rbac/users", q="er_al", role_id=2) == ["filter_alpha_one"]
+    assert list_usernames("/v1/rbac/users", q="re") == ["reader_user"]
+    assert list_usernames("/v1/rbac/users", q="%") == []
+    assert "disabled_user" in list_usernames("/v1/rbac/users", disabled=True)
+    assert "admin" not in list_usernames("/v1/rbac/users", disabled=True)
+    assert list_usernames("/v1/rbac/users", tenant_id=7) == []
+    assert list_usernames("/v1/rbac/roles", q="ER_RO") == ["reader_role"]
+    assert list_usernames("/v1/rbac/roles", q="ad") == ["admin_role"]
+
+    paged_items, page_count = _collect_pages(mock_client, "/v1/rbac/users", limit=2, q="filter_")
+    assert [item["id"] for item in paged_items] == [
+        created_user_ids["filter_alpha_one"],
+        created_user_ids["filter_alpha_two"],
+        created_user_ids["filter_beta"],
+    ]
+    assert page_count == 2
+
+    invalid_filter_response = mock_client.get("/v1/rbac/users", params={"role_id": 0}, headers=admin_headers)
+    assert invalid_filter_response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_rbac_list_endpoints_reject_invalid_pagination(mock_client: TestClient) -> None:
+    admin_headers = _admin_headers(mock_client)
+
+    invalid_cursor_response = mock_client.get(
+        "/v1/rbac/users",
+        params={"cursor": "not-a-cursor"},
+        headers=admin_headers,
+    )
+    assert_error_response(
+        invalid_cursor_response,
+        detail="Invalid pagination cursor",
+        status_code=HTTPStatus.BAD_REQUEST,
+        code="invalid_input",
+        meta={"cursor": "not-a-cursor"},
+    )
+
+    invalid_limit_response = mock_client.get("/v1/rbac/roles", params={"limit": 0}, headers=admin_headers)
+    assert invalid_limit_response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_rbac_writes_record_audit_log_entries_for_acting_admin(
+    mock_client: TestClient,
+    mock_audit_log_writer: AuditLogWriter,
+) -> None:
+    headers = _admin_headers(mock_client)
+    create_response = mock_client.post("/v1/rbac/roles", headers=headers, json={"name": "audited_role"})
+    assert create_response.status_code == HTTPStatus.CREATED
+    role_id = create_response.json()["id"]
+    delete_response = mock_client.delete(f"/v1/rbac/roles/{role_id}", headers=headers)
+    assert delete_response.status_code == HTTPStatus.NO_CONTENT
+
+    mock_client.portal.call(mock_audit_log_writer.flush)
+    audit_response = mock_client.get("/v1/audit-log", headers=headers, params={"resource_type": "role"})
+
+    assert audit_response.status_code == HTTPStatus.OK
+    assert [
+        (entry["action"], entry["actor_user_id"], entry["summary"])
+        for entry in audit_response.json()
+        if entry["resource_id"] == str(role_id) and entry["summary"].endswith("audited_role")
+    ] == [
+        ("role.deleted", 1, "Deleted role audited_role"),
+        ("role.created", 1, "Created role audited_role"),
+    ]
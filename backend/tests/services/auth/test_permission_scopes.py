@@ -129,3 +129,67 @@ def test_user_has_permission_reuses_cached_grant_for_same_permission() -> None:
         assert permission_evaluator.is_granted_scope_allowed.call_count == 2
 
     asyncio.run(run_test())
+
+
+def test_user_has_permissions_loads_every_missing_grant_in_one_lookup_and_fills_cache() -> None:
+    permission_scope_cache: dict[tuple[int, str], str | None] = {
+        (5, PermissionId.USER_MANAGE): PermissionScope.TENANT,
+    }
+    service, repository = build_service(
+        permission_evaluator=PermissionEvaluator(),
+        permission_scope_cache=permission_scope_cache,
+    )
+    repository.get_user_permission_scopes.return_value = {
+        PermissionId.ROLE_MANAGE: PermissionScope.ANY,
+        PermissionId.ROLE_PERMISSION_MANAGE: None,
+    }
+
+    async def run_test() -> None:
+        decisions = await service.user_has_permissions(
+            user_id=5,
+            permission_ids=(
+                PermissionId.USER_MANAGE,
+                PermissionId.ROLE_MANAGE,
+                PermissionId.ROLE_PERMISSION_MANAGE,
+                PermissionId.ROLE_MANAGE,
+            ),
+            required_scope=PermissionScope.TENANT,
+            user_tenant_id=9,
+            resource_tenant_id=9,
+        )
+
+        assert decisions == {
+            PermissionId.USER_MANAGE: True,
+            PermissionId.ROLE_MANAGE: True,
+            PermissionId.ROLE_PERMISSION_MANAGE: False,
+        }
+        repository.get_user_permission_scopes.assert_awaited_once_with(
+            user_id=5,
+            permission_ids=(PermissionId.ROLE_MANAGE, PermissionId.ROLE_PERMISSION_MANAGE),
+        )
+        assert permission_scope_cache[(5, PermissionId.ROLE_MANAGE)] == PermissionScope.ANY
+        assert permission_scope_cache[(5, PermissionId.ROLE_PERMISSION_MANAGE)] is None
+
+        assert await service.user_has_permission(user_id=5, permission_id=PermissionId.ROLE_MANAGE) is True
+        repository.get_user_permission_scope.assert_not_awaited()
+        repository.get_user_permission_scopes.assert_awaited_once()
+
+    asyncio.run(run_test())
+
+
+def test_user_has_permissions_without_request_cache_still_uses_single_lookup() -> None:
+    service, repository = build_service(permission_evaluator=PermissionEvaluator())
+    repository.get_user_permission_scopes.return_value = {PermissionId.ROLE_MANAGE: PermissionScope.OWN}
+
+    async def run_test() -> None:
+        decisions = await service.user_has_permissions(
+            user_id=3,
+            permission_ids=(PermissionId.ROLE_MANAGE, PermissionId.USER_MANAGE),
+            required_scope=PermissionScope.OWN,
+            resource_owner_id=3,
+        )
+
+        assert decisions == {PermissionId.ROLE_MANAGE: True, PermissionId.USER_MANAGE: False}
+        repository.get_user_permission_scopes.assert_awaited_once()
+
+    asyncio.run(run_test())
@@ -1,10 +1,11 @@
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.core.errors.repositories import RepositoryConflictError
 from app.core.errors.services import ConflictError, ForbiddenError, UnauthorizedError
+from app.core.security.service import ARGON2_COST_PROFILES, Argon2PasswordService
 from app.features.auth.schemas import LoginCommand, RegisterUserCommand
 from utils.testing_support.auth_service import assert_unit_of_work_scope_committed, build_service, build_user
 
@@ -67,6 +68,7 @@ def test_login_returns_bearer_token_for_authenticated_user() -> None:
         encode_access_token.assert_called_once_with(
             subject="john",
             rbac_version="0" * 64,
+            stateless_claims=None,
         )
 
     asyncio.run(run_test())
@@ -119,7 +121,8 @@ def test_register_creates_user_and_returns_authenticated_user() -> None:
         assert created_kwargs["disabled"] is False
         assert created_kwargs["hashed_password"] != registration.password
         assert (
-            service.password_service.verify_password(registration.password, created_kwargs["hashed_password"]) is True
+            await service.password_service.verify_password(registration.password, created_kwargs["hashed_password"])
+            is True
         )
 
     asyncio.run(run_test())
@@ -169,3 +172,31 @@ def test_register_propagates_repository_conflict_from_create() -> None:
         assert exc_info.value.details == {"username": "john"}
 
     asyncio.run(run_test())
+
+
+def test_login_schedules_rehash_when_stored_hash_uses_outdated_parameters() -> None:
+    password_rehasher = MagicMock()
+    service, repository = build_service(
+        password_service=Argon2PasswordService(cost_profile=ARGON2_COST_PROFILES["low"]),
+        password_rehasher=password_rehasher,
+    )
+    user = build_user(service)
+    repository.get_by_username.return_value = user
+
+    asyncio.run(service.login(LoginCommand(username="john", password="StrongPass1")))
+
+    password_rehasher.schedule.assert_called_once_with(
+        user_id=1,
+        plain_password="StrongPass1",  # pragma: allowlist secret
+        current_hash=user.hashed_password,
+    )
+
+
+def test_login_skips_rehash_when_stored_hash_matches_current_parameters() -> None:
+    password_rehasher = MagicMock()
+    service, repository = build_service(password_rehasher=password_rehasher)
+    repository.get_by_username.return_value = build_user(service)
+
+    asyncio.run(service.login(LoginCommand(username="john", password="StrongPass1")))
+
+    password_rehasher.schedule.assert_not_called()
@@ -0,0 +1,157 @@
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.core.authorization import PERMISSION_BITSET_VERSION, PermissionId, PermissionScope, encode_permission_scopes
+from app.core.common.records import UserTokenWatermarkRecord
+from app.core.errors.services import UnauthorizedError
+from app.features.auth.principal import CurrentPrincipal
+from app.features.auth.schemas import AccessTokenPayload, LoginCommand
+from utils.testing_support.auth_service import build_service, build_user
+
+
+class _FakeTokenWatermarks:
+    def __init__(self, *, fresh: bool = True, entries: dict[int, UserTokenWatermarkRecord] | None = None) -> None:
+        self.fresh = fresh
+        self.entries = entries or {}
+
+    def is_fresh(self) -> bool:
+        return self.fresh
+
+    def get(self, user_id: int) -> UserTokenWatermarkRecord | None:
+        return self.entries.get(user_id)
+
+
+def _build_stateless_payload(
+    *,
+    rbac_version: str = "1",
+    perm: str = "c",
+    pbv: str = PERMISSION_BITSET_VERSION,
+) -> AccessTokenPayload:
+    return AccessTokenPayload(
+        sub="john",
+        iss="unit-test-issuer",
+        aud="unit-test-audience",
+        iat=123456700,
+        exp=123456789,
+        jti="token-123",
+        rbac_version=rbac_version,
+        uid=1,
+        tid=7,
+        dis=False,
+        perm=perm,
+        pbv=pbv,
+    )
+
+
+def _build_watermark(*, rbac_version: str) -> UserTokenWatermarkRecord:
+    return UserTokenWatermarkRecord(
+        id=1,
+        username="john",
+        disabled=False,
+        tenant_id=7,
+        rbac_version=rbac_version,
+        updated_at=datetime(2026, 5, 12, tzinfo=UTC),
+    )
+
+
+def test_login_embeds_principal_and_permission_bitset_when_stateless_tokens_are_enabled() -> None:
+    service, repository = build_service(stateless_tokens=True)
+    repository.get_by_username.return_value = build_user(service, tenant_id=7)
+    repository.get_rbac_version.return_value = "3"
+    repository.get_user_permission_bitset.return_value = encode_permission_scopes(
+        {PermissionId.ROLE_MANAGE: PermissionScope.TENANT}
+    )
+
+    async def run_test() -> None:
+        token = await service.login(LoginCommand(username="john", password="StrongPass1"))
+        payload = service.token_service.decode_access_token(token.access_token)
+
+        assert payload is not None
+        assert payload.rbac_version == "3"
+        assert payload.stateless_claims is not None
+        assert payload.stateless_claims.model_dump() == {
+            "uid": 1,
+            "tid": 7,
+            "dis": False,
+            "perm": "8",
+            "pbv": PERMISSION_BITSET_VERSION,
+        }
+
+    asyncio.run(run_test())
+
+
+def test_stateless_token_resolves_principal_and_permissions_without_repository_reads() -> None:
+    permission_scope_cache: dict[tuple[int, str], str | None] = {}
+    service, repository = build_service(
+        stateless_tokens=True,
+        token_watermarks=_FakeTokenWatermarks(),
+        permission_scope_cache=permission_scope_cache,
+    )
+
+    async def run_test() -> None:
+        # "c" grants roles:manage with scope any and nothing else.
+        with patch.object(
+            service.token_service, "decode_access_token", return_value=_build_stateless_payload(perm="c")
+        ):
+            principal = await service.get_user_from_token("stateless-token")
+
+        decisions = await service.user_has_permissions(
+            user_id=principal.id,
+            permission_ids=(PermissionId.ROLE_MANAGE, PermissionId.AUDIT_LOG_READ),
+        )
+
+        assert principal == CurrentPrincipal(id=1, username="john", disabled=False, tenant_id=7)
+        assert decisions == {PermissionId.ROLE_MANAGE: True, PermissionId.AUDIT_LOG_READ: False}
+        repository.get_by_username.assert_not_awaited()
+        repository.get_rbac_version.assert_not_awaited()
+        repository.get_user_permission_scopes.assert_not_awaited()
+
+    asyncio.run(run_test())
+
+
+def test_stateless_token_falls_back_to_database_when_user_changed_since_issue() -> None:
+    service, repository = build_service(
+        stateless_tokens=True,
+        token_watermarks=_FakeTokenWatermarks(entries={1: _build_watermark(rbac_version="2")}),
+    )
+    repository.get_by_username.return_value = build_user(service)
+    repository.get_rbac_version.return_value = "2"
+
+    async def run_test() -> None:
+        with (
+            patch.object(service.token_service, "decode_access_token", return_value=_build_stateless_payload()),
+            pytest.raises(UnauthorizedError),
+        ):
+            await service.get_user_from_token("revoked-token")
+
+        repository.get_by_username.assert_awaited_once_with("john")
+
+    asyncio.run(run_test())
+
+
+@pytest.mark.parametrize(
+    ("token_watermarks", "payload"),
+    [
+        (_FakeTokenWatermarks(fresh=False), _build_stateless_payload()),
+        (_FakeTokenWatermarks(), _build_stateless_payload(pbv="00000000")),
+    ],
+)
+def test_stateless_token_falls_back_to_database_when_watermarks_are_stale_or_catalog_differs(
+    token_watermarks: _FakeTokenWatermarks,
+    payload: AccessTokenPayload,
+) -> None:
+    service, repository = build_service(stateless_tokens=True, token_watermarks=token_watermarks)
+    repository.get_by_username.return_value = build_user(service)
+    repository.get_rbac_version.return_value = "1"
+
+    async def run_test() -> None:
+        with patch.object(service.token_service, "decode_access_token", return_value=payload):
+            principal = await service.get_user_from_token("stateless-token")
+
+        assert principal.username == "john"
+        repository.get_by_username.assert_awaited_once_with("john")
+
+    asyncio.run(run_test())
@@ -3,6 +3,9 @@ from unittest.mock import patch
 
 import pytest
 
+from app.core.authorization import PermissionId, PermissionScope, encode_permission_scopes
+from app.core.authorization.snapshot_cache import AuthorizationSnapshot, AuthorizationSnapshotCache
+from app.core.common.records import UserRecord
 from app.core.errors.services import UnauthorizedError
 from app.features.auth.principal import CurrentPrincipal
 from app.features.auth.schemas import AccessTokenPayload
@@ -93,3 +96,72 @@ def test_get_user_from_token_raises_when_rbac_version_changed() -> None:
         repository.get_rbac_version.assert_awaited_once_with(1)
 
     asyncio.run(run_test())
+
+
+def _build_snapshot_cache() -> AuthorizationSnapshotCache:
+    return AuthorizationSnapshotCache(ttl_seconds=60, max_entries=10)
+
+
+def test_get_user_from_token_serves_cached_snapshot_without_repository_reads() -> None:
+    cache = _build_snapshot_cache()
+    service, repository = build_service(authorization_snapshot_cache=cache)
+    payload = build_access_token_payload()
+    repository.get_by_username.return_value = build_user(service, username="john")
+
+    async def run_test() -> None:
+        with patch.object(service.token_service, "decode_access_token", return_value=payload):
+            first_user = await service.get_user_from_token("valid-token")
+            second_user = await service.get_user_from_token("valid-token")
+
+        assert first_user == second_user
+        assert len(cache) == 1
+        repository.get_by_username.assert_awaited_once_with("john")
+        repository.get_rbac_version.assert_awaited_once_with(1)
+
+    asyncio.run(run_test())
+
+
+def test_get_user_from_token_reloads_snapshot_when_cached_rbac_version_differs() -> None:
+    cache = _build_snapshot_cache()
+    service, repository = build_service(authorization_snapshot_cache=cache)
+    user = build_user(service, username="john")
+    cache.store(AuthorizationSnapshot(user=UserRecord.from_domain(user), rbac_version="1" * 64))
+    repository.get_by_username.return_value = user
+
+    async def run_test() -> None:
+        with patch.object(service.token_service, "decode_access_token", return_value=build_access_token_payload()):
+            principal = await service.get_user_from_token("valid-token")
+
+        assert principal.username == "john"
+        repository.get_rbac_version.assert_awaited_once_with(1)
+        cached_snapshot = cache.get_by_username("john")
+        assert cached_snapshot is not None
+        assert cached_snapshot.rbac_version == "0" * 64
+
+    asyncio.run(run_test())
+
+
+def test_get_user_from_token_prefills_request_permission_cache_from_snapshot_bitset() -> None:
+    permission_scope_cache: dict[tuple[int, str], str | None] = {}
+    service, repository = build_service(
+        authorization_snapshot_cache=_build_snapshot_cache(),
+        permission_scope_cache=permission_scope_cache,
+    )
+    repository.get_by_username.return_value = build_user(service, username="john")
+    repository.get_user_permission_bitset.return_value = encode_permission_scopes(
+        {PermissionId.USER_MANAGE: PermissionScope.ANY}
+    )
+
+    async def run_test() -> None:
+        with patch.object(service.token_service, "decode_access_token", return_value=build_access_token_payload()):
+            principal = await service.get_user_from_token("valid-token")
+
+        can_manage_users = await service.user_has_permission(principal.id, PermissionId.USER_MANAGE)
+        can_read_audit_log = await service.user_has_permission(principal.id, PermissionId.AUDIT_LOG_READ)
+
+        assert (can_manage_users, can_read_audit_log) == (True, False)
+        assert permission_scope_cache[(1, PermissionId.USER_MANAGE)] == PermissionScope.ANY
+        repository.get_user_permission_bitset.assert_awaited_once_with(1)
+        repository.get_user_permission_scope.assert_not_awaited()
+
+    asyncio.run(run_test())
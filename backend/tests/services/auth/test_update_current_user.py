@@ -1,5 +1,5 @@
 import asyncio
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -67,48 +67,53 @@ def test_build_password_change_validates_current_and_new_password() -> None:
     service, _ = build_service()
     current_user = build_user(service, username="john", password="StrongPass1")
 
-    assert service._build_password_change(current_user, UpdateCurrentUserCommand(username="john"), "john") == {}
-
-    with pytest.raises(InvalidInputError) as missing_current:
-        service._build_password_change(
-            current_user,
-            UpdateCurrentUserCommand(new_password="AnotherPass1"),  # pragma: allowlist secret
-            "john",
+    async def run_test() -> None:
+        assert (
+            await service._build_password_change(current_user, UpdateCurrentUserCommand(username="john"), "john") == {}
         )
-    assert "current_password is required" in str(missing_current.value)
 
-    with pytest.raises(UnauthorizedError) as invalid_current:
-        service._build_password_change(
-            current_user,
-            UpdateCurrentUserCommand(
-                current_password="WrongPass1",  # pragma: allowlist secret
-                new_password="AnotherPass1",  # pragma: allowlist secret
-            ),
-            "john",
-        )
-    assert "Current password is invalid" in str(invalid_current.value)
+        with pytest.raises(InvalidInputError) as missing_current:
+            await service._build_password_change(
+                current_user,
+                UpdateCurrentUserCommand(new_password="AnotherPass1"),  # pragma: allowlist secret
+                "john",
+            )
+        assert "current_password is required" in str(missing_current.value)
 
-    with pytest.raises(InvalidInputError) as same_password:
-        service._build_password_change(
+        with pytest.raises(UnauthorizedError) as invalid_current:
+            await service._build_password_change(
+                current_user,
+                UpdateCurrentUserCommand(
+                    current_password="WrongPass1",  # pragma: allowlist secret
+                    new_password="AnotherPass1",  # pragma: allowlist secret
+                ),
+                "john",
+            )
+        assert "Current password is invalid" in str(invalid_current.value)
+
+        with pytest.raises(InvalidInputError) as same_password:
+            await service._build_password_change(
+                current_user,
+                UpdateCurrentUserCommand(
+                    current_password="StrongPass1",  # pragma: allowlist secret
+                    new_password="StrongPass1",  # pragma: allowlist secret
+                ),
+                "john",
+            )
+        assert "New password must be different from current password" in str(same_password.value)
+
+        changes = await service._build_password_change(
             current_user,
             UpdateCurrentUserCommand(
                 current_password="StrongPass1",  # pragma: allowlist secret
-                new_password="StrongPass1",  # pragma: allowlist secret
+                new_password="AnotherPass1",  # pragma: allowlist secret
             ),
             "john",
         )
-    assert "New password must be different from current password" in str(same_password.value)
-
-    changes = service._build_password_change(
-        current_user,
-        UpdateCurrentUserCommand(
-            current_password="StrongPass1",  # pragma: allowlist secret
-            new_password="AnotherPass1",  # pragma: allowlist secret
-        ),
-        "john",
-    )
-    assert "hashed_password" in changes
-    assert service.password_service.verify_password("AnotherPass1", changes["hashed_password"]) is True
+        assert "hashed_password" in changes
+        assert await service.password_service.verify_password("AnotherPass1", changes["hashed_password"]) is True
+
+    asyncio.run(run_test())
 
 
 def test_persist_user_changes_propagates_repository_conflict_for_username_change() -> None:
@@ -183,9 +188,29 @@ def test_update_current_user_persists_username_and_password_changes() -> None:
         repository.username_exists.assert_awaited_once_with("new.user", exclude_user_id=9)
         repository.update_user.assert_awaited_once()
         assert_unit_of_work_scope_committed(service.unit_of_work)
-        update_kwargs = repository.update_user.await_args.kwargs
-        assert update_kwargs["username"] == "new.user"
-        assert service.password_service.verify_password("AnotherPass1", update_kwargs["hashed_password"]) is True
+        assert repository.update_user.await_args.kwargs == {"username": "new.user"}
+        replace_kwargs = repository.replace_password_hash.await_args.kwargs
+        assert replace_kwargs["current_hash"] == current_user.hashed_password
+        assert await service.password_service.verify_password("AnotherPass1", replace_kwargs["new_hash"]) is True
+
+    asyncio.run(run_test())
+
+
+def test_update_current_user_raises_conflict_when_password_changed_concurrently() -> None:
+    service, repository = build_service()
+    current_user = build_user(service, user_id=9, username="john", password="StrongPass1")
+    repository.get_by_username.return_value = current_user
+    repository.replace_password_hash.return_value = False
+    update_data = UpdateCurrentUserCommand(
+        current_password="StrongPass1",  # pragma: allowlist secret
+        new_password="AnotherPass1",  # pragma: allowlist secret
+    )
+
+    async def run_test() -> None:
+        with pytest.raises(ConflictError, match="Password was changed by another request"):
+            await service.update_current_user(current_user, update_data)
+
+        repository.update_user.assert_not_awaited()
 
     asyncio.run(run_test())
 
@@ -249,3 +274,18 @@ def test_update_current_user_raises_unauthorized_when_principal_user_is_missing(
             await service.update_current_user(principal, update_data)
 
     asyncio.run(run_test())
+
+
+def test_update_current_user_invalidates_authorization_snapshot() -> None:
+    snapshot_cache = MagicMock()
+    service, repository = build_service(authorization_snapshot_cache=snapshot_cache)
+    current_user = build_user(service, user_id=9, username="john")
+    repository.get_by_username.return_value = current_user
+    repository.update_user.return_value = build_user(service, user_id=9, username="new.user")
+
+    async def run_test() -> None:
+        await service.update_current_user(current_user, UpdateCurrentUserCommand(username="new.user"))
+
+        snapshot_cache.invalidate_user.assert_called_once_with(9)
+
+    asyncio.run(run_test())
@@ -0,0 +1,211 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.integration import EnqueueJobCommand
+from app.core.db.uow import UnitOfWork
+from app.features.jobs.models import JobStatus
+from app.features.jobs.repository import JobRepository
+from app.features.jobs.schemas import JobRecord
+from app.features.jobs.worker import JobWorker
+from utils.testing_support.database import MockDatabase
+
+_CPU_BOUND_PAYLOADS: list[dict[str, Any]] = []
+
+
+def _record_cpu_bound_payload(payload: dict[str, Any]) -> None:
+    _CPU_BOUND_PAYLOADS.append(payload)
+
+
+class ManualClock:
+    def __init__(self) -> None:
+        self.now = datetime.now(UTC) + timedelta(seconds=1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+async def _enqueue(mock_database: MockDatabase, *jobs: EnqueueJobCommand) -> list[int]:
+    async with mock_database.Session() as session:
+        repository = JobRepository(session=session)
+        async with UnitOfWork(session=session):
+            records = [
+                await repository.create_job(
+                    job_name=job.job_name,
+                    payload=job.payload,
+                    priority=job.priority,
+                    max_attempts=job.max_attempts,
+                )
+                for job in jobs
+            ]
+    return [record.id for record in records]
+
+
+async def _get_job(mock_database: MockDatabase, job_id: int) -> JobRecord:
+    async with mock_database.Session() as session:
+        job = await JobRepository(session=session).get_job(job_id)
+    assert job is not None
+    return job
+
+
+def test_job_worker_runs_retries_and_fails_jobs(mock_database: MockDatabase) -> None:
+    handled: list[dict[str, Any]] = []
+    flaky_calls = 0
+
+    async def handle_ok(payload: dict[str, Any]) -> None:
+        handled.append(payload)
+
+    async def handle_flaky(payload: dict[str, Any]) -> None:
+        nonlocal flaky_calls
+        flaky_calls += 1
+        if flaky_calls == 1:
+            raise RuntimeError("transient")
+
+    async def handle_broken(payload: dict[str, Any]) -> None:
+        raise ValueError("always broken")
+
+    async def run_test() -> None:
+        ok_id, flaky_id, broken_id, unknown_id, cpu_id = await _enqueue(
+            mock_database,
+            EnqueueJobCommand(job_name="worker.ok", payload={"n": 1}),
+            EnqueueJobCommand(job_name="worker.flaky", payload={}),
+            EnqueueJobCommand(job_name="worker.broken", payload={}, max_attempts=2),
+            EnqueueJobCommand(job_name="worker.unknown", payload={}),
+            EnqueueJobCommand(job_name="worker.cpu", payload={"password": "x"}, priority=10),
+        )
+        clock = ManualClock()
+        worker = JobWorker(
+            session_factory=mock_database.Session,
+            handlers={"worker.ok": handle_ok, "worker.flaky": handle_flaky, "worker.broken": handle_broken},
+            cpu_bound_handlers={"worker.cpu": _record_cpu_bound_payload},
+            concurrency=2,
+            retry_base_seconds=5.0,
+            clock=clock,
+        )
+
+        assert await worker.drain() == 5
+        assert (worker.metrics.succeeded_count, worker.metrics.retried_count, worker.metrics.failed_count) == (2, 2, 1)
+        assert handled == [{"n": 1}]
+        assert _CPU_BOUND_PAYLOADS == [{"password": "x"}]
+        unknown = await _get_job(mock_database, unknown_id)
+        assert (unknown.status, unknown.last_error) == (
+            JobStatus.FAILED,
+            "No handler registered for job 'worker.unknown'",
+        )
+        flaky = await _get_job(mock_database, flaky_id)
+        assert (flaky.status, flaky.last_error) == (JobStatus.QUEUED, "RuntimeError: transient")
+        assert flaky.run_at.replace(tzinfo=UTC) == clock.now + worker.retry_delay(1)
+
+        clock.advance(5)
+        assert await worker.drain() == 2
+        assert worker.metrics.processed_count == 7
+        assert (await _get_job(mock_database, flaky_id)).status == JobStatus.SUCCEEDED
+        broken = await _get_job(mock_database, broken_id)
+        assert (broken.status, broken.attempts, broken.last_error) == (JobStatus.FAILED, 2, "ValueError: always broken")
+        assert (await _get_job(mock_database, ok_id)).finished_at is not None
+        assert (await _get_job(mock_database, cpu_id)).status == JobStatus.SUCCEEDED
+
+    asyncio.run(run_test())
+
+
+def test_job_worker_fails_jobs_that_outlive_their_visibility_timeout(mock_database: MockDatabase) -> None:
+    async def handle_slow(payload: dict[str, Any]) -> None:
+        await asyncio.sleep(1)
+
+    async def run_test() -> None:
+        slow_id, abandoned_id = await _enqueue(
+            mock_database,
+            EnqueueJobCommand(job_name="worker.slow", payload={}, max_attempts=1),
+            EnqueueJobCommand(job_name="worker.abandoned", payload={}, max_attempts=1),
+        )
+        clock = ManualClock()
+        worker = JobWorker(
+            session_factory=mock_database.Session,
+            handlers={"worker.slow": handle_slow, "worker.abandoned": handle_slow},
+            concurrency=1,
+            visibility_timeout_seconds=0.05,
+            clock=clock,
+        )
+        # A worker that died mid-job leaves its claim behind until the visibility timeout expires.
+        async with mock_database.Session() as session, UnitOfWork(session=session):
+            await JobRepository(session=session).claim_next(visibility_timeout=timedelta(seconds=0.05), now=clock())
+        clock.advance(1)
+
+        assert await worker.drain() == 2
+
+        slow = await _get_job(mock_database, slow_id)
+        abandoned = await _get_job(mock_database, abandoned_id)
+        outcomes = {slow.job_name: slow.last_error, abandoned.job_name: abandoned.last_error}
+        assert {slow.status, abandoned.status} == {JobStatus.FAILED}
+        assert sorted(outcomes.values()) == ["TimeoutError: ", "Visibility timeout expired on the last attempt"]
+
+    asyncio.run(run_test())
+
+
+def test_job_worker_run_processes_jobs_until_stopped(mock_database: MockDatabase) -> None:
+    async def run_test() -> None:
+        stop_event = asyncio.Event()
+        handled: list[int] = []
+
+        async def handle(payload: dict[str, Any]) -> None:
+            handled.append(payload["n"])
+            asyncio.get_running_loop().call_later(0.05, stop_event.set)
+
+        (job_id,) = await _enqueue(mock_database, EnqueueJobCommand(job_name="worker.run", payload={"n": 7}))
+        worker = JobWorker(
+            session_factory=mock_database.Session,
+            handlers={"worker.run": handle},
+            concurrency=2,
+            poll_interval_seconds=0.01,
+            max_poll_interval_seconds=0.02,
+            clock=ManualClock(),
+        )
+
+        await asyncio.wait_for(worker.run(stop_event), timeout=5)
+
+        assert handled == [7]
+        assert (await _get_job(mock_database, job_id)).status == JobStatus.SUCCEEDED
+
+    asyncio.run(run_test())
+
+
+def test_job_worker_run_keeps_processing_after_a_transient_database_error(mock_database: MockDatabase) -> None:
+    async def run_test() -> None:
+        stop_event = asyncio.Event()
+        handled: list[int] = []
+        session_calls = 0
+
+        def flaky_session_factory() -> AsyncSession:
+            nonlocal session_calls
+            session_calls += 1
+            if session_calls == 1:
+                raise ConnectionError("database unavailable")
+            return mock_database.Session()
+
+        async def handle(payload: dict[str, Any]) -> None:
+            handled.append(payload["n"])
+            asyncio.get_running_loop().call_later(0.05, stop_event.set)
+
+        (job_id,) = await _enqueue(mock_database, EnqueueJobCommand(job_name="worker.run", payload={"n": 7}))
+        worker = JobWorker(
+            session_factory=flaky_session_factory,
+            handlers={"worker.run": handle},
+            concurrency=1,
+            poll_interval_seconds=0.01,
+            max_poll_interval_seconds=0.02,
+            clock=ManualClock(),
+        )
+
+        await asyncio.wait_for(worker.run(stop_event), timeout=5)
+
+        assert handled == [7]
+        assert worker.metrics.error_count == 1
+        assert worker.metrics.succeeded_count == 1
+        assert (await _get_job(mock_database, job_id)).status == JobStatus.SUCCEEDED
+
+    asyncio.run(run_test())
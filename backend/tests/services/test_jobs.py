@@ -0,0 +1,52 @@
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.common.integration import EnqueueJobCommand
+from app.features.jobs.models import JobStatus
+from app.features.jobs.schemas import JobRecord
+from app.features.jobs.service import JobService
+
+
+def _build_unit_of_work_mock() -> MagicMock:
+    unit_of_work = MagicMock()
+    unit_of_work.__aenter__ = AsyncMock(return_value=unit_of_work)
+    unit_of_work.__aexit__ = AsyncMock(return_value=None)
+    return unit_of_work
+
+
+def test_job_service_enqueue_persists_job_in_transaction_scope() -> None:
+    run_at = datetime(2026, 5, 8, 12, 0, tzinfo=UTC)
+    job_repository = MagicMock()
+    job_repository.create_job = AsyncMock(
+        return_value=JobRecord(
+            id=12,
+            job_name="users.import",
+            payload={"file": "users.csv"},
+            status=JobStatus.QUEUED,
+            priority=5,
+            run_at=run_at,
+            attempts=0,
+            max_attempts=3,
+        )
+    )
+    unit_of_work = _build_unit_of_work_mock()
+    service = JobService(job_repository=job_repository, unit_of_work=unit_of_work)
+
+    async def run_test() -> None:
+        job_id = await service.enqueue(
+            EnqueueJobCommand(job_name="users.import", payload={"file": "users.csv"}, priority=5, run_at=run_at)
+        )
+
+        assert job_id == "12"
+        job_repository.create_job.assert_awaited_once_with(
+            job_name="users.import",
+            payload={"file": "users.csv"},
+            priority=5,
+            run_at=run_at,
+            max_attempts=3,
+        )
+        unit_of_work.__aenter__.assert_awaited_once_with()
+        unit_of_work.__aexit__.assert_awaited_once_with(None, None, None)
+
+    asyncio.run(run_test())
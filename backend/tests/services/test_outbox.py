@@ -28,6 +28,7 @@ def _build_outbox_event(*, event_id: int, published_at: datetime | None = None)
 def test_outbox_service_enqueue_uses_transaction_scope() -> None:
     outbox_repository = MagicMock()
     outbox_repository.create_event = AsyncMock(return_value=_build_outbox_event(event_id=33))
+    outbox_repository.notify_pending = AsyncMock()
     unit_of_work = _build_unit_of_work_mock()
     service = OutboxService(outbox_repository=outbox_repository, unit_of_work=unit_of_work)
     command = EnqueueOutboxEventCommand(
@@ -47,6 +48,7 @@ def test_outbox_service_enqueue_uses_transaction_scope() -> None:
             event_type="book.updated",
             payload={"book_id": 33},
         )
+        outbox_repository.notify_pending.assert_awaited_once_with()
         unit_of_work.__aenter__.assert_awaited_once_with()
         unit_of_work.__aexit__.assert_awaited_once_with(None, None, None)
 
@@ -114,3 +116,53 @@ def test_outbox_service_mark_published_updates_existing_event() -> None:
         unit_of_work.__aexit__.assert_awaited_once_with(None, None, None)
 
     asyncio.run(run_test())
+
+
+def test_outbox_service_enqueue_many_inserts_batch_in_one_transaction() -> None:
+    outbox_repository = MagicMock()
+    outbox_repository.create_events = AsyncMock(
+        return_value=[_build_outbox_event(event_id=60), _build_outbox_event(event_id=61)]
+    )
+    outbox_repository.notify_pending = AsyncMock()
+    unit_of_work = _build_unit_of_work_mock()
+    service = OutboxService(outbox_repository=outbox_repository, unit_of_work=unit_of_work)
+    commands = [
+        EnqueueOutboxEventCommand(
+            aggregate_type="book",
+            aggregate_id=str(book_id),
+            event_type="book.updated",
+            payload={"book_id": book_id},
+        )
+        for book_id in (60, 61)
+    ]
+
+    async def run_test() -> None:
+        assert await service.enqueue_many([]) == []
+        outbox_repository.create_events.assert_not_awaited()
+
+        outbox_events = await service.enqueue_many(commands)
+
+        assert [outbox_event.id for outbox_event in outbox_events] == [60, 61]
+        outbox_repository.create_events.assert_awaited_once_with(commands)
+        outbox_repository.notify_pending.assert_awaited_once_with()
+        unit_of_work.__aenter__.assert_awaited_once_with()
+
+    asyncio.run(run_test())
+
+
+def test_outbox_service_mark_published_many_uses_bulk_update() -> None:
+    published_at = datetime(2026, 3, 5, 11, 0, tzinfo=UTC)
+    outbox_repository = MagicMock()
+    outbox_repository.mark_published_many = AsyncMock(return_value=2)
+    unit_of_work = _build_unit_of_work_mock()
+    service = OutboxService(outbox_repository=outbox_repository, unit_of_work=unit_of_work)
+
+    async def run_test() -> None:
+        assert await service.mark_published_many([]) == 0
+        outbox_repository.mark_published_many.assert_not_awaited()
+
+        assert await service.mark_published_many([70, 71, 72], published_at=published_at) == 2
+        outbox_repository.mark_published_many.assert_awaited_once_with([70, 71, 72], published_at=published_at)
+        unit_of_work.__aenter__.assert_awaited_once_with()
+
+    asyncio.run(run_test())
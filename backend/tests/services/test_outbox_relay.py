@@ -0,0 +1,637 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.integration import PublishMessageCommand
+from app.features.outbox.models import OutboxDeadLetter, OutboxEvent, outbox_shard_key
+from app.features.outbox.notifications import OutboxNotificationListener
+from app.features.outbox.relay import (
+    OutboxRelay,
+    OutboxRelayBatchResult,
+    OutboxShardMetrics,
+    to_publish_message_command,
+)
+from app.features.outbox.schemas import OutboxEventRecord
+from utils.testing_support.database import MockDatabase
+
+
+class RecordingMessageBroker:
+    def __init__(self, *, fail_on_event_id: int | None = None) -> None:
+        self.messages: list[PublishMessageCommand] = []
+        self._fail_on_event_id = fail_on_event_id
+
+    async def publish(self, message: PublishMessageCommand) -> None:
+        if message.payload["event_id"] == self._fail_on_event_id:
+            raise RuntimeError("broker unavailable")
+        self.messages.append(message)
+
+    @property
+    def event_ids(self) -> list[int]:
+        return [message.payload["event_id"] for message in self.messages]
+
+
+async def _seed_pending_events(mock_database: MockDatabase, *, count: int) -> list[int]:
+    occurred_at = datetime(2026, 3, 5, 10, 0, tzinfo=UTC)
+    events = [
+        OutboxEvent(
+            aggregate_type="book",
+            aggregate_id=str(index % 2),
+            event_type="book.updated",
+            payload={"sequence": index},
+            occurred_at=occurred_at + timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+    async with mock_database.Session() as session, session.begin():
+        session.add_all(events)
+    return [event.id for event in events]
+
+
+async def _list_pending_ids(mock_database: MockDatabase) -> list[int]:
+    async with mock_database.Session() as session:
+        result = await session.execute(
+            select(OutboxEvent.id).where(OutboxEvent.published_at.is_(None)).order_by(OutboxEvent.id)
+        )
+        return list(result.scalars().all())
+
+
+class FakeNotificationListener:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.on_notify: Callable[[], None] | None = None
+        self.stopped = False
+        self._fail = fail
+
+    async def start(self, on_notify: Callable[[], None]) -> bool:
+        if self._fail:
+            raise OSError("connection refused")
+        self.on_notify = on_notify
+        return True
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+def _build_relay(
+    mock_database: MockDatabase,
+    broker: RecordingMessageBroker,
+    *,
+    batch_size: int = 2,
+    poll_interval_seconds: float = 0.01,
+    max_poll_interval_seconds: float = 0.01,
+    notification_listener: FakeNotificationListener | None = None,
+) -> OutboxRelay:
+    return OutboxRelay(
+        session_factory=mock_database.Session,
+        message_broker=broker,
+        batch_size=batch_size,
+        poll_interval_seconds=poll_interval_seconds,
+        max_poll_interval_seconds=max_poll_interval_seconds,
+        notification_listener=notification_listener,
+    )
+
+
+async def _wait_until_drained(mock_database: MockDatabase) -> None:
+    while await _list_pending_ids(mock_database):
+        await asyncio.sleep(0.005)
+
+
+def test_to_publish_message_command_keys_messages_by_aggregate() -> None:
+    event = OutboxEventRecord(
+        id=9,
+        aggregate_type="book",
+        aggregate_id="42",
+        event_type="book.updated",
+        payload={"title": "Dune"},
+        occurred_at=datetime(2026, 3, 5, 10, 0, tzinfo=UTC),
+        published_at=None,
+    )
+
+    message = to_publish_message_command(event)
+
+    assert message.topic == "book"
+    assert message.key == "42"
+    assert message.payload == {
+        "event_id": 9,
+        "event_type": "book.updated",
+        "aggregate_type": "book",
+        "aggregate_id": "42",
+        "occurred_at": "2026-03-05T10:00:00+00:00",
+        "payload": {"title": "Dune"},
+    }
+
+
+def test_outbox_relay_drains_pending_events_in_batches(mock_database: MockDatabase) -> None:
+    broker = RecordingMessageBroker()
+    relay = _build_relay(mock_database, broker)
+
+    async def run_test() -> None:
+        event_ids = await _seed_pending_events(mock_database, count=5)
+
+        assert await relay.drain() == 5
+        assert broker.event_ids == event_ids
+        assert await _list_pending_ids(mock_database) == []
+        assert await relay.drain() == 0
+
+    asyncio.run(run_test())
+
+
+class ManualClock:
+    def __init__(self) -> None:
+        self.now = datetime.now(UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+async def _get_event(mock_database: MockDatabase, event_id: int) -> OutboxEvent | None:
+    async with mock_database.Session() as session:
+        return await session.get(OutboxEvent, event_id)
+
+
+def test_outbox_relay_retries_failed_event_while_other_aggregates_keep_flowing(mock_database: MockDatabase) -> None:
+    async def run_test() -> None:
+        event_ids = await _seed_pending_events(mock_database, count=5)
+        clock = ManualClock()
+        broker = RecordingMessageBroker(fail_on_event_id=event_ids[0])
+        relay = OutboxRelay(
+            session_factory=mock_database.Session,
+            message_broker=broker,
+            batch_size=5,
+            retry_base_seconds=1.0,
+            clock=clock,
+        )
+
+        batch = await relay.relay_batch()
+
+        assert (batch.claimed_count, batch.published_count, batch.retried_count, batch.failed) == (5, 2, 1, True)
+        assert broker.event_ids == [event_ids[1], event_ids[3]]
+        failed_event = await _get_event(mock_database, event_ids[0])
+        assert failed_event is not None
+        assert (failed_event.attempts, failed_event.last_error) == (1, "RuntimeError: broker unavailable")
+        assert failed_event.available_at.replace(tzinfo=UTC) == clock.now + timedelta(seconds=1)
+
+        # The failed head holds back the rest of its aggregate until its retry is due.
+        clock.advance(0.5)
+        assert await relay.drain() == 0
+        assert await _list_pending_ids(mock_database) == [event_ids[0], event_ids[2], event_ids[4]]
+
+        clock.advance(1)
+        recovered_broker = RecordingMessageBroker()
+        recovered_relay = OutboxRelay(
+            session_factory=mock_database.Session, message_broker=recovered_broker, clock=clock
+        )
+        assert await recovered_relay.drain() == 3
+        assert recovered_broker.event_ids == [event_ids[0], event_ids[2], event_ids[4]]
+
+    asyncio.run(run_test())
+
+
+def test_outbox_relay_moves_event_to_dead_letters_after_max_attempts(mock_database: MockDatabase) -> None:
+    async def run_test() -> None:
+        event_ids = await _seed_pending_events(mock_database, count=3)
+        clock = ManualClock()
+        broker = RecordingMessageBroker(fail_on_event_id=event_ids[0])
+        relay = OutboxRelay(
+            session_factory=mock_database.Session,
+            message_broker=broker,
+            max_attempts=2,
+            retry_base_seconds=1.0,
+            clock=clock,
+        )
+
+        assert await relay.drain() == 1
+        clock.advance(1)
+        batch = await relay.relay_batch()
+        assert (batch.retried_count, batch.dead_lettered_count) == (0, 1)
+        assert await _get_event(mock_database, event_ids[0]) is None
+
+        async with mock_database.Session() as session:
+            dead_letter = (
+                await session.execute(select(OutboxDeadLetter).where(OutboxDeadLetter.outbox_event_id == event_ids[0]))
+            ).scalar_one()
+        assert (dead_letter.attempts, dead_letter.last_error) == (2, "RuntimeError: broker unavailable")
+        assert dead_letter.payload == {"sequence": 0}
+
+        # Once the poison event is gone, the rest of its aggregate is delivered.
+        assert await relay.drain() == 1
+        assert broker.event_ids == [event_ids[1], event_ids[2]]
+        assert relay.shard_metrics[0].dead_lettered_count == 1
+        assert await _list_pending_ids(mock_database) == []
+
+    asyncio.run(run_test())
+
+
+def test_outbox_relay_retry_delay_doubles_up_to_the_cap() -> None:
+    relay = OutboxRelay(
+        session_factory=MagicMock(),
+        message_broker=RecordingMessageBroker(),
+        retry_base_seconds=1.0,
+        retry_max_seconds=5.0,
+    )
+
+    assert [relay.retry_delay(attempts).total_seconds() for attempts in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_concurrent_outbox_relays_publish_each_event_once(mock_database: MockDatabase) -> None:
+    brokers = [RecordingMessageBroker() for _ in range(3)]
+    relays = [_build_relay(mock_database, broker) for broker in brokers]
+
+    async def run_test() -> None:
+        event_ids = await _seed_pending_events(mock_database, count=9)
+
+        published_counts = await asyncio.gather(*(relay.drain() for relay in relays))
+
+        assert sum(published_counts) == 9
+        assert sorted(event_id for broker in brokers for event_id in broker.event_ids) == event_ids
+        assert await _list_pending_ids(mock_database) == []
+
+    asyncio.run(run_test())
+
+
+def test_outbox_relay_run_polls_until_stopped(mock_database: MockDatabase) -> None:
+    broker = RecordingMessageBroker()
+    relay = _build_relay(mock_database, broker)
+
+    async def run_test() -> None:
+        stop_event = asyncio.Event()
+        relay_task = asyncio.create_task(relay.run(stop_event))
+        await asyncio.sleep(0.05)
+        event_ids = await _seed_pending_events(mock_database, count=3)
+        await _wait_until_drained(mock_database)
+
+        stop_event.set()
+        await asyncio.wait_for(relay_task, timeout=1)
+        assert broker.event_ids == event_ids
+
+    asyncio.run(run_test())
+
+
+def test_outbox_relay_run_wakes_on_notification_instead_of_polling(mock_database: MockDatabase) -> None:
+    broker = RecordingMessageBroker()
+    listener = FakeNotificationListener()
+    relay = _build_relay(
+        mock_database,
+        broker,
+        poll_interval_seconds=30,
+        max_poll_interval_seconds=30,
+        notification_listener=listener,
+    )
+
+    async def run_test() -> None:
+        stop_event = asyncio.Event()
+        relay_task = asyncio.create_task(relay.run(stop_event))
+        await asyncio.sleep(0.05)
+        event_ids = await _seed_pending_events(mock_database, count=2)
+        assert listener.on_notify is not None
+        listener.on_notify()
+        await asyncio.wait_for(_wait_until_drained(mock_database), timeout=1)
+
+        stop_event.set()
+        await asyncio.wait_for(relay_task, timeout=1)
+        assert broker.event_ids == event_ids
+        assert listener.stopped
+
+    asyncio.run(run_test())
+
+
+def test_outbox_relay_run_backs_off_while_idle_and_resets_on_wakeup(mock_database: MockDatabase) -> None:
+    relay = _build_relay(
+        mock_database,
+        RecordingMessageBroker(),
+        poll_interval_seconds=0.01,
+        max_poll_interval_seconds=0.04,
+    )
+    timeouts: list[float] = []
+    wait_for_wakeup = relay._wait_for_wakeup  # pyright: ignore[reportPrivateUsage]
+
+    async def run_test() -> None:
+        stop_event = asyncio.Event()
+
+        async def tracked_wait_for_wakeup(stop: asyncio.Event, wakeup: asyncio.Event, *, timeout: float) -> bool:
+            timeouts.append(timeout)
+            if len(timeouts) == 4:
+                relay.wake()
+            if len(timeouts) == 6:
+                stop_event.set()
+            return await wait_for_wakeup(stop, wakeup, timeout=timeout)
+
+        relay._wait_for_wakeup = tracked_wait_for_wakeup  # type: ignore[method-assign]
+        await asyncio.wait_for(relay.run(stop_event), timeout=1)
+
+    asyncio.run(run_test())
+
+    assert timeouts == [0.01, 0.02, 0.04, 0.04, 0.01, 0.02]
+
+
+def test_outbox_relay_run_falls_back_to_polling_when_listen_fails(
+    mock_database: MockDatabase,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    broker = RecordingMessageBroker()
+    listener = FakeNotificationListener(fail=True)
+    relay = _build_relay(mock_database, broker, notification_listener=listener)
+
+    async def run_test() -> None:
+        stop_event = asyncio.Event()
+        relay_task = asyncio.create_task(relay.run(stop_event))
+        event_ids = await _seed_pending_events(mock_database, count=1)
+        await asyncio.wait_for(_wait_until_drained(mock_database), timeout=1)
+
+        stop_event.set()
+        await asyncio.wait_for(relay_task, timeout=1)
+        assert broker.event_ids == event_ids
+
+    with caplog.at_level(logging.ERROR, logger="app.outbox"):
+        asyncio.run(run_test())
+
+    assert "event=outbox_relay_listen_failed" in caplog.text
+    assert not listener.stopped
+
+
+def test_outbox_relay_run_keeps_publishing_after_a_batch_fails(
+    mock_database: MockDatabase,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    broker = RecordingMessageBroker()
+    session_calls = 0
+
+    def flaky_session_factory() -> AsyncSession:
+        nonlocal session_calls
+        session_calls += 1
+        if session_calls == 1:
+            raise ConnectionError("database unavailable")
+        return mock_database.Session()
+
+    relay = OutboxRelay(
+        session_factory=flaky_session_factory,
+        message_broker=broker,
+        batch_size=2,
+        poll_interval_seconds=0.01,
+        max_poll_interval_seconds=0.01,
+    )
+
+    async def run_test() -> None:
+        event_ids = await _seed_pending_events(mock_database, count=3)
+        stop_event = asyncio.Event()
+        relay_task = asyncio.create_task(relay.run(stop_event))
+        await asyncio.wait_for(_wait_until_drained(mock_database), timeout=1)
+
+        stop_event.set()
+        await asyncio.wait_for(relay_task, timeout=1)
+        assert broker.event_ids == event_ids
+
+    with caplog.at_level(logging.ERROR, logger="app.outbox"):
+        asyncio.run(run_test())
+
+    assert "event=outbox_relay_batch_failed" in caplog.text
+    assert relay.shard_metrics[0].error_count == 1
+    assert relay.shard_metrics[0].published_count == 3
+
+
+def _build_listener_engine() -> tuple[MagicMock, MagicMock]:
+    driver_connection = MagicMock()
+    driver_connection.add_listener = AsyncMock()
+    driver_connection.remove_listener = AsyncMock()
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver_connection))
+    connection.close = AsyncMock()
+    engine = MagicMock()
+    engine.connect = AsyncMock(return_value=connection)
+    engine.dispose = AsyncMock()
+    return engine, driver_connection
+
+
+def test_outbox_notification_listener_is_unsupported_on_sqlite() -> None:
+    listener = OutboxNotificationListener(database_url=URL.create("sqlite+aiosqlite", database=":memory:"))
+
+    with patch("app.features.outbox.notifications.DatabaseManager.build_engine") as build_engine:
+        assert asyncio.run(listener.start(lambda: None)) is False
+
+    build_engine.assert_not_called()
+    assert not listener.listening
+
+
+def test_outbox_notification_listener_listens_on_dedicated_postgres_connection() -> None:
+    engine, driver_connection = _build_listener_engine()
+    listener = OutboxNotificationListener(database_url=URL.create("postgresql+asyncpg", database="app"))
+    notifications: list[str] = []
+
+    async def run_test() -> None:
+        with patch("app.features.outbox.notifications.DatabaseManager.build_engine", return_value=engine):
+            assert await listener.start(lambda: notifications.append("outbox")) is True
+            assert await listener.start(lambda: None) is True
+
+        engine.connect.assert_awaited_once_with()
+        channel, callback = driver_connection.add_listener.await_args.args
+        assert channel == "outbox_events"
+        callback(MagicMock(), 4321, channel, "")
+        assert notifications == ["outbox"]
+
+        await listener.stop()
+        driver_connection.remove_listener.assert_awaited_once_with("outbox_events", callback)
+        engine.dispose.assert_awaited_once_with()
+        assert not listener.listening
+
+    asyncio.run(run_test())
+
+
+def test_outbox_notification_listener_releases_engine_when_listen_fails() -> None:
+    engine, driver_connection = _build_listener_engine()
+    driver_connection.add_listener.side_effect = OSError("connection lost")
+    listener = OutboxNotificationListener(database_url=URL.create("postgresql+asyncpg", database="app"))
+
+    async def run_test() -> None:
+        with (
+            patch("app.features.outbox.notifications.DatabaseManager.build_engine", return_value=engine),
+            pytest.raises(OSError, match="connection lost"),
+        ):
+            await listener.start(lambda: None)
+
+        engine.dispose.assert_awaited_once_with()
+        assert not listener.listening
+        await listener.stop()
+
+    asyncio.run(run_test())
+
+
+def test_outbox_notification_listener_reconnects_after_connection_loss(caplog: pytest.LogCaptureFixture) -> None:
+    engine, driver_connection = _build_listener_engine()
+    listener = OutboxNotificationListener(
+        database_url=URL.create("postgresql+asyncpg", database="app"),
+        reconnect_backoff_seconds=0,
+    )
+    notifications: list[str] = []
+
+    async def run_test() -> None:
+        with patch("app.features.outbox.notifications.DatabaseManager.build_engine", return_value=engine):
+            await listener.start(lambda: notifications.append("outbox"))
+            (terminated,) = driver_connection.add_termination_listener.call_args.args
+            engine.connect.side_effect = [OSError("database restarting"), engine.connect.return_value]
+
+            terminated(driver_connection)
+            assert notifications == ["outbox"]
+            assert not listener.listening
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+            assert listener.listening
+            assert engine.connect.await_count == 3
+            assert notifications == ["outbox", "outbox"]
+            assert driver_connection.add_listener.await_count == 2
+
+        await listener.stop()
+        assert not listener.listening
+
+    with caplog.at_level(logging.INFO, logger="app.outbox"):
+        asyncio.run(run_test())
+
+    assert "event=outbox_listener_lost" in caplog.text
+    assert "event=outbox_listener_reconnect_failed" in caplog.text
+    assert "event=outbox_listener_reconnected" in caplog.text
+
+
+def test_outbox_notification_listener_stop_cancels_pending_reconnect() -> None:
+    engine, driver_connection = _build_listener_engine()
+    listener = OutboxNotificationListener(
+        database_url=URL.create("postgresql+asyncpg", database="app"),
+        reconnect_backoff_seconds=60,
+    )
+
+    async def run_test() -> None:
+        with patch("app.features.outbox.notifications.DatabaseManager.build_engine", return_value=engine):
+            await listener.start(lambda: None)
+            (terminated,) = driver_connection.add_termination_listener.call_args.args
+            engine.connect.side_effect = OSError("database down")
+
+            terminated(driver_connection)
+            await asyncio.sleep(0)
+            await asyncio.wait_for(listener.stop(), timeout=1)
+
+        assert not listener.listening
+        assert engine.connect.await_count == 2
+
+    asyncio.run(run_test())
+
+
+def test_outbox_shard_metrics_track_throughput() -> None:
+    metrics = OutboxShardMetrics(shard_index=2)
+    assert metrics.events_per_second == 0.0
+
+    metrics.record_batch(OutboxRelayBatchResult(claimed_count=4, published_count=4), duration_seconds=0.5)
+    metrics.record_batch(OutboxRelayBatchResult(claimed_count=2, published_count=1), duration_seconds=0.5)
+
+    assert (metrics.batch_count, metrics.claimed_count, metrics.published_count) == (2, 6, 5)
+    assert metrics.failed_batch_count == 1
+    assert metrics.events_per_second == 5.0
+
+
+def test_sharded_outbox_relay_keeps_each_aggregate_in_order(mock_database: MockDatabase) -> None:
+    broker = RecordingMessageBroker()
+    relay = OutboxRelay(session_factory=mock_database.Session, message_broker=broker, batch_size=3, shard_count=3)
+
+    async def run_test() -> None:
+        occurred_at = datetime(2026, 3, 6, 10, 0, tzinfo=UTC)
+        events = [
+            OutboxEvent(
+                aggregate_type="sharded_book",
+                aggregate_id=str(index % 5),
+                event_type="book.updated",
+                payload={"sequence": index},
+                occurred_at=occurred_at + timedelta(seconds=index),
+            )
+            for index in range(20)
+        ]
+        async with mock_database.Session() as session, session.begin():
+            session.add_all(events)
+
+        assert await relay.drain() == 20
+
+        sequences_by_aggregate: dict[str, list[int]] = {}
+        for message in broker.messages:
+            sequences_by_aggregate.setdefault(message.key or "", []).append(message.payload["payload"]["sequence"])
+        assert sequences_by_aggregate == {
+            str(aggregate): [index for index in range(20) if index % 5 == aggregate] for aggregate in range(5)
+        }
+        assert all(event.shard_key == outbox_shard_key("sharded_book", event.aggregate_id) for event in events)
+
+        metrics = relay.shard_metrics
+        assert sorted(metrics) == [0, 1, 2]
+        assert sum(shard.published_count for shard in metrics.values()) == 20
+        for shard_index, shard in metrics.items():
+            expected_count = sum(
+                1 for event in events if outbox_shard_key("sharded_book", event.aggregate_id) % 3 == shard_index
+            )
+            assert shard.published_count == expected_count
+
+    asyncio.run(run_test())
+
+
+def test_sharded_outbox_relay_publishes_shards_concurrently() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    class SlowBroker:
+        async def publish(self, _message: PublishMessageCommand) -> None:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    def build_event(event_id: int) -> OutboxEventRecord:
+        return OutboxEventRecord(
+            id=event_id,
+            aggregate_type="book",
+            aggregate_id=str(event_id),
+            event_type="book.updated",
+            payload={},
+            occurred_at=datetime(2026, 3, 6, 10, 0, tzinfo=UTC),
+            published_at=None,
+        )
+
+    pending_by_shard = {shard_index: [build_event(shard_index)] for shard_index in range(4)}
+    claimed_shards: list[int] = []
+
+    async def claim_pending(
+        *,
+        limit: int,
+        shard_count: int,
+        shard_index: int,
+        now: datetime,
+    ) -> list[OutboxEventRecord]:
+        assert (limit, shard_count) == (2, 4)
+        claimed_shards.append(shard_index)
+        return pending_by_shard[shard_index][:limit]
+
+    repository = MagicMock()
+    repository.claim_pending = claim_pending
+    repository.mark_published_many = AsyncMock(return_value=1)
+    repository.move_to_dead_letters = AsyncMock(return_value=0)
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    session.commit = AsyncMock()
+    relay = OutboxRelay(
+        session_factory=MagicMock(return_value=session),
+        message_broker=SlowBroker(),
+        batch_size=2,
+        shard_count=4,
+        shard_indexes=[3, 1],
+    )
+
+    with patch("app.features.outbox.relay.OutboxRepository", return_value=repository):
+        assert asyncio.run(relay.drain()) == 2
+
+    assert sorted(claimed_shards) == [1, 3]
+    assert max_in_flight == 2
+    assert sorted(relay.shard_metrics) == [1, 3]
@@ -0,0 +1,139 @@
+import asyncio
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy import select
+
+from app.features.outbox.models import OutboxEvent
+from app.features.outbox.retention import OutboxRetention
+from utils.testing_support.database import MockDatabase
+
+_NOW = datetime(2026, 5, 20, 12, 0, tzinfo=UTC)
+
+
+async def _seed_events(mock_database: MockDatabase) -> None:
+    old = _NOW - timedelta(days=45)
+    recent = _NOW - timedelta(days=2)
+    async with mock_database.Session() as session, session.begin():
+        session.add_all(
+            [
+                OutboxEvent(
+                    aggregate_type="retention",
+                    aggregate_id="old-published",
+                    event_type="book.created",
+                    payload={},
+                    occurred_at=old,
+                    published_at=old + timedelta(seconds=1),
+                ),
+                OutboxEvent(
+                    aggregate_type="retention",
+                    aggregate_id="old-pending",
+                    event_type="book.created",
+                    payload={},
+                    occurred_at=old,
+                ),
+                OutboxEvent(
+                    aggregate_type="retention",
+                    aggregate_id="recent-published",
+                    event_type="book.created",
+                    payload={},
+                    occurred_at=recent,
+                    published_at=recent + timedelta(seconds=1),
+                ),
+            ]
+        )
+
+
+async def _list_aggregate_ids(mock_database: MockDatabase) -> list[str]:
+    async with mock_database.Session() as session:
+        result = await session.execute(
+            select(OutboxEvent.aggregate_id)
+            .where(OutboxEvent.aggregate_type == "retention")
+            .order_by(OutboxEvent.aggregate_id)
+        )
+        return list(result.scalars().all())
+
+
+def test_outbox_retention_deletes_expired_published_events_on_sqlite(mock_database: MockDatabase) -> None:
+    async def run_test() -> None:
+        await _seed_events(mock_database)
+
+        archive_report = await OutboxRetention(
+            session_factory=mock_database.Session,
+            archive=True,
+            clock=lambda: _NOW,
+        ).run()
+        assert archive_report.deleted_count == 0
+        assert len(await _list_aggregate_ids(mock_database)) == 3
+
+        report = await OutboxRetention(session_factory=mock_database.Session, clock=lambda: _NOW).run()
+
+        assert report.deleted_count == 1
+        assert report.created_partitions == report.removed_partitions == ()
+        assert await _list_aggregate_ids(mock_database) == ["old-pending", "recent-published"]
+
+    asyncio.run(run_test())
+
+
+def _build_partitioned_repository(partition_months: list[date]) -> MagicMock:
+    repository = MagicMock()
+    repository.supports_partitions.return_value = True
+    repository.list_partition_months = AsyncMock(return_value=partition_months)
+    repository.create_partition = AsyncMock(side_effect=lambda month: f"outbox_events_p{month:%Y%m}")
+    repository.partition_has_pending = AsyncMock(side_effect=lambda month: month == date(2026, 2, 1))
+    repository.remove_partition = AsyncMock(side_effect=lambda month, archive: f"outbox_events_p{month:%Y%m}")
+    repository.delete_published_before = AsyncMock(return_value=2)
+    repository.archive_default_published_before = AsyncMock(return_value=4)
+    return repository
+
+
+def _build_session_factory() -> MagicMock:
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return MagicMock(return_value=session)
+
+
+def test_outbox_retention_rotates_postgres_partitions_in_bulk() -> None:
+    repository = _build_partitioned_repository(
+        [date(2026, 1, 1), date(2026, 2, 1), date(2026, 3, 1), date(2026, 4, 1), date(2026, 5, 1)]
+    )
+    retention = OutboxRetention(session_factory=_build_session_factory(), premake_months=2, clock=lambda: _NOW)
+
+    with patch("app.features.outbox.retention.OutboxRepository", return_value=repository):
+        report = asyncio.run(retention.run())
+
+    assert report.created_partitions == ("outbox_events_p202606", "outbox_events_p202607")
+    assert report.removed_partitions == ("outbox_events_p202601", "outbox_events_p202603")
+    assert report.kept_partitions == ("outbox_events_p202602",)
+    assert report.deleted_count == 2
+    assert [call.args[0] for call in repository.partition_has_pending.await_args_list] == [
+        date(2026, 1, 1),
+        date(2026, 2, 1),
+        date(2026, 3, 1),
+    ]
+    repository.remove_partition.assert_any_await(date(2026, 1, 1), archive=False)
+    repository.delete_published_before.assert_awaited_once_with(_NOW - timedelta(days=30))
+
+
+def test_outbox_retention_archive_mode_archives_default_partition_rows() -> None:
+    repository = _build_partitioned_repository([date(2026, 1, 1)])
+    retention = OutboxRetention(
+        session_factory=_build_session_factory(),
+        archive=True,
+        premake_months=0,
+        clock=lambda: _NOW,
+    )
+
+    with patch("app.features.outbox.retention.OutboxRepository", return_value=repository):
+        report = asyncio.run(retention.run())
+
+    assert report.created_partitions == ("outbox_events_p202605",)
+    assert report.removed_partitions == ("outbox_events_p202601",)
+    assert report.archived_count == 4
+    assert report.deleted_count == 0
+    repository.remove_partition.assert_awaited_once_with(date(2026, 1, 1), archive=True)
+    repository.archive_default_published_before.assert_awaited_once_with(_NOW - timedelta(days=30))
+    repository.delete_published_before.assert_not_awaited()
@@ -1,16 +1,95 @@
-from app.core.security.service import Argon2PasswordService
+import asyncio
+from threading import Event
+
+import pytest
+
+from app.core.config.settings import AuthSettings
+from app.core.errors.domain import DomainErrorType
+from app.core.errors.services import ServiceUnavailableError
+from app.core.security.service import (
+    ARGON2_COST_PROFILES,
+    Argon2CostProfile,
+    Argon2PasswordService,
+    PasswordHashingPool,
+    resolve_argon2_cost_profile,
+)
 
 
 def test_hash_and_verify_password_round_trip() -> None:
     password_service = Argon2PasswordService()
 
-    hashed_password = password_service.hash_password("StrongPass1")
+    async def run_test() -> None:
+        hashed_password = await password_service.hash_password("StrongPass1")
+
+        assert hashed_password != "StrongPass1"  # pragma: allowlist secret
+        assert await password_service.verify_password("StrongPass1", hashed_password) is True
+        assert await password_service.verify_password("OtherPass1", hashed_password) is False
 
-    assert hashed_password != "StrongPass1"  # pragma: allowlist secret
-    assert password_service.verify_password("StrongPass1", hashed_password) is True
+    asyncio.run(run_test())
 
 
 def test_verify_password_returns_false_for_invalid_hash() -> None:
     password_service = Argon2PasswordService()
 
-    assert password_service.verify_password("StrongPass1", "not-a-valid-hash") is False
+    assert asyncio.run(password_service.verify_password("StrongPass1", "not-a-valid-hash")) is False
+
+
+def test_hashing_pool_rejects_work_beyond_concurrency_and_queue_depth() -> None:
+    hashing_pool = PasswordHashingPool(max_concurrency=1, max_queue_depth=1, retry_after_seconds=2)
+    release = Event()
+
+    async def run_test() -> None:
+        running = asyncio.ensure_future(hashing_pool.run(release.wait))
+        queued = asyncio.ensure_future(hashing_pool.run(release.wait))
+        await asyncio.sleep(0)
+        assert hashing_pool.pending == 2
+
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            await hashing_pool.run(release.wait)
+
+        assert exc_info.value.error_type is DomainErrorType.SERVICE_UNAVAILABLE
+        assert exc_info.value.headers == {"Retry-After": "2"}
+
+        release.set()
+        assert await asyncio.gather(running, queued) == [True, True]
+        assert hashing_pool.pending == 0
+
+    try:
+        asyncio.run(run_test())
+    finally:
+        release.set()
+        hashing_pool.shutdown()
+
+
+def test_needs_rehash_flags_hashes_made_with_other_cost_parameters() -> None:
+    low_cost_service = Argon2PasswordService(cost_profile=ARGON2_COST_PROFILES["low"])
+    default_service = Argon2PasswordService()
+
+    async def run_test() -> None:
+        low_cost_hash = await low_cost_service.hash_password("StrongPass1")
+        default_hash = await default_service.hash_password("StrongPass1")
+
+        assert default_service.needs_rehash(low_cost_hash) is True
+        assert default_service.needs_rehash(default_hash) is False
+        assert low_cost_service.needs_rehash(default_hash) is True
+        assert await default_service.verify_password("StrongPass1", low_cost_hash) is True
+
+    asyncio.run(run_test())
+
+
+def test_needs_rehash_returns_false_for_invalid_hash() -> None:
+    assert Argon2PasswordService().needs_rehash("not-a-valid-hash") is False
+
+
+def test_resolve_argon2_cost_profile_applies_overrides_on_top_of_named_profile() -> None:
+    settings = AuthSettings(
+        JWT_SECRET_KEY="unit-test-secret",  # pragma: allowlist secret
+        PASSWORD_HASH_PROFILE="low",
+        PASSWORD_HASH_MEMORY_COST_KIB=32_768,
+    )
+
+    assert resolve_argon2_cost_profile(settings) == Argon2CostProfile(
+        time_cost=2,
+        memory_cost_kib=32_768,
+        parallelism=1,
+    )
@@ -3,15 +3,19 @@ from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
+from app.core.common.pagination import CursorPage, PageRequest
 from app.core.errors.repositories import RepositoryConflictError
 from app.core.errors.services import ConflictError, InvalidInputError, UnauthorizedError
 from app.features.auth.models import User
-from app.features.rbac.models import Role, RoleInheritance
+from app.features.rbac.models import Permission, Role, RoleInheritance, RolePermission
 from app.features.rbac.schemas import (
     CreateAdminUserCommand,
     CreateRoleCommand,
+    RoleListFilters,
+    SetRolePermissionCommand,
     UpdateAdminUserCommand,
     UpdateRoleCommand,
+    UserListFilters,
 )
 from app.features.rbac.service import RBACService
 from app.features.rbac.service_mappers import normalize_role_name
@@ -20,7 +24,9 @@ from app.features.rbac.service_mappers import normalize_role_name
 def _build_repository_mock() -> MagicMock:
     repository = MagicMock()
     repository.list_users = AsyncMock(return_value=[])
+    repository.list_users_page = AsyncMock(return_value=CursorPage(items=[]))
     repository.list_roles = AsyncMock(return_value=[])
+    repository.list_roles_page = AsyncMock(return_value=CursorPage(items=[]))
     repository.list_permissions = AsyncMock(return_value=[])
     repository.list_role_permissions = AsyncMock(return_value=[])
     repository.list_role_inheritances = AsyncMock(return_value=[])
@@ -36,13 +42,20 @@ def _build_repository_mock() -> MagicMock:
     repository.username_exists = AsyncMock(return_value=False)
     repository.create_user = AsyncMock()
     repository.update_user = AsyncMock()
+    repository.replace_password_hash = AsyncMock(return_value=True)
     repository.list_user_role_ids = AsyncMock(return_value=[])
+    repository.list_role_ids_by_user_ids = AsyncMock(return_value={})
+    repository.list_role_ids_by_user_filters = AsyncMock(return_value={})
     repository.assign_user_role = AsyncMock()
     repository.remove_user_role = AsyncMock()
     repository.list_user_roles = AsyncMock(return_value=[])
+    repository.list_user_roles_page = AsyncMock(return_value=CursorPage(items=[]))
     repository.list_role_users = AsyncMock(return_value=[])
+    repository.list_role_users_page = AsyncMock(return_value=CursorPage(items=[]))
     repository.assign_role_inheritance = AsyncMock()
     repository.remove_role_inheritance = AsyncMock()
+    repository.list_role_dependent_user_ids = AsyncMock(return_value=[])
+    repository.rebuild_user_effective_permissions = AsyncMock()
     return repository
 
 
@@ -74,7 +87,7 @@ def test_list_roles_returns_empty_without_fetching_permissions() -> None:
         roles = await service.list_roles()
 
         assert roles == []
-        repository.list_roles.assert_awaited_once_with()
+        repository.list_roles.assert_awaited_once_with(filters=None)
         repository.list_permissions.assert_not_awaited()
         repository.list_role_permissions.assert_not_awaited()
         repository.list_role_inheritances.assert_not_awaited()
@@ -258,17 +271,55 @@ def test_list_users_returns_role_ids() -> None:
         User(id=1, username="admin", hashed_password="hash", disabled=False),  # pragma: allowlist secret
         User(id=3, username="reader_user", hashed_password="hash", disabled=False),  # pragma: allowlist secret
     ]
-    repository.list_user_role_ids.side_effect = [[1], [2]]
+    repository.list_role_ids_by_user_filters.return_value = {1: [1]}
 
     async def run_test() -> None:
-        users = await service.list_users()
+        users = await service.list_users(UserListFilters(disabled=False))
 
         assert [user.model_dump() for user in users] == [
             {"id": 1, "username": "admin", "disabled": False, "role_ids": [1]},
-            {"id": 3, "username": "reader_user", "disabled": False, "role_ids": [2]},
+            {"id": 3, "username": "reader_user", "disabled": False, "role_ids": []},
         ]
-        repository.list_users.assert_awaited_once_with()
-        assert repository.list_user_role_ids.await_count == 2
+        repository.list_users.assert_awaited_once_with(filters=UserListFilters(disabled=False))
+        repository.list_role_ids_by_user_filters.assert_awaited_once_with(filters=UserListFilters(disabled=False))
+        repository.list_role_ids_by_user_ids.assert_not_awaited()
+        repository.list_user_role_ids.assert_not_awaited()
+
+    asyncio.run(run_test())
+
+
+def test_list_page_methods_map_items_and_keep_next_cursor() -> None:
+    service, repository, _ = _build_service()
+    page = PageRequest(limit=1, cursor="cursor-1")
+    reader = User(id=3, username="reader_user", hashed_password="hash", disabled=False)  # pragma: allowlist secret
+    reader_role = Role(id=2, name="reader_role")
+    repository.list_users_page.return_value = CursorPage(items=[reader], next_cursor="cursor-2")
+    repository.list_role_ids_by_user_ids.return_value = {3: [2]}
+    repository.list_roles_page.return_value = CursorPage(items=[reader_role], next_cursor="cursor-3")
+    repository.get_user.return_value = reader
+    repository.get_role.return_value = reader_role
+    repository.list_user_roles_page.return_value = CursorPage(items=[reader_role], next_cursor="cursor-4")
+    repository.list_role_users_page.return_value = CursorPage(items=[reader])
+
+    async def run_test() -> None:
+        user_page = await service.list_users_page(page)
+        role_page = await service.list_roles_page(page, RoleListFilters(q="read"))
+        user_role_page = await service.list_user_roles_page(3, page)
+        role_user_page = await service.list_role_users_page(2, page)
+
+        assert [user.role_ids for user in user_page.items] == [[2]]
+        assert user_page.next_cursor == "cursor-2"
+        assert [role.name for role in role_page.items] == ["reader_role"]
+        assert role_page.next_cursor == "cursor-3"
+        assert [role.id for role in user_role_page.items] == [2]
+        assert user_role_page.next_cursor == "cursor-4"
+        assert [user.username for user in role_user_page.items] == ["reader_user"]
+        assert role_user_page.next_cursor is None
+        repository.list_users_page.assert_awaited_once_with(page=page, filters=None)
+        repository.list_roles_page.assert_awaited_once_with(page=page, filters=RoleListFilters(q="read"))
+        repository.list_role_ids_by_user_ids.assert_awaited_once_with(user_ids=(3,))
+        repository.list_user_roles_page.assert_awaited_once_with(user_id=3, page=page)
+        repository.list_role_users_page.assert_awaited_once_with(role_id=2, page=page)
 
     asyncio.run(run_test())
 
@@ -443,24 +494,85 @@ def test_update_user_requires_current_password_when_new_password_is_provided() -
     asyncio.run(run_test())
 
 
-def test_apply_password_update_requires_current_password_when_new_password_is_provided() -> None:
+def test_prepare_password_update_requires_current_password_when_new_password_is_provided() -> None:
     service, repository, _ = _build_service()
     user = User(id=3, username="reader_user", hashed_password="hash", disabled=False)
-    changes: dict[str, object] = {}
 
     with pytest.raises(InvalidInputError, match="current_password is required"):
-        service._user_management._apply_password_update(  # pyright: ignore[reportPrivateUsage]
-            user=user,
-            current_password=None,
-            new_password="NewPass123",  # pragma: allowlist secret
-            normalized_username="reader_user",
-            changes=changes,
+        asyncio.run(
+            service._user_management._prepare_password_update(  # pyright: ignore[reportPrivateUsage]
+                user=user,
+                current_password=None,
+                new_password="NewPass123",  # pragma: allowlist secret
+                normalized_username="reader_user",
+            )
         )
 
-    assert changes == {}
     repository.update_user.assert_not_awaited()
 
 
+def test_update_user_hashes_password_before_opening_unit_of_work() -> None:
+    service, repository, unit_of_work = _build_service()
+    repository.get_user.return_value = User(id=3, username="reader_user", hashed_password="hash", disabled=False)
+    events: list[str] = []
+
+    password_service = MagicMock()
+    password_service.verify_password = AsyncMock(side_effect=[True, False])
+
+    async def hash_password(_password: str) -> str:
+        events.append("hash")
+        return "new-hash"
+
+    async def enter_unit_of_work() -> MagicMock:
+        events.append("unit_of_work")
+        return unit_of_work
+
+    password_service.hash_password = hash_password
+    unit_of_work.__aenter__ = AsyncMock(side_effect=enter_unit_of_work)
+    service._user_management._password_service = password_service  # pyright: ignore[reportPrivateUsage]
+
+    async def run_test() -> None:
+        await service.update_user(
+            3,
+            UpdateAdminUserCommand(
+                current_password="CurrentPass123",  # pragma: allowlist secret
+                new_password="NewPass123",  # pragma: allowlist secret
+            ),
+        )
+
+        assert events == ["hash", "unit_of_work"]
+        repository.replace_password_hash.assert_awaited_once_with(3, current_hash="hash", new_hash="new-hash")
+        repository.update_user.assert_not_awaited()
+
+    asyncio.run(run_test())
+
+
+def test_update_user_raises_conflict_when_password_changed_concurrently() -> None:
+    service, repository, _ = _build_service()
+    repository.get_user.return_value = User(id=3, username="reader_user", hashed_password="hash", disabled=False)
+    repository.replace_password_hash.return_value = False
+
+    password_service = MagicMock()
+    password_service.verify_password = AsyncMock(side_effect=[True, False])
+    password_service.hash_password = AsyncMock(return_value="new-hash")
+    service._user_management._password_service = password_service  # pyright: ignore[reportPrivateUsage]
+
+    async def run_test() -> None:
+        with pytest.raises(ConflictError, match="Password was changed by another request"):
+            await service.update_user(
+                3,
+                UpdateAdminUserCommand(
+                    username="renamed_user",
+                    current_password="CurrentPass123",  # pragma: allowlist secret
+                    new_password="NewPass123",  # pragma: allowlist secret
+                ),
+            )
+
+        repository.update_user.assert_not_awaited()
+
+    asyncio.run(run_test())
+
+
 def test_update_user_replaces_role_set() -> None:
     service, repository, _ = _build_service()
     repository.get_user.return_value = User(id=3, username="reader_user", hashed_password="hash", disabled=False)
@@ -532,6 +644,7 @@ def test_update_user_rejects_invalid_current_password() -> None:
     repository.get_user.return_value = User(id=3, username="reader_user", hashed_password="hash", disabled=False)
 
     password_service = MagicMock()
+    password_service.verify_password = AsyncMock()
     password_service.verify_password.side_effect = [False]
     service._user_management._password_service = password_service  # pyright: ignore[reportPrivateUsage]
 
@@ -555,6 +668,7 @@ def test_update_user_rejects_reusing_current_password() -> None:
     repository.get_user.return_value = User(id=3, username="reader_user", hashed_password="hash", disabled=False)
 
     password_service = MagicMock()
+    password_service.verify_password = AsyncMock()
     password_service.verify_password.side_effect = [True, True]
     service._user_management._password_service = password_service  # pyright: ignore[reportPrivateUsage]
 
@@ -617,3 +731,162 @@ def test_delete_user_soft_delete_is_idempotent_for_already_disabled_user() -> No
         repository.update_user.assert_not_awaited()
 
     asyncio.run(run_test())
+
+
+def test_rbac_mutations_invalidate_authorization_snapshots() -> None:
+    snapshot_cache = MagicMock()
+    service = RBACService(
+        rbac_repository=_build_repository_mock(),
+        unit_of_work=_build_unit_of_work_mock(),
+        authorization_snapshot_cache=snapshot_cache,
+    )
+    service._user_management = AsyncMock()  # pyright: ignore[reportPrivateUsage]
+    service._role_operations = AsyncMock()  # pyright: ignore[reportPrivateUsage]
+    service._user_role_assignments = AsyncMock()  # pyright: ignore[reportPrivateUsage]
+
+    async def run_test() -> None:
+        await service.update_user(3, UpdateAdminUserCommand(disabled=True))
+        await service.delete_user(4)
+        await service.assign_user_role(5, 1)
+        await service.remove_user_role(6, 1)
+        assert snapshot_cache.invalidate_user.call_args_list == [call(3), call(4), call(5), call(6)]
+        snapshot_cache.clear.assert_not_called()
+
+        await service.delete_role(1)
+        await service.assign_role_permission(1, "roles:manage", MagicMock())
+        await service.remove_role_permission(1, "roles:manage")
+        await service.assign_role_inheritance(2, 1)
+        await service.remove_role_inheritance(2, 1)
+        assert snapshot_cache.clear.call_count == 5
+
+    asyncio.run(run_test())
+
+
+def test_delete_role_rebuilds_effective_permissions_of_users_resolved_before_deletion() -> None:
+    service, repository, _ = _build_service()
+    repository.get_role.return_value = Role(id=4, name="editor_role")
+    repository.list_role_dependent_user_ids.return_value = [3, 7]
+    events = MagicMock()
+    events.attach_mock(repository.list_role_dependent_user_ids, "list_role_dependent_user_ids")
+    events.attach_mock(repository.delete_role, "delete_role")
+    events.attach_mock(repository.rebuild_user_effective_permissions, "rebuild_user_effective_permissions")
+
+    async def run_test() -> None:
+        await service.delete_role(4)
+
+        assert events.mock_calls == [
+            call.list_role_dependent_user_ids(4),
+            call.delete_role(4),
+            call.rebuild_user_effective_permissions(user_ids=(3, 7)),
+        ]
+
+    asyncio.run(run_test())
+
+
+def test_user_role_changes_rebuild_effective_permissions_only_when_assignments_change() -> None:
+    service, repository, _ = _build_service()
+    repository.get_user.return_value = User(id=3, username="reader_user", hashed_password="hash", disabled=False)
+    repository.get_role.return_value = Role(id=2, name="editor_role")
+    repository.assign_user_role.side_effect = [True, False]
+    repository.remove_user_role.return_value = False
+
+    async def run_test() -> None:
+        await service.assign_user_role(3, 2)
+        await service.assign_user_role(3, 2)
+        await service.remove_user_role(3, 2)
+
+        repository.rebuild_user_effective_permissions.assert_awaited_once_with(user_ids=(3,))
+
+    asyncio.run(run_test())
+
+
+def _build_audited_service() -> tuple[RBACService, MagicMock, MagicMock]:
+    repository = _build_repository_mock()
+    audit_log_writer = MagicMock()
+    audit_log_writer.record = AsyncMock()
+    service = RBACService(
+        rbac_repository=repository,
+        unit_of_work=_build_unit_of_work_mock(),
+        audit_log_writer=audit_log_writer,
+    )
+    return service, repository, audit_log_writer
+
+
+def _recorded_audit_actions(audit_log_writer: MagicMock) -> list[tuple[str, str | None, int | None]]:
+    return [
+        (entry.action, entry.resource_id, entry.actor_user_id)
+        for entry in (recorded_call.args[0] for recorded_call in audit_log_writer.record.await_args_list)
+    ]
+
+
+def test_role_mutations_record_audit_entries_only_for_applied_changes() -> None:
+    service, repository, audit_log_writer = _build_audited_service()
+    repository.create_role.return_value = Role(id=4, name="editor_role")
+    repository.get_role.side_effect = lambda role_id: Role(id=role_id, name=f"role_{role_id}")
+    repository.update_role.return_value = Role(id=4, name="writer_role")
+    repository.get_permission.return_value = Permission(id="roles:manage", name="Manage roles")
+    repository.upsert_role_permission.return_value = RolePermission(
+        role_id=4,
+        permission_id="roles:manage",
+        scope="any",
+    )
+    repository.delete_role_permission.side_effect = [True, False]
+    repository.remove_role_inheritance.side_effect = [True, False]
+
+    async def run_test() -> None:
+        await service.create_role(CreateRoleCommand(name="editor_role"), actor_user_id=1)
+        await service.update_role(4, UpdateRoleCommand(name="writer_role"), actor_user_id=1)
+        await service.update_role(4, UpdateRoleCommand(name="role_4"), actor_user_id=1)
+        await service.assign_role_permission(4, "roles:manage", SetRolePermissionCommand(scope="any"), actor_user_id=1)
+        await service.remove_role_permission(4, "roles:manage", actor_user_id=1)
+        await service.remove_role_permission(4, "roles:manage", actor_user_id=1)
+        await service.assign_role_inheritance(4, 2, actor_user_id=1)
+        await service.remove_role_inheritance(4, 2, actor_user_id=1)
+        await service.remove_role_inheritance(4, 2, actor_user_id=1)
+        await service.delete_role(4, actor_user_id=1)
+
+        assert _recorded_audit_actions(audit_log_writer) == [
+            ("role.created", "4", 1),
+            ("role.updated", "4", 1),
+            ("role_permission.assigned", "4", 1),
+            ("role_permission.removed", "4", 1),
+            ("role_inheritance.assigned", "4", 1),
+            ("role_inheritance.removed", "4", 1),
+            ("role.deleted", "4", 1),
+        ]
+
+    asyncio.run(run_test())
+
+
+def test_user_mutations_record_audit_entries_only_for_applied_changes() -> None:
+    service, repository, audit_log_writer = _build_audited_service()
+    repository.create_user.return_value = User(id=7, username="ops_user", hashed_password="hash", disabled=False)
+    repository.get_user.return_value = User(id=7, username="ops_user", hashed_password="hash", disabled=False)
+    repository.get_role.return_value = Role(id=2, name="reader_role")
+    repository.list_user_role_ids.side_effect = [[], [], [2], [2], [2]]
+    repository.assign_user_role.side_effect = [True, True, False]
+    repository.remove_user_role.return_value = True
+
+    async def run_test() -> None:
+        await service.create_user(
+            CreateAdminUserCommand(username="ops_user", password="OpsUser123"),  # pragma: allowlist secret
+            actor_user_id=1,
+        )
+        await service.update_user(7, UpdateAdminUserCommand(disabled=True, role_ids=[2]), actor_user_id=1)
+        await service.update_user(7, UpdateAdminUserCommand(role_ids=[2]), actor_user_id=1)
+        await service.assign_user_role(7, 2, actor_user_id=1)
+        await service.assign_user_role(7, 2, actor_user_id=1)
+        await service.remove_user_role(7, 2, actor_user_id=1)
+        await service.delete_user(7, actor_user_id=1)
+
+        assert _recorded_audit_actions(audit_log_writer) == [
+            ("user.created", "7", 1),
+            ("user.updated", "7", 1),
+            ("user_role.assigned", "7", 1),
+            ("user_role.removed", "7", 1),
+            ("user.disabled", "7", 1),
+        ]
+        updated_entry = audit_log_writer.record.await_args_list[1].args[0]
+        assert updated_entry.summary == "Updated user ops_user: disabled, role_ids"
+
+    asyncio.run(run_test())
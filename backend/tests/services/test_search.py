@@ -0,0 +1,88 @@
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, call
+
+from app.core.common.integration import (
+    DeleteSearchDocumentCommand,
+    SearchDocumentsQuery,
+    SearchDocumentUpsertCommand,
+    SearchHit,
+)
+from app.features.search.service import SearchService
+
+
+def _build_unit_of_work_mock() -> MagicMock:
+    unit_of_work = MagicMock()
+    unit_of_work.__aenter__ = AsyncMock(return_value=unit_of_work)
+    unit_of_work.__aexit__ = AsyncMock(return_value=None)
+    return unit_of_work
+
+
+def _build_search_repository_mock() -> MagicMock:
+    search_repository = MagicMock()
+    search_repository.upsert_documents = AsyncMock(side_effect=lambda commands: len(commands))
+    search_repository.delete_documents = AsyncMock(side_effect=lambda commands: len(commands))
+    search_repository.clear_index = AsyncMock(return_value=3)
+    search_repository.search = AsyncMock(return_value=[])
+    return search_repository
+
+
+def test_search_service_writes_documents_in_transaction_scope() -> None:
+    search_repository = _build_search_repository_mock()
+    unit_of_work = _build_unit_of_work_mock()
+    service = SearchService(search_repository=search_repository, unit_of_work=unit_of_work)
+    upsert = SearchDocumentUpsertCommand(index="users", document_id="1", body={"username": "alice"})
+    delete = DeleteSearchDocumentCommand(index="users", document_id="2")
+
+    async def run_test() -> None:
+        await service.upsert_document(upsert)
+        await service.delete_document(delete)
+        assert await service.upsert_documents([]) == 0
+        assert await service.delete_documents([]) == 0
+        assert await service.apply_changes(upserts=[upsert], deletes=[]) == (1, 0)
+
+        assert search_repository.upsert_documents.await_args_list == [call([upsert]), call([upsert])]
+        search_repository.delete_documents.assert_awaited_once_with([delete])
+        assert unit_of_work.__aenter__.await_count == 3
+
+    asyncio.run(run_test())
+
+
+def test_search_service_rebuild_index_replaces_documents_in_one_transaction() -> None:
+    search_repository = _build_search_repository_mock()
+    unit_of_work = _build_unit_of_work_mock()
+    service = SearchService(search_repository=search_repository, unit_of_work=unit_of_work)
+    pages = [
+        [SearchDocumentUpsertCommand(index="roles", document_id=str(index), body={}) for index in range(2)],
+        [SearchDocumentUpsertCommand(index="roles", document_id="2", body={})],
+    ]
+
+    async def iter_pages() -> AsyncIterator[list[SearchDocumentUpsertCommand]]:
+        for page in pages:
+            yield page
+
+    async def run_test() -> None:
+        assert await service.rebuild_index("roles", iter_pages()) == 3
+
+        search_repository.clear_index.assert_awaited_once_with("roles")
+        assert search_repository.upsert_documents.await_count == 2
+        unit_of_work.__aenter__.assert_awaited_once_with()
+
+    asyncio.run(run_test())
+
+
+def test_search_service_search_delegates_to_repository() -> None:
+    search_repository = _build_search_repository_mock()
+    hit = SearchHit(index="users", document_id="1", score=0.5, body={"username": "alice"})
+    search_repository.search.return_value = [hit]
+    unit_of_work = _build_unit_of_work_mock()
+    service = SearchService(search_repository=search_repository, unit_of_work=unit_of_work)
+    query = SearchDocumentsQuery(index="users", text="ali")
+
+    async def run_test() -> None:
+        assert await service.search(query) == [hit]
+
+        search_repository.search.assert_awaited_once_with(query)
+        unit_of_work.__aenter__.assert_not_awaited()
+
+    asyncio.run(run_test())
@@ -0,0 +1,137 @@
+import asyncio
+import tempfile
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import delete, select
+
+from app.core.common.integration import PublishMessageCommand, SearchDocumentsQuery
+from app.core.db.database import Base
+from app.features.auth.models import User
+from app.features.outbox.models import OutboxEvent
+from app.features.outbox.relay import to_publish_message_command
+from app.features.outbox.schemas import OutboxEventRecord
+from app.features.rbac.models import Role
+from app.features.search.indexer import SearchIndexer, to_search_change
+from app.features.search.repository import SearchRepository
+from app.features.search.tracking import _record_search_changes, install_search_change_tracking
+from app.integrations.fanout_broker import FanOutMessageBroker
+from utils.testing_support.database import MockDatabase
+
+
+async def _take_outbox_messages(mock_db: MockDatabase) -> list[PublishMessageCommand]:
+    async with mock_db.Session() as session, session.begin():
+        events = (await session.execute(select(OutboxEvent).order_by(OutboxEvent.id))).scalars().all()
+        await session.execute(delete(OutboxEvent))
+    return [to_publish_message_command(OutboxEventRecord.model_validate(event)) for event in events]
+
+
+async def _search(mock_db: MockDatabase, index: str, text: str) -> list[str]:
+    async with mock_db.Session() as session:
+        hits = await SearchRepository(session=session).search(SearchDocumentsQuery(index=index, text=text))
+    return [hit.document_id for hit in hits]
+
+
+def test_search_tracking_feeds_indexer_through_outbox_events() -> None:
+    install_search_change_tracking()
+    install_search_change_tracking()
+
+    async def run_test(mock_db: MockDatabase) -> None:
+        await mock_db.setup(Base)
+        indexer = SearchIndexer(session_factory=mock_db.Session)
+
+        async with mock_db.Session() as session, session.begin():
+            alice = User(username="alice", hashed_password="hash")  # pragma: allowlist secret
+            auditor = Role(name="auditor")
+            session.add_all([alice, auditor])
+        async with mock_db.Session() as session, session.begin():
+            user = await session.get(User, alice.id)
+            assert user is not None
+            user.username = "alicia"
+            user.hashed_password = "rehash"  # pragma: allowlist secret
+            await session.flush()
+            user.hashed_password = "rehash-again"  # pragma: allowlist secret
+
+        messages = await _take_outbox_messages(mock_db)
+        assert [(message.topic, message.payload["event_type"]) for message in messages] == [
+            ("user", "user.upserted"),
+            ("role", "role.upserted"),
+            ("user", "user.upserted"),
+        ]
+        assert messages[-1].payload["payload"] == {"username": "alicia", "disabled": False}
+
+        await indexer.publish_many(messages)
+        assert await _search(mock_db, "users", "alic") == [str(alice.id)]
+        assert await _search(mock_db, "users", "alice") == []
+        assert await _search(mock_db, "roles", "audit") == [str(auditor.id)]
+
+        async with mock_db.Session() as session, session.begin():
+            await session.delete(await session.get(Role, auditor.id))
+        (deleted,) = await _take_outbox_messages(mock_db)
+        assert deleted.payload["event_type"] == "role.deleted"
+
+        await indexer.publish(deleted)
+        assert await _search(mock_db, "roles", "audit") == []
+
+        async with mock_db.Session() as session, session.begin():
+            session.add(Role(name="reviewer"))
+        await _take_outbox_messages(mock_db)
+        assert await indexer.reindex() == {"users": 1, "roles": 1}
+        assert await _search(mock_db, "roles", "review") != []
+        assert await _search(mock_db, "users", "alicia") == [str(alice.id)]
+
+    with tempfile.TemporaryDirectory(prefix="backend-search-indexer-") as db_tmp_dir:
+        mock_db = MockDatabase(path=db_tmp_dir, echo=False)
+        try:
+            asyncio.run(run_test(mock_db))
+        finally:
+            asyncio.run(mock_db.close())
+
+
+def test_search_indexer_ignores_untracked_topics() -> None:
+    session_factory = AsyncMock()
+    indexer = SearchIndexer(session_factory=session_factory)
+    message = PublishMessageCommand(topic="book", key="1", payload={"event_type": "book.updated", "payload": {}})
+
+    assert to_search_change(message) is None
+    assert to_search_change(PublishMessageCommand(topic="user", payload={"event_type": "user.upserted"})) is None
+
+    asyncio.run(indexer.publish_many([message]))
+    session_factory.assert_not_called()
+
+
+def test_fan_out_message_broker_publishes_to_every_broker_in_order() -> None:
+    calls: list[str] = []
+    first = AsyncMock()
+    first.publish.side_effect = lambda message: calls.append("first")
+    second = AsyncMock()
+    second.publish.side_effect = lambda message: calls.append("second")
+    message = PublishMessageCommand(topic="user", key="1", payload={})
+
+    asyncio.run(FanOutMessageBroker([first, second]).publish(message))
+
+    assert calls == ["first", "second"]
+    first.publish.assert_awaited_once_with(message)
+    second.publish.assert_awaited_once_with(message)
+
+
+def test_search_tracking_wakes_the_relay_on_postgres() -> None:
+    session = MagicMock()
+    session.new = [User(id=3, username="carol", hashed_password="hash", disabled=False)]  # pragma: allowlist secret
+    session.dirty = []
+    session.deleted = [Role(id=4, name="auditor"), OutboxEvent(id=1)]
+    connection = session.connection.return_value
+    connection.dialect.name = "postgresql"
+
+    _record_search_changes(session, MagicMock())
+
+    insert_call, notify_call = connection.execute.call_args_list
+    assert insert_call.args[1] == [
+        {
+            "aggregate_type": "user",
+            "aggregate_id": "3",
+            "event_type": "user.upserted",
+            "payload": {"username": "carol", "disabled": False},
+        },
+        {"aggregate_type": "role", "aggregate_id": "4", "event_type": "role.deleted", "payload": {}},
+    ]
+    assert "pg_notify" in str(notify_call.args[0])
@@ -13,6 +13,12 @@ ALLOWED_CROSS_FEATURE_IMPORT_PREFIXES: dict[str, tuple[str, ...]] = {
         "app.features.auth.models",
         "app.features.auth.principal",
     ),
+    "search": (
+        "app.features.auth.models",
+        "app.features.outbox.models",
+        "app.features.outbox.repository",
+        "app.features.rbac.models",
+    ),
 }
 
 
@@ -0,0 +1,98 @@
+from app.core.authorization.snapshot_cache import (
+    AuthorizationSnapshot,
+    AuthorizationSnapshotCache,
+    AuthorizationSnapshotCacheRuntime,
+)
+from app.core.common.records import UserRecord
+from app.core.config.settings import AuthSettings
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _snapshot(user_id: int, username: str, rbac_version: str = "1") -> AuthorizationSnapshot:
+    return AuthorizationSnapshot(
+        user=UserRecord(
+            id=user_id,
+            username=username,
+            hashed_password="hash",  # pragma: allowlist secret
+            disabled=False,
+        ),
+        rbac_version=rbac_version,
+    )
+
+
+def test_snapshot_cache_returns_stored_snapshot_until_ttl_expires() -> None:
+    clock = _FakeClock()
+    cache = AuthorizationSnapshotCache(ttl_seconds=5, max_entries=10, clock=clock)
+    cache.store(_snapshot(1, "admin"))
+
+    clock.now = 4.9
+    cached_snapshot = cache.get_by_username("admin")
+    assert cached_snapshot is not None
+    assert cached_snapshot.user.id == 1
+
+    clock.now = 5.0
+    assert cache.get_by_username("admin") is None
+    assert len(cache) == 0
+    assert cache.get_by_username("unknown") is None
+
+
+def test_snapshot_cache_evicts_least_recently_used_entry() -> None:
+    cache = AuthorizationSnapshotCache(ttl_seconds=60, max_entries=2)
+    cache.store(_snapshot(1, "admin"))
+    cache.store(_snapshot(2, "reader"))
+    assert cache.get_by_username("admin") is not None
+
+    cache.store(_snapshot(3, "auditor"))
+
+    assert len(cache) == 2
+    assert cache.get_by_username("reader") is None
+    assert cache.get_by_username("admin") is not None
+    assert cache.get_by_username("auditor") is not None
+
+
+def test_snapshot_cache_replaces_entry_when_username_changes() -> None:
+    cache = AuthorizationSnapshotCache(ttl_seconds=60, max_entries=10)
+    cache.store(_snapshot(1, "admin"))
+    cache.store(_snapshot(1, "root", rbac_version="2"))
+    cache.store(_snapshot(2, "admin"))
+
+    cache.invalidate_user(1)
+
+    assert cache.get_by_username("root") is None
+    admin_snapshot = cache.get_by_username("admin")
+    assert admin_snapshot is not None
+    assert admin_snapshot.user.id == 2
+
+    cache.invalidate_user(99)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_snapshot_cache_is_disabled_with_zero_ttl() -> None:
+    cache = AuthorizationSnapshotCache(ttl_seconds=0, max_entries=10)
+    cache.store(_snapshot(1, "admin"))
+
+    assert cache.enabled is False
+    assert cache.get_by_username("admin") is None
+    assert len(cache) == 0
+
+
+def test_snapshot_cache_runtime_builds_cache_lazily_from_settings() -> None:
+    runtime = AuthorizationSnapshotCacheRuntime(
+        settings_loader=lambda: AuthSettings(AUTH_SNAPSHOT_CACHE_TTL_SECONDS=0),
+    )
+
+    cache = runtime.get_cache()
+
+    assert runtime.get_cache() is cache
+    assert cache.enabled is False
+
+    runtime.reset()
+    assert runtime.get_cache() is not cache
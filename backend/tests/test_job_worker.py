@@ -0,0 +1,61 @@
+import asyncio
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.db.database import Base
+from app.features.jobs.models import Job
+from utils import job_worker
+from utils.testing_support.database import MockDatabase
+
+
+def test_job_worker_main_drains_once_and_prints_report(capsys: pytest.CaptureFixture[str]) -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-job-worker-") as db_tmp_dir:
+        mock_db = MockDatabase(path=db_tmp_dir, echo=False)
+        asyncio.run(mock_db.setup(Base))
+        asyncio.run(mock_db.load_rows(Job, [{"job_name": "unregistered.job", "payload": {}}]))
+        try:
+            with (
+                patch.object(job_worker, "get_async_session_factory", return_value=mock_db.Session),
+                patch("sys.argv", ["job_worker", "--once", "--processes", "1"]),
+            ):
+                assert job_worker.main() == 0
+        finally:
+            asyncio.run(mock_db.close())
+
+    assert capsys.readouterr().out == "Jobs drained.\n- succeeded: 0\n- retried: 0\n- failed: 1\n"
+
+
+def test_job_worker_main_rejects_invalid_arguments(capsys: pytest.CaptureFixture[str]) -> None:
+    with patch("sys.argv", ["job_worker", "--concurrency", "0"]):
+        assert job_worker.main() == 2
+
+    assert "--concurrency must be >= 1" in capsys.readouterr().out
+
+    with patch("sys.argv", ["job_worker", "--poll-interval", "2", "--max-poll-interval", "1"]):
+        assert job_worker.main() == 2
+
+    assert "--max-poll-interval >= --poll-interval" in capsys.readouterr().out
+
+
+def test_job_worker_main_runs_until_stopped() -> None:
+    worker = MagicMock()
+    worker.run = AsyncMock()
+
+    with (
+        patch.object(job_worker, "build_worker", return_value=worker) as build_worker,
+        patch("sys.argv", ["job_worker", "--concurrency", "8", "--visibility-timeout", "60"]),
+    ):
+        assert job_worker.main() == 0
+
+    build_worker.assert_called_once_with(
+        concurrency=8,
+        visibility_timeout_seconds=60.0,
+        poll_interval_seconds=1.0,
+        max_poll_interval_seconds=10.0,
+        process_pool=None,
+    )
+    stop_event = worker.run.await_args.args[0]
+    assert isinstance(stop_event, asyncio.Event)
+    assert not stop_event.is_set()
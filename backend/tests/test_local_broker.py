@@ -0,0 +1,126 @@
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.core.common.integration import PublishMessageCommand
+from app.integrations.local_broker import (
+    BrokerOverflowError,
+    InProcessMessageBroker,
+    OverflowPolicy,
+)
+
+
+def _message(topic: str, key: str) -> PublishMessageCommand:
+    return PublishMessageCommand(topic=topic, key=key, payload={"key": key})
+
+
+def test_in_process_broker_delivers_batches_to_matching_subscriptions() -> None:
+    async def scenario() -> None:
+        broker = InProcessMessageBroker()
+        books = broker.subscribe("book", batch_size=2)
+        everything = broker.subscribe()
+
+        await broker.publish_many([_message("book", "1"), _message("author", "2"), _message("book", "3")])
+        await broker.publish_many([])
+
+        first_batch = await books.get_batch()
+        assert [(delivered.offset, delivered.message.key) for delivered in first_batch] == [(0, "1"), (2, "3")]
+        assert [delivered.message.key for delivered in await everything.get_batch()] == ["1", "2", "3"]
+        assert books.delivered_count == 2
+        assert await books.get_batch(timeout=0.01) == []
+
+        broker.unsubscribe(books)
+        broker.unsubscribe(books)
+        await broker.publish(_message("book", "4"))
+        assert books.pending_count == 0
+        assert everything.pending_count == 1
+
+    asyncio.run(scenario())
+
+
+def test_in_process_broker_applies_overflow_policies() -> None:
+    async def scenario() -> None:
+        broker = InProcessMessageBroker()
+        dropping = broker.subscribe("book", max_queue_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        failing = broker.subscribe("author", max_queue_size=1, overflow_policy=OverflowPolicy.FAIL)
+
+        await broker.publish_many([_message("book", str(index)) for index in range(3)])
+        assert [delivered.message.key for delivered in await dropping.get_batch()] == ["1", "2"]
+        assert dropping.dropped_count == 1
+
+        await broker.publish(_message("author", "1"))
+        with pytest.raises(BrokerOverflowError, match="'author' is full"):
+            await broker.publish(_message("author", "2"))
+        assert failing.pending_count == 1
+
+    asyncio.run(scenario())
+
+
+def test_in_process_broker_rejects_whole_batch_when_a_fail_subscription_lacks_room() -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-local-broker-") as tmp_dir:
+        log_path = Path(tmp_dir) / "messages.jsonl"
+
+        async def scenario() -> None:
+            broker = InProcessMessageBroker(log_path=log_path)
+            everything = broker.subscribe(max_queue_size=10, overflow_policy=OverflowPolicy.DROP_OLDEST)
+            failing = broker.subscribe("author", max_queue_size=2, overflow_policy=OverflowPolicy.FAIL)
+            await broker.publish(_message("author", "1"))
+
+            with pytest.raises(BrokerOverflowError, match="'author' is full"):
+                await broker.publish_many([_message("book", "2"), _message("author", "3"), _message("author", "4")])
+
+            assert failing.pending_count == 1
+            assert [delivered.message.key for delivered in await everything.get_batch()] == ["1"]
+            assert [delivered.offset for delivered in broker.replay()] == [0]
+
+            await broker.publish_many([_message("book", "2"), _message("author", "3")])
+            assert [delivered.offset for delivered in await failing.get_batch()] == [0, 2]
+
+        asyncio.run(scenario())
+
+
+def test_in_process_broker_blocks_publishers_until_subscribers_catch_up() -> None:
+    async def scenario() -> None:
+        broker = InProcessMessageBroker()
+        subscription = broker.subscribe("book", max_queue_size=1)
+        await broker.publish(_message("book", "1"))
+
+        publish_task = asyncio.create_task(broker.publish(_message("book", "2")))
+        await asyncio.sleep(0.01)
+        assert not publish_task.done()
+
+        assert [delivered.message.key for delivered in await subscription.get_batch()] == ["1"]
+        await publish_task
+        assert [delivered.message.key for delivered in await subscription.get_batch()] == ["2"]
+
+    asyncio.run(scenario())
+
+
+def test_in_process_broker_appends_messages_to_a_replayable_log() -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-local-broker-") as tmp_dir:
+        log_path = Path(tmp_dir) / "messages.jsonl"
+        assert InProcessMessageBroker(log_path=log_path).replay() == []
+
+        with patch("app.integrations.local_broker.os.fsync") as fsync:
+            asyncio.run(
+                InProcessMessageBroker(log_path=log_path, fsync=True).publish_many(
+                    [_message("book", "1"), _message("author", "2")]
+                )
+            )
+        fsync.assert_called_once()
+
+        # Offsets continue from the existing log after a restart.
+        restarted = InProcessMessageBroker(log_path=log_path)
+        asyncio.run(restarted.publish(_message("book", "3")))
+
+        assert [(delivered.offset, delivered.message.key) for delivered in restarted.replay(from_offset=1)] == [
+            (1, "2"),
+            (2, "3"),
+        ]
+        assert [delivered.message.key for delivered in restarted.replay(topic="book")] == ["1", "3"]
+        assert restarted.replay()[0].message == _message("book", "1")
+
+    assert InProcessMessageBroker().replay() == []
@@ -0,0 +1,111 @@
+import asyncio
+import hashlib
+import tempfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.core.common.integration import StoreFileCommand, StoreFileStreamCommand
+from app.integrations.local_files import InvalidFilePathError, LocalFileStorage
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+async def _read_all(storage: LocalFileStorage, *, bucket: str, path: str) -> list[bytes]:
+    return [chunk async for chunk in storage.read_stream(bucket=bucket, path=path)]
+
+
+def test_local_file_storage_streams_writes_and_reads_in_chunks() -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-local-files-") as root:
+        storage = LocalFileStorage(Path(root), read_chunk_size=4)
+        command = StoreFileStreamCommand(bucket="avatars", path="users/1/photo.png", content_type="image/png")
+
+        async def run_test() -> None:
+            stored = await storage.store_stream(command, _chunks(b"hello ", b"streamed ", b"world"))
+
+            assert stored.etag == hashlib.md5(b"hello streamed world", usedforsecurity=False).hexdigest()
+            assert stored.size == 20
+            assert await _read_all(storage, bucket="avatars", path="users/1/photo.png") == [
+                b"hell",
+                b"o st",
+                b"ream",
+                b"ed w",
+                b"orld",
+            ]
+
+            replaced = await storage.store(
+                StoreFileCommand(bucket="avatars", path="users/1/photo.png", content_type="image/png", body=b"new")
+            )
+            assert (replaced.size, replaced.bucket, replaced.path) == (3, "avatars", "users/1/photo.png")
+            assert b"".join(await _read_all(storage, bucket="avatars", path="users/1/photo.png")) == b"new"
+
+            assert await storage.delete(bucket="avatars", path="users/1/photo.png")
+            assert not await storage.delete(bucket="avatars", path="users/1/photo.png")
+
+        asyncio.run(run_test())
+        assert [path.name for path in Path(root).rglob("*") if path.is_file()] == []
+
+
+def test_local_file_storage_discards_partial_writes() -> None:
+    async def failing_chunks() -> AsyncIterator[bytes]:
+        yield b"partial"
+        raise ConnectionError("client went away")
+
+    with tempfile.TemporaryDirectory(prefix="backend-local-files-") as root:
+        storage = LocalFileStorage(Path(root), fsync=False)
+
+        async def run_test() -> None:
+            await storage.store(StoreFileCommand(bucket="docs", path="a.txt", content_type="text/plain", body=b"old"))
+            with pytest.raises(ConnectionError):
+                await storage.store_stream(
+                    StoreFileStreamCommand(bucket="docs", path="a.txt", content_type="text/plain"),
+                    failing_chunks(),
+                )
+
+        asyncio.run(run_test())
+
+        # The previous version stays in place and no temporary file is left behind.
+        assert [path.name for path in (Path(root) / "docs").iterdir()] == ["a.txt"]
+        assert (Path(root) / "docs" / "a.txt").read_bytes() == b"old"
+
+
+def test_local_file_storage_serves_files_through_file_response() -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-local-files-") as root:
+        storage = LocalFileStorage(Path(root))
+        with patch("app.integrations.local_files.os.fsync") as fsync:
+            asyncio.run(
+                storage.store(StoreFileCommand(bucket="docs", path="report.pdf", content_type="x", body=b"%PDF"))
+            )
+        fsync.assert_called_once()
+
+        response = storage.file_response(bucket="docs", path="report.pdf")
+        assert Path(response.path) == (Path(root) / "docs" / "report.pdf").resolve()
+        assert response.media_type == "application/pdf"
+        assert storage.file_response(bucket="docs", path="report.pdf", media_type="text/plain").media_type == (
+            "text/plain"
+        )
+
+        with pytest.raises(FileNotFoundError):
+            storage.file_response(bucket="docs", path="missing.pdf")
+
+
+@pytest.mark.parametrize(
+    ("bucket", "path"),
+    [("docs", "../escape.txt"), ("docs", "/etc/passwd"), ("", "a.txt"), ("docs", ""), ("docs", "link/secret.txt")],
+)
+def test_local_file_storage_rejects_paths_outside_the_root(bucket: str, path: str) -> None:
+    with (
+        tempfile.TemporaryDirectory(prefix="backend-local-files-") as outside,
+        tempfile.TemporaryDirectory(prefix="backend-local-files-") as root,
+    ):
+        (Path(root) / "docs").mkdir()
+        (Path(root) / "docs" / "link").symlink_to(outside)
+        storage = LocalFileStorage(Path(root))
+
+        with pytest.raises(InvalidFilePathError):
+            storage.local_path(bucket=bucket, path=path)
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from app.core.common.integration import TakeRateLimitTokenCommand
+from app.core.config.settings import RateLimitSettings
+from app.core.errors.services import TooManyRequestsError
+from app.core.setup.rate_limit import LoginRateLimiter, LoginRateLimiterRuntime, build_rate_limit_store
+from app.features.rate_limit.store import DatabaseRateLimitStore
+from app.integrations.local_rate_limit import InMemoryRateLimitStore
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _command(key: str = "login:user:admin") -> TakeRateLimitTokenCommand:
+    return TakeRateLimitTokenCommand(key=key, capacity=2, refill_per_second=0.5)
+
+
+def test_in_memory_store_spends_burst_then_refills_over_time() -> None:
+    clock = _FakeClock()
+    store = InMemoryRateLimitStore(clock=clock)
+
+    async def run_test() -> None:
+        assert (await store.take(_command())).allowed is True
+        assert (await store.take(_command())).allowed is True
+        denied = await store.take(_command())
+        assert denied.allowed is False
+        assert denied.retry_after_seconds == pytest.approx(2.0)
+
+        clock.now = 1.0
+        assert (await store.take(_command())).retry_after_seconds == pytest.approx(1.0)
+
+        clock.now = 2.0
+        assert (await store.take(_command())).allowed is True
+        assert (await store.take(_command("login:user:other"))).allowed is True
+
+    asyncio.run(run_test())
+
+
+def test_in_memory_store_evicts_least_recently_used_keys_per_shard() -> None:
+    store = InMemoryRateLimitStore(shard_count=1, max_keys=2)
+
+    async def run_test() -> None:
+        await store.take(_command("a"))
+        await store.take(_command("a"))
+        await store.take(_command("b"))
+        await store.take(_command("c"))
+
+        assert len(store) == 2
+        # "a" was evicted with its spent tokens, so it starts again from a full bucket.
+        assert (await store.take(_command("a"))).allowed is True
+        assert (await store.take(_command("a"))).allowed is True
+
+    asyncio.run(run_test())
+
+
+def test_login_rate_limiter_rejects_with_retry_after_and_spares_user_bucket_on_ip_limit() -> None:
+    store = InMemoryRateLimitStore(clock=_FakeClock())
+    limiter = LoginRateLimiter(store, user_burst=2, user_per_minute=6, ip_burst=1, ip_per_minute=60)
+
+    async def run_test() -> None:
+        await limiter.check(username=" Admin ", client_ip="10.0.0.1")
+
+        with pytest.raises(TooManyRequestsError) as ip_limited:
+            await limiter.check(username="admin", client_ip="10.0.0.1")
+        assert ip_limited.value.headers == {"Retry-After": "1"}
+
+        # Only the first attempt spent a token from the shared "admin" bucket.
+        await limiter.check(username="ADMIN", client_ip="10.0.0.2")
+        with pytest.raises(TooManyRequestsError) as user_limited:
+            await limiter.check(username="admin", client_ip="10.0.0.3")
+        assert user_limited.value.code == "rate_limited"
+        assert user_limited.value.headers == {"Retry-After": "10"}
+
+    asyncio.run(run_test())
+
+
+def test_disabled_login_rate_limiter_never_consumes_tokens() -> None:
+    store = InMemoryRateLimitStore()
+    limiter = LoginRateLimiter(store, user_burst=1, user_per_minute=1, ip_burst=1, ip_per_minute=1, enabled=False)
+
+    async def run_test() -> None:
+        for _ in range(3):
+            await limiter.check(username="admin", client_ip="10.0.0.1")
+
+    asyncio.run(run_test())
+    assert len(store) == 0
+
+
+def test_build_rate_limit_store_selects_backend_from_settings() -> None:
+    assert isinstance(build_rate_limit_store(RateLimitSettings()), InMemoryRateLimitStore)
+    assert isinstance(
+        build_rate_limit_store(RateLimitSettings(LOGIN_RATE_LIMIT_STORE="database")),
+        DatabaseRateLimitStore,
+    )
+
+
+def test_login_rate_limiter_runtime_reuses_limiter_until_reset() -> None:
+    runtime = LoginRateLimiterRuntime(settings_loader=RateLimitSettings)
+
+    limiter = runtime.get_limiter()
+    assert runtime.get_limiter() is limiter
+
+    runtime.reset()
+    assert runtime.get_limiter() is not limiter
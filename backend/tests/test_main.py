@@ -129,6 +129,22 @@ def test_app_lifespan_logs_startup_and_shutdown() -> None:
     )
 
 
+def test_app_lifespan_starts_and_drains_audit_log_writer() -> None:
+    audit_log_writer = MagicMock()
+    audit_log_writer.start = AsyncMock()
+    audit_log_writer.stop = AsyncMock()
+
+    async def run_lifespan() -> None:
+        async with app_lifespan(FastAPI()):
+            audit_log_writer.start.assert_awaited_once()
+            audit_log_writer.stop.assert_not_awaited()
+
+    with patch("app.core.setup.factory.get_audit_log_writer", return_value=audit_log_writer):
+        asyncio.run(run_lifespan())
+
+    audit_log_writer.stop.assert_awaited_once()
+
+
 def test_request_context_middleware_generates_request_id_and_logs_success() -> None:
     logger = MagicMock()
     with patch("app.core.setup.factory.logging.getLogger", return_value=logger):
@@ -362,6 +378,7 @@ def test_configure_cors_adds_cors_middleware_when_origins_are_provided() -> None
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
 
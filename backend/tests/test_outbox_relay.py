@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.engine import URL
+
+from app.core.common.integration import PublishMessageCommand
+from app.core.db.database import Base
+from app.features.outbox.models import OutboxEvent, outbox_shard_key
+from app.features.search.indexer import SearchIndexer
+from app.integrations.fanout_broker import FanOutMessageBroker
+from app.integrations.local_broker import InProcessMessageBroker
+from app.integrations.logging_broker import LoggingMessageBroker
+from utils import outbox_relay
+from utils.testing_support.database import MockDatabase
+
+
+def test_logging_message_broker_logs_published_messages(caplog: pytest.LogCaptureFixture) -> None:
+    broker = LoggingMessageBroker()
+
+    with caplog.at_level(logging.INFO, logger="app.integrations.broker"):
+        asyncio.run(broker.publish(PublishMessageCommand(topic="book", key="42", payload={"event_id": 1})))
+
+    assert "event=broker_message_published layer=integration key=42 topic=book" in caplog.text
+
+
+def test_outbox_relay_main_drains_once_and_prints_report(capsys: pytest.CaptureFixture[str]) -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-outbox-relay-") as db_tmp_dir:
+        mock_db = MockDatabase(path=db_tmp_dir, echo=False)
+        asyncio.run(mock_db.setup(Base))
+        asyncio.run(
+            mock_db.load_rows(
+                OutboxEvent,
+                [
+                    {"aggregate_type": "book", "aggregate_id": "1", "event_type": "book.created", "payload": {}},
+                    {"aggregate_type": "book", "aggregate_id": "2", "event_type": "book.created", "payload": {}},
+                ],
+            )
+        )
+        try:
+            with (
+                patch.object(outbox_relay, "get_async_session_factory", return_value=mock_db.Session),
+                patch.object(outbox_relay, "get_database_url", return_value=mock_db.engine.url),
+                patch("sys.argv", ["outbox_relay", "--once", "--batch-size", "1"]),
+            ):
+                assert outbox_relay.main() == 0
+        finally:
+            asyncio.run(mock_db.close())
+
+    assert capsys.readouterr().out == "Outbox drained.\n- published: 2\n"
+
+
+def test_outbox_relay_main_appends_published_events_to_the_broker_log(capsys: pytest.CaptureFixture[str]) -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-outbox-relay-") as db_tmp_dir:
+        mock_db = MockDatabase(path=db_tmp_dir, echo=False)
+        asyncio.run(mock_db.setup(Base))
+        asyncio.run(
+            mock_db.load_rows(
+                OutboxEvent,
+                [{"aggregate_type": "author", "aggregate_id": "7", "event_type": "author.created", "payload": {}}],
+            )
+        )
+        log_path = Path(db_tmp_dir) / "broker" / "messages.jsonl"
+        try:
+            with (
+                patch.object(outbox_relay, "get_async_session_factory", return_value=mock_db.Session),
+                patch.object(outbox_relay, "get_database_url", return_value=mock_db.engine.url),
+                patch("sys.argv", ["outbox_relay", "--once", "--broker-log", str(log_path), "--broker-fsync"]),
+            ):
+                assert outbox_relay.main() == 0
+        finally:
+            asyncio.run(mock_db.close())
+
+        replayed = InProcessMessageBroker(log_path=log_path).replay()
+
+    assert capsys.readouterr().out == "Outbox drained.\n- published: 1\n"
+    assert [(delivered.offset, delivered.message.topic, delivered.message.key) for delivered in replayed] == [
+        (0, "author", "7")
+    ]
+    assert replayed[0].message.payload["event_type"] == "author.created"
+
+
+def test_build_relay_fans_out_to_the_search_indexer() -> None:
+    session_factory = MagicMock()
+
+    with (
+        patch.object(outbox_relay, "get_async_session_factory", return_value=session_factory),
+        patch.object(outbox_relay, "get_database_url", return_value=MagicMock()),
+    ):
+        relay = outbox_relay.build_relay(
+            batch_size=10,
+            poll_interval_seconds=1.0,
+            max_poll_interval_seconds=1.0,
+            index_search=True,
+        )
+
+    broker = relay._message_broker
+    assert isinstance(broker, FanOutMessageBroker)
+    assert [type(target) for target in broker._brokers] == [LoggingMessageBroker, SearchIndexer]
+    assert broker._brokers[1]._session_factory is session_factory
+
+
+def test_outbox_relay_main_rejects_search_indexing_on_sqlite(capsys: pytest.CaptureFixture[str]) -> None:
+    with (
+        patch.object(outbox_relay, "get_database_url", return_value=URL.create("sqlite+aiosqlite", database="x.db")),
+        patch.object(outbox_relay, "build_relay") as build_relay,
+        patch("sys.argv", ["outbox_relay", "--once", "--index-search"]),
+    ):
+        assert outbox_relay.main() == 2
+
+    build_relay.assert_not_called()
+    assert "--index-search requires PostgreSQL" in capsys.readouterr().out
+
+
+def test_outbox_relay_main_reports_published_events_per_shard(capsys: pytest.CaptureFixture[str]) -> None:
+    aggregate_ids = [str(index) for index in range(6)]
+    with tempfile.TemporaryDirectory(prefix="backend-outbox-relay-") as db_tmp_dir:
+        mock_db = MockDatabase(path=db_tmp_dir, echo=False)
+        asyncio.run(mock_db.setup(Base))
+        asyncio.run(
+            mock_db.load_rows(
+                OutboxEvent,
+                [
+                    {
+                        "aggregate_type": "book",
+                        "aggregate_id": aggregate_id,
+                        "event_type": "book.created",
+                        "payload": {},
+                    }
+                    for aggregate_id in aggregate_ids
+                ],
+            )
+        )
+        try:
+            with (
+                patch.object(outbox_relay, "get_async_session_factory", return_value=mock_db.Session),
+                patch.object(outbox_relay, "get_database_url", return_value=mock_db.engine.url),
+                patch("sys.argv", ["outbox_relay", "--once", "--shards", "2"]),
+            ):
+                assert outbox_relay.main() == 0
+        finally:
+            asyncio.run(mock_db.close())
+
+    shard_one_count = sum(outbox_shard_key("book", aggregate_id) % 2 for aggregate_id in aggregate_ids)
+    assert capsys.readouterr().out == (
+        "Outbox drained.\n"
+        "- published: 6\n"
+        f"- shard_0_published: {6 - shard_one_count}\n"
+        f"- shard_1_published: {shard_one_count}\n"
+    )
+
+
+def test_outbox_relay_main_rejects_invalid_arguments(capsys: pytest.CaptureFixture[str]) -> None:
+    with patch("sys.argv", ["outbox_relay", "--batch-size", "0"]):
+        assert outbox_relay.main() == 2
+
+    assert "--batch-size must be >= 1" in capsys.readouterr().out
+
+    with patch("sys.argv", ["outbox_relay", "--poll-interval", "2", "--max-poll-interval", "1"]):
+        assert outbox_relay.main() == 2
+
+    with patch("sys.argv", ["outbox_relay", "--shards", "2", "--shard-index", "2"]):
+        assert outbox_relay.main() == 2
+
+    assert "every --shard-index must be between 0 and --shards - 1" in capsys.readouterr().out
+
+    with patch("sys.argv", ["outbox_relay", "--retry-base", "10", "--retry-max", "5"]):
+        assert outbox_relay.main() == 2
+
+    assert "--retry-max >= --retry-base" in capsys.readouterr().out
+
+
+def test_outbox_relay_main_runs_until_stopped() -> None:
+    relay = MagicMock()
+    relay.run = AsyncMock()
+
+    with (
+        patch.object(outbox_relay, "build_relay", return_value=relay) as build_relay,
+        patch("sys.argv", ["outbox_relay", "--poll-interval", "0.5"]),
+    ):
+        assert outbox_relay.main() == 0
+
+    build_relay.assert_called_once_with(
+        batch_size=100,
+        poll_interval_seconds=0.5,
+        max_poll_interval_seconds=10.0,
+        shard_count=1,
+        shard_indexes=None,
+        max_attempts=10,
+        retry_base_seconds=1.0,
+        retry_max_seconds=300.0,
+        message_broker=None,
+        index_search=False,
+    )
+    stop_event = relay.run.await_args.args[0]
+    assert isinstance(stop_event, asyncio.Event)
+    assert not stop_event.is_set()
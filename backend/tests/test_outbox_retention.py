@@ -0,0 +1,47 @@
+import asyncio
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from app.core.db.database import Base
+from app.features.outbox.retention import OutboxRetentionReport
+from utils import outbox_retention
+from utils.testing_support.database import MockDatabase
+
+
+def test_outbox_retention_main_runs_job_and_prints_report(capsys: pytest.CaptureFixture[str]) -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-outbox-retention-") as db_tmp_dir:
+        mock_db = MockDatabase(path=db_tmp_dir, echo=False)
+        asyncio.run(mock_db.setup(Base))
+        try:
+            with (
+                patch.object(outbox_retention, "get_async_session_factory", return_value=mock_db.Session),
+                patch("sys.argv", ["outbox_retention", "--retention-days", "7"]),
+            ):
+                assert outbox_retention.main() == 0
+        finally:
+            asyncio.run(mock_db.close())
+
+    assert capsys.readouterr().out == (
+        "Outbox retention completed.\n"
+        "- partitions_created: 0\n"
+        "- partitions_dropped: 0\n"
+        "- partitions_kept_pending: 0\n"
+        "- events_deleted: 0\n"
+    )
+
+
+def test_outbox_retention_report_labels_archived_partitions() -> None:
+    report = OutboxRetentionReport(removed_partitions=("outbox_events_p202601",), archived_count=3)
+
+    formatted = outbox_retention._format_report(report, archive=True)  # pyright: ignore[reportPrivateUsage]
+    assert "- partitions_archived: 1" in formatted
+    assert formatted.endswith("- events_archived: 3")
+
+
+def test_outbox_retention_main_rejects_invalid_arguments(capsys: pytest.CaptureFixture[str]) -> None:
+    with patch("sys.argv", ["outbox_retention", "--retention-days", "-1"]):
+        assert outbox_retention.main() == 2
+
+    assert "--retention-days and --premake-months must be >= 0." in capsys.readouterr().out
@@ -0,0 +1,33 @@
+import base64
+
+import pytest
+
+from app.core.common.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def _raw_cursor(payload: str) -> str:
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def test_cursor_round_trips_without_padding() -> None:
+    cursor = encode_cursor(("reader_user", 3))
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("reader_user", 3)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "%%%",
+        "bm90LWpzb24",
+        _raw_cursor('{"id": 3}'),
+        _raw_cursor("[]"),
+        _raw_cursor("[true]"),
+        _raw_cursor("[1.5]"),
+        "é",
+    ],
+)
+def test_decode_cursor_rejects_malformed_values(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError, match="Malformed pagination cursor"):
+        decode_cursor(cursor)
@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.core.security.service import Argon2CostProfile
+from utils import password_hash_calibrate
+from utils.password_hash_calibrate import CalibrationResult
+
+
+def _fake_measure(profile: Argon2CostProfile, *, samples: int, concurrency: int) -> CalibrationResult:
+    # Latency grows with the work an Argon2 hash does: passes times memory.
+    latency_ms = profile.time_cost * profile.memory_cost_kib / 1_000
+    return CalibrationResult(profile=profile, p50_ms=latency_ms, p99_ms=latency_ms * 1.5)
+
+
+def test_calibrate_main_recommends_costliest_candidate_within_target(capsys: pytest.CaptureFixture[str]) -> None:
+    argv = [
+        "password_hash_calibrate",
+        "--target-p99-ms",
+        "300",
+        "--memory-cost-kib",
+        "19456",
+        "65536",
+        "--max-time-cost",
+        "5",
+    ]
+    with (
+        patch.object(password_hash_calibrate, "measure_profile", side_effect=_fake_measure) as measure_profile,
+        patch("sys.argv", argv),
+    ):
+        assert password_hash_calibrate.main() == 0
+
+    # 19456 KiB stays within target for every time cost; 65536 KiB stops at the first miss (time_cost=4).
+    assert measure_profile.call_count == 9
+    assert capsys.readouterr().out.endswith(
+        "Recommended settings (p99 294.9ms <= 300ms):\n"
+        "PASSWORD_HASH_TIME_COST=3\n"
+        "PASSWORD_HASH_MEMORY_COST_KIB=65536\n"
+        "PASSWORD_HASH_PARALLELISM=4\n"
+    )
+
+
+def test_calibrate_main_reports_when_no_candidate_meets_target(capsys: pytest.CaptureFixture[str]) -> None:
+    with (
+        patch.object(password_hash_calibrate, "measure_profile", side_effect=_fake_measure),
+        patch("sys.argv", ["password_hash_calibrate", "--target-p99-ms", "1"]),
+    ):
+        assert password_hash_calibrate.main() == 1
+
+    assert "No candidate met the 1ms p99 target." in capsys.readouterr().out
+
+
+def test_measure_profile_reports_latency_percentiles() -> None:
+    profile = Argon2CostProfile(time_cost=1, memory_cost_kib=8, parallelism=1)
+
+    result = password_hash_calibrate.measure_profile(profile, samples=3, concurrency=2)
+
+    assert result.profile == profile
+    assert 0 < result.p50_ms <= result.p99_ms
+
+
+def test_calibrate_main_rejects_invalid_arguments(capsys: pytest.CaptureFixture[str]) -> None:
+    with patch("sys.argv", ["password_hash_calibrate", "--samples", "0"]):
+        assert password_hash_calibrate.main() == 2
+
+    assert "--samples, --concurrency, --max-time-cost and --parallelism must be >= 1." in capsys.readouterr().out
@@ -0,0 +1,62 @@
+from app.core.authorization import (
+    PERMISSION_BITSET_VERSION,
+    PERMISSION_IDS,
+    PERMISSION_SCOPE_RANK,
+    PermissionId,
+    PermissionScope,
+    decode_permission_scopes,
+    encode_permission_scopes,
+    merge_permission_bitsets,
+    split_permission_scopes,
+)
+
+
+def test_permission_bitset_packs_two_bits_per_catalog_permission() -> None:
+    scopes = {
+        PermissionId.AUDIT_LOG_READ: PermissionScope.OWN,
+        PermissionId.ROLE_MANAGE: PermissionScope.TENANT,
+        PermissionId.USER_MANAGE: PermissionScope.ANY,
+    }
+
+    bitset = encode_permission_scopes(scopes)
+
+    assert bitset == 0b11_00_00_10_01
+    assert decode_permission_scopes(bitset) == dict.fromkeys(PERMISSION_IDS) | scopes
+
+
+def test_permission_bitset_treats_missing_grants_as_empty() -> None:
+    assert encode_permission_scopes(dict.fromkeys(PERMISSION_IDS)) == 0
+    assert decode_permission_scopes(0) == dict.fromkeys(PERMISSION_IDS)
+
+
+def test_permission_bitset_version_fingerprints_catalog_order() -> None:
+    assert len(PERMISSION_BITSET_VERSION) == 8
+    assert int(PERMISSION_BITSET_VERSION, 16) >= 0
+
+
+def test_merge_permission_bitsets_keeps_broadest_scope_per_permission() -> None:
+    scope_options = (None, PermissionScope.OWN, PermissionScope.TENANT, PermissionScope.ANY)
+    for left_scope in scope_options:
+        for right_scope in scope_options:
+            left = encode_permission_scopes(
+                {PermissionId.ROLE_MANAGE: left_scope, PermissionId.USER_MANAGE: right_scope}
+            )
+            right = encode_permission_scopes(
+                {PermissionId.ROLE_MANAGE: right_scope, PermissionId.USER_MANAGE: left_scope}
+            )
+
+            merged = decode_permission_scopes(merge_permission_bitsets(left, right))
+
+            granted_scopes = [scope for scope in (left_scope, right_scope) if scope is not None]
+            expected_scope = max(granted_scopes, key=PERMISSION_SCOPE_RANK.__getitem__, default=None)
+            assert merged[PermissionId.ROLE_MANAGE] == expected_scope
+            assert merged[PermissionId.USER_MANAGE] == expected_scope
+
+
+def test_split_permission_scopes_keeps_permissions_outside_catalog_aside() -> None:
+    bitset, uncataloged_scopes = split_permission_scopes(
+        {PermissionId.ROLE_MANAGE: PermissionScope.ANY, "reports:export": PermissionScope.OWN}
+    )
+
+    assert decode_permission_scopes(bitset)[PermissionId.ROLE_MANAGE] == PermissionScope.ANY
+    assert uncataloged_scopes == {"reports:export": PermissionScope.OWN}
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db.database import Base
 from app.features.auth.models import User
-from app.features.rbac.models import Permission, Role, RolePermission, UserRole
+from app.features.rbac.models import Permission, Role, RolePermission, UserEffectivePermission, UserRole
 from utils.rbac_bootstrap import BASE_PERMISSION_SPECS, BASE_ROLE_PERMISSION_SPECS, bootstrap_rbac
 from utils.testing_support.database import MockDatabase
 
@@ -54,6 +54,7 @@ def test_bootstrap_rbac_is_idempotent() -> None:
                     assert await _count_rows(session, RolePermission) == len(BASE_PERMISSION_SPECS)
                     assert await _count_rows(session, User) == 1
                     assert await _count_rows(session, UserRole) == 1
+                    assert await _count_rows(session, UserEffectivePermission) == len(BASE_PERMISSION_SPECS)
                     role_permissions = (await session.execute(select(RolePermission))).scalars().all()
                     assert {role_permission.scope for role_permission in role_permissions} == {"any"}
 
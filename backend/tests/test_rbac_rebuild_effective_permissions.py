@@ -0,0 +1,106 @@
+import asyncio
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.core.db.database import Base
+from app.features.auth.models import User
+from app.features.rbac.models import (
+    Permission,
+    Role,
+    RoleInheritance,
+    RolePermission,
+    UserEffectivePermission,
+    UserRole,
+)
+from utils import rbac_rebuild_effective_permissions
+from utils.rbac_rebuild_effective_permissions import rebuild_effective_permissions
+from utils.testing_support.database import MockDatabase
+
+
+async def _seed(mock_db: MockDatabase) -> None:
+    await mock_db.setup(Base)
+    await mock_db.load_rows(
+        User,
+        [
+            {"id": 1, "username": "lead", "hashed_password": "hash"},  # pragma: allowlist secret
+            {"id": 2, "username": "member", "hashed_password": "hash"},  # pragma: allowlist secret
+        ],
+    )
+    await mock_db.load_rows(
+        Permission,
+        [{"id": "roles:manage", "name": "Manage roles"}, {"id": "users:manage", "name": "Manage users"}],
+    )
+    await mock_db.load_rows(Role, [{"id": 1, "name": "base"}, {"id": 2, "name": "team"}, {"id": 3, "name": "lead"}])
+    await mock_db.load_rows(
+        RoleInheritance,
+        [{"role_id": 2, "parent_role_id": 1}, {"role_id": 3, "parent_role_id": 2}],
+    )
+    await mock_db.load_rows(
+        RolePermission,
+        [
+            {"role_id": 1, "permission_id": "roles:manage", "scope": "own"},
+            {"role_id": 2, "permission_id": "users:manage", "scope": "tenant"},
+            {"role_id": 3, "permission_id": "roles:manage", "scope": "any"},
+        ],
+    )
+    await mock_db.load_rows(UserRole, [{"user_id": 1, "role_id": 3}, {"user_id": 2, "role_id": 2}])
+    await mock_db.load_rows(UserEffectivePermission, [{"user_id": 2, "permission_id": "users:manage", "scope": "any"}])
+
+
+async def _list_grants(mock_db: MockDatabase) -> set[tuple[int, str, str]]:
+    async with mock_db.Session() as session:
+        result = await session.execute(
+            select(
+                UserEffectivePermission.user_id,
+                UserEffectivePermission.permission_id,
+                UserEffectivePermission.scope,
+            )
+        )
+        return set(result.tuples().all())
+
+
+def test_rebuild_effective_permissions_resolves_inherited_max_scopes() -> None:
+    async def run_test() -> None:
+        with tempfile.TemporaryDirectory(prefix="backend-rbac-rebuild-") as db_tmp_dir:
+            mock_db = MockDatabase(path=db_tmp_dir, echo=False)
+            try:
+                await _seed(mock_db)
+
+                partial_report = await rebuild_effective_permissions(mock_db.Session, user_ids=(1,))
+                assert partial_report.grants_written == 2
+                assert (2, "users:manage", "any") in await _list_grants(mock_db)
+
+                full_report = await rebuild_effective_permissions(mock_db.Session)
+                assert full_report.user_ids is None
+                assert full_report.grants_written == 4
+                assert await _list_grants(mock_db) == {
+                    (1, "roles:manage", "any"),
+                    (1, "users:manage", "tenant"),
+                    (2, "roles:manage", "own"),
+                    (2, "users:manage", "tenant"),
+                }
+            finally:
+                await mock_db.close()
+
+    asyncio.run(run_test())
+
+
+def test_rebuild_effective_permissions_main_prints_report(capsys: pytest.CaptureFixture[str]) -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-rbac-rebuild-") as db_tmp_dir:
+        mock_db = MockDatabase(path=db_tmp_dir, echo=False)
+        asyncio.run(_seed(mock_db))
+        try:
+            with (
+                patch.object(
+                    rbac_rebuild_effective_permissions, "get_async_session_factory", return_value=mock_db.Session
+                ),
+                patch("sys.argv", ["rbac_rebuild_effective_permissions", "--user-id", "2", "--user-id", "1"]),
+            ):
+                assert rbac_rebuild_effective_permissions.main() == 0
+        finally:
+            asyncio.run(mock_db.close())
+
+    assert capsys.readouterr().out == "Effective permissions rebuilt.\n- users: 1, 2\n- grants_written: 4\n"
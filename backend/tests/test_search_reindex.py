@@ -0,0 +1,34 @@
+import asyncio
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from app.core.db.database import Base
+from app.features.auth.models import User
+from app.features.rbac.models import Role
+from utils import search_reindex
+from utils.testing_support.database import MockDatabase
+
+
+def test_search_reindex_main_rebuilds_every_index_and_prints_counts(capsys: pytest.CaptureFixture[str]) -> None:
+    with tempfile.TemporaryDirectory(prefix="backend-search-reindex-") as db_tmp_dir:
+        mock_db = MockDatabase(path=db_tmp_dir, echo=False)
+        asyncio.run(mock_db.setup(Base))
+        asyncio.run(
+            mock_db.load_rows(
+                User,
+                [
+                    {"username": "alice", "hashed_password": "hash"},  # pragma: allowlist secret
+                    {"username": "bob", "hashed_password": "hash"},  # pragma: allowlist secret
+                ],
+            )
+        )
+        asyncio.run(mock_db.load_rows(Role, [{"name": "auditor"}]))
+        try:
+            with patch.object(search_reindex, "get_async_session_factory", return_value=mock_db.Session):
+                assert search_reindex.main() == 0
+        finally:
+            asyncio.run(mock_db.close())
+
+    assert capsys.readouterr().out == "Search index rebuilt.\n- users: 2\n- roles: 1\n"
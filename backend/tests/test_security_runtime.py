@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.core.config.settings import AuthSettings
+from app.core.security.runtime import SecurityRuntime, reload_security_runtime, security_runtime
+from app.core.setup.dependencies import get_auth_settings, get_password_service, get_token_service
+
+
+def test_security_runtime_builds_each_service_once() -> None:
+    calls: list[int] = []
+
+    def load_settings() -> AuthSettings:
+        calls.append(1)
+        return AuthSettings()
+
+    runtime = SecurityRuntime(settings_loader=load_settings)
+
+    assert runtime.get_auth_settings() is runtime.get_auth_settings()
+    assert runtime.get_token_service() is runtime.get_token_service()
+    assert runtime.get_password_service() is runtime.get_password_service()
+    assert runtime.get_token_service().secret_key == runtime.get_auth_settings().JWT_SECRET_KEY
+    assert len(calls) == 1
+
+
+def test_security_runtime_reload_rereads_settings_and_rebuilds_services() -> None:
+    secrets = iter(["first-secret", "second-secret"])  # pragma: allowlist secret
+    runtime = SecurityRuntime(settings_loader=lambda: AuthSettings(JWT_SECRET_KEY=next(secrets)))
+    token_service = runtime.get_token_service()
+    password_service = runtime.get_password_service()
+
+    runtime.reload()
+
+    assert runtime.get_auth_settings().JWT_SECRET_KEY == "second-secret"  # pragma: allowlist secret
+    assert runtime.get_token_service() is not token_service
+    assert runtime.get_password_service() is not password_service
+    assert token_service.secret_key == "first-secret"  # pragma: allowlist secret
+
+
+def test_security_runtime_reload_shuts_down_previous_hashing_pool() -> None:
+    runtime = SecurityRuntime(settings_loader=AuthSettings)
+    password_service = runtime.get_password_service()
+    hashed_password = asyncio.run(password_service.hash_password("Secret123"))  # pragma: allowlist secret
+
+    runtime.reload()
+
+    with pytest.raises(RuntimeError, match="after shutdown"):
+        asyncio.run(password_service.verify_password("Secret123", hashed_password))  # pragma: allowlist secret
+    assert asyncio.run(runtime.get_password_service().verify_password("Secret123", hashed_password)) is True
+
+
+def test_security_dependencies_return_process_singletons() -> None:
+    reload_security_runtime()
+
+    async def resolve() -> tuple[object, ...]:
+        return (await get_auth_settings(), await get_token_service(), await get_password_service())
+
+    first = asyncio.run(resolve())
+    second = asyncio.run(resolve())
+
+    assert all(left is right for left, right in zip(first, second, strict=True))
+    assert first[0] is security_runtime.get_auth_settings()
+    assert first[1] is security_runtime.get_token_service()
+    assert first[2] is security_runtime.get_password_service()
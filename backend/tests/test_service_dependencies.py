@@ -6,14 +6,24 @@ from starlette.requests import Request
 from app.core.setup.dependencies import (
     get_audit_log_repository,
     get_audit_log_service,
+    get_job_repository,
+    get_job_scheduler,
     get_outbox_repository,
     get_outbox_service,
+    get_request_audit_log_writer,
     get_request_permission_scope_cache,
+    get_search_index,
+    get_search_repository,
 )
 from app.features.audit_log.repository import AuditLogRepository
 from app.features.audit_log.service import AuditLogService
+from app.features.audit_log.writer import get_audit_log_writer
+from app.features.jobs.repository import JobRepository
+from app.features.jobs.service import JobService
 from app.features.outbox.repository import OutboxRepository
 from app.features.outbox.service import OutboxService
+from app.features.search.repository import SearchRepository
+from app.features.search.service import SearchService
 
 
 def _request(path: str) -> Request:
@@ -46,6 +56,13 @@ def test_get_request_permission_scope_cache_reuses_request_state_cache() -> None
     asyncio.run(run_test())
 
 
+def test_get_request_audit_log_writer_returns_process_writer() -> None:
+    async def run_test() -> None:
+        assert await get_request_audit_log_writer() is get_audit_log_writer()
+
+    asyncio.run(run_test())
+
+
 def test_get_outbox_repository_builds_outbox_repository() -> None:
     session = MagicMock()
 
@@ -96,3 +113,37 @@ def test_get_outbox_service_builds_outbox_service() -> None:
         assert service.unit_of_work is unit_of_work
 
     asyncio.run(run_test())
+
+
+def test_get_job_scheduler_builds_job_service_on_the_request_session() -> None:
+    session = MagicMock()
+    unit_of_work = MagicMock()
+
+    async def run_test() -> None:
+        job_repository = await get_job_repository(session)
+        scheduler = await get_job_scheduler(job_repository=job_repository, unit_of_work=unit_of_work)
+
+        assert isinstance(job_repository, JobRepository)
+        assert job_repository.session is session
+        assert isinstance(scheduler, JobService)
+        assert scheduler.job_repository is job_repository
+        assert scheduler.unit_of_work is unit_of_work
+
+    asyncio.run(run_test())
+
+
+def test_get_search_index_builds_search_service_on_the_request_session() -> None:
+    session = MagicMock()
+    unit_of_work = MagicMock()
+
+    async def run_test() -> None:
+        search_repository = await get_search_repository(session)
+        search_index = await get_search_index(search_repository=search_repository, unit_of_work=unit_of_work)
+
+        assert isinstance(search_repository, SearchRepository)
+        assert search_repository.session is session
+        assert isinstance(search_index, SearchService)
+        assert search_index.search_repository is search_repository
+        assert search_index.unit_of_work is unit_of_work
+
+    asyncio.run(run_test())
@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+import signal
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.db.database import get_async_session_factory
+from app.features.jobs.handlers import CPU_BOUND_JOB_HANDLERS, JOB_HANDLERS
+from app.features.jobs.worker import JobWorker
+
+
+def build_worker(
+    *,
+    concurrency: int,
+    visibility_timeout_seconds: float,
+    poll_interval_seconds: float,
+    max_poll_interval_seconds: float,
+    process_pool: ProcessPoolExecutor | None = None,
+) -> JobWorker:
+    return JobWorker(
+        session_factory=get_async_session_factory(),
+        handlers=JOB_HANDLERS,
+        cpu_bound_handlers=CPU_BOUND_JOB_HANDLERS,
+        process_pool=process_pool,
+        concurrency=concurrency,
+        visibility_timeout_seconds=visibility_timeout_seconds,
+        poll_interval_seconds=poll_interval_seconds,
+        max_poll_interval_seconds=max_poll_interval_seconds,
+    )
+
+
+async def run_until_stopped(worker: JobWorker) -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for stop_signal in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(stop_signal, stop_event.set)
+    await worker.run(stop_event)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run queued jobs from the jobs table.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Jobs run at the same time (default: 4).")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="Size of the process pool for CPU-bound jobs; 0 runs them in threads (default: 0).",
+    )
+    parser.add_argument(
+        "--visibility-timeout",
+        type=float,
+        default=300.0,
+        help="Seconds a claimed job may run before another worker can claim it again (default: 300.0).",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Shortest wait in seconds between polls once the queue is empty (default: 1.0).",
+    )
+    parser.add_argument(
+        "--max-poll-interval",
+        type=float,
+        default=10.0,
+        help="Longest wait in seconds that idle polling backs off to (default: 10.0).",
+    )
+    parser.add_argument("--once", action="store_true", help="Run the due jobs once and exit.")
+    return parser
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    if args.concurrency < 1 or args.processes < 0 or args.visibility_timeout <= 0:
+        print("--concurrency must be >= 1, --processes must be >= 0 and --visibility-timeout must be > 0.")
+        return 2
+    if args.poll_interval <= 0 or args.max_poll_interval < args.poll_interval:
+        print("--poll-interval must be > 0 and --max-poll-interval >= --poll-interval.")
+        return 2
+
+    process_pool = ProcessPoolExecutor(max_workers=args.processes) if args.processes else None
+    try:
+        worker = build_worker(
+            concurrency=args.concurrency,
+            visibility_timeout_seconds=args.visibility_timeout,
+            poll_interval_seconds=args.poll_interval,
+            max_poll_interval_seconds=args.max_poll_interval,
+            process_pool=process_pool,
+        )
+        if args.once:
+            asyncio.run(worker.drain())
+            metrics = worker.metrics
+            print(
+                "Jobs drained.\n"
+                f"- succeeded: {metrics.succeeded_count}\n"
+                f"- retried: {metrics.retried_count}\n"
+                f"- failed: {metrics.failed_count}"
+            )
+            return 0
+
+        asyncio.run(run_until_stopped(worker))
+        return 0
+    finally:
+        if process_pool is not None:
+            process_pool.shutdown()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
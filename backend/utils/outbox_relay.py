@@ -0,0 +1,168 @@
+import argparse
+import asyncio
+import signal
+from collections.abc import Sequence
+from pathlib import Path
+
+from app.core.db.database import get_async_session_factory, get_database_url
+from app.features.outbox.notifications import OutboxNotificationListener
+from app.features.outbox.relay import OutboxRelay
+from app.features.search.indexer import SearchIndexer
+from app.integrations.broker import MessageBrokerPort
+from app.integrations.fanout_broker import FanOutMessageBroker
+from app.integrations.local_broker import InProcessMessageBroker
+from app.integrations.logging_broker import LoggingMessageBroker
+
+
+def build_relay(
+    *,
+    batch_size: int,
+    poll_interval_seconds: float,
+    max_poll_interval_seconds: float,
+    shard_count: int = 1,
+    shard_indexes: Sequence[int] | None = None,
+    max_attempts: int = 10,
+    retry_base_seconds: float = 1.0,
+    retry_max_seconds: float = 300.0,
+    message_broker: MessageBrokerPort | None = None,
+    index_search: bool = False,
+) -> OutboxRelay:
+    session_factory = get_async_session_factory()
+    message_broker = message_broker or LoggingMessageBroker()
+    if index_search:
+        message_broker = FanOutMessageBroker([message_broker, SearchIndexer(session_factory=session_factory)])
+    return OutboxRelay(
+        session_factory=session_factory,
+        message_broker=message_broker,
+        batch_size=batch_size,
+        poll_interval_seconds=poll_interval_seconds,
+        max_poll_interval_seconds=max_poll_interval_seconds,
+        notification_listener=OutboxNotificationListener(database_url=get_database_url()),
+        shard_count=shard_count,
+        shard_indexes=shard_indexes,
+        max_attempts=max_attempts,
+        retry_base_seconds=retry_base_seconds,
+        retry_max_seconds=retry_max_seconds,
+    )
+
+
+async def run_until_stopped(relay: OutboxRelay) -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for stop_signal in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(stop_signal, stop_event.set)
+    await relay.run(stop_event)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Publish pending outbox events through the message broker.")
+    parser.add_argument("--batch-size", type=int, default=100, help="Events claimed per transaction (default: 100).")
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=0.1,
+        help="Shortest wait in seconds between polls once the outbox is drained (default: 0.1).",
+    )
+    parser.add_argument(
+        "--max-poll-interval",
+        type=float,
+        default=10.0,
+        help="Longest wait in seconds that idle polling backs off to (default: 10.0).",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Shards that pending events are hashed into by (aggregate_type, aggregate_id) (default: 1).",
+    )
+    parser.add_argument(
+        "--shard-index",
+        dest="shard_indexes",
+        action="append",
+        type=int,
+        help="Shard this process publishes (repeatable). Publishes every shard when omitted.",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=10,
+        help="Failed deliveries before an event moves to outbox_dead_letters (default: 10).",
+    )
+    parser.add_argument(
+        "--retry-base",
+        type=float,
+        default=1.0,
+        help="Seconds before the first retry; each later retry waits twice as long (default: 1.0).",
+    )
+    parser.add_argument(
+        "--retry-max",
+        type=float,
+        default=300.0,
+        help="Longest wait in seconds between retries of one event (default: 300.0).",
+    )
+    parser.add_argument(
+        "--broker-log",
+        type=Path,
+        help="Publish through the in-process broker and append every message to this JSON-lines file.",
+    )
+    parser.add_argument(
+        "--broker-fsync",
+        action="store_true",
+        help="fsync the broker log after every batch (only with --broker-log).",
+    )
+    parser.add_argument(
+        "--index-search",
+        action="store_true",
+        help="Also apply user and role changes to the embedded search index.",
+    )
+    parser.add_argument("--once", action="store_true", help="Drain the pending events once and exit.")
+    return parser
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    if args.batch_size < 1 or args.poll_interval <= 0 or args.max_poll_interval < args.poll_interval:
+        print("--batch-size must be >= 1, --poll-interval must be > 0 and --max-poll-interval >= --poll-interval.")
+        return 2
+    shard_indexes = tuple(sorted(set(args.shard_indexes))) if args.shard_indexes else None
+    if args.shards < 1 or any(not 0 <= shard_index < args.shards for shard_index in shard_indexes or ()):
+        print("--shards must be >= 1 and every --shard-index must be between 0 and --shards - 1.")
+        return 2
+    if args.max_attempts < 1 or args.retry_base <= 0 or args.retry_max < args.retry_base:
+        print("--max-attempts must be >= 1, --retry-base must be > 0 and --retry-max >= --retry-base.")
+        return 2
+    if args.index_search and get_database_url().get_backend_name() == "sqlite":
+        # Relay batches hold SQLite's single write lock while publishing, so the indexer could never commit.
+        print("--index-search requires PostgreSQL. Use utils/search_reindex.py to refresh the index on SQLite.")
+        return 2
+
+    relay = build_relay(
+        batch_size=args.batch_size,
+        poll_interval_seconds=args.poll_interval,
+        max_poll_interval_seconds=args.max_poll_interval,
+        shard_count=args.shards,
+        shard_indexes=shard_indexes,
+        max_attempts=args.max_attempts,
+        retry_base_seconds=args.retry_base,
+        retry_max_seconds=args.retry_max,
+        message_broker=(
+            InProcessMessageBroker(log_path=args.broker_log, fsync=args.broker_fsync)
+            if args.broker_log is not None
+            else None
+        ),
+        index_search=args.index_search,
+    )
+    if args.once:
+        published_count = asyncio.run(relay.drain())
+        print(f"Outbox drained.\n- published: {published_count}")
+        if args.shards > 1:
+            for shard_index, metrics in relay.shard_metrics.items():
+                print(f"- shard_{shard_index}_published: {metrics.published_count}")
+        return 0
+
+    asyncio.run(run_until_stopped(relay))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
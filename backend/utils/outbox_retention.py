@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+
+from app.core.db.database import get_async_session_factory
+from app.features.outbox.retention import OutboxRetention, OutboxRetentionReport
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Remove published outbox events older than the retention window.")
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=30,
+        help="Keep published events for this many days (default: 30).",
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help=(
+            "Detach expired PostgreSQL partitions as outbox_events_archive_YYYYMM tables, and move expired rows of "
+            "the default partition into outbox_events_archive_default, instead of deleting them."
+        ),
+    )
+    parser.add_argument(
+        "--premake-months",
+        type=int,
+        default=3,
+        help="Monthly PostgreSQL partitions to create ahead of the current month (default: 3).",
+    )
+    return parser
+
+
+def _format_report(report: OutboxRetentionReport, *, archive: bool) -> str:
+    removed_label = "archived" if archive else "dropped"
+    events_line = (
+        f"- events_archived: {report.archived_count}" if archive else f"- events_deleted: {report.deleted_count}"
+    )
+    return (
+        "Outbox retention completed.\n"
+        f"- partitions_created: {len(report.created_partitions)}\n"
+        f"- partitions_{removed_label}: {len(report.removed_partitions)}\n"
+        f"- partitions_kept_pending: {len(report.kept_partitions)}\n"
+        f"{events_line}"
+    )
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    if args.retention_days < 0 or args.premake_months < 0:
+        print("--retention-days and --premake-months must be >= 0.")
+        return 2
+
+    retention = OutboxRetention(
+        session_factory=get_async_session_factory(),
+        retention_days=args.retention_days,
+        archive=args.archive,
+        premake_months=args.premake_months,
+    )
+    report = asyncio.run(retention.run())
+    print(_format_report(report, archive=args.archive))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
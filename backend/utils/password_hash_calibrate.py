@@ -0,0 +1,170 @@
+import argparse
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+
+from argon2 import PasswordHasher
+
+from app.core.security.service import ARGON2_COST_PROFILES, Argon2CostProfile
+
+_SAMPLE_PASSWORD = "calibration-sample-password"  # pragma: allowlist secret
+
+
+@dataclass(frozen=True)
+class CalibrationResult:
+    profile: Argon2CostProfile
+    p50_ms: float
+    p99_ms: float
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure Argon2 hash latency on this host and recommend the costliest parameters within a p99 target."
+    )
+    parser.add_argument(
+        "--target-p99-ms",
+        type=float,
+        default=250.0,
+        help="Highest acceptable p99 latency of one hash, in milliseconds (default: 250).",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=20,
+        help="Hashes measured per candidate (default: 20).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Hashes run at once; match PASSWORD_HASH_MAX_CONCURRENCY (default: 4).",
+    )
+    parser.add_argument(
+        "--memory-cost-kib",
+        type=int,
+        nargs="+",
+        default=sorted({profile.memory_cost_kib for profile in ARGON2_COST_PROFILES.values()}),
+        help="Memory costs to try, in KiB (default: the memory costs of the built-in profiles).",
+    )
+    parser.add_argument(
+        "--max-time-cost",
+        type=int,
+        default=6,
+        help="Highest time cost to try for each memory cost (default: 6).",
+    )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=ARGON2_COST_PROFILES["default"].parallelism,
+        help="Argon2 lanes per hash (default: 4).",
+    )
+    return parser
+
+
+def _percentile(latencies_ms: list[float], percentile: float) -> float:
+    ordered = sorted(latencies_ms)
+    return ordered[max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)]
+
+
+def measure_profile(profile: Argon2CostProfile, *, samples: int, concurrency: int) -> CalibrationResult:
+    password_hasher = PasswordHasher(
+        time_cost=profile.time_cost,
+        memory_cost=profile.memory_cost_kib,
+        parallelism=profile.parallelism,
+    )
+
+    def timed_hash(_: int) -> float:
+        started_at = perf_counter()
+        password_hasher.hash(_SAMPLE_PASSWORD)
+        return (perf_counter() - started_at) * 1000
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies_ms = list(executor.map(timed_hash, range(samples)))
+    return CalibrationResult(
+        profile=profile,
+        p50_ms=_percentile(latencies_ms, 50),
+        p99_ms=_percentile(latencies_ms, 99),
+    )
+
+
+def calibrate(
+    *,
+    target_p99_ms: float,
+    samples: int,
+    concurrency: int,
+    memory_costs_kib: list[int],
+    max_time_cost: int,
+    parallelism: int,
+) -> list[CalibrationResult]:
+    results: list[CalibrationResult] = []
+    for memory_cost_kib in sorted(set(memory_costs_kib)):
+        for time_cost in range(1, max_time_cost + 1):
+            profile = Argon2CostProfile(time_cost=time_cost, memory_cost_kib=memory_cost_kib, parallelism=parallelism)
+            result = measure_profile(profile, samples=samples, concurrency=concurrency)
+            results.append(result)
+            # Extra passes only add latency, so higher time costs at this memory cost would miss the target too.
+            if result.p99_ms > target_p99_ms:
+                break
+    return results
+
+
+def recommend(results: list[CalibrationResult], *, target_p99_ms: float) -> CalibrationResult | None:
+    within_target = [result for result in results if result.p99_ms <= target_p99_ms]
+    if not within_target:
+        return None
+    return max(
+        within_target,
+        key=lambda result: (result.profile.memory_cost_kib * result.profile.time_cost, result.profile.memory_cost_kib),
+    )
+
+
+def _format_result(result: CalibrationResult) -> str:
+    profile = result.profile
+    return (
+        f"- time_cost={profile.time_cost} memory_cost_kib={profile.memory_cost_kib} "
+        f"parallelism={profile.parallelism}: p50={result.p50_ms:.1f}ms p99={result.p99_ms:.1f}ms"
+    )
+
+
+def _format_recommendation(result: CalibrationResult, *, target_p99_ms: float) -> str:
+    profile = result.profile
+    return (
+        f"Recommended settings (p99 {result.p99_ms:.1f}ms <= {target_p99_ms:g}ms):\n"
+        f"PASSWORD_HASH_TIME_COST={profile.time_cost}\n"
+        f"PASSWORD_HASH_MEMORY_COST_KIB={profile.memory_cost_kib}\n"
+        f"PASSWORD_HASH_PARALLELISM={profile.parallelism}"
+    )
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    if min(args.samples, args.concurrency, args.max_time_cost, args.parallelism) < 1:
+        print("--samples, --concurrency, --max-time-cost and --parallelism must be >= 1.")
+        return 2
+    if min(args.memory_cost_kib) < 8 * args.parallelism:
+        print("--memory-cost-kib values must be >= 8 times --parallelism.")
+        return 2
+
+    results = calibrate(
+        target_p99_ms=args.target_p99_ms,
+        samples=args.samples,
+        concurrency=args.concurrency,
+        memory_costs_kib=args.memory_cost_kib,
+        max_time_cost=args.max_time_cost,
+        parallelism=args.parallelism,
+    )
+    print(f"Argon2 calibration ({args.samples} hashes per candidate, concurrency {args.concurrency}).")
+    for result in results:
+        print(_format_result(result))
+
+    recommended = recommend(results, target_p99_ms=args.target_p99_ms)
+    if recommended is None:
+        print(f"No candidate met the {args.target_p99_ms:g}ms p99 target.")
+        return 1
+    print(_format_recommendation(recommended, target_p99_ms=args.target_p99_ms))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,6 +20,7 @@ from app.core.security.policies import (
 )
 from app.features.auth.models import User
 from app.features.rbac.models import Permission, Role, RolePermission, UserRole
+from app.features.rbac.repository import RBACRepository
 
 BASE_PERMISSION_SPECS: tuple[tuple[str, str], ...] = PERMISSION_SPECS
 
@@ -194,6 +195,7 @@ async def bootstrap_rbac(
             user_id=admin_user.id,
             admin_role_id=roles_by_name["admin_role"].id,
         )
+        await RBACRepository(session).rebuild_user_effective_permissions()
 
     return BootstrapReport(
         permissions_created=permissions_created,
@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+from dataclasses import dataclass
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.db.database import get_async_session_factory
+from app.features.rbac.models import UserEffectivePermission
+from app.features.rbac.repository import RBACRepository
+
+
+@dataclass(frozen=True)
+class RebuildReport:
+    user_ids: tuple[int, ...] | None
+    grants_written: int
+
+
+async def rebuild_effective_permissions(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    user_ids: tuple[int, ...] | None = None,
+) -> RebuildReport:
+    async with session_factory() as session, session.begin():
+        await RBACRepository(session).rebuild_user_effective_permissions(user_ids=user_ids)
+        count_query = select(func.count()).select_from(UserEffectivePermission)
+        if user_ids is not None:
+            count_query = count_query.where(UserEffectivePermission.user_id.in_(user_ids))
+        grants_written = int((await session.execute(count_query)).scalar_one())
+
+    return RebuildReport(user_ids=user_ids, grants_written=grants_written)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Rebuild the user effective-permission closure table.")
+    parser.add_argument(
+        "--user-id",
+        dest="user_ids",
+        action="append",
+        type=int,
+        help="Rebuild only this user (repeatable). Rebuilds every user when omitted.",
+    )
+    return parser
+
+
+def _format_report(report: RebuildReport) -> str:
+    scope = "all" if report.user_ids is None else ", ".join(str(user_id) for user_id in report.user_ids)
+    return f"Effective permissions rebuilt.\n- users: {scope}\n- grants_written: {report.grants_written}"
+
+
+def main() -> int:
+    parser = _build_parser()
+    args = parser.parse_args()
+    user_ids = tuple(sorted(set(args.user_ids))) if args.user_ids else None
+
+    report = asyncio.run(rebuild_effective_permissions(get_async_session_factory(), user_ids=user_ids))
+    print(_format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
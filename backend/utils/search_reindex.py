@@ -0,0 +1,17 @@
+import asyncio
+
+from app.core.db.database import get_async_session_factory
+from app.features.search.indexer import SearchIndexer
+
+
+def main() -> int:
+    indexer = SearchIndexer(session_factory=get_async_session_factory())
+    indexed_counts = asyncio.run(indexer.reindex())
+    print("Search index rebuilt.")
+    for index, indexed_count in indexed_counts.items():
+        print(f"- {index}: {indexed_count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,11 +1,16 @@
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock
 
+from argon2 import PasswordHasher
+
 from app.core.authorization.permission_evaluator import PermissionEvaluatorPort
+from app.core.authorization.snapshot_cache import AuthorizationSnapshotCachePort
 from app.core.config.settings import AuthSettings
 from app.core.security.service import PasswordServicePort, TokenServicePort
 from app.features.auth.models import User
-from app.features.auth.service import AuthService
+from app.features.auth.service import AuthService, PasswordRehasherPort, TokenWatermarkPort
+
+_PASSWORD_HASHER = PasswordHasher()
 
 
 def assert_unit_of_work_scope_committed(unit_of_work: object) -> None:
@@ -22,10 +27,13 @@ def _build_repository_mock() -> MagicMock:
     repository.username_exists = AsyncMock(return_value=False)
     repository.create_user = AsyncMock()
     repository.update_user = AsyncMock()
+    repository.replace_password_hash = AsyncMock(return_value=True)
     repository.get_rbac_version = AsyncMock(
         return_value="0" * 64,
     )
+    repository.get_user_permission_bitset = AsyncMock(return_value=0)
     repository.get_user_permission_scope = AsyncMock(return_value=None)
+    repository.get_user_permission_scopes = AsyncMock(return_value={})
     repository.user_has_permission = AsyncMock()
     return repository
 
@@ -44,6 +52,10 @@ def build_service(
     token_service: TokenServicePort | None = None,
     password_service: PasswordServicePort | None = None,
     permission_scope_cache: dict[tuple[int, str], str | None] | None = None,
+    authorization_snapshot_cache: AuthorizationSnapshotCachePort | None = None,
+    password_rehasher: PasswordRehasherPort | None = None,
+    token_watermarks: TokenWatermarkPort | None = None,
+    stateless_tokens: bool = False,
 ) -> tuple[AuthService, MagicMock]:
     repo = repository or _build_repository_mock()
     unit_of_work = _build_unit_of_work_mock()
@@ -53,6 +65,7 @@ def build_service(
         JWT_ACCESS_TOKEN_EXPIRE_MINUTES=30,
         JWT_ISSUER="unit-test-issuer",
         JWT_AUDIENCE="unit-test-audience",
+        AUTH_STATELESS_TOKENS_ENABLED=stateless_tokens,
     )
     return (
         AuthService(
@@ -63,6 +76,9 @@ def build_service(
             token_service=token_service,
             password_service=password_service,
             permission_scope_cache=permission_scope_cache,
+            authorization_snapshot_cache=authorization_snapshot_cache,
+            password_rehasher=password_rehasher,
+            token_watermarks=token_watermarks,
         ),
         repo,
     )
@@ -80,7 +96,7 @@ def build_user(
     return User(
         id=user_id,
         username=username,
-        hashed_password=service.password_service.hash_password(password),
+        hashed_password=_PASSWORD_HASHER.hash(password),
         disabled=disabled,
         tenant_id=tenant_id,
     )
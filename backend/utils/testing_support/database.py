@@ -4,6 +4,7 @@ import pathlib
 from collections.abc import AsyncGenerator
 from typing import Any
 
+from sqlalchemy import insert
 from sqlalchemy.engine import URL
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeMeta
@@ -26,8 +27,11 @@ class MockDatabase:
             await conn.run_sync(base.metadata.create_all)
 
     async def load_rows(self, model: Any, data: list[dict[str, Any]]) -> None:
+        if not data:
+            return
+        # Bulk inserts bypass the unit of work, so seeding does not trigger flush hooks such as outbox tracking.
         async with self.Session() as session, session.begin():
-            session.add_all([model(**row) for row in data])
+            await session.execute(insert(model), data)
 
     async def get_db_session(self) -> AsyncGenerator[AsyncSession]:
         async with self.Session() as session: